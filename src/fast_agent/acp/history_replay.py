@@ -0,0 +1,126 @@
+"""
+Windowed, batched replay of session history for ACP ``session/load``.
+
+When a session is loaded the client is sent its history as message chunks.
+Long sessions can hold thousands of messages, and converting and sending all
+of them (one notification per content block) kept the client busy for seconds
+before the user could type.
+
+Replay is limited to a window of the most recent messages, starting at a turn
+boundary so the first replayed message is a user prompt; older turns remain
+available through ``/history``, and the replay opens with an agent message
+saying how many were left out. Within the window, adjacent plain text blocks
+from the same role are merged into a single chunk (clients concatenate
+consecutive chunks of the same kind, so the rendered transcript is the same),
+and updates are produced page by page so the sender can yield between pages.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from acp.helpers import text_block, update_agent_message, update_user_message
+from acp.schema import TextContentBlock
+
+from fast_agent.acp.content_conversion import convert_mcp_content_to_acp
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from acp.helpers import ContentBlock as ACPContentBlock
+    from acp.schema import AgentMessageChunk, UserMessageChunk
+
+    from fast_agent.types import PromptMessageExtended
+
+
+def _role(message: PromptMessageExtended) -> str:
+    role = message.role
+    return role.value if hasattr(role, "value") else str(role)
+
+
+def _is_turn_start(message: PromptMessageExtended) -> bool:
+    return _role(message) == "user" and not message.tool_results
+
+
+def replay_start(history: Sequence[PromptMessageExtended], max_messages: int) -> int:
+    """Index of the first message to replay so at most ``max_messages`` are sent.
+
+    The window is moved forward to the next turn start; if the last turn alone
+    is longer than the window, only the most recent ``max_messages`` are sent.
+    """
+    if max_messages <= 0 or len(history) <= max_messages:
+        return 0
+    start = len(history) - max_messages
+    for index in range(start, len(history)):
+        if _is_turn_start(history[index]):
+            return index
+    return start
+
+
+def omitted_history_notice(omitted: int) -> AgentMessageChunk:
+    """Agent message telling the client that ``omitted`` earlier messages were not replayed."""
+    noun = "message" if omitted == 1 else "messages"
+    return update_agent_message(
+        text_block(f"{omitted} earlier {noun} not shown — use /history to view them.")
+    )
+
+
+def _is_plain_text(block: ACPContentBlock) -> bool:
+    return (
+        isinstance(block, TextContentBlock)
+        and block.annotations is None
+        and block.field_meta is None
+    )
+
+
+def iter_history_update_pages(
+    history: Sequence[PromptMessageExtended],
+    *,
+    page_size: int = 50,
+    max_text_chars: int = 32_000,
+) -> Iterator[list[UserMessageChunk | AgentMessageChunk]]:
+    """Yield the ACP updates for ``history`` in pages of at most ``page_size`` updates."""
+    page_size = max(1, page_size)
+    page: list[UserMessageChunk | AgentMessageChunk] = []
+    text_role: str | None = None
+    text_parts: list[str] = []
+    text_chars = 0
+
+    def build(role: str, block: ACPContentBlock) -> UserMessageChunk | AgentMessageChunk:
+        if role == "user":
+            return update_user_message(block)
+        return update_agent_message(block)
+
+    def flush_text() -> None:
+        nonlocal text_role, text_chars
+        if text_role is not None and text_parts:
+            page.append(build(text_role, text_block("".join(text_parts))))
+        text_role = None
+        text_parts.clear()
+        text_chars = 0
+
+    for message in history:
+        role = _role(message)
+        if role not in ("user", "assistant"):
+            continue
+        for content in message.content:
+            block = convert_mcp_content_to_acp(content)
+            if block is None:
+                continue
+            if not _is_plain_text(block):
+                flush_text()
+                page.append(build(role, block))
+            else:
+                assert isinstance(block, TextContentBlock)
+                if role != text_role or text_chars + len(block.text) > max_text_chars:
+                    flush_text()
+                    text_role = role
+                text_parts.append(block.text)
+                text_chars += len(block.text)
+            if len(page) >= page_size:
+                yield page
+                page = []
+
+    flush_text()
+    if page:
+        yield page
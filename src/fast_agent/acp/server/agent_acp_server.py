@@ -26,12 +26,7 @@ from acp import (
 )
 from acp.exceptions import RequestError
 from acp.helpers import ContentBlock as ACPContentBlock
-from acp.helpers import (
-    update_agent_message,
-    update_agent_message_text,
-    update_agent_thought_text,
-    update_user_message,
-)
+from acp.helpers import update_agent_message_text
 from acp.schema import (
     AgentCapabilities,
     AgentMessageChunk,
@@ -64,10 +59,14 @@ from fast_agent.acp.acp_context import ACPContext, ClientInfo
 from fast_agent.acp.acp_context import ClientCapabilities as FAClientCapabilities
 from fast_agent.acp.content_conversion import (
     convert_acp_prompt_to_mcp_content_blocks,
-    convert_mcp_content_to_acp,
     inline_resources_for_slash_command,
 )
 from fast_agent.acp.filesystem_runtime import ACPFilesystemRuntime
+from fast_agent.acp.history_replay import (
+    iter_history_update_pages,
+    omitted_history_notice,
+    replay_start,
+)
 from fast_agent.acp.permission_store import PermissionStore
 from fast_agent.acp.protocols import (
     FilesystemRuntimeCapable,
@@ -77,6 +76,7 @@ from fast_agent.acp.protocols import (
     WorkflowTelemetryCapable,
 )
 from fast_agent.acp.slash_commands import SlashCommandHandler
+from fast_agent.acp.stream_sender import ACPStreamSender
 from fast_agent.acp.terminal_runtime import ACPTerminalRuntime
 from fast_agent.acp.tool_permission_adapter import ACPToolPermissionAdapter
 from fast_agent.acp.tool_progress import ACPToolProgressManager
@@ -105,7 +105,6 @@ from fast_agent.interfaces import (
     StreamingAgentProtocol,
     ToolRunnerHookCapable,
 )
-from fast_agent.llm.stream_types import StreamChunk
 from fast_agent.llm.terminal_output_limits import (
     calculate_terminal_output_limit_for_model,
     calculate_terminal_output_limit_for_resolved_model,
@@ -124,6 +123,7 @@ from fast_agent.session import (
 )
 from fast_agent.types import LlmStopReason, PromptMessageExtended, RequestParams
 from fast_agent.ui.interactive_diagnostics import write_interactive_trace
+from fast_agent.utils.async_utils import gather_with_cancel
 from fast_agent.workflow_telemetry import ACPPlanTelemetryProvider, ToolHandlerWorkflowTelemetry
 
 logger = get_logger(__name__)
@@ -234,6 +234,7 @@ class ACPSessionState:
     acp_context: ACPContext | None = None
     prompt_context: dict[str, str] = field(default_factory=dict)
     resolved_instructions: dict[str, str] = field(default_factory=dict)
+    history_replay: asyncio.Task[None] | None = None
 
 
 def truncate_description(text: str, max_length: int = 200) -> str:
@@ -294,6 +295,8 @@ class AgentACPServer(ACPAgent):
         | None = None,
         dump_agent_card_callback: Callable[[str], Awaitable[str]] | None = None,
         reload_callback: Callable[[], Awaitable[bool]] | None = None,
+        history_replay_messages: int = 200,
+        history_replay_page_size: int = 50,
     ) -> None:
         """
         Initialize the ACP server.
@@ -317,6 +320,8 @@ class AgentACPServer(ACPAgent):
                 detached MCP servers
             dump_agent_card_callback: Optional callback to dump AgentCards at runtime
             reload_callback: Optional callback to reload AgentCards
+            history_replay_messages: Most recent messages replayed on session/load (0 for all)
+            history_replay_page_size: Updates sent per page before yielding during replay
         """
         super().__init__()
 
@@ -344,6 +349,8 @@ class AgentACPServer(ACPAgent):
         self.server_name = server_name
         self._skills_directory_override = skills_directory_override
         self._permissions_enabled = permissions_enabled
+        self._history_replay_messages = history_replay_messages
+        self._history_replay_page_size = history_replay_page_size
         # Use provided version or get fast-agent version
         if server_version is None:
             try:
@@ -1665,30 +1672,6 @@ class AgentACPServer(ACPAgent):
             return None
         return extract_session_title(cast("Mapping[str, object]", metadata))
 
-    def _build_history_updates(
-        self,
-        history: Sequence[PromptMessageExtended],
-    ) -> list[UserMessageChunk | AgentMessageChunk]:
-        updates: list[UserMessageChunk | AgentMessageChunk] = []
-        for message in history:
-            role_value = message.role.value if hasattr(message.role, "value") else str(
-                message.role
-            )
-            if role_value == "user":
-                update_builder = update_user_message
-            elif role_value == "assistant":
-                update_builder = update_agent_message
-            else:
-                continue
-
-            for content in message.content:
-                acp_block = convert_mcp_content_to_acp(content)
-                if acp_block is None:
-                    continue
-                updates.append(update_builder(acp_block))
-
-        return updates
-
     async def _send_session_history_updates(
         self,
         session_state: ACPSessionState,
@@ -1720,19 +1703,29 @@ class AgentACPServer(ACPAgent):
             if not history:
                 return
 
-            updates = self._build_history_updates(history)
-            for update in updates:
+            start = replay_start(history, self._history_replay_messages)
+            update_count = 0
+            if start > 0:
                 await self._connection.session_update(
                     session_id=session_state.session_id,
-                    update=update,
+                    update=omitted_history_notice(start),
                 )
+                update_count += 1
+            for page in iter_history_update_pages(
+                history[start:], page_size=self._history_replay_page_size
+            ):
+                await self._send_update_page(session_state.session_id, page)
+                update_count += len(page)
+                # Let prompts and other sessions' requests run between pages.
+                await asyncio.sleep(0)
 
             logger.info(
                 "Sent session history updates",
                 name="acp_session_history_sent",
                 session_id=session_state.session_id,
-                message_count=len(history),
-                update_count=len(updates),
+                message_count=len(history) - start,
+                omitted_message_count=start,
+                update_count=update_count,
             )
         except Exception as exc:
             logger.error(
@@ -1742,6 +1735,32 @@ class AgentACPServer(ACPAgent):
                 exc_info=True,
             )
 
+    async def _send_update_page(
+        self, session_id: str, page: Sequence[UserMessageChunk | AgentMessageChunk]
+    ) -> None:
+        """Send a page of updates as one burst on the connection.
+
+        ``session/update`` carries a single update, so a page cannot share one
+        notification. The sends are started together instead: each queues its
+        line on the connection's writer before it first suspends, so they are
+        written back to back in page order and the page waits on the writer once.
+        """
+        assert self._connection is not None
+        results = await gather_with_cancel(
+            self._connection.session_update(session_id=session_id, update=update)
+            for update in page
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _wait_for_history_replay(self, session_state: ACPSessionState | None) -> None:
+        """Let a pending history replay finish so a new turn is not interleaved with it."""
+        replay = session_state.history_replay if session_state else None
+        if replay is None or replay.done():
+            return
+        await replay
+
     async def list_sessions(
         self,
         cursor: str | None = None,
@@ -1903,7 +1922,9 @@ class AgentACPServer(ACPAgent):
                 session_state.acp_context.set_current_mode(current_agent)
 
         if self._connection:
-            asyncio.create_task(
+            if session_state.history_replay and not session_state.history_replay.done():
+                session_state.history_replay.cancel()
+            session_state.history_replay = asyncio.create_task(
                 self._send_session_history_updates(
                     session_state,
                     session,
@@ -2187,6 +2208,7 @@ class AgentACPServer(ACPAgent):
             # Get current agent for this session (defaults to primary agent if not set).
             # Prefer ACPContext.current_mode so agent-initiated mode switches route correctly.
             session_state = self._session_state.get(session_id)
+            await self._wait_for_history_replay(session_state)
             acp_context = session_state.acp_context if session_state else None
             current_agent_name = None
             if acp_context is not None:
@@ -2266,43 +2288,17 @@ class AgentACPServer(ACPAgent):
                     # Set up streaming if connection is available and agent supports it
                     stream_listener = None
                     remove_listener: Callable[[], None] | None = None
-                    streaming_tasks: list[asyncio.Task] = []
+                    stream_sender: ACPStreamSender | None = None
                     if self._connection and isinstance(agent, StreamingAgentProtocol):
-                        connection = self._connection
-                        update_lock = asyncio.Lock()
-
-                        async def send_stream_update(chunk: StreamChunk) -> None:
-                            """Send sessionUpdate with accumulated text so far."""
-                            if not chunk.text:
-                                return
-                            try:
-                                async with update_lock:
-                                    if chunk.is_reasoning:
-                                        message_chunk = update_agent_thought_text(chunk.text)
-                                    else:
-                                        message_chunk = update_agent_message_text(chunk.text)
-                                    await connection.session_update(
-                                        session_id=session_id, update=message_chunk
-                                    )
-                            except Exception as e:
-                                logger.error(
-                                    f"Error sending stream update: {e}",
-                                    name="acp_stream_error",
-                                    exc_info=True,
-                                )
-
-                        def on_stream_chunk(chunk: StreamChunk):
-                            """
-                            Sync callback from fast-agent streaming.
-                            Sends each chunk as it arrives to the ACP client.
-                            """
-                            if not chunk or not chunk.text:
-                                return
-                            task = asyncio.create_task(send_stream_update(chunk))
-                            streaming_tasks.append(task)
-
-                        # Register the stream listener and keep the cleanup function
-                        stream_listener = on_stream_chunk
+                        stream_sender = ACPStreamSender(self._connection, session_id)
+                        stream_sender.start()
+                        # Tool stream notifications are queued behind the text.
+                        if session_state and session_state.progress_manager:
+                            session_state.progress_manager.set_stream_sender(stream_sender)
+
+                        # Register the stream listener and keep the cleanup function.
+                        # Chunks are coalesced into frames by the sender task.
+                        stream_listener = stream_sender.push
                         remove_listener = agent.add_stream_listener(stream_listener)
 
                         logger.info(
@@ -2332,6 +2328,9 @@ class AgentACPServer(ACPAgent):
                             async def after_llm_call(_runner, message):
                                 if message.stop_reason != LlmStopReason.TOOL_USE:
                                     return
+                                if stream_sender is not None:
+                                    # Streamed text precedes the tool calls it introduces.
+                                    await stream_sender.flush()
                                 await self._send_status_line_update(
                                     session_id, agent, turn_start_index
                                 )
@@ -2379,28 +2378,25 @@ class AgentACPServer(ACPAgent):
                             acp_stop_reason=acp_stop_reason,
                         )
 
-                        # Wait for all streaming tasks to complete before sending final message
-                        # and returning PromptResponse. This ensures all chunks arrive before END_TURN.
-                        if streaming_tasks:
-                            try:
-                                await asyncio.gather(*streaming_tasks)
-                                logger.debug(
-                                    f"All {len(streaming_tasks)} streaming tasks completed",
-                                    name="acp_streaming_complete",
-                                    session_id=session_id,
-                                    task_count=len(streaming_tasks),
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f"Error waiting for streaming tasks: {e}",
-                                    name="acp_streaming_wait_error",
-                                    exc_info=True,
-                                )
+                        # Send any buffered stream text before the final message and the
+                        # PromptResponse. This ensures all chunks arrive before END_TURN.
+                        streamed = False
+                        if stream_sender is not None:
+                            await stream_sender.aclose()
+                            stream_stats = stream_sender.stats
+                            streamed = stream_stats.chunks > 0
+                            logger.debug(
+                                "Streamed response sent",
+                                name="acp_streaming_complete",
+                                session_id=session_id,
+                                chunk_count=stream_stats.chunks,
+                                frame_count=stream_stats.frames,
+                            )
 
                         # Only send final update if no streaming chunks were sent
                         # When chunks were streamed, the final chunk already contains the complete response
                         # This prevents duplicate messages from being sent to the client
-                        if not streaming_tasks and self._connection and response_text:
+                        if not streamed and self._connection and response_text:
                             try:
                                 message_chunk = update_agent_message_text(response_text)
                                 if status_line_meta:
@@ -2424,7 +2420,7 @@ class AgentACPServer(ACPAgent):
                                     name="acp_final_update_error",
                                     exc_info=True,
                                 )
-                        elif streaming_tasks and self._connection and status_line_meta:
+                        elif streamed and self._connection and status_line_meta:
                             try:
                                 message_chunk = update_agent_message_text("")
                                 await self._connection.session_update(
@@ -2460,6 +2456,10 @@ class AgentACPServer(ACPAgent):
                         raise send_error
 
                     finally:
+                        if stream_sender is not None:
+                            if session_state and session_state.progress_manager:
+                                session_state.progress_manager.set_stream_sender(None)
+                            stream_sender.cancel()
                         # Clean up stream listener (if not already cleaned up in except)
                         if stream_listener and remove_listener:
                             try:
@@ -2642,6 +2642,9 @@ class AgentACPServer(ACPAgent):
         async with self._session_lock:
             # Clean up per-session state
             for session_id, state in list(self._session_state.items()):
+                if state.history_replay and not state.history_replay.done():
+                    state.history_replay.cancel()
+
                 if state.terminal_runtime:
                     try:
                         logger.debug(
@@ -0,0 +1,228 @@
+"""
+Coalescing sender for streamed assistant text.
+
+Providers emit one ``StreamChunk`` per token. Sending each as its own
+``session/update`` notification means one JSON-RPC frame per token, which
+editor clients struggle to keep up with on fast models.
+
+``ACPStreamSender`` runs one sender task per prompt. Chunks are pushed
+synchronously from the stream listener; consecutive deltas of the same kind
+(message text or thought) are merged into a single pending frame, which is sent
+once the flush interval has passed or the frame reaches ``max_frame_bytes``.
+Frames are sent one at a time, in the order their text arrived. While a send
+is in flight new deltas keep accumulating in the pending frame, so a slow
+client receives fewer, larger frames instead of a growing backlog of tasks.
+
+Stream listeners are synchronous and cannot be made to wait, so backpressure
+is applied to the frame queue instead: once ``max_pending_frames`` frames are
+waiting, new deltas are merged into the newest frame regardless of
+``max_frame_bytes``. The queue length stays bounded and the pending text is
+never more than what the provider has already buffered for its response.
+
+Other notifications that must stay ordered with the text (tool stream
+start/delta updates) are queued with ``enqueue()``. They flush the text ahead
+of them immediately and are sent by the same task, so a client never sees a
+tool card before the text that preceded it.
+
+``aclose()`` sends everything still pending before returning, so it must be
+awaited before the prompt response is returned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from acp.helpers import update_agent_message_text, update_agent_thought_text
+
+from fast_agent.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from acp import AgentSideConnection
+
+    from fast_agent.llm.stream_types import StreamChunk
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _Frame:
+    is_reasoning: bool
+    parts: list[str] = field(default_factory=list)
+    size: int = 0
+
+
+@dataclass(slots=True)
+class _Call:
+    send: Callable[[], Awaitable[None]]
+    done: asyncio.Future[None]
+
+
+@dataclass(frozen=True, slots=True)
+class StreamSenderStats:
+    chunks: int
+    frames: int
+
+
+class ACPStreamSender:
+    """Send streamed text deltas for one session as coalesced ``session/update`` frames."""
+
+    def __init__(
+        self,
+        connection: AgentSideConnection,
+        session_id: str,
+        *,
+        flush_interval: float = 0.03,
+        max_frame_bytes: int = 8192,
+        max_pending_frames: int = 64,
+    ) -> None:
+        self._connection = connection
+        self._session_id = session_id
+        self.flush_interval = max(0.0, flush_interval)
+        self.max_frame_bytes = max(1, max_frame_bytes)
+        self.max_pending_frames = max(1, max_pending_frames)
+        self._frames: deque[_Frame | _Call] = deque()
+        self._has_data = asyncio.Event()
+        self._send_now = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        self._task: asyncio.Task[None] | None = None
+        self._chunks = 0
+        self._frames_sent = 0
+
+    @property
+    def stats(self) -> StreamSenderStats:
+        return StreamSenderStats(chunks=self._chunks, frames=self._frames_sent)
+
+    @property
+    def pending_frames(self) -> int:
+        return len(self._frames)
+
+    @property
+    def accepting(self) -> bool:
+        """True while the sender task is running and ``enqueue()`` keeps ordering."""
+        return not self._closed and self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def push(self, chunk: StreamChunk) -> None:
+        """Queue a stream chunk; safe to call from synchronous stream listeners."""
+        if self._closed or not chunk or not chunk.text:
+            return
+        self._chunks += 1
+        last = self._frames[-1] if self._frames else None
+        frame = last if isinstance(last, _Frame) else None
+        if frame is None or frame.is_reasoning != chunk.is_reasoning:
+            frame = _Frame(chunk.is_reasoning)
+            self._frames.append(frame)
+        elif frame.size >= self.max_frame_bytes and len(self._frames) < self.max_pending_frames:
+            frame = _Frame(chunk.is_reasoning)
+            self._frames.append(frame)
+        frame.parts.append(chunk.text)
+        frame.size += len(chunk.text.encode("utf-8"))
+        if frame.size >= self.max_frame_bytes:
+            self._send_now.set()
+        self._idle.clear()
+        self._has_data.set()
+
+    def enqueue(self, send: Callable[[], Awaitable[None]]) -> asyncio.Future[None]:
+        """Run ``send`` on the sender task after everything pushed so far.
+
+        Pending text is flushed without waiting for the interval. The returned
+        future resolves once ``send`` has finished. When the sender is not
+        accepting work, ``send`` runs in a task of its own.
+        """
+        if not self.accepting:
+            return asyncio.ensure_future(send())
+        call = _Call(send, asyncio.get_running_loop().create_future())
+        self._frames.append(call)
+        self._idle.clear()
+        self._send_now.set()
+        self._has_data.set()
+        return call.done
+
+    async def flush(self) -> None:
+        """Send everything pushed so far."""
+        if self._task is None or self._task.done():
+            return
+        if self._idle.is_set():
+            return
+        self._send_now.set()
+        await self._idle.wait()
+
+    async def aclose(self) -> None:
+        """Send pending text and stop the sender task."""
+        self._closed = True
+        task = self._task
+        if task is None:
+            return
+        self._send_now.set()
+        self._has_data.set()
+        await task
+
+    def cancel(self) -> None:
+        """Stop the sender task without sending pending text."""
+        self._closed = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        # Queued notifications are not text; send them even though the text is dropped.
+        while self._frames:
+            item = self._frames.popleft()
+            if isinstance(item, _Call):
+                asyncio.create_task(self._call(item))
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_data.wait()
+            if not self._send_now.is_set() and self.flush_interval:
+                try:
+                    await asyncio.wait_for(self._send_now.wait(), self.flush_interval)
+                except TimeoutError:
+                    pass
+            while self._frames:
+                item = self._frames.popleft()
+                if isinstance(item, _Call):
+                    await self._call(item)
+                else:
+                    await self._send(item)
+            self._has_data.clear()
+            self._send_now.clear()
+            self._idle.set()
+            if self._closed:
+                return
+
+    async def _call(self, call: _Call) -> None:
+        try:
+            await call.send()
+        except asyncio.CancelledError:
+            call.done.cancel()
+            raise
+        except Exception as e:
+            if not call.done.done():
+                call.done.set_exception(e)
+        else:
+            if not call.done.done():
+                call.done.set_result(None)
+
+    async def _send(self, frame: _Frame) -> None:
+        text = "".join(frame.parts)
+        if frame.is_reasoning:
+            update = update_agent_thought_text(text)
+        else:
+            update = update_agent_message_text(text)
+        try:
+            await self._connection.session_update(session_id=self._session_id, update=update)
+            self._frames_sent += 1
+        except Exception as e:
+            logger.error(
+                f"Error sending stream update: {e}",
+                name="acp_stream_error",
+                exc_info=True,
+            )
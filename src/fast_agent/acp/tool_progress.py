@@ -9,7 +9,9 @@ When MCP tools execute and report progress, this module:
 """
 
 import asyncio
+import functools
 import uuid
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from acp.contrib import ToolCallTracker
@@ -45,6 +47,8 @@ from fast_agent.mcp.common import get_resource_name, get_server_name, is_namespa
 if TYPE_CHECKING:
     from acp import AgentSideConnection
 
+    from fast_agent.acp.stream_sender import ACPStreamSender
+
 logger = get_logger(__name__)
 
 
@@ -145,7 +149,10 @@ class ACPToolProgressManager:
         # late/duplicate stream deltas do not mutate a tool call after execution begins.
         self._stream_tool_use_ids: dict[str, str] = {}  # tool_use_id → external_id
         # Track pending stream notification tasks
-        self._stream_tasks: dict[str, asyncio.Task] = {}  # tool_use_id → task
+        self._stream_tasks: dict[str, asyncio.Future[None]] = {}  # tool_use_id → task
+        # Sender for the active prompt's streamed text; stream notifications are
+        # queued behind the text so they reach the client in order.
+        self._stream_sender: "ACPStreamSender | None" = None
         # Track stream chunk counts for title updates
         self._stream_chunk_counts: dict[str, int] = {}  # tool_use_id → chunk count
         # Track base titles for streaming tools (before chunk count suffix)
@@ -268,6 +275,18 @@ class ACPToolProgressManager:
 
         return tool_call_start.tool_call_id
 
+    def set_stream_sender(self, sender: "ACPStreamSender | None") -> None:
+        """Order stream notifications after text pushed to ``sender`` (None to detach)."""
+        self._stream_sender = sender
+
+    def _schedule_stream_notification(
+        self, send: Callable[[], Awaitable[None]]
+    ) -> asyncio.Future[None]:
+        sender = self._stream_sender
+        if sender is not None and sender.accepting:
+            return sender.enqueue(send)
+        return asyncio.ensure_future(send())
+
     def handle_tool_stream_event(self, event_type: str, info: dict[str, Any] | None = None) -> None:
         """
         Handle tool stream events from the LLM during streaming.
@@ -304,8 +323,13 @@ class ACPToolProgressManager:
                 self._stream_tool_use_ids[tool_use_id] = external_id
 
                 # Schedule async notification sending and store the task
-                task = asyncio.create_task(
-                    self._send_stream_start_notification(tool_name, tool_use_id, external_id)
+                task = self._schedule_stream_notification(
+                    functools.partial(
+                        self._send_stream_start_notification,
+                        tool_name,
+                        tool_use_id,
+                        external_id,
+                    )
                 )
                 # Store task reference so we can await it in on_tool_start if needed
                 self._stream_tasks[tool_use_id] = task
@@ -321,7 +345,9 @@ class ACPToolProgressManager:
                 if tool_use_id not in self._stream_tool_use_ids:
                     return
                 # Schedule async notification with accumulated arguments
-                asyncio.create_task(self._send_stream_delta_notification(tool_use_id, chunk))
+                self._schedule_stream_notification(
+                    functools.partial(self._send_stream_delta_notification, tool_use_id, chunk)
+                )
 
         elif event_type == "stop" and info:
             tool_use_id = info.get("tool_use_id")
@@ -68,6 +68,7 @@ from fast_agent.interfaces import (
 from fast_agent.llm.model_database import ModelDatabase
 from fast_agent.llm.provider_types import Provider
 from fast_agent.llm.stream_types import StreamChunk
+from fast_agent.llm.token_counting import get_token_counter
 from fast_agent.llm.usage_tracking import UsageAccumulator
 from fast_agent.mcp.helpers.content_helpers import normalize_to_extended_list, text_content
 from fast_agent.mcp.mime_utils import is_text_mime_type
@@ -435,6 +436,8 @@ class LlmDecorator(StreamingAgentMixin, AgentProtocol):
             deepcopy(request_params) if request_params is not None else None
         )
         self._llm_attach_kwargs = attach_kwargs
+        # Resolve the tokenizer off the event loop before streaming needs it.
+        get_token_counter().warm(self._llm.model_name)
         self._on_llm_attached(self._llm)
 
         return self._llm
@@ -487,8 +490,13 @@ class LlmDecorator(StreamingAgentMixin, AgentProtocol):
 
         return clone
 
-    def merge_usage_from(self, other: "LlmAgent") -> None:
-        """Merge LLM usage metrics from another agent instance into this one."""
+    def merge_usage_from(self, other: "LlmAgent", *, since_turn: int = 0) -> None:
+        """Merge LLM usage metrics from another agent instance into this one.
+
+        Args:
+            other: Agent whose usage turns should be copied
+            since_turn: Skip the first N turns (already merged from a reused instance)
+        """
 
         if not hasattr(self, "_llm") or not hasattr(other, "_llm"):
             return
@@ -503,7 +511,7 @@ class LlmDecorator(StreamingAgentMixin, AgentProtocol):
         if not source_usage or not target_usage:
             return
 
-        for turn in source_usage.turns:
+        for turn in source_usage.turns[since_turn:]:
             try:
                 target_usage.add_turn(turn.model_copy(deep=True))
             except AttributeError:
@@ -59,9 +59,13 @@ Algorithm
    - Collect all tool calls from the parent LLM response.
    - Partition them into **child-agent tools** and **regular MCP/local tools**.
    - Child-agent tools are executed in parallel:
-     - For each child tool call, spawn a detached clone with its own LLM + MCP aggregator and suffixed name.
+     - For each child tool call, take a detached clone with its own LLM + MCP aggregator and suffixed name,
+       reusing a warm clone from the instance pool when one is idle for that slot.
+       Only the first `max_parallel` slots per child (or `DEFAULT_WARM_INSTANCES` when
+       uncapped) are pooled; clones for higher slots are shut down after their call.
+     - When `max_parallel` is set, calls beyond the cap queue for a free slot instead of being dropped.
      - Emit `ProgressAction.CHATTING` / `ProgressAction.READY` events for each instance and keep parent status untouched.
-     - Merge each clone's usage back into the template child after shutdown.
+     - Merge each clone's usage for the call back into the template child, then reset and return it to the pool.
    - Remaining MCP/local tools are delegated to `McpAgent.run_tools()`.
    - Child and MCP results (and their error text from `FAST_AGENT_ERROR_CHANNEL`) are merged into a single `PromptMessageExtended` that is returned to the parent LLM.
 
@@ -103,8 +107,9 @@ table) undergoes dynamic updates:
 
 Stats and Usage Semantics
 -------------------------
-- Each detached clone accrues usage on its own `UsageAccumulator`; after shutdown we
-  call `child.merge_usage_from(clone)` so template agents retain consolidated totals.
+- Each detached clone accrues usage on its own `UsageAccumulator`; after each call we
+  call `child.merge_usage_from(clone, since_turn=...)` with only that call's turns, so
+  template agents retain consolidated totals even when a warm clone is reused.
 - Runtime events (logs, MCP progress, chat headers) use the suffixed clone names,
   ensuring per-instance traceability even though usage rolls up to the template.
 - The CLI *Usage Summary* table still reports one row per template agent
@@ -226,6 +231,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Warm clones kept per child tool when max_parallel is unset
+DEFAULT_WARM_INSTANCES = 4
+
 
 def _response_mode_schema() -> dict[str, Any]:
     return {
@@ -283,9 +291,11 @@ class AgentsAsToolsOptions:
     Defaults:
     - history_source: none (child starts with empty history)
     - history_merge_target: none (no merge back)
-    - max_parallel: None (no cap; caller may set an explicit limit)
+    - max_parallel: None (no cap; calls beyond the cap queue until a slot frees up)
     - child_timeout_sec: None (no per-child timeout)
     - max_display_instances: 20 (show first N lines, collapse the rest)
+    - reuse_instances: True (keep up to max_parallel, or DEFAULT_WARM_INSTANCES,
+      detached clones per child warm between calls)
     """
 
     history_source: HistorySource = HistorySource.NONE
@@ -293,6 +303,7 @@ class AgentsAsToolsOptions:
     max_parallel: int | None = None
     child_timeout_sec: float | None = None
     max_display_instances: int = 20
+    reuse_instances: bool = True
 
     def __post_init__(self) -> None:
         self.history_source = HistorySource.from_input(self.history_source)
@@ -344,6 +355,8 @@ class AgentsAsToolsAgent(McpAgent):
         self._history_merge_lock = asyncio.Lock()
         self._display_suppression_count: dict[int, int] = {}
         self._original_display_configs: dict[int, Any] = {}
+        # Idle detached clones keyed by (child tool name, instance index)
+        self._instance_pool: dict[tuple[str, int], LlmAgent] = {}
 
         for child in agents:
             tool_name = self._make_tool_name(child.name)
@@ -372,8 +385,12 @@ class AgentsAsToolsAgent(McpAgent):
                 await agent.initialize()
 
     async def shutdown(self) -> None:
-        """Shutdown this agent and all child agents."""
+        """Shutdown this agent, pooled child instances and all child agents."""
         await super().shutdown()
+        pooled = list(self._instance_pool.values())
+        self._instance_pool.clear()
+        for clone in pooled:
+            await self._shutdown_child_instance(clone)
         for agent in self._child_agents.values():
             try:
                 await agent.shutdown()
@@ -554,6 +571,56 @@ class AgentsAsToolsAgent(McpAgent):
                 if original_config is not None and hasattr(child, "display") and child.display:
                     child.display.config = original_config
 
+    async def _acquire_child_instance(
+        self, child: LlmAgent, tool_name: str, instance: int
+    ) -> LlmAgent:
+        """Return a warm detached instance for this slot, spawning one if none is idle."""
+        if self._options.reuse_instances:
+            clone = self._instance_pool.pop((tool_name, instance), None)
+            if clone is not None:
+                return clone
+
+        base_name = getattr(child, "_name", child.name)
+        return await child.spawn_detached_instance(name=f"{base_name}[{instance}]")
+
+    async def _release_child_instance(
+        self, clone: LlmAgent, tool_name: str, instance: int, *, reusable: bool
+    ) -> None:
+        """Return a finished instance to the warm pool, or shut it down."""
+        key = (tool_name, instance)
+        warm_limit = self._options.max_parallel or DEFAULT_WARM_INSTANCES
+        if (
+            reusable
+            and self._options.reuse_instances
+            and instance <= warm_limit
+            and key not in self._instance_pool
+        ):
+            try:
+                clone.clear()
+            except Exception as exc:
+                logger.warning(
+                    "Failed to reset child instance, discarding",
+                    data={"instance_name": getattr(clone, "_name", clone.name), "error": str(exc)},
+                )
+            else:
+                self._instance_pool[key] = clone
+                return
+
+        await self._shutdown_child_instance(clone)
+
+    @staticmethod
+    async def _shutdown_child_instance(clone: LlmAgent) -> None:
+        try:
+            await clone.shutdown()
+        except Exception as shutdown_exc:
+            logger.warning(
+                "Error shutting down dedicated child instance",
+                data={
+                    "instance_name": getattr(clone, "_name", clone.name),
+                    "error": str(shutdown_exc),
+                },
+            )
+
     async def _merge_history(
         self, target: LlmAgent, clone: LlmAgent, start_index: int
     ) -> None:
@@ -1010,19 +1077,14 @@ class AgentsAsToolsAgent(McpAgent):
             descriptor["status"] = "pending"
             id_list.append(correlation_id)
 
+        # Calls beyond max_parallel wait for a free instance slot rather than being
+        # dropped; slot numbers double as instance suffixes so warm clones are reused.
         max_parallel = self._options.max_parallel
+        free_slots: asyncio.Queue[int] | None = None
         if max_parallel and len(id_list) > max_parallel:
-            skipped_ids = id_list[max_parallel:]
-            id_list = id_list[:max_parallel]
-            skip_msg = f"Skipped {len(skipped_ids)} agent-tool calls (max_parallel={max_parallel})"
-            tool_loop_error = tool_loop_error or skip_msg
-            for cid in skipped_ids:
-                tool_results[cid] = CallToolResult(
-                    content=[text_content(skip_msg)],
-                    isError=True,
-                )
-                descriptor_by_id[cid]["status"] = "error"
-                descriptor_by_id[cid]["error_message"] = skip_msg
+            free_slots = asyncio.Queue()
+            for slot in range(1, max_parallel + 1):
+                free_slots.put_nowait(slot)
 
         from fast_agent.event_progress import ProgressAction, ProgressEvent
         from fast_agent.ui.progress_display import (
@@ -1044,7 +1106,7 @@ class AgentsAsToolsAgent(McpAgent):
             instance_name = f"{base_name}[{instance}]"
 
             try:
-                clone = await child.spawn_detached_instance(name=instance_name)
+                clone = await self._acquire_child_instance(child, tool_name, instance)
             except Exception as exc:
                 logger.error(
                     "Failed to spawn dedicated child instance",
@@ -1075,6 +1137,9 @@ class AgentsAsToolsAgent(McpAgent):
                     data={"instance_name": instance_name, "error": str(hist_exc)},
                 )
 
+            usage = getattr(clone, "usage_accumulator", None)
+            usage_start = len(usage.turns) if usage is not None else 0
+            reusable = False
             progress_started = False
             try:
                 outer_progress_display.update(
@@ -1098,21 +1163,15 @@ class AgentsAsToolsAgent(McpAgent):
                 )
                 timeout = self._options.child_timeout_sec
                 if timeout:
-                    return await asyncio.wait_for(call_coro, timeout=timeout)
-                return await call_coro
+                    result = await asyncio.wait_for(call_coro, timeout=timeout)
+                else:
+                    result = await call_coro
+                # Only instances that finished cleanly go back to the warm pool
+                reusable = True
+                return result
             finally:
                 try:
-                    await clone.shutdown()
-                except Exception as shutdown_exc:
-                    logger.warning(
-                        "Error shutting down dedicated child instance",
-                        data={
-                            "instance_name": instance_name,
-                            "error": str(shutdown_exc),
-                        },
-                    )
-                try:
-                    child.merge_usage_from(clone)
+                    child.merge_usage_from(clone, since_turn=usage_start)
                 except Exception as merge_exc:
                     logger.warning(
                         "Failed to merge usage from child instance",
@@ -1152,6 +1211,9 @@ class AgentsAsToolsAgent(McpAgent):
                                 "error": str(merge_hist_exc),
                             },
                         )
+                await self._release_child_instance(
+                    clone, tool_name, instance, reusable=reusable and clone is not child
+                )
                 if progress_started and instance_name:
                     outer_progress_display.update(
                         ProgressEvent(
@@ -1183,25 +1245,31 @@ class AgentsAsToolsAgent(McpAgent):
             show_tool_call_id=show_tool_call_id,
         )
 
+        async def call_in_slot(position: int, correlation_id: str) -> CallToolResult:
+            descriptor = descriptor_by_id[correlation_id]
+            if free_slots is None:
+                return await call_with_instance_name(
+                    descriptor["tool"], descriptor["args"], position, correlation_id
+                )
+            slot = await free_slots.get()
+            try:
+                return await call_with_instance_name(
+                    descriptor["tool"], descriptor["args"], slot, correlation_id
+                )
+            finally:
+                free_slots.put_nowait(slot)
+
         results: list[CallToolResult | BaseException] = []
         if id_list:
             if FORCE_SEQUENTIAL_TOOL_CALLS:
                 for i, cid in enumerate(id_list, 1):
-                    tool_name = descriptor_by_id[cid]["tool"]
-                    tool_args = descriptor_by_id[cid]["args"]
                     try:
-                        results.append(await call_with_instance_name(tool_name, tool_args, i, cid))
+                        results.append(await call_in_slot(i, cid))
                     except Exception as exc:
                         results.append(exc)
             else:
                 results = await gather_with_cancel(
-                    call_with_instance_name(
-                        descriptor_by_id[cid]["tool"],
-                        descriptor_by_id[cid]["args"],
-                        i,
-                        cid,
-                    )
-                    for i, cid in enumerate(id_list, 1)
+                    call_in_slot(i, cid) for i, cid in enumerate(id_list, 1)
                 )
             for i, result in enumerate(results):
                 correlation_id = id_list[i]
@@ -17,6 +17,7 @@ Key concepts from the paper:
 - Red-flagging: Discard suspicious outputs (too long, malformed) before voting
 """
 
+import asyncio
 from collections import defaultdict
 from enum import StrEnum
 from typing import Any, Callable, List, Optional, Tuple, Type
@@ -70,6 +71,10 @@ class MakerResult(BaseModel):
     converged: bool = Field(
         default=False, description="Whether k-margin consensus was achieved"
     )
+    cancelled_samples: int = Field(
+        default=0,
+        description="Concurrent samples abandoned (not tallied) once consensus was reached",
+    )
 
 
 class MakerAgent(LlmAgent):
@@ -104,6 +109,7 @@ class MakerAgent(LlmAgent):
         match_fn: Callable[[str], str] | None = None,
         red_flag_max_length: int | None = None,
         red_flag_validator: Callable[[str], bool] | None = None,
+        parallel_samples: int = 1,
         context: Optional[Any] = None,
         **kwargs,
     ) -> None:
@@ -125,6 +131,9 @@ class MakerAgent(LlmAgent):
                                  with errors.
             red_flag_validator: Custom validator function. Return False to
                                 discard the response (red-flag it).
+            parallel_samples: Number of samples kept in flight at once. 1 samples
+                              sequentially; larger values draw samples concurrently
+                              and cancel the remainder once a winner emerges.
             context: Optional context object
         """
         super().__init__(config, context=context, **kwargs)
@@ -135,6 +144,8 @@ class MakerAgent(LlmAgent):
             raise AgentConfigError("k must be at least 1")
         if max_samples < k:
             raise AgentConfigError("max_samples must be at least k")
+        if parallel_samples < 1:
+            raise AgentConfigError("parallel_samples must be at least 1")
 
         self.worker_agent = worker_agent
         self.k = k
@@ -143,6 +154,7 @@ class MakerAgent(LlmAgent):
         self.match_fn = match_fn
         self.red_flag_max_length = red_flag_max_length
         self.red_flag_validator = red_flag_validator
+        self.parallel_samples = parallel_samples
 
         # Result tracking
         self.last_result: MakerResult | None = None
@@ -227,6 +239,44 @@ class MakerAgent(LlmAgent):
 
         return None
 
+    @staticmethod
+    def _margin(votes: dict[str, int]) -> int:
+        """Return the lead of the top response over the runner-up."""
+        sorted_votes = sorted(votes.values(), reverse=True)
+        return sorted_votes[0] - (sorted_votes[1] if len(sorted_votes) > 1 else 0)
+
+    def _plurality_result(
+        self,
+        votes: dict[str, int],
+        response_map: dict[str, PromptMessageExtended],
+        total_samples: int,
+        discarded_samples: int,
+    ) -> PromptMessageExtended:
+        """Fall back to the most voted response once max_samples is exhausted."""
+        logger.warning(
+            f"MAKER: max_samples ({self.max_samples}) reached without "
+            f"k-margin ({self.k}) consensus, using plurality"
+        )
+
+        if not votes:
+            # All samples were red-flagged
+            raise AgentConfigError(
+                f"All {total_samples} samples were red-flagged. "
+                "Consider relaxing red-flag criteria."
+            )
+
+        winner_key = max(votes, key=lambda x: votes[x])
+        self.last_result = MakerResult(
+            winner=winner_key,
+            votes=dict(votes),
+            total_samples=total_samples,
+            discarded_samples=discarded_samples,
+            margin=self._margin(votes),
+            converged=False,
+        )
+
+        return response_map[winner_key]
+
     async def generate_impl(
         self,
         messages: List[PromptMessageExtended],
@@ -249,6 +299,9 @@ class MakerAgent(LlmAgent):
         """
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Maker: '{self._name}' generate"):
+            if self.parallel_samples > 1:
+                return await self._generate_concurrently(messages, request_params)
+
             votes: dict[str, int] = defaultdict(int)
             response_map: dict[str, PromptMessageExtended] = {}
             total_samples = 0
@@ -291,10 +344,7 @@ class MakerAgent(LlmAgent):
                 # Check for k-margin winner
                 winner_key = self._check_winner(votes)
                 if winner_key:
-                    sorted_votes = sorted(votes.values(), reverse=True)
-                    margin = sorted_votes[0] - (
-                        sorted_votes[1] if len(sorted_votes) > 1 else 0
-                    )
+                    margin = self._margin(votes)
 
                     self.last_result = MakerResult(
                         winner=winner_key,
@@ -312,34 +362,143 @@ class MakerAgent(LlmAgent):
                     return response_map[winner_key]
 
             # Max samples reached - fall back to plurality
-            logger.warning(
-                f"MAKER: max_samples ({self.max_samples}) reached without "
-                f"k-margin ({self.k}) consensus, using plurality"
+            return self._plurality_result(
+                votes, response_map, total_samples, discarded_samples
             )
 
-            if not votes:
-                # All samples were red-flagged
-                raise AgentConfigError(
-                    f"All {total_samples} samples were red-flagged. "
-                    "Consider relaxing red-flag criteria."
-                )
-
-            winner_key = max(votes, key=lambda x: votes[x])
-            sorted_votes = sorted(votes.values(), reverse=True)
-            margin = sorted_votes[0] - (
-                sorted_votes[1] if len(sorted_votes) > 1 else 0
-            )
+    async def _draw_sample(
+        self,
+        messages: List[PromptMessageExtended],
+        request_params: RequestParams,
+        sample: int,
+        current_votes: dict[str, int],
+    ) -> tuple[PromptMessageExtended, bool]:
+        """Draw one concurrent sample, returning the response and its red-flag status."""
+        async with self.workflow_telemetry.start_step(
+            "maker.sample",
+            server_name=self.name,
+            arguments={
+                "agent": self.worker_agent.name,
+                "sample": sample,
+                "current_votes": current_votes,
+            },
+        ) as step:
+            response = await self.worker_agent.generate(messages, request_params)
+            red_flagged = self._is_red_flagged(response.last_text() or "")
+            if red_flagged:
+                await step.finish(False, text=f"Sample {sample} red-flagged, discarded")
+            else:
+                await step.finish(True, text=f"Sample {sample} completed")
+            return response, red_flagged
+
+    async def _generate_concurrently(
+        self,
+        messages: List[PromptMessageExtended],
+        request_params: RequestParams | None,
+    ) -> PromptMessageExtended:
+        """
+        Voting loop that keeps up to parallel_samples worker calls in flight.
 
-            self.last_result = MakerResult(
-                winner=winner_key,
-                votes=dict(votes),
-                total_samples=total_samples,
-                discarded_samples=discarded_samples,
-                margin=margin,
-                converged=False,
-            )
+        Votes are tallied in completion order. Once a response reaches a
+        k-margin, samples still in flight are cancelled and any completed but
+        untallied samples are reported as cancelled in the MakerResult.
 
-            return response_map[winner_key]
+        Samples share one worker, so each is drawn with use_history=False over
+        a snapshot of the worker's history; when the worker keeps history, only
+        the selected turn is appended once voting ends.
+        """
+        keep_history = (
+            request_params.use_history
+            if request_params is not None and "use_history" in request_params.model_fields_set
+            else self.worker_agent.config.use_history
+        )
+        sample_params = (
+            request_params.model_copy(update={"use_history": False})
+            if request_params is not None
+            else RequestParams(use_history=False)
+        )
+        sample_messages = list(messages)
+        if keep_history:
+            history = self.worker_agent.message_history
+            start = 0
+            while start < len(history) and history[start].is_template:
+                start += 1
+            sample_messages = [*history[start:], *messages]
+
+        response = await self._vote_concurrently(sample_messages, sample_params)
+        if keep_history and isinstance(self.worker_agent, LlmAgent):
+            self.worker_agent.append_history([*messages, response])
+        return response
+
+    async def _vote_concurrently(
+        self,
+        messages: List[PromptMessageExtended],
+        request_params: RequestParams,
+    ) -> PromptMessageExtended:
+        """Run the concurrent voting loop over already-isolated sample inputs."""
+        votes: dict[str, int] = defaultdict(int)
+        response_map: dict[str, PromptMessageExtended] = {}
+        total_samples = 0
+        discarded_samples = 0
+        launched = 0
+        pending: dict[asyncio.Task[tuple[PromptMessageExtended, bool]], int] = {}
+
+        try:
+            while True:
+                while launched < self.max_samples and len(pending) < self.parallel_samples:
+                    launched += 1
+                    task = asyncio.create_task(
+                        self._draw_sample(messages, request_params, launched, dict(votes))
+                    )
+                    pending[task] = launched
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Tally in launch order so concurrent completions resolve deterministically
+                for task in sorted(done, key=pending.__getitem__):
+                    del pending[task]
+                    response, red_flagged = task.result()
+                    total_samples += 1
+                    if red_flagged:
+                        discarded_samples += 1
+                        continue
+
+                    normalized = self._normalize_response(response.last_text() or "")
+                    votes[normalized] += 1
+                    response_map[normalized] = response
+
+                    winner_key = self._check_winner(votes)
+                    if not winner_key:
+                        continue
+
+                    cancelled_samples = launched - total_samples
+                    margin = self._margin(votes)
+                    self.last_result = MakerResult(
+                        winner=winner_key,
+                        votes=dict(votes),
+                        total_samples=total_samples,
+                        discarded_samples=discarded_samples,
+                        margin=margin,
+                        converged=True,
+                        cancelled_samples=cancelled_samples,
+                    )
+
+                    logger.debug(
+                        f"MAKER converged: {votes[winner_key]} votes, "
+                        f"margin {margin}, {total_samples} samples, "
+                        f"{cancelled_samples} cancelled"
+                    )
+                    return response_map[winner_key]
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Max samples reached - fall back to plurality
+        return self._plurality_result(votes, response_map, total_samples, discarded_samples)
 
     async def structured_impl(
         self,
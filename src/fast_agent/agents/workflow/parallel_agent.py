@@ -1,5 +1,8 @@
 import asyncio
-from typing import Any, List, Optional, Tuple
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import List, Literal, Optional, Tuple
 
 from mcp import Tool
 from mcp.types import TextContent
@@ -7,6 +10,7 @@ from opentelemetry import trace
 
 from fast_agent.agents.agent_types import AgentConfig, AgentType
 from fast_agent.agents.llm_agent import LlmAgent
+from fast_agent.core.exceptions import AgentConfigError
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.interfaces import AgentProtocol, ModelT
 from fast_agent.types import PromptMessageExtended, RequestParams
@@ -14,6 +18,39 @@ from fast_agent.types import PromptMessageExtended, RequestParams
 logger = get_logger(__name__)
 
 
+class FanInMode(StrEnum):
+    """
+    When the fan-in agent starts aggregating fan-out results.
+
+    - ALL: Wait for every fan-out agent (default)
+    - FIRST_N: Aggregate as soon as ``fan_in_count`` agents have responded
+    - DEADLINE: Aggregate whatever has arrived once ``fan_out_timeout`` elapses
+    - ARRIVAL_ORDER: Wait for every fan-out agent (or ``fan_out_timeout``), reporting
+      progress as each responds, and list responses in the order they arrived
+
+    None of the modes feed the fan-in agent before collection ends; aggregation is a
+    single fan-in call over the collected responses.
+    """
+
+    ALL = "all"
+    FIRST_N = "first_n"
+    DEADLINE = "deadline"
+    ARRIVAL_ORDER = "arrival_order"
+
+
+FanOutStatus = Literal["completed", "cancelled", "timed_out"]
+
+
+@dataclass(slots=True)
+class FanOutBranch:
+    """Outcome of a single fan-out agent for one request."""
+
+    agent_name: str
+    status: FanOutStatus
+    latency_ms: float
+    response: PromptMessageExtended | None = None
+
+
 class ParallelAgent(LlmAgent):
     """
     LLMs can sometimes work simultaneously on a task (fan-out)
@@ -33,6 +70,9 @@ class ParallelAgent(LlmAgent):
         fan_in_agent: AgentProtocol,
         fan_out_agents: List[AgentProtocol],
         include_request: bool = True,
+        fan_in_mode: FanInMode = FanInMode.ALL,
+        fan_in_count: int | None = None,
+        fan_out_timeout: float | None = None,
         **kwargs,
     ) -> None:
         """
@@ -43,12 +83,34 @@ class ParallelAgent(LlmAgent):
             fan_in_agent: Agent that aggregates results from fan-out agents
             fan_out_agents: List of agents to execute in parallel
             include_request: Whether to include the original request in the aggregation
+            fan_in_mode: When aggregation starts (see FanInMode)
+            fan_in_count: Responses required before aggregating in FIRST_N mode
+            fan_out_timeout: Seconds to wait for fan-out agents. Required for DEADLINE,
+                             an optional upper bound for FIRST_N and ARRIVAL_ORDER.
             **kwargs: Additional keyword arguments to pass to BaseAgent
         """
         super().__init__(config, **kwargs)
+        fan_in_mode = FanInMode(fan_in_mode)
+        if fan_in_mode == FanInMode.FIRST_N and not (
+            fan_in_count is not None and 1 <= fan_in_count <= len(fan_out_agents)
+        ):
+            raise AgentConfigError(
+                f"fan_in_count must be between 1 and {len(fan_out_agents)} for first_n fan-in"
+            )
+        if fan_out_timeout is not None and fan_out_timeout <= 0:
+            raise AgentConfigError("fan_out_timeout must be > 0")
+        if fan_in_mode == FanInMode.DEADLINE and fan_out_timeout is None:
+            raise AgentConfigError("fan_out_timeout is required for deadline fan-in")
+        if fan_in_mode == FanInMode.ALL and fan_out_timeout is not None:
+            raise AgentConfigError("fan_out_timeout requires a fan_in_mode other than 'all'")
+
         self.fan_in_agent = fan_in_agent
         self.fan_out_agents = fan_out_agents
         self.include_request = include_request
+        self.fan_in_mode = fan_in_mode
+        self.fan_in_count = fan_in_count
+        self.fan_out_timeout = fan_out_timeout
+        self.last_fan_out: List[FanOutBranch] = []
 
     async def generate_impl(
         self,
@@ -69,20 +131,13 @@ class ParallelAgent(LlmAgent):
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Parallel: '{self._name}' generate"):
-            responses: List[PromptMessageExtended] = await self._execute_fan_out(
-                messages, request_params
-            )
+            branches = await self._execute_fan_out(messages, request_params)
 
             # Extract the received message from the input
             received_message: Optional[str] = messages[-1].all_text() if messages else None
 
-            # Convert responses to strings for aggregation
-            string_responses = []
-            for response in responses:
-                string_responses.append(response.all_text())
-
             # Format the responses and send to the fan-in agent
-            aggregated_prompt = self._format_responses(string_responses, received_message)
+            aggregated_prompt = self._format_responses(branches, received_message)
 
             # Create a new multipart message with the formatted responses
             formatted_prompt = PromptMessageExtended(
@@ -92,12 +147,14 @@ class ParallelAgent(LlmAgent):
             # Use the fan-in agent to aggregate the responses
             return await self._fan_in_generate(formatted_prompt, request_params)
 
-    def _format_responses(self, responses: List[Any], message: Optional[str] = None) -> str:
+    def _format_responses(
+        self, branches: List[FanOutBranch], message: Optional[str] = None
+    ) -> str:
         """
-        Format a list of responses for the fan-in agent.
+        Format fan-out results for the fan-in agent.
 
         Args:
-            responses: List of responses from fan-out agents
+            branches: Fan-out outcomes; stragglers are listed with their status
             message: Optional original message that was sent to the agents
 
         Returns:
@@ -111,10 +168,15 @@ class ParallelAgent(LlmAgent):
             formatted.append(f"<fastagent:request>\n{message}\n</fastagent:request>")
 
         # Format each agent's response
-        for i, response in enumerate(responses):
-            agent_name = self.fan_out_agents[i].name
+        for branch in branches:
+            if branch.response is None:
+                formatted.append(
+                    f'<fastagent:response agent="{branch.agent_name}" status="{branch.status}"/>'
+                )
+                continue
             formatted.append(
-                f'<fastagent:response agent="{agent_name}">\n{response}\n</fastagent:response>'
+                f'<fastagent:response agent="{branch.agent_name}">\n'
+                f"{branch.response.all_text()}\n</fastagent:response>"
             )
         return "\n\n".join(formatted)
 
@@ -140,18 +202,13 @@ class ParallelAgent(LlmAgent):
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span(f"Parallel: '{self._name}' generate"):
-            responses: List[PromptMessageExtended] = await self._execute_fan_out(
-                messages, request_params
-            )
+            branches = await self._execute_fan_out(messages, request_params)
 
             # Extract the received message
             received_message: Optional[str] = messages[-1].all_text() if messages else None
 
-            # Convert responses to strings
-            string_responses = [response.all_text() for response in responses]
-
             # Format the responses for the fan-in agent
-            aggregated_prompt = self._format_responses(string_responses, received_message)
+            aggregated_prompt = self._format_responses(branches, received_message)
 
             # Create a multipart message
             formatted_prompt = PromptMessageExtended(
@@ -197,22 +254,122 @@ class ParallelAgent(LlmAgent):
         self,
         messages: List[PromptMessageExtended],
         request_params: Optional[RequestParams],
-    ) -> List[PromptMessageExtended]:
+    ) -> List[FanOutBranch]:
         """
         Run fan-out agents with telemetry so transports can surface progress.
+
+        Depending on ``fan_in_mode`` this returns before every agent has responded;
+        agents still running are cancelled and reported with a straggler status.
+        Each branch step reports its latency when it finishes or is cancelled.
         """
+        started = time.perf_counter()
+        branches: dict[int, FanOutBranch] = {}
+        straggler_status: FanOutStatus = "cancelled"
+
+        def _elapsed_ms() -> float:
+            return (time.perf_counter() - started) * 1000
 
-        async def _run_agent(agent: AgentProtocol) -> PromptMessageExtended:
+        async def _run_agent(index: int, agent: AgentProtocol) -> PromptMessageExtended:
             async with self.workflow_telemetry.start_step(
                 "parallel.fan_out",
                 server_name=self.name,
                 arguments={"agent": agent.name},
             ) as step:
-                result = await agent.generate(messages, request_params)
-                await step.finish(True, text=f"{agent.name} completed fan-out work")
+                try:
+                    result = await agent.generate(messages, request_params)
+                except asyncio.CancelledError:
+                    latency_ms = _elapsed_ms()
+                    branches[index] = FanOutBranch(agent.name, straggler_status, latency_ms)
+                    await step.finish(
+                        False,
+                        error=f"{agent.name} {straggler_status} after {latency_ms / 1000:.2f}s",
+                    )
+                    raise
+                latency_ms = _elapsed_ms()
+                branches[index] = FanOutBranch(agent.name, "completed", latency_ms, result)
+                await step.finish(
+                    True,
+                    text=f"{agent.name} completed fan-out work in {latency_ms / 1000:.2f}s",
+                )
                 return result
 
-        return await asyncio.gather(*[_run_agent(agent) for agent in self.fan_out_agents])
+        if self.fan_in_mode == FanInMode.ALL:
+            await asyncio.gather(
+                *[_run_agent(i, agent) for i, agent in enumerate(self.fan_out_agents)]
+            )
+            self.last_fan_out = [branches[i] for i in range(len(self.fan_out_agents))]
+            return self.last_fan_out
+
+        required = (
+            self.fan_in_count
+            if self.fan_in_mode == FanInMode.FIRST_N and self.fan_in_count is not None
+            else len(self.fan_out_agents)
+        )
+        deadline = None if self.fan_out_timeout is None else started + self.fan_out_timeout
+        tasks = [
+            asyncio.create_task(_run_agent(i, agent))
+            for i, agent in enumerate(self.fan_out_agents)
+        ]
+        pending: set[asyncio.Task[PromptMessageExtended]] = set(tasks)
+        arrival_order: List[int] = []
+        try:
+            async with self.workflow_telemetry.start_step(
+                "parallel.fan_in_collect",
+                server_name=self.name,
+                arguments={"mode": self.fan_in_mode.value, "required": required},
+            ) as collect_step:
+                while pending and len(arrival_order) < required:
+                    timeout = None if deadline is None else deadline - time.perf_counter()
+                    if timeout is not None and timeout <= 0:
+                        straggler_status = "timed_out"
+                        break
+                    done, pending = await asyncio.wait(
+                        pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        straggler_status = "timed_out"
+                        break
+                    # Surface branch failures the same way gather() does
+                    for task in tasks:
+                        if task in done:
+                            task.result()
+                            arrival_order.append(tasks.index(task))
+                    if self.fan_in_mode == FanInMode.ARRIVAL_ORDER:
+                        await collect_step.update(
+                            message=", ".join(
+                                branches[i].agent_name for i in arrival_order
+                            )
+                            + " responded",
+                            progress=len(arrival_order),
+                            total=len(tasks),
+                        )
+                await collect_step.finish(
+                    True,
+                    text=f"{len(arrival_order)}/{len(tasks)} fan-out agents responded",
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not arrival_order:
+            logger.warning(
+                "No fan-out agent responded before the deadline",
+                data={"agent_name": self.name, "fan_out_timeout": self.fan_out_timeout},
+            )
+
+        if self.fan_in_mode == FanInMode.ARRIVAL_ORDER:
+            order = arrival_order + [i for i in range(len(tasks)) if i not in arrival_order]
+        else:
+            order = list(range(len(tasks)))
+        # A branch cancelled before it started never recorded its own outcome
+        self.last_fan_out = [
+            branches.get(i)
+            or FanOutBranch(self.fan_out_agents[i].name, straggler_status, _elapsed_ms())
+            for i in order
+        ]
+        return self.last_fan_out
 
     async def _fan_in_generate(
         self,
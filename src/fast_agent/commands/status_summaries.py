@@ -15,6 +15,7 @@ from fast_agent.commands.protocols import (
 from fast_agent.constants import FAST_AGENT_ERROR_CHANNEL
 from fast_agent.llm.model_display_name import resolve_llm_display_name
 from fast_agent.llm.model_info import ModelInfo
+from fast_agent.llm.token_counting import get_token_counter, message_parts
 from fast_agent.mcp.helpers.content_helpers import get_text
 from fast_agent.types.conversation_summary import ConversationSummary
 
@@ -233,16 +234,10 @@ def _context_usage_line(summary: ConversationSummary, agent: "AgentProtocol") ->
 def _estimate_tokens(
     summary: ConversationSummary, agent: "AgentProtocol"
 ) -> tuple[int, int]:
-    text_parts: list[str] = []
-    for message in summary.messages:
-        for content in message.content:
-            text = get_text(content)
-            if text:
-                text_parts.append(text)
-
-    combined = "\n".join(text_parts)
-    char_count = len(combined)
-    if not combined:
+    char_count = sum(
+        len(text) for message in summary.messages for text in message_parts(message)[0]
+    )
+    if not char_count:
         return 0, 0
 
     model_name = None
@@ -250,24 +245,10 @@ def _estimate_tokens(
     if llm:
         model_name = llm.model_name
 
-    token_count = _count_tokens_with_tiktoken(combined, model_name)
+    token_count = get_token_counter().count_messages(summary.messages, model_name)
     return token_count, char_count
 
 
-def _count_tokens_with_tiktoken(text: str, model_name: str | None) -> int:
-    try:
-        import tiktoken
-
-        if model_name:
-            encoding = tiktoken.encoding_for_model(model_name)
-        else:
-            encoding = tiktoken.get_encoding("cl100k_base")
-
-        return len(encoding.encode(text))
-    except Exception:
-        return max(1, (len(text) + 3) // 4)
-
-
 def build_conversation_stats_summary(
     agent: "AgentProtocol | None",
     *,
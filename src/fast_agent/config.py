@@ -186,6 +186,22 @@ class ShellSettings(BaseModel):
         default=None,
         description="Override model-based output byte limit (None = auto)",
     )
+    output_tail_fraction: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Share of the output byte limit kept from the end of output that overflows it "
+            "(the rest keeps the start; 0 = keep only the start)"
+        ),
+    )
+    output_spill: bool = Field(
+        default=False,
+        description=(
+            "Write the full output of commands that exceed the byte limit to a temporary file "
+            "the agent can read in pages"
+        ),
+    )
     missing_cwd_policy: Literal["ask", "create", "warn", "error"] = Field(
         default="warn",
         description="Policy when an agent shell cwd is missing or invalid",
@@ -436,6 +452,13 @@ class MCPSettings(BaseModel):
     """Configuration for all MCP servers."""
 
     servers: dict[str, MCPServerSettings] = {}
+
+    startup_concurrency: int = 8
+    """Maximum number of MCP servers an agent attaches concurrently at startup."""
+
+    startup_deadline_seconds: float | None = None
+    """Deadline for attaching each server at startup (connect and discovery). None disables it."""
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
     @classmethod
@@ -679,6 +702,13 @@ class AnthropicSettings(BaseModel):
         default="5m",
         description="Cache TTL: 5m (standard) or 1h (extended, additional cost)",
     )
+    cache_placement: Literal["stable", "sliding"] = Field(
+        default="stable",
+        description=(
+            "Conversation cache breakpoints: stable (keep placed breakpoints as history "
+            "grows) or sliding (recompute from scratch each request)"
+        ),
+    )
     reasoning: ReasoningEffortSetting | str | int | bool | None = Field(
         default=None,
         description=(
@@ -1054,6 +1084,90 @@ class HuggingFaceSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class RateLimitSettings(BaseModel):
+    """Shared request/token budget for one provider (applied per API key)."""
+
+    requests_per_minute: int | None = None
+    """Maximum requests per minute across all agents in the process."""
+
+    tokens_per_minute: int | None = None
+    """Maximum (estimated) tokens per minute across all agents in the process."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class HistoryCompactionSettings(BaseModel):
+    """Token-budget compaction of the conversation history sent with each request."""
+
+    enabled: bool = True
+    """Compact old turns when a request approaches the model's context window (default: True)."""
+
+    max_context_fraction: float = Field(default=0.8, gt=0, le=1)
+    """Compact when a request is estimated above this fraction of the context window (default: 0.8)."""
+
+    compact_to_fraction: float = Field(default=0.6, gt=0, le=1)
+    """Fraction of the context window to compact down to, so later requests reuse the prefix (default: 0.6)."""
+
+    preserve_recent_turns: int = Field(default=2, ge=1)
+    """Number of most recent turns that are never compacted (default: 2)."""
+
+    tool_result_keep_chars: int = Field(default=2000, ge=0)
+    """Characters of each compacted tool output kept ahead of the elision note (default: 2000)."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class InstancePoolSettings(BaseModel):
+    """Reuse of agent instances between requests when serving with ``--instance-scope request``."""
+
+    enabled: bool = True
+    """Reset and reuse instances instead of building one per request (default: True)."""
+
+    min_size: int = Field(default=1, ge=0)
+    """Instances kept built ahead of demand (default: 1)."""
+
+    max_size: int = Field(default=8, ge=1)
+    """Maximum instances kept by the pool; busier periods use one-off instances (default: 8)."""
+
+    max_reuse: int = Field(default=100, ge=1)
+    """Requests served by an instance before it is rebuilt (default: 100)."""
+
+    idle_ttl_seconds: float | None = Field(default=300.0, gt=0)
+    """Seconds an idle instance above ``min_size`` is kept; None keeps them (default: 300)."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class AdmissionSettings(BaseModel):
+    """Per-agent admission control when serving with ``--instance-scope shared``."""
+
+    enabled: bool = True
+    """Limit concurrent and queued requests per agent (default: True)."""
+
+    max_concurrent_per_agent: int = Field(default=1, ge=1)
+    """Requests an agent runs at once; 1 keeps its shared history consistent (default: 1)."""
+
+    max_queue_per_agent: int = Field(default=32, ge=0)
+    """Requests that may wait for an agent before new ones are rejected (default: 32)."""
+
+    max_wait_seconds: float | None = Field(default=60.0, gt=0)
+    """Seconds a request may wait for an agent before it is rejected; None waits indefinitely (default: 60)."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+class ACPSettings(BaseModel):
+    """Agent Client Protocol server settings."""
+
+    history_replay_messages: int = Field(default=200, ge=0)
+    """Most recent messages replayed to the client on session/load; 0 replays all (default: 200)."""
+
+    history_replay_page_size: int = Field(default=50, ge=1)
+    """Updates sent together before yielding to other work during replay (default: 50)."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
 class LoggerSettings(BaseModel):
     """
     Logger settings for the fast-agent application.
@@ -1070,6 +1184,18 @@ class LoggerSettings(BaseModel):
     path: str = "fastagent.jsonl"
     """Path to log file, if logger 'type' is 'file'."""
 
+    write_behind: bool = False
+    """Buffer file log lines and write them in batches off the event loop"""
+
+    max_file_bytes: int | None = None
+    """Rotate the log file once it would grow past this size (bytes)"""
+
+    backup_count: int = 5
+    """Number of rotated log files to keep"""
+
+    compress_rotated: bool = False
+    """Gzip rotated log files"""
+
     batch_size: int = 100
     """Number of events to accumulate before processing"""
 
@@ -1089,6 +1215,15 @@ class LoggerSettings(BaseModel):
     http_timeout: float = 5.0
     """HTTP timeout seconds for event transport"""
 
+    http_max_queue_size: int = 10000
+    """Events buffered for the HTTP transport before the oldest are dropped"""
+
+    http_max_retries: int = 3
+    """Retries for a batch rejected with a 5xx status or a connection error"""
+
+    http_compress: bool = True
+    """Gzip HTTP transport request bodies"""
+
     show_chat: bool = True
     """Show chat User/Assistant on the console"""
     show_tools: bool = True
@@ -1372,12 +1507,18 @@ class Settings(BaseSettings):
     auto_sampling: bool = True
     """Enable automatic sampling model selection if not explicitly configured"""
 
+    agent_startup_concurrency: int = 8
+    """Maximum number of agents in a dependency group that are built concurrently (default: 8)."""
+
     session_history: bool = True
     """Persist session history in the environment sessions folder (default: True)."""
 
     session_history_window: int = 20
     """Maximum number of sessions to keep in the rolling window (default: 20)."""
 
+    session_history_journal: bool = True
+    """Append new session history messages to a journal instead of rewriting the file (default: True)."""
+
     anthropic: AnthropicSettings | None = None
     """Settings for using Anthropic models in the fast-agent application"""
 
@@ -1456,6 +1597,24 @@ class Settings(BaseSettings):
     shell_execution: ShellSettings = ShellSettings()
     """Shell execution timeout and warning settings."""
 
+    rate_limits: dict[str, RateLimitSettings] = {}
+    """
+    Process-wide rate limits keyed by provider name (e.g. "anthropic", "openai").
+    Agents sharing a provider and API key draw from the same request and token buckets.
+    """
+
+    history_compaction: HistoryCompactionSettings = HistoryCompactionSettings()
+    """Token-budget compaction of the history sent to the model."""
+
+    instance_pool: InstancePoolSettings = InstancePoolSettings()
+    """Agent instance pool used by request-scoped servers."""
+
+    admission: AdmissionSettings = AdmissionSettings()
+    """Per-agent admission control used by shared-scope servers."""
+
+    acp: ACPSettings = ACPSettings()
+    """Agent Client Protocol server settings."""
+
     llm_retries: int = 1
     """
     Number of times to retry transient LLM API errors.
@@ -182,6 +182,7 @@ async def configure_logger(config: "Settings") -> None:
         transport=transport,
         batch_size=settings.batch_size,
         flush_interval=settings.flush_interval,
+        max_queue_size=settings.max_queue_size,
         progress_display=settings.progress_display,
     )
 
@@ -242,6 +243,11 @@ async def cleanup_context() -> None:
     Cleanup the global application context.
     """
 
+    # Let queued session history/metadata writes land before shutting down
+    from fast_agent.session.persistence import flush_session_writes
+
+    await flush_session_writes()
+
     # Shutdown logging and telemetry
     await LoggingConfig.shutdown()
 
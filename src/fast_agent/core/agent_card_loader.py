@@ -461,6 +461,17 @@ def _build_agent_data(
         agent_data["include_request"] = _ensure_bool(
             raw.get("include_request"), "include_request", path, default=True
         )
+        agent_data["fan_in_mode"] = _ensure_str(
+            raw.get("fan_in_mode", "all"), "fan_in_mode", path
+        )
+        fan_in_count = raw.get("fan_in_count")
+        if fan_in_count is not None:
+            fan_in_count = _ensure_int(fan_in_count, "fan_in_count", path)
+        agent_data["fan_in_count"] = fan_in_count
+        fan_out_timeout = raw.get("fan_out_timeout")
+        if fan_out_timeout is not None:
+            fan_out_timeout = _ensure_float(fan_out_timeout, "fan_out_timeout", path)
+        agent_data["fan_out_timeout"] = fan_out_timeout
     elif type_key == "evaluator_optimizer":
         agent_data["generator"] = _ensure_str(raw.get("generator"), "generator", path)
         agent_data["evaluator"] = _ensure_str(raw.get("evaluator"), "evaluator", path)
@@ -500,6 +511,9 @@ def _build_agent_data(
         if red_flag is not None:
             red_flag = _ensure_int(red_flag, "red_flag_max_length", path)
         agent_data["red_flag_max_length"] = red_flag
+        agent_data["parallel_samples"] = _ensure_int(
+            raw.get("parallel_samples", 1), "parallel_samples", path
+        )
 
     return agent_data
 
@@ -676,6 +690,7 @@ def _agents_as_tools_options(raw: dict[str, Any], path: Path) -> dict[str, Any]:
     max_parallel = raw.get("max_parallel")
     child_timeout_sec = raw.get("child_timeout_sec")
     max_display_instances = raw.get("max_display_instances")
+    reuse_instances = raw.get("reuse_instances")
 
     if history_source is not None:
         options["history_source"] = _ensure_optional_str(
@@ -695,6 +710,8 @@ def _agents_as_tools_options(raw: dict[str, Any], path: Path) -> dict[str, Any]:
         options["max_display_instances"] = _ensure_int(
             max_display_instances, "max_display_instances", path
         )
+    if reuse_instances is not None:
+        options["reuse_instances"] = _ensure_bool(reuse_instances, "reuse_instances", path)
     return options
 
 
@@ -935,6 +952,10 @@ def _serialize_agents_as_tools_options(card: dict[str, Any], options: object) ->
     if max_display_instances is not None:
         card["max_display_instances"] = max_display_instances
 
+    reuse_instances = options.get("reuse_instances")
+    if reuse_instances is not None:
+        card["reuse_instances"] = reuse_instances
+
 
 def _serialize_chain_fields(
     card: dict[str, Any],
@@ -961,6 +982,18 @@ def _serialize_parallel_fields(
     if include_request is False:
         card["include_request"] = False
 
+    fan_in_mode = agent_data.get("fan_in_mode", "all")
+    if fan_in_mode != "all":
+        card["fan_in_mode"] = fan_in_mode
+
+    fan_in_count = agent_data.get("fan_in_count")
+    if fan_in_count is not None:
+        card["fan_in_count"] = fan_in_count
+
+    fan_out_timeout = agent_data.get("fan_out_timeout")
+    if fan_out_timeout is not None:
+        card["fan_out_timeout"] = fan_out_timeout
+
 
 def _serialize_evaluator_optimizer_fields(
     card: dict[str, Any],
@@ -1019,6 +1052,10 @@ def _serialize_maker_fields(
     if red_flag is not None:
         card["red_flag_max_length"] = red_flag
 
+    parallel_samples = agent_data.get("parallel_samples", 1)
+    if parallel_samples != 1:
+        card["parallel_samples"] = parallel_samples
+
 
 _CARD_SERIALIZERS: dict[CardType, CardTypeSerializer] = {
     "agent": _serialize_agent_like_fields,
@@ -63,6 +63,7 @@ AGENT_CARD_FIELDS = {
     "max_parallel",
     "child_timeout_sec",
     "max_display_instances",
+    "reuse_instances",
     "function_tools",
     "tool_hooks",
     "lifecycle_hooks",
@@ -86,6 +87,9 @@ ALLOWED_FIELDS_BY_TYPE: dict[CardType, set[str]] = {
         "fan_out",
         "fan_in",
         "include_request",
+        "fan_in_mode",
+        "fan_in_count",
+        "fan_out_timeout",
     },
     "evaluator_optimizer": {
         *COMMON_CARD_FIELDS,
@@ -138,6 +142,7 @@ ALLOWED_FIELDS_BY_TYPE: dict[CardType, set[str]] = {
         "max_samples",
         "match_strategy",
         "red_flag_max_length",
+        "parallel_samples",
         "messages",
     },
 }
@@ -28,6 +28,9 @@ class AgentCardData(TypedDict, total=False):
     fan_out: list[str]
     fan_in: str | None
     include_request: bool
+    fan_in_mode: str
+    fan_in_count: int | None
+    fan_out_timeout: float | None
     generator: str
     evaluator: str
     min_rating: str
@@ -42,5 +45,6 @@ class AgentCardData(TypedDict, total=False):
     max_samples: int
     match_strategy: str
     red_flag_max_length: int | None
+    parallel_samples: int
     agent_class: type | None
     cls: type | None
@@ -308,6 +308,7 @@ class DecoratorMixin:
         max_parallel: int | None = None,
         child_timeout_sec: int | None = None,
         max_display_instances: int | None = None,
+        reuse_instances: bool | None = None,
     ) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
         """
         Decorator to create and register a standard agent with type-safe signature.
@@ -362,6 +363,7 @@ class DecoratorMixin:
                 "max_parallel": max_parallel,
                 "child_timeout_sec": child_timeout_sec,
                 "max_display_instances": max_display_instances,
+                "reuse_instances": reuse_instances,
             },
         )
 
@@ -390,6 +392,7 @@ class DecoratorMixin:
         max_parallel: int | None = None,
         child_timeout_sec: int | None = None,
         max_display_instances: int | None = None,
+        reuse_instances: bool | None = None,
     ) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
         """Decorator to create and register a smart agent."""
         final_instruction_raw = (
@@ -422,6 +425,7 @@ class DecoratorMixin:
                 "max_parallel": max_parallel,
                 "child_timeout_sec": child_timeout_sec,
                 "max_display_instances": max_display_instances,
+                "reuse_instances": reuse_instances,
             },
         )
 
@@ -711,6 +715,9 @@ class DecoratorMixin:
         fan_in: str | None = None,
         instruction: str | Path | AnyUrl | None = None,
         include_request: bool = True,
+        fan_in_mode: str = "all",
+        fan_in_count: int | None = None,
+        fan_out_timeout: float | None = None,
         default: bool = False,
     ) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
         """
@@ -722,6 +729,16 @@ class DecoratorMixin:
             fan_in: Agent to aggregate results
             instruction: Base instruction for the parallel agent
             include_request: Whether to include the original request when aggregating
+            fan_in_mode: When aggregation starts:
+                - "all": Wait for every fan-out agent (default)
+                - "first_n": Start once fan_in_count agents have responded
+                - "deadline": Start once fan_out_timeout seconds have elapsed
+                - "arrival_order": Wait for every agent (or fan_out_timeout), reporting
+                  progress as each responds; responses are listed in arrival order
+                Fan-out agents still running when aggregation starts are cancelled.
+            fan_in_count: Number of responses to wait for in "first_n" mode
+            fan_out_timeout: Seconds to wait for fan-out agents ("deadline" mode, or
+                an upper bound for "first_n"/"arrival_order")
             default: Whether to mark this as the default agent
 
         Returns:
@@ -742,6 +759,9 @@ class DecoratorMixin:
             fan_in=fan_in,
             fan_out=fan_out,
             include_request=include_request,
+            fan_in_mode=fan_in_mode,
+            fan_in_count=fan_in_count,
+            fan_out_timeout=fan_out_timeout,
             default=default,
         )
 
@@ -804,6 +824,7 @@ class DecoratorMixin:
         max_samples: int = 50,
         match_strategy: str = "exact",
         red_flag_max_length: int | None = None,
+        parallel_samples: int = 1,
         instruction: str | Path | AnyUrl | None = None,
         default: bool = False,
     ) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
@@ -834,6 +855,9 @@ class DecoratorMixin:
             red_flag_max_length: Discard responses longer than this (characters).
                                  Per the paper, overly long responses correlate
                                  with errors. None = no length limit.
+            parallel_samples: Number of worker samples drawn concurrently. 1 (default)
+                              samples sequentially; larger values cut wall-clock
+                              latency and cancel in-flight samples once a winner emerges.
             instruction: Base instruction for the MAKER agent
             default: Whether to mark this as the default agent
 
@@ -866,5 +890,6 @@ class DecoratorMixin:
             max_samples=max_samples,
             match_strategy=match_strategy,
             red_flag_max_length=red_flag_max_length,
+            parallel_samples=parallel_samples,
             default=default,
         )
@@ -3,6 +3,7 @@ Direct factory functions for creating agent and workflow instances without proxi
 Implements type-safe factories with improved error handling.
 """
 
+import asyncio
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -18,7 +19,7 @@ from fast_agent.agents.workflow.evaluator_optimizer import (
     QualityRating,
 )
 from fast_agent.agents.workflow.iterative_planner import IterativePlanner
-from fast_agent.agents.workflow.parallel_agent import ParallelAgent
+from fast_agent.agents.workflow.parallel_agent import FanInMode, ParallelAgent
 from fast_agent.agents.workflow.router_agent import RouterAgent
 from fast_agent.context import Context
 from fast_agent.core import Core
@@ -47,6 +48,7 @@ from fast_agent.mcp.ui_agent import McpAgentWithUI
 from fast_agent.tools.function_tool_loader import load_function_tools
 from fast_agent.tools.hook_loader import load_tool_runner_hooks
 from fast_agent.types import RequestParams
+from fast_agent.utils.async_utils import gather_with_cancel
 
 # Type aliases for improved readability and IDE support
 AgentDict = dict[str, AgentProtocol]
@@ -778,6 +780,9 @@ async def _create_parallel_workflow_agent(
         fan_in_agent=fan_in_agent,
         fan_out_agents=fan_out_agents,
         include_request=agent_data.get("include_request", True),
+        fan_in_mode=FanInMode(agent_data.get("fan_in_mode", "all")),
+        fan_in_count=agent_data.get("fan_in_count"),
+        fan_out_timeout=agent_data.get("fan_out_timeout"),
     )
     await parallel.initialize()
     result_agents[name] = parallel
@@ -892,6 +897,7 @@ async def _create_maker_agent(
         max_samples=agent_data.get("max_samples", 50),
         match_strategy=MatchStrategy(agent_data.get("match_strategy", "exact")),
         red_flag_max_length=agent_data.get("red_flag_max_length"),
+        parallel_samples=agent_data.get("parallel_samples", 1),
     )
     await maker_agent.initialize()
     result_agents[name] = maker_agent
@@ -912,6 +918,86 @@ _AGENT_TYPE_BUILDERS: dict[AgentType, AgentTypeBuilder] = {
 }
 
 
+def _agent_startup_concurrency(app_instance: CoreContextProtocol) -> int:
+    """Maximum number of agents built at once, from the ``agent_startup_concurrency`` setting."""
+    context = getattr(app_instance, "context", None)
+    config = getattr(context, "config", None) if context else None
+    concurrency = getattr(config, "agent_startup_concurrency", None) or 8
+    return max(1, int(concurrency))
+
+
+def _build_context(
+    app_instance: CoreContextProtocol,
+    agents_dict: AgentConfigDict,
+    model_factory_func: ModelFactoryFunctionProtocol,
+    active_agents: AgentDict,
+) -> AgentBuildContext:
+    session_history_enabled = True
+    if app_instance.context and app_instance.context.config:
+        session_history_enabled = getattr(app_instance.context.config, "session_history", True)
+    return AgentBuildContext(
+        app_instance=app_instance,
+        agents_dict=agents_dict,
+        active_agents=active_agents,
+        model_factory_func=model_factory_func,
+        session_history_enabled=session_history_enabled,
+    )
+
+
+async def _shutdown_agents(agents: AgentDict) -> None:
+    for name, agent in agents.items():
+        try:
+            await agent.shutdown()
+        except Exception as exc:
+            logger.warning(
+                "Failed to shut down agent after startup failure",
+                data={"agent_name": name, "error": str(exc)},
+            )
+
+
+async def _build_agents_concurrently(
+    build_ctx: AgentBuildContext,
+    entries: Sequence[tuple[AgentType, str, Mapping[str, Any]]],
+    concurrency: int,
+) -> AgentDict:
+    """
+    Build independent agents concurrently and return them in ``entries`` order.
+
+    Each builder writes into its own result dictionary (parallel agents may add a
+    default fan-in agent), so the merged result does not depend on completion order.
+    If any build fails, the agents that were built are shut down and the first
+    failure in ``entries`` order is raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def build_one(agent_type: AgentType, name: str, agent_data: Mapping[str, Any]):
+        built: AgentDict = {}
+        async with semaphore:
+            await _AGENT_TYPE_BUILDERS[agent_type](name, agent_data, build_ctx, built)
+        return built
+
+    results = await gather_with_cancel(build_one(*entry) for entry in entries)
+
+    result_agents: AgentDict = {}
+    failures: list[tuple[str, BaseException]] = []
+    for (_, name, _), result in zip(entries, results, strict=True):
+        if isinstance(result, BaseException):
+            failures.append((name, result))
+        else:
+            result_agents.update(result)
+
+    if failures:
+        if len(failures) > 1:
+            logger.error(
+                "Multiple agents failed to start",
+                data={"agents": [name for name, _ in failures]},
+            )
+        await _shutdown_agents(result_agents)
+        raise failures[0][1]
+
+    return result_agents
+
+
 async def create_agents_by_type(
     app_instance: CoreContextProtocol,
     agents_dict: AgentConfigDict,
@@ -937,27 +1023,18 @@ async def create_agents_by_type(
     if active_agents is None:
         active_agents = {}
 
-    result_agents: AgentDict = {}
-    session_history_enabled = True
-    if app_instance.context and app_instance.context.config:
-        session_history_enabled = getattr(app_instance.context.config, "session_history", True)
-    builder = _AGENT_TYPE_BUILDERS.get(agent_type)
-    if builder is None:
+    if agent_type not in _AGENT_TYPE_BUILDERS:
         raise ValueError(f"Unknown agent type: {agent_type}")
 
-    build_ctx = AgentBuildContext(
-        app_instance=app_instance,
-        agents_dict=agents_dict,
-        active_agents=active_agents,
-        model_factory_func=model_factory_func,
-        session_history_enabled=session_history_enabled,
+    build_ctx = _build_context(app_instance, agents_dict, model_factory_func, active_agents)
+    entries = [
+        (agent_type, name, agent_data)
+        for name, agent_data in _iter_agents_of_type(agents_dict, agent_type)
+    ]
+    return await _build_agents_concurrently(
+        build_ctx, entries, _agent_startup_concurrency(app_instance)
     )
 
-    for name, agent_data in _iter_agents_of_type(agents_dict, agent_type):
-        await builder(name, agent_data, build_ctx, result_agents)
-
-    return result_agents
-
 
 async def active_agents_in_dependency_group(
     app_instance: CoreContextProtocol,
@@ -967,25 +1044,27 @@ async def active_agents_in_dependency_group(
     active_agents: AgentDict,
 ):
     """
-    For each of the possible agent types, create agents and update the active agents dictionary.
+    Create the agents of one dependency group and add them to the active agents dictionary.
+
+    Agents in a group only depend on agents from earlier groups, so they are built
+    concurrently (bounded by ``agent_startup_concurrency``). They are added to
+    ``active_agents`` by agent type and then declaration order, whatever order the
+    builds finish in.
 
     Notice: This function modifies the active_agents dictionary in-place which is a feature (no copies).
     """
-    type_of_agents = list(map(lambda c: (c, c.value), AgentType))
-    for agent_type, agent_type_value in type_of_agents:
-        agents_dict_local = {
-            name: agents_dict[name]
-            for name in group
-            if normalize_agent_type_value(agents_dict[name].get("type")) == agent_type_value
-        }
-        agents = await create_agents_by_type(
-            app_instance,
-            agents_dict_local,
-            agent_type,
-            model_factory_func,
-            active_agents,
-        )
-        active_agents.update(agents)
+    members = set(group)
+    local_agents = {name: data for name, data in agents_dict.items() if name in members}
+    entries = [
+        (agent_type, name, agent_data)
+        for agent_type in AgentType
+        for name, agent_data in _iter_agents_of_type(local_agents, agent_type)
+    ]
+    build_ctx = _build_context(app_instance, local_agents, model_factory_func, active_agents)
+    agents = await _build_agents_concurrently(
+        build_ctx, entries, _agent_startup_concurrency(app_instance)
+    )
+    active_agents.update(agents)
 
 
 async def create_agents_in_dependency_order(
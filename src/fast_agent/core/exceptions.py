@@ -102,3 +102,19 @@ class ServerSessionTerminatedError(FastAgentError):
         self.server_name = server_name
         message = f"MCP server '{server_name}' session terminated"
         super().__init__(message, details)
+
+
+class ProviderUnavailableError(FastAgentError):
+    """Raised when a provider's circuit breaker is open and calls are short-circuited.
+
+    ``retry_after`` is the number of seconds until the breaker lets a probe request through.
+    """
+
+    def __init__(self, provider: str, retry_after: float, details: str = "") -> None:
+        self.provider = provider
+        self.retry_after = retry_after
+        message = (
+            f"Provider '{provider}' is temporarily unavailable "
+            f"(circuit open, retry in {retry_after:.1f}s)"
+        )
+        super().__init__(message, details)
@@ -2057,6 +2057,8 @@ class FastAgent(DecoratorMixin):
         server_name = getattr(self.args, "server_name", None)
         instance_scope = getattr(self.args, "instance_scope", "shared")
         permissions_enabled = getattr(self.args, "permissions_enabled", True)
+        app_config = self.app.context.config
+        acp_settings = app_config.acp if app_config else config.ACPSettings()
 
         acp_server = AgentACPServer(
             primary_instance=state.primary_instance,
@@ -2078,6 +2080,8 @@ class FastAgent(DecoratorMixin):
             ),
             dump_agent_card_callback=callbacks.dump_agent_card,
             reload_callback=callbacks.reload_source,
+            history_replay_messages=acp_settings.history_replay_messages,
+            history_replay_page_size=acp_settings.history_replay_page_size,
         )
         await acp_server.run_async()
 
@@ -2093,6 +2097,7 @@ class FastAgent(DecoratorMixin):
         server_description = getattr(self.args, "server_description", None)
         server_name = getattr(self.args, "server_name", None)
         instance_scope = getattr(self.args, "instance_scope", "shared")
+        config = self.app.context.config
         mcp_server = AgentMCPServer(
             primary_instance=state.primary_instance,
             create_instance=callbacks.create_instance,
@@ -2105,6 +2110,8 @@ class FastAgent(DecoratorMixin):
             host=self.args.host,
             get_registry_version=self._get_registry_version,
             reload_callback=callbacks.reload_source,
+            instance_pool=config.instance_pool if config else None,
+            admission=config.admission if config else None,
         )
 
         await mcp_server.run_async(
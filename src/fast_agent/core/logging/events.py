@@ -12,6 +12,14 @@ from pydantic import BaseModel, ConfigDict, Field
 EventType = Literal["debug", "info", "warning", "error", "progress"]
 """Broad categories for events (severity or role)."""
 
+EVENT_LEVELS: dict[EventType, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+"""Python logging levels for severity event types ("progress" has none)."""
+
 
 class EventContext(BaseModel):
     """
@@ -68,31 +76,33 @@ class EventFilter(BaseModel):
         """
         Check if an event matches this EventFilter criteria.
         """
+        return self.prefilter(event.type, event.name, event.namespace)
+
+    def prefilter(self, event_type: EventType, name: str | None, namespace: str) -> bool:
+        """
+        Check the criteria that are known before an Event is constructed.
+
+        Subclasses that also inspect message or data may still reject an event
+        that passes here, but never accept one that fails.
+        """
         # 1) Filter by broad event type
         if self.types:
-            if event.type not in self.types:
+            if event_type not in self.types:
                 return False
 
         # 2) Filter by custom event name
         if self.names:
-            if not event.name or event.name not in self.names:
+            if not name or name not in self.names:
                 return False
 
         # 3) Filter by namespace prefix
-        if self.namespaces and not any(event.namespace.startswith(ns) for ns in self.namespaces):
+        if self.namespaces and not any(namespace.startswith(ns) for ns in self.namespaces):
             return False
 
         # 4) Minimum severity
         if self.min_level:
-            level_map: dict[EventType, int] = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-            }
-
-            min_val = level_map.get(self.min_level, logging.DEBUG)
-            event_val = level_map.get(event.type, logging.DEBUG)
+            min_val = EVENT_LEVELS.get(self.min_level, logging.DEBUG)
+            event_val = EVENT_LEVELS.get(event_type, logging.DEBUG)
             if event_val < min_val:
                 return False
 
@@ -6,12 +6,12 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from fast_agent.event_progress import ProgressEvent
 
-from fast_agent.core.logging.events import Event, EventFilter, EventType
+from fast_agent.core.logging.events import EVENT_LEVELS, Event, EventFilter, EventType
 
 
 def _append_details(base: str, extra: str | None, *, separator: str = " - ") -> str:
@@ -134,6 +134,8 @@ def convert_log_event(event: Event) -> "ProgressEvent | None":
 
         if tool_context:
             details = f"{details} • {tool_context}".strip()
+        if action == ProgressAction.RETRYING:
+            details = _append_details(details, raw_details)
     else:
         if not target:
             target = event_data.get("target", "unknown")
@@ -180,6 +182,20 @@ class EventListener(ABC):
     async def handle_event(self, event: Event):
         """Process an incoming event."""
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        """
+        Cheap pre-check used by loggers before an Event is allocated.
+
+        Return False only when handle_event would certainly ignore the event.
+        """
+        return True
+
 
 class LifecycleAwareListener(EventListener):
     """
@@ -214,6 +230,15 @@ class FilteredListener(LifecycleAwareListener):
         if not self.filter or self.filter.matches(event):
             await self.handle_matched_event(event)
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        return not self.filter or self.filter.prefilter(event_type, name, namespace)
+
     async def handle_matched_event(self, event: Event) -> None:
         """Process an event that matches the filter."""
         pass
@@ -237,14 +262,19 @@ class LoggingListener(FilteredListener):
         super().__init__(event_filter=event_filter)
         self.logger = logger or logging.getLogger("fast_agent")
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        return super().accepts(event_type, name, namespace, data) and self.logger.isEnabledFor(
+            EVENT_LEVELS.get(event_type, logging.INFO)
+        )
+
     async def handle_matched_event(self, event) -> None:
-        level_map: dict[EventType, int] = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-        }
-        level = level_map.get(event.type, logging.INFO)
+        level = EVENT_LEVELS.get(event.type, logging.INFO)
 
         # Check if this is a server stderr message and format accordingly
         if event.name == "mcpserver.stderr":
@@ -290,6 +320,17 @@ class ProgressListener(LifecycleAwareListener):
         """Stop the progress display."""
         self.display.stop()
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        # Mirrors the first checks in convert_log_event
+        payload = data.get("data") if data else None
+        return isinstance(payload, dict) and bool(payload.get("progress_action"))
+
     async def handle_event(self, event: Event) -> None:
         """Process an incoming event and display progress if relevant."""
 
@@ -358,6 +399,18 @@ class BatchingListener(FilteredListener):
         finally:
             await self.flush()  # Final flush
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        # The base batch processor discards events, so only subclasses need them
+        if type(self)._process_batch is BatchingListener._process_batch:
+            return False
+        return super().accepts(event_type, name, namespace, data)
+
     async def handle_matched_event(self, event) -> None:
         self.batch.append(event)
         if len(self.batch) >= self.batch_size:
@@ -7,7 +7,6 @@ Logger module for the MCP Agent, which provides:
 - Developer-friendly Logger that can be used anywhere
 """
 
-import asyncio
 import logging
 import threading
 import time
@@ -22,7 +21,6 @@ from fast_agent.core.logging.listeners import (
     ProgressListener,
 )
 from fast_agent.core.logging.transport import AsyncEventBus, EventTransport
-from fast_agent.utils.async_utils import ensure_event_loop
 
 
 class Logger:
@@ -36,21 +34,37 @@ class Logger:
         self.namespace = namespace
         self.event_bus = AsyncEventBus.get()
 
-    def _emit_event(self, event: Event) -> None:
-        """Emit an event by running it in the event loop."""
+    def _enabled(self, etype: EventType, name: str | None, data: dict[str, Any]) -> bool:
+        """Check whether anything will consume this event, before building it."""
         # AsyncEventBus is a singleton that tests may reset between runs.
         # Logger instances are cached globally and can therefore outlive a bus
         # reset. Always re-resolve the current bus before emitting to avoid
         # dispatching to a stale, stopped bus instance.
         self.event_bus = AsyncEventBus.get()
+        return self.event_bus.accepts(etype, name, self.namespace, data)
 
-        loop = ensure_event_loop()
-        if loop.is_running():
-            # If we're in a thread with a running loop, schedule the coroutine
-            asyncio.create_task(self.event_bus.emit(event))
-        else:
-            # If no loop is running, run it until the emit completes
-            loop.run_until_complete(self.event_bus.emit(event))
+    def _emit_event(self, event: Event) -> None:
+        """Hand an event to the event bus queue without scheduling a task."""
+        self.event_bus.emit_nowait(event)
+
+    def _create_event(
+        self,
+        etype: EventType,
+        ename: str | None,
+        message: str,
+        context: EventContext | None,
+        data: dict,
+    ) -> None:
+        self._emit_event(
+            Event(
+                type=etype,
+                name=ename,
+                namespace=self.namespace,
+                message=message,
+                context=context,
+                data=data,
+            )
+        )
 
     @staticmethod
     def _coerce_exc_info(data: dict[str, Any]) -> dict[str, Any]:
@@ -106,16 +120,9 @@ class Logger:
         context: EventContext | None,
         data: dict,
     ) -> None:
-        """Create and emit an event."""
-        evt = Event(
-            type=etype,
-            name=ename,
-            namespace=self.namespace,
-            message=message,
-            context=context,
-            data=data,
-        )
-        self._emit_event(evt)
+        """Create and emit an event if the bus has a consumer for it."""
+        if self._enabled(etype, ename, data):
+            self._create_event(etype, ename, message, context, data)
 
     def debug(
         self,
@@ -125,7 +132,8 @@ class Logger:
         **data,
     ) -> None:
         """Log a debug message."""
-        self.event("debug", name, message, context, self._coerce_exc_info(data))
+        if self._enabled("debug", name, data):
+            self._create_event("debug", name, message, context, self._coerce_exc_info(data))
 
     def info(
         self,
@@ -135,7 +143,8 @@ class Logger:
         **data,
     ) -> None:
         """Log an info message."""
-        self.event("info", name, message, context, self._coerce_exc_info(data))
+        if self._enabled("info", name, data):
+            self._create_event("info", name, message, context, self._coerce_exc_info(data))
 
     def warning(
         self,
@@ -145,7 +154,8 @@ class Logger:
         **data,
     ) -> None:
         """Log a warning message."""
-        self.event("warning", name, message, context, self._coerce_exc_info(data))
+        if self._enabled("warning", name, data):
+            self._create_event("warning", name, message, context, self._coerce_exc_info(data))
 
     def error(
         self,
@@ -155,7 +165,8 @@ class Logger:
         **data,
     ) -> None:
         """Log an error message."""
-        self.event("error", name, message, context, self._coerce_exc_info(data))
+        if self._enabled("error", name, data):
+            self._create_event("error", name, message, context, self._coerce_exc_info(data))
 
     def exception(
         self,
@@ -167,11 +178,13 @@ class Logger:
         """Log an error message with exception info."""
         import sys
 
+        if not self._enabled("error", name, data):
+            return
         exc_info = sys.exc_info()
         if exc_info[0] is not None:
             tb_str = "".join(traceback.format_exception(*exc_info))
             data["exception"] = tb_str
-        self.event("error", name, message, context, self._coerce_exc_info(data))
+        self._create_event("error", name, message, context, self._coerce_exc_info(data))
 
     def progress(
         self,
@@ -182,8 +195,9 @@ class Logger:
         **data,
     ) -> None:
         """Log a progress message."""
-        merged_data = dict(percentage=percentage, **data)
-        self.event("progress", name, message, context, merged_data)
+        if self._enabled("progress", name, data):
+            merged_data = dict(percentage=percentage, **data)
+            self._create_event("progress", name, message, context, merged_data)
 
 
 @contextmanager
@@ -252,6 +266,7 @@ class LoggingConfig:
         transport: EventTransport | None = None,
         batch_size: int = 100,
         flush_interval: float = 2.0,
+        max_queue_size: int = 2048,
         **kwargs: Any,
     ) -> None:
         """
@@ -262,6 +277,7 @@ class LoggingConfig:
             transport: Transport for sending events to external systems
             batch_size: Default batch size for batching listener
             flush_interval: Default flush interval for batching listener
+            max_queue_size: Pending events kept before the oldest are dropped
             **kwargs: Additional configuration options
         """
         if cls._initialized:
@@ -274,6 +290,7 @@ class LoggingConfig:
         logging.getLogger("s3transfer").setLevel(logging.WARNING)
 
         bus = AsyncEventBus.get(transport=transport)
+        bus.max_queue_size = max_queue_size
 
         # Add standard listeners
         if "logging" not in bus.listeners:
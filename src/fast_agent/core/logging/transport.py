@@ -5,11 +5,17 @@ Transports for the Logger module for MCP Agent, including:
 """
 
 import asyncio
+import gzip
 import json
+import random
+import shutil
+import threading
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import Any, Protocol, TextIO
 
 import aiohttp
 from opentelemetry import trace
@@ -18,7 +24,7 @@ from rich.json import JSON
 from rich.text import Text
 
 from fast_agent.config import LoggerSettings
-from fast_agent.core.logging.events import Event, EventFilter
+from fast_agent.core.logging.events import Event, EventFilter, EventType
 from fast_agent.core.logging.json_serializer import JSONSerializer
 from fast_agent.core.logging.listeners import EventListener, LifecycleAwareListener
 from fast_agent.ui.console import console
@@ -52,6 +58,16 @@ class FilteredEventTransport(EventTransport, ABC):
         if not self.filter or self.filter.matches(event):
             await self.send_matched_event(event)
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        """Cheap pre-check used by loggers before an Event is allocated."""
+        return not self.filter or self.filter.prefilter(event_type, name, namespace)
+
     @abstractmethod
     async def send_matched_event(self, event: Event):
         """Send an event to the external system."""
@@ -60,6 +76,15 @@ class FilteredEventTransport(EventTransport, ABC):
 class NoOpTransport(FilteredEventTransport):
     """Default transport that does nothing (purely local)."""
 
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        return False
+
     async def send_matched_event(self, event) -> None:
         """Do nothing."""
         pass
@@ -107,7 +132,16 @@ class ConsoleTransport(FilteredEventTransport):
 
 
 class FileTransport(FilteredEventTransport):
-    """Transport that writes events to a file with proper formatting."""
+    """
+    Transport that writes events to a file with proper formatting.
+
+    By default every event is written as soon as it arrives. In write-behind mode
+    serialized lines are buffered and a background task writes them in batches
+    from a worker thread, flushing when ``flush_bytes`` are pending or every
+    ``flush_interval`` seconds, so slow disks never block the event loop.
+    With ``max_bytes`` set the file is rotated to ``<name>.1`` ... ``<name>.N``
+    (optionally gzip-compressed) once it would grow past that size.
+    """
 
     def __init__(
         self,
@@ -115,6 +149,13 @@ class FileTransport(FilteredEventTransport):
         event_filter: EventFilter | None = None,
         mode: str = "a",
         encoding: str = "utf-8",
+        *,
+        write_behind: bool = False,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+        compress_rotated: bool = False,
     ) -> None:
         """Initialize FileTransport.
 
@@ -123,22 +164,43 @@ class FileTransport(FilteredEventTransport):
             event_filter: Optional filter for events
             mode: File open mode ('a' for append, 'w' for write)
             encoding: File encoding to use
+            write_behind: Buffer lines and write them in batches off the event loop
+            flush_bytes: Pending bytes that trigger a write-behind flush
+            flush_interval: Maximum seconds a write-behind line waits before flushing
+            max_bytes: Rotate the file before it grows past this size (None disables)
+            backup_count: Number of rotated files to keep
+            compress_rotated: Gzip rotated files (``<name>.1.gz``)
         """
         super().__init__(event_filter=event_filter)
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
+        self.write_behind = write_behind
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress_rotated = compress_rotated
         self._serializer = JSONSerializer()
 
+        self._file: TextIO | None = None
+        self._file_size = 0
+        self._truncate_on_open = mode == "w"
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._flush_requested: asyncio.Event | None = None
+        self._writer_task: asyncio.Task | None = None
+        # Orders writes issued from the event loop; each one may await a worker thread.
+        self._write_lock = asyncio.Lock()
+        # Serializes file access in worker threads (writes, rotation, close).
+        self._io_lock = threading.Lock()
+        self._closing = False
+        self._closed = False
+
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    async def send_matched_event(self, event: Event) -> None:
-        """Write matched event to log file asynchronously.
-
-        Args:
-            event: Event to write to file
-        """
+    def _format_line(self, event: Event) -> str:
         # Format the log entry
         namespace = event.namespace
         if event.name:
@@ -155,29 +217,160 @@ class FileTransport(FilteredEventTransport):
         if event.data:
             log_entry["data"] = self._serializer(event.data)
 
-        try:
-            with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-                # Write the log entry as compact JSON (JSONL format)
-                f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
-                f.flush()  # Ensure writing to disk
-        except IOError as e:
-            # Log error without recursion
-            print(f"Error writing to log file {self.filepath}: {e}")
+        # Compact JSON (JSONL format)
+        return json.dumps(log_entry, separators=(",", ":")) + "\n"
+
+    async def send_matched_event(self, event: Event) -> None:
+        """Write matched event to log file asynchronously.
+
+        Args:
+            event: Event to write to file
+        """
+        line = self._format_line(event)
+
+        if not self.write_behind or self._closing:
+            async with self._write_lock:
+                if self._rotation_due(line):
+                    # Rotation renames and possibly gzips files; keep it off the event loop.
+                    await asyncio.to_thread(self._write_lines, [line])
+                else:
+                    self._write_lines([line])
+            return
+
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self._ensure_writer()
+        if self._pending_bytes >= self.flush_bytes and self._flush_requested is not None:
+            self._flush_requested.set()
+
+    def _ensure_writer(self) -> None:
+        if self._writer_task is not None and not self._writer_task.done():
+            return
+        self._flush_requested = asyncio.Event()
+        self._writer_task = asyncio.create_task(self._write_behind_loop())
+
+    async def _write_behind_loop(self) -> None:
+        assert self._flush_requested is not None
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write any buffered lines from a worker thread."""
+        async with self._write_lock:
+            if not self._pending:
+                return
+            lines = self._pending
+            self._pending = []
+            self._pending_bytes = 0
+            await asyncio.to_thread(self._write_lines, lines)
+
+    def _rotation_due(self, data: str) -> bool:
+        if not self.max_bytes or not self._file_size:
+            return False
+        return self._file_size + len(data.encode(self.encoding)) > self.max_bytes
+
+    def _write_lines(self, lines: list[str]) -> None:
+        data = "".join(lines)
+        with self._io_lock:
+            try:
+                handle = self._open_file()
+                if self.max_bytes:
+                    if self._rotation_due(data):
+                        self._rotate()
+                        handle = self._open_file()
+                    self._file_size += len(data.encode(self.encoding))
+                handle.write(data)
+                handle.flush()  # Ensure writing to disk
+            except (OSError, ValueError) as e:
+                # Log error without recursion
+                print(f"Error writing to log file {self.filepath}: {e}")
+
+    def _close_file(self) -> None:
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open_file(self) -> TextIO:
+        if self._file is None or self._file.closed:
+            mode = "w" if self._truncate_on_open else "a"
+            self._truncate_on_open = False
+            self._file = open(self.filepath, mode=mode, encoding=self.encoding)
+            self._file_size = self._file.tell()
+        return self._file
+
+    def _rotated_path(self, index: int) -> Path:
+        suffix = f".{index}.gz" if self.compress_rotated else f".{index}"
+        return self.filepath.with_name(self.filepath.name + suffix)
+
+    def _rotate(self) -> None:
+        # Called from _write_lines with _io_lock held.
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if self.backup_count <= 0:
+            self.filepath.unlink(missing_ok=True)
+            return
+
+        self._rotated_path(self.backup_count).unlink(missing_ok=True)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._rotated_path(index)
+            if source.exists():
+                source.replace(self._rotated_path(index + 1))
+
+        target = self._rotated_path(1)
+        if self.compress_rotated:
+            with open(self.filepath, "rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            self.filepath.unlink()
+        else:
+            self.filepath.replace(target)
 
     async def close(self) -> None:
-        """Clean up resources if needed."""
-        pass  # File handles are automatically closed after each write
+        """Flush buffered lines, stop the write-behind task and close the file."""
+        # Let the writer finish its current batch and exit rather than cancelling
+        # it: a cancelled flush leaves its worker thread writing to the file.
+        self._closing = True
+        task, self._writer_task = self._writer_task, None
+        if task is not None and not task.done():
+            if self._flush_requested is not None:
+                self._flush_requested.set()
+            await task
+        await self.flush()
+        async with self._write_lock:
+            await asyncio.to_thread(self._close_file)
+        self._closed = True
 
     @property
     def is_closed(self) -> bool:
         """Check if transport is closed."""
-        return False  # Since we open/close per write
+        return self._closed
+
+
+@dataclass(frozen=True, slots=True)
+class TransportStats:
+    sent: int
+    dropped: int
+    retried: int
+    pending: int
 
 
 class HTTPTransport(FilteredEventTransport):
     """
     Sends events to an HTTP endpoint in batches.
     Useful for sending to remote logging services like Elasticsearch, etc.
+
+    Events are serialized into a bounded queue that drops the oldest entries when
+    full, and a background task posts them over a pooled, persistent session,
+    gzip-compressed by default. Batches rejected with a 5xx status or a
+    connection error are retried with jittered exponential backoff; batches that
+    still fail (or get a 4xx) are dropped and counted.
     """
 
     def __init__(
@@ -187,90 +380,230 @@ class HTTPTransport(FilteredEventTransport):
         batch_size: int = 100,
         timeout: float = 5.0,
         event_filter: EventFilter | None = None,
+        *,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 10_000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        compress: bool = True,
+        pool_size: int = 4,
     ) -> None:
+        """
+        Args:
+            endpoint: URL that accepts a JSON array of events per POST
+            headers: Extra request headers
+            batch_size: Events per request; a full batch is sent immediately
+            timeout: Total timeout per request in seconds
+            event_filter: Optional filter for events
+            flush_interval: Maximum seconds an event waits before being sent
+            max_queue_size: Pending events kept before the oldest are dropped
+            max_retries: Retries for a batch after a 5xx or connection error
+            retry_backoff: Base delay for the jittered exponential backoff
+            compress: Gzip request bodies
+            pool_size: Maximum pooled connections to the endpoint
+        """
         super().__init__(event_filter=event_filter)
         self.endpoint = endpoint
         self.headers = headers or {}
         self.batch_size = batch_size
         self.timeout = timeout
-
-        self.batch: list[Event] = []
-        self.lock = asyncio.Lock()
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.compress = compress
+        self.pool_size = pool_size
+
+        self._queue: deque[dict[str, Any]] = deque(maxlen=max(max_queue_size, 1))
+        self._batch_ready: asyncio.Event | None = None
+        self._sender_task: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+        self._stopping = False
         self._session: aiohttp.ClientSession | None = None
         self._serializer = JSONSerializer()
+        self._sent = 0
+        self._dropped = 0
+        self._retried = 0
+
+    @property
+    def stats(self) -> TransportStats:
+        return TransportStats(
+            sent=self._sent,
+            dropped=self._dropped,
+            retried=self._retried,
+            pending=len(self._queue),
+        )
 
     async def start(self) -> None:
-        """Initialize HTTP session."""
-        if not self._session:
+        """Initialize the pooled HTTP session."""
+        if not self._session or self._session.closed:
             self._session = aiohttp.ClientSession(
-                headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30),
             )
 
     async def stop(self) -> None:
-        """Close HTTP session and flush any remaining events."""
-        if self.batch:
-            await self._flush()
+        """Send any remaining events and close the HTTP session."""
+        # Ask the sender to finish its current batch and exit; cancelling it
+        # mid-request would abandon that batch.
+        self._stopping = True
+        try:
+            task, self._sender_task = self._sender_task, None
+            if task is not None and not task.done():
+                if self._batch_ready is not None:
+                    self._batch_ready.set()
+                await task
+            while self._queue:
+                await self._flush()
+        finally:
+            self._stopping = False
         if self._session:
             await self._session.close()
             self._session = None
 
+    async def close(self) -> None:
+        """Alias for stop() so the event bus can flush this transport on shutdown."""
+        await self.stop()
+
     async def send_matched_event(self, event: Event) -> None:
-        """Add event to batch, flush if batch is full."""
-        async with self.lock:
-            self.batch.append(event)
-            if len(self.batch) >= self.batch_size:
+        """Queue event for the background sender, waking it when a batch is full."""
+        if len(self._queue) == self._queue.maxlen:
+            self._dropped += 1
+        self._queue.append(self._serialize(event))
+
+        if self._sender_task is None or self._sender_task.done():
+            self._batch_ready = asyncio.Event()
+            self._sender_task = asyncio.create_task(self._send_loop())
+        if len(self._queue) >= self.batch_size and self._batch_ready is not None:
+            self._batch_ready.set()
+
+    def _serialize(self, event: Event) -> dict[str, Any]:
+        # Convert events to JSON-serializable dicts
+        return {
+            "timestamp": event.timestamp.isoformat(),
+            "type": event.type,
+            "name": event.name,
+            "namespace": event.namespace,
+            "message": event.message,
+            "data": self._serializer(event.data),
+            "trace_id": event.trace_id,
+            "span_id": event.span_id,
+            "context": event.context.model_dump() if event.context else None,
+        }
+
+    async def _send_loop(self) -> None:
+        assert self._batch_ready is not None
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            while self._queue:
                 await self._flush()
+                if len(self._queue) < self.batch_size:
+                    break
 
     async def _flush(self) -> None:
-        """Send batch of events to HTTP endpoint."""
-        if not self.batch:
-            return
+        """Send one batch of queued events to the HTTP endpoint."""
+        async with self._send_lock:
+            if not self._queue:
+                return
+            count = min(self.batch_size, len(self._queue))
+            events_data = [self._queue.popleft() for _ in range(count)]
+
+            body = json.dumps(events_data, separators=(",", ":")).encode("utf-8")
+            headers = {"Content-Type": "application/json"}
+            if self.compress:
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
 
-        if not self._session:
-            await self.start()
+            try:
+                sent = await self._post_with_retry(body, headers)
+            except asyncio.CancelledError:
+                self._requeue(events_data)
+                raise
+            if sent:
+                self._sent += count
+            else:
+                self._dropped += count
+
+    def _requeue(self, events_data: list[dict[str, Any]]) -> None:
+        """Put an unsent batch back at the front of the queue, keeping the oldest events."""
+        maxlen = self._queue.maxlen or len(self._queue) + len(events_data)
+        overflow = min(len(self._queue) + len(events_data) - maxlen, len(self._queue))
+        # extendleft on a full deque discards from the right; make room explicitly
+        for _ in range(max(overflow, 0)):
+            self._queue.pop()
+            self._dropped += 1
+        self._queue.extendleft(reversed(events_data))
+
+    async def _post_with_retry(self, body: bytes, headers: dict[str, str]) -> bool:
+        await self.start()
         assert self._session is not None
 
-        try:
-            # Convert events to JSON-serializable dicts
-            events_data = [
-                {
-                    "timestamp": event.timestamp.isoformat(),
-                    "type": event.type,
-                    "name": event.name,
-                    "namespace": event.namespace,
-                    "message": event.message,
-                    "data": self._serializer(event.data),
-                    "trace_id": event.trace_id,
-                    "span_id": event.span_id,
-                    "context": event.context.model_dump() if event.context else None,
-                }
-                for event in self.batch
-            ]
-
-            async with self._session.post(self.endpoint, json=events_data) as response:
-                if response.status >= 400:
+        error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._retried += 1
+                # Full jitter keeps many agents from retrying against the collector in lockstep
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * 2 ** (attempt - 1)))
+            try:
+                async with self._session.post(
+                    self.endpoint, data=body, headers=headers
+                ) as response:
+                    if response.status < 400:
+                        return True
                     text = await response.text()
-                    print(
-                        f"Error sending log events to {self.endpoint}. "
-                        f"Status: {response.status}, Response: {text}"
-                    )
-        except Exception as e:
-            print(f"Error sending log events to {self.endpoint}: {e}")
-        finally:
-            self.batch.clear()
+                    if response.status < 500:
+                        print(
+                            f"Error sending log events to {self.endpoint}. "
+                            f"Status: {response.status}, Response: {text}"
+                        )
+                        return False
+                    error = f"Status: {response.status}, Response: {text}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+
+        print(
+            f"Error sending log events to {self.endpoint} after "
+            f"{self.max_retries + 1} attempts: {error}"
+        )
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class EventBusStats:
+    enqueued: int
+    dropped: int
+    filtered: int
+    pending: int
+    transport: TransportStats | None = None
 
 
 class AsyncEventBus:
     """
     Async event bus with local in-process listeners + optional remote transport.
     Also injects distributed tracing (trace_id, span_id) if there's a current span.
+
+    Events are enqueued synchronously onto a bounded queue and delivered to the
+    transport and listeners by a single worker task. When the queue is full the
+    oldest pending event is discarded, so bursts cost a counter increment rather
+    than unbounded memory or a task per event.
     """
 
     _instance = None
 
-    def __init__(self, transport: EventTransport | None = None) -> None:
+    max_queue_size: int = 2048
+    _loop: asyncio.AbstractEventLoop | None = None
+    _enqueued: int = 0
+    _dropped: int = 0
+    _filtered: int = 0
+
+    def __init__(self, transport: EventTransport | None = None, max_queue_size: int = 2048) -> None:
         self.transport: EventTransport = transport or NoOpTransport()
         self.listeners: dict[str, EventListener] = {}
+        self.max_queue_size = max_queue_size
         self._queue: asyncio.Queue | None = None
         self._task: asyncio.Task | None = None
         self._running = False
@@ -324,7 +657,8 @@ class AsyncEventBus:
 
         ensure_event_loop()
 
-        self._queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=max(self.max_queue_size, 1))
 
         # Start each lifecycle-aware listener
         for listener in self.listeners.values():
@@ -404,32 +738,121 @@ class AsyncEventBus:
                 except Exception as e:
                     print(f"Error stopping listener: {e}")
 
+        # Let buffering transports flush what they still hold
+        close = getattr(self.transport, "close", None)
+        if close is not None and same_loop_task:
+            try:
+                await asyncio.wait_for(close(), timeout=5.0)
+            except asyncio.TimeoutError:
+                print(f"Timeout closing transport: {self.transport}")
+            except Exception as e:
+                print(f"Error closing transport: {e}")
+
+    @property
+    def stats(self) -> EventBusStats:
+        """
+        Counters for events enqueued, dropped on overflow and rejected up front.
+
+        ``transport`` carries the transport's own delivery counters when it keeps any.
+        """
+        return EventBusStats(
+            enqueued=self._enqueued,
+            dropped=self._dropped,
+            filtered=self._filtered,
+            pending=self._queue.qsize() if self._queue is not None else 0,
+            transport=getattr(self.transport, "stats", None),
+        )
+
+    def accepts(
+        self,
+        event_type: EventType,
+        name: str | None,
+        namespace: str,
+        data: dict[str, Any],
+    ) -> bool:
+        """
+        Return True if the transport or any listener may want this event.
+
+        Called before an Event is built so rejected log calls allocate nothing.
+        """
+        if not self._running:
+            return False
+
+        transport_accepts = getattr(self.transport, "accepts", None)
+        if transport_accepts is None or transport_accepts(event_type, name, namespace, data):
+            return True
+        for listener in tuple(self.listeners.values()):
+            if listener.accepts(event_type, name, namespace, data):
+                return True
+
+        self._filtered += 1
+        return False
+
     async def emit(self, event: Event) -> None:
         """Emit an event to all listeners and transport."""
+        self.emit_nowait(event)
+
+    def emit_nowait(self, event: Event) -> None:
+        """
+        Enqueue an event for the transport and listeners without awaiting.
+
+        Safe to call from any thread; events from threads other than the bus loop
+        are handed over with call_soon_threadsafe.
+        """
         if not self._running:
             return
 
-        # Inject current tracing info if available
+        # Inject current tracing info here, while the caller's span is current
         span = trace.get_current_span()
         if span.is_recording():
             ctx = span.get_span_context()
             event.trace_id = f"{ctx.trace_id:032x}"
             event.span_id = f"{ctx.span_id:016x}"
 
-        # Forward to transport first (immediate processing)
+        loop = self._loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if loop is not None and running_loop is loop:
+            self._enqueue(event)
+            return
+
+        if loop is None or loop.is_closed():
+            self._dropped += 1
+            return
+        try:
+            loop.call_soon_threadsafe(self._enqueue, event)
+        except RuntimeError:
+            # Event loop may be closing during shutdown/test teardown.
+            self._dropped += 1
+
+    def _enqueue(self, event: Event) -> None:
+        queue = self._queue
+        if queue is None:
+            self._dropped += 1
+            return
+
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Ring buffer: discard the oldest pending event to admit the newest
+            try:
+                queue.get_nowait()
+                queue.task_done()
+            except (asyncio.QueueEmpty, ValueError):
+                pass
+            self._dropped += 1
+            queue.put_nowait(event)
+        self._enqueued += 1
+
+    async def _send_to_transport(self, event: Event) -> None:
         try:
             await self.transport.send_event(event)
         except Exception as e:
             print(f"Error in transport.send_event: {e}")
 
-        # Then queue for listeners
-        if self._queue is not None:
-            try:
-                await self._queue.put(event)
-            except RuntimeError:
-                # Event loop may be closing during shutdown/test teardown.
-                return
-
     def add_listener(self, name: str, listener: EventListener) -> None:
         """Add a listener to the event bus."""
         self.listeners[name] = listener
@@ -451,7 +874,8 @@ class AsyncEventBus:
                 except asyncio.TimeoutError:
                     continue
 
-                # Process the event through all listeners
+                # Forward to transport first, then process through all listeners
+                await self._send_to_transport(event)
                 tasks = []
                 for listener in self.listeners.values():
                     try:
@@ -488,6 +912,7 @@ class AsyncEventBus:
             while not self._queue.empty():
                 try:
                     event = self._queue.get_nowait()
+                    await self._send_to_transport(event)
                     tasks = []
                     for listener in self.listeners.values():
                         try:
@@ -515,6 +940,11 @@ def create_transport(
         return FileTransport(
             filepath=settings.path,
             event_filter=event_filter,
+            write_behind=settings.write_behind,
+            flush_interval=settings.flush_interval,
+            max_bytes=settings.max_file_bytes,
+            backup_count=settings.backup_count,
+            compress_rotated=settings.compress_rotated,
         )
     elif settings.type == "http":
         if not settings.http_endpoint:
@@ -525,6 +955,10 @@ def create_transport(
             batch_size=settings.batch_size,
             timeout=settings.http_timeout,
             event_filter=event_filter,
+            flush_interval=settings.flush_interval,
+            max_queue_size=settings.http_max_queue_size,
+            max_retries=settings.http_max_retries,
+            compress=settings.http_compress,
         )
     else:
         raise ValueError(f"Unsupported transport type: {settings.type}")
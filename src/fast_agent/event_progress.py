@@ -27,6 +27,7 @@ class ProgressAction(str, Enum):
     SERVER_OFFLINE = "Offline"
     SERVER_RECONNECTING = "Reconnecting"
     SERVER_ONLINE = "Online"
+    RETRYING = "Retrying"
     FATAL_ERROR = "Error"
 
 
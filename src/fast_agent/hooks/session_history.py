@@ -70,7 +70,7 @@ async def save_session_history(ctx: "HookContext") -> None:
             and session.info.metadata.get("acp_session_id") != acp_session_id
         ):
             session.info.metadata["acp_session_id"] = acp_session_id
-            session._save_metadata()
+            await session._save_metadata_async()
 
     previous_title = extract_session_title(session.info.metadata) if session else None
 
@@ -28,13 +28,12 @@ from mcp.types import (
 from openai import NotGiven
 from openai.lib._parsing import type_to_response_format_param as _type_to_response_format
 from pydantic_core import from_json
-from rich import print as rich_print
 
 from fast_agent.constants import (
     CONTROL_MESSAGE_SAVE_HISTORY,
 )
 from fast_agent.context_dependent import ContextDependent
-from fast_agent.core.exceptions import AgentConfigError, ProviderKeyError, ServerConfigError
+from fast_agent.core.exceptions import ProviderKeyError, ProviderUnavailableError
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.core.prompt import Prompt
 from fast_agent.event_progress import ProgressAction
@@ -42,9 +41,12 @@ from fast_agent.interfaces import (
     FastAgentLLMProtocol,
     ModelT,
 )
+from fast_agent.llm.history_compaction import HistoryCompactor
 from fast_agent.llm.memory import Memory, SimpleMemory
 from fast_agent.llm.model_database import ModelDatabase, ModelParameters
+from fast_agent.llm.provider_conversion_cache import ProviderConversionCache
 from fast_agent.llm.provider_types import Provider
+from fast_agent.llm.rate_limiter import ProviderRateLimiter, get_rate_limiter
 from fast_agent.llm.reasoning_effort import (
     ReasoningEffortSetting,
     ReasoningEffortSpec,
@@ -64,13 +66,16 @@ from fast_agent.llm.response_telemetry import (
     append_usage_channel,
     start_request_timing_capture,
 )
+from fast_agent.llm.retry_policy import RetryAction, RetryDecision, RetryPolicy
 from fast_agent.llm.stream_types import StreamChunk
 from fast_agent.llm.text_verbosity import (
     TextVerbosityLevel,
     TextVerbositySpec,
     validate_text_verbosity,
 )
-from fast_agent.llm.usage_tracking import TurnUsage, UsageAccumulator
+from fast_agent.llm.token_counting import count_tokens, get_token_counter
+from fast_agent.llm.tool_schema_cache import ToolSchemaCache
+from fast_agent.llm.usage_tracking import TurnUsage, UsageAccumulator, estimate_request_tokens
 from fast_agent.mcp.helpers.content_helpers import get_text
 from fast_agent.types import PromptMessageExtended, RequestParams
 
@@ -117,6 +122,10 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         PARAM_SERVICE_TIER,
     }
 
+    # Providers whose _convert_extended_messages_to_provider is a pure per-message
+    # mapping opt in to reusing converted history between calls.
+    CACHE_PROVIDER_CONVERSION: bool = False
+
     """
     Implementation of the Llm Protocol - intended be subclassed for Provider
     or behaviour specific reasons. Contains convenience and template methods.
@@ -171,6 +180,11 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         self._provider = provider
         # memory contains provider specific API types.
         self.history: Memory[MessageParamT] = SimpleMemory[MessageParamT]()
+        self._conversion_cache: ProviderConversionCache[MessageParamT] = ProviderConversionCache()
+        self._tool_schema_cache: ToolSchemaCache[Any] = ToolSchemaCache()
+        self._history_compactor = HistoryCompactor.from_settings(
+            getattr(getattr(self.context, "config", None), "history_compaction", None)
+        )
 
         # Initialize the display component
         from fast_agent.ui.console_display import ConsoleDisplay
@@ -255,6 +269,7 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         self._tool_stream_listeners: set[Callable[[str, dict[str, Any] | None], None]] = set()
         self.retry_count = self._resolve_retry_count()
         self.retry_backoff_seconds: float = 10.0
+        self.retry_policy = RetryPolicy()
 
     def _resolved_model_matches(self, model_name: str | None) -> bool:
         if not model_name:
@@ -510,69 +525,94 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         func: Callable[..., Awaitable[Any]],
         *args: Any,
         on_final_error: Callable[[Exception], Awaitable[Any] | Any] | None = None,
+        request_messages: list[PromptMessageExtended] | None = None,
         **kwargs: Any,
     ) -> Any:
         """
         Executes a function with robust retry logic for transient API errors.
+
+        Retry decisions, delays and the per-provider circuit breaker come from
+        ``self.retry_policy``; each retry is reported as an ``llm_retry`` event.
+        When a shared rate limit is configured for the provider, every attempt
+        first waits for its share of the budget, estimated from ``request_messages``.
         """
         retries = max(0, int(self.retry_count))
-
-        def _is_fatal_error(e: Exception) -> bool:
-            if isinstance(e, (KeyboardInterrupt, AgentConfigError, ServerConfigError)):
-                return True
-            if isinstance(e, ProviderKeyError):
-                msg = str(e).lower()
-                # Retry on Rate Limits (429, Quota, Overloaded)
-                keywords = [
-                    "429",
-                    "503",
-                    "quota",
-                    "exhausted",
-                    "overloaded",
-                    "unavailable",
-                    "timeout",
-                ]
-                if any(k in msg for k in keywords):
-                    return False
-                return True
-            return False
+        policy = self.retry_policy
+        provider_name = self.provider.config_name
+        breaker = policy.circuit_breaker(provider_name)
+        limiter = self._rate_limiter()
+        estimated_tokens = 0
+        if limiter is not None:
+            await get_token_counter().wait_ready(self._model_name)
+            estimated_tokens = estimate_request_tokens(
+                request_messages or [], self.usage_accumulator, model=self._model_name
+            )
 
         last_error = None
 
         for attempt in range(retries + 1):
+            blocked_for = breaker.check()
+            if blocked_for is not None:
+                last_error = ProviderUnavailableError(provider_name, blocked_for)
+                break
+
+            turns_before = len(self.usage_accumulator.turns)
+            if limiter is not None:
+                waited = await limiter.acquire(estimated_tokens)
+                if waited > 0:
+                    self.logger.debug(
+                        "Waiting for shared provider rate limit",
+                        name="llm_rate_limited",
+                        data={
+                            "provider": provider_name,
+                            "agent_name": self.name,
+                            "waited": round(waited, 3),
+                            "estimated_tokens": estimated_tokens,
+                        },
+                    )
+
             try:
                 # Await the async function
-                return await func(*args, **kwargs)
+                result = await func(*args, **kwargs)
             except Exception as e:
-                if _is_fatal_error(e):
+                decision = policy.decide(e, attempt, base_delay=self.retry_backoff_seconds)
+                if decision.action == RetryAction.FATAL:
                     raise e
 
                 last_error = e
-                if attempt < retries:
-                    wait_time = self.retry_backoff_seconds * (attempt + 1)
-
-                    if os.environ.get("FAST_AGENT_WEBDEBUG"):
-                        print(
-                            "[webdebug] provider call failed "
-                            f"attempt={attempt + 1}/{retries + 1} "
-                            f"error_type={type(e).__name__}"
+                if decision.trips_circuit and breaker.record_failure():
+                    self.logger.warning(
+                        f"Circuit opened for provider '{provider_name}'",
+                        name="llm_circuit_open",
+                        data={
+                            "provider": provider_name,
+                            "agent_name": self.name,
+                            "reset_seconds": breaker.reset_seconds,
+                        },
+                    )
+                if decision.action != RetryAction.RETRY or attempt >= retries:
+                    break
+
+                if os.environ.get("FAST_AGENT_WEBDEBUG"):
+                    print(
+                        "[webdebug] provider call failed "
+                        f"attempt={attempt + 1}/{retries + 1} "
+                        f"error_type={type(e).__name__}"
+                    )
+                    traceback.print_exception(type(e), e, e.__traceback__)
+
+                self._log_retry(e, decision, attempt=attempt, retries=retries)
+                await asyncio.sleep(decision.delay)
+            else:
+                breaker.record_success()
+                if limiter is not None:
+                    new_turns = self.usage_accumulator.turns[turns_before:]
+                    if new_turns:
+                        limiter.reconcile(
+                            estimated_tokens,
+                            sum(turn.input_tokens + turn.output_tokens for turn in new_turns),
                         )
-                        traceback.print_exception(type(e), e, e.__traceback__)
-
-                    # Try to import progress_display safely
-                    try:
-                        from fast_agent.ui.progress_display import progress_display
-
-                        with progress_display.paused():
-                            rich_print(f"\n[yellow]▲ Provider Error: {str(e)[:300]}...[/yellow]")
-                            rich_print(
-                                f"[dim]⟳ Retrying in {wait_time}s... (Attempt {attempt + 1}/{retries})[/dim]"
-                            )
-                    except ImportError:
-                        print(f"▲ Provider Error: {str(e)[:300]}...")
-                        print(f"⟳ Retrying in {wait_time}s... (Attempt {attempt + 1}/{retries})")
-
-                    await asyncio.sleep(wait_time)
+                return result
 
         if last_error:
             handler = on_final_error or getattr(self, "_handle_retry_failure", None)
@@ -588,6 +628,69 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         # This line satisfies Pylance that we never implicitly return None
         raise RuntimeError("Retry loop finished without success or exception")
 
+    async def _compact_request_history(
+        self, messages: list[PromptMessageExtended]
+    ) -> list[PromptMessageExtended]:
+        """Compact old turns so the request fits ``history_compaction`` budget."""
+        compactor = self._history_compactor
+        if compactor is None:
+            return messages
+        await get_token_counter().wait_ready(self._model_name)
+        context_window = self.usage_accumulator.context_window_size
+        if context_window is None:
+            context_window = self._context_window_override or self._get_model_context_window(
+                self._model_name
+            )
+        return compactor.compact(
+            messages,
+            context_window=context_window,
+            usage=self.usage_accumulator,
+            model=self._model_name,
+        )
+
+    def _rate_limiter(self) -> ProviderRateLimiter | None:
+        """Shared limiter for this provider and API key, if ``rate_limits`` configures one."""
+        config = getattr(self.context, "config", None)
+        limits = (getattr(config, "rate_limits", None) or {}).get(self.provider.config_name)
+        if limits is None:
+            return None
+        if not limits.requests_per_minute and not limits.tokens_per_minute:
+            return None
+
+        from fast_agent.llm.provider_key_manager import ProviderKeyManager
+
+        try:
+            fingerprint = ProviderKeyManager.key_fingerprint(self._api_key())
+        except ProviderKeyError:
+            fingerprint = ""
+        return get_rate_limiter(
+            self.provider.config_name,
+            fingerprint,
+            requests_per_minute=limits.requests_per_minute,
+            tokens_per_minute=limits.tokens_per_minute,
+        )
+
+    def _log_retry(
+        self, error: Exception, decision: RetryDecision, *, attempt: int, retries: int
+    ) -> None:
+        """Emit a structured retry event (also shown on the progress display)."""
+        data = {
+            "progress_action": ProgressAction.RETRYING,
+            "agent_name": self.name,
+            "model": self.default_request_params.model,
+            "provider": self.provider.config_name,
+            "attempt": attempt + 1,
+            "max_attempts": retries + 1,
+            "delay": round(decision.delay, 3),
+            "reason": decision.reason,
+            "status_code": decision.status_code,
+            "retry_after": decision.retry_after,
+            "error_type": type(error).__name__,
+            "error": str(error)[:300],
+            "details": f"retry {attempt + 1}/{retries} in {decision.delay:.1f}s",
+        }
+        self.logger.warning("Provider call failed, retrying", name="llm_retry", data=data)
+
     def _handle_retry_failure(self, error: Exception) -> Any | None:
         """
         Optional hook for providers to convert an exhausted retry into a user-facing response.
@@ -662,12 +765,16 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
             _mcp_metadata_var.set(final_request_params.mcp_metadata)
 
         # The caller supplies the full conversation to send
-        full_history = messages
+        full_history = await self._compact_request_history(messages)
 
         timing_capture, cleanup_timing_capture = self._start_request_timing_capture()
         try:
             assistant_response = await self._execute_with_retry(
-                self._apply_prompt_provider_specific, full_history, request_params, tools
+                self._apply_prompt_provider_specific,
+                full_history,
+                request_params,
+                tools,
+                request_messages=full_history,
             )
         finally:
             cleanup_timing_capture()
@@ -775,7 +882,7 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         if final_request_params.mcp_metadata:
             _mcp_metadata_var.set(final_request_params.mcp_metadata)
 
-        full_history = messages
+        full_history = await self._compact_request_history(messages)
 
         timing_capture, cleanup_timing_capture = self._start_request_timing_capture()
         try:
@@ -785,6 +892,7 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
                 model,
                 request_params,
                 on_final_error=self._handle_retry_failure,
+                request_messages=full_history,
             )
         finally:
             cleanup_timing_capture()
@@ -1006,9 +1114,8 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         Returns:
             Updated estimated token count
         """
-        # Rough estimate: 1 token per 4 characters (OpenAI's typical ratio)
-        text_length = len(content)
-        additional_tokens = max(1, text_length // 4)
+        # Never load the encoder here: that would block the event loop mid-stream.
+        additional_tokens = max(1, count_tokens(content, model, load=False))
         new_total = estimated_tokens + additional_tokens
 
         # Format token count for display
@@ -1121,7 +1228,9 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
     ) -> list[MessageParamT]:
         """
         Convert provided messages to provider-specific format.
-        Called fresh on EVERY API call - no caching.
+        Called on EVERY API call. When the provider sets CACHE_PROVIDER_CONVERSION,
+        messages whose content is unchanged since the previous call reuse their
+        earlier conversion and only new or edited messages are converted.
 
         Args:
             messages: List of PromptMessageExtended
@@ -1129,7 +1238,21 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         Returns:
             List of provider-specific message objects
         """
-        return self._convert_extended_messages_to_provider(messages)
+        if not self.CACHE_PROVIDER_CONVERSION:
+            return self._convert_extended_messages_to_provider(messages)
+        return self._conversion_cache.convert(
+            messages,
+            self._convert_extended_messages_to_provider,
+            dialect=self._provider_conversion_dialect(),
+        )
+
+    def _provider_conversion_dialect(self) -> Any:
+        """Settings that affect message conversion; a change invalidates cached conversions."""
+        return self.default_request_params.model
+
+    def invalidate_conversion_cache(self) -> None:
+        """Discard cached provider-format conversions of the conversation history."""
+        self._conversion_cache.clear()
 
     @abstractmethod
     def _convert_extended_messages_to_provider(
@@ -1204,6 +1327,7 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
 
         # Convert to PromptMessageExtended objects and delegate
         multipart_messages = PromptMessageExtended.parse_get_prompt_result(prompt_result)
+        self.invalidate_conversion_cache()
         result = await self._apply_prompt_provider_specific(
             multipart_messages, None, is_template=True
         )
@@ -1243,12 +1367,16 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
 
     def pop_last_message(self) -> PromptMessageExtended | None:
         """Remove and return the most recent message from the conversation history."""
+        self.invalidate_conversion_cache()
         return None
 
     def clear(self, *, clear_prompts: bool = False) -> None:
         """Reset stored message history while optionally retaining prompt templates."""
 
         self.history.clear(clear_prompts=clear_prompts)
+        self.invalidate_conversion_cache()
+        if self._history_compactor is not None:
+            self._history_compactor.reset()
 
     def _api_key(self):
         if self._init_api_key is not None:
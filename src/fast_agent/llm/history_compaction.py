@@ -0,0 +1,338 @@
+"""
+Token-budget compaction of the history sent to the model.
+
+The full conversation is resent on every request. In long sessions old tool
+output, images and embedded resources come to dominate the request and
+eventually overflow the model's context window. ``HistoryCompactor`` keeps each
+request below a configurable fraction of the window (from ``ModelDatabase`` or
+the provider's override), using local token counts calibrated against the
+input tokens the provider actually reported for the previous request.
+
+Only the outgoing request is compacted; the agent's stored history is left
+untouched. Compaction works on whole turns from the oldest side, and its state
+is a watermark that only moves forward:
+
+- messages before the watermark have large tool output shortened to a head
+  plus an elision note, and images, audio and large embedded resources
+  replaced by short text references;
+- when that is not enough, the oldest compacted turns are dropped.
+
+When a request goes over budget the watermark is advanced until the estimate
+falls to a lower target, so successive requests share the same compacted
+prefix and provider prompt caches (including ``AnthropicCachePlanner``
+breakpoints past the template prefix) stay valid until the next advance.
+Template messages and the most recent turns are never compacted.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from mcp.types import (
+    AudioContent,
+    BlobResourceContents,
+    CallToolResult,
+    ContentBlock,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+    TextResourceContents,
+)
+
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.llm.provider_types import Provider
+from fast_agent.llm.token_counting import get_token_counter
+
+if TYPE_CHECKING:
+    from fast_agent.config import HistoryCompactionSettings
+    from fast_agent.llm.usage_tracking import TurnUsage, UsageAccumulator
+    from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
+logger = get_logger(__name__)
+
+_MIN_CALIBRATION = 0.5
+_MAX_CALIBRATION = 4.0
+
+
+def estimate_message_tokens(message: PromptMessageExtended, model: str | None = None) -> int:
+    """Estimate the tokens a message contributes to a request."""
+    return get_token_counter().count_message(message, model)
+
+
+def _reference(kind: str, detail: str) -> TextContent:
+    return TextContent(type="text", text=f"[{kind} omitted from earlier context: {detail}]")
+
+
+def _compact_block(block: ContentBlock, keep_chars: int, *, tool_output: bool) -> ContentBlock:
+    if isinstance(block, TextContent):
+        if not tool_output or len(block.text) <= keep_chars:
+            return block
+        elided = len(block.text) - keep_chars
+        return TextContent(
+            type="text",
+            text=f"{block.text[:keep_chars]}\n[... {elided} characters of earlier tool output elided]",
+        )
+    if isinstance(block, ImageContent):
+        return _reference("image", f"{block.mimeType}, {len(block.data)} base64 characters")
+    if isinstance(block, AudioContent):
+        return _reference("audio", f"{block.mimeType}, {len(block.data)} base64 characters")
+    if isinstance(block, EmbeddedResource):
+        resource = block.resource
+        mime_type = resource.mimeType or "unknown type"
+        if isinstance(resource, BlobResourceContents):
+            return _reference("resource", f"{resource.uri} ({mime_type})")
+        if isinstance(resource, TextResourceContents) and len(resource.text) > keep_chars:
+            return _reference(
+                "resource", f"{resource.uri} ({mime_type}, {len(resource.text)} characters)"
+            )
+    return block
+
+
+def compact_message(message: PromptMessageExtended, keep_chars: int) -> PromptMessageExtended:
+    """Return ``message`` with bulky content shortened, or ``message`` itself if nothing changed."""
+    content = [_compact_block(block, keep_chars, tool_output=False) for block in message.content]
+    changed = any(new is not old for new, old in zip(content, message.content))
+
+    tool_results: dict[str, CallToolResult] | None = None
+    if message.tool_results:
+        tool_results = {}
+        for call_id, result in message.tool_results.items():
+            result_content = [
+                _compact_block(block, keep_chars, tool_output=True) for block in result.content
+            ]
+            if result.structuredContent or any(
+                new is not old for new, old in zip(result_content, result.content)
+            ):
+                # Structured output duplicates the text content it accompanies.
+                result = result.model_copy(
+                    update={"content": result_content, "structuredContent": None}
+                )
+                changed = True
+            tool_results[call_id] = result
+
+    if not changed:
+        return message
+    return message.model_copy(update={"content": content, "tool_results": tool_results})
+
+
+def _is_turn_start(message: PromptMessageExtended) -> bool:
+    return message.role == "user" and not message.tool_results
+
+
+def _measured_input_tokens(turn: TurnUsage) -> int:
+    if turn.provider == Provider.ANTHROPIC:
+        # Anthropic reports cached input separately from input_tokens.
+        return turn.current_context_tokens - turn.output_tokens
+    return turn.input_tokens
+
+
+def _fingerprint(message: PromptMessageExtended) -> tuple[object, ...]:
+    return (
+        message.role,
+        message.first_text()[:128],
+        len(message.content),
+        tuple(message.tool_calls or ()),
+        tuple(message.tool_results or ()),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryCompactionStats:
+    requests: int
+    advances: int
+    compacted_messages: int
+    dropped_messages: int
+    last_estimate: int
+    """Estimated input tokens of the last request, after compaction."""
+    last_saved: int
+    """Estimated tokens removed from the last request."""
+
+
+class HistoryCompactor:
+    """Keep requests under a fraction of the context window by compacting old turns."""
+
+    def __init__(
+        self,
+        *,
+        max_context_fraction: float = 0.8,
+        compact_to_fraction: float = 0.6,
+        preserve_recent_turns: int = 2,
+        tool_result_keep_chars: int = 2000,
+    ) -> None:
+        self.max_context_fraction = max_context_fraction
+        self.compact_to_fraction = min(compact_to_fraction, max_context_fraction)
+        self.preserve_recent_turns = max(1, preserve_recent_turns)
+        self.tool_result_keep_chars = max(0, tool_result_keep_chars)
+        self._calibration = 1.0
+        self._last_raw_estimate = 0
+        self._turns_seen = 0
+        # Conversation messages (after the template prefix) that are compacted
+        # or dropped, and the fingerprint of the last of them.
+        self._watermark = 0
+        self._dropped = 0
+        self._anchor: tuple[object, ...] | None = None
+        self._requests = 0
+        self._advances = 0
+        self._last_compacted = 0
+        self._last_estimate = 0
+        self._last_saved = 0
+
+    @classmethod
+    def from_settings(cls, settings: HistoryCompactionSettings | None) -> HistoryCompactor | None:
+        if settings is None or not settings.enabled:
+            return None
+        return cls(
+            max_context_fraction=settings.max_context_fraction,
+            compact_to_fraction=settings.compact_to_fraction,
+            preserve_recent_turns=settings.preserve_recent_turns,
+            tool_result_keep_chars=settings.tool_result_keep_chars,
+        )
+
+    def reset(self) -> None:
+        """Forget the compaction watermark (e.g. after the history was cleared)."""
+        self._watermark = 0
+        self._dropped = 0
+        self._anchor = None
+
+    @property
+    def stats(self) -> HistoryCompactionStats:
+        return HistoryCompactionStats(
+            requests=self._requests,
+            advances=self._advances,
+            compacted_messages=self._last_compacted,
+            dropped_messages=self._dropped,
+            last_estimate=self._last_estimate,
+            last_saved=self._last_saved,
+        )
+
+    def _calibrate(self, usage: UsageAccumulator | None) -> None:
+        if usage is None:
+            return
+        turns = usage.turns
+        if len(turns) > self._turns_seen and self._last_raw_estimate > 0:
+            measured = _measured_input_tokens(turns[-1])
+            if measured > 0:
+                ratio = measured / self._last_raw_estimate
+                self._calibration = min(_MAX_CALIBRATION, max(_MIN_CALIBRATION, ratio))
+        self._turns_seen = len(turns)
+
+    def _scaled(self, raw_tokens: int) -> int:
+        return int(raw_tokens * self._calibration)
+
+    def compact(
+        self,
+        messages: list[PromptMessageExtended],
+        *,
+        context_window: int | None,
+        usage: UsageAccumulator | None = None,
+        model: str | None = None,
+    ) -> list[PromptMessageExtended]:
+        """Return the messages to send, compacted to fit the context budget."""
+        self._requests += 1
+        self._calibrate(usage)
+
+        sizes = get_token_counter().count_each(messages, model)
+        raw_total = sum(sizes)
+        if not context_window or context_window <= 0:
+            self._record(raw_total, raw_total, 0)
+            return messages
+
+        prefix = 0
+        while prefix < len(messages) and messages[prefix].is_template:
+            prefix += 1
+        turn_starts = [
+            index for index in range(prefix, len(messages)) if _is_turn_start(messages[index])
+        ]
+        # Conversation offset past which nothing may be compacted or dropped.
+        if len(turn_starts) > self.preserve_recent_turns:
+            limit = turn_starts[-self.preserve_recent_turns] - prefix
+        else:
+            limit = 0
+
+        if self._watermark:
+            end = prefix + self._watermark
+            if (
+                self._watermark > limit
+                or end > len(messages)
+                or _fingerprint(messages[end - 1]) != self._anchor
+            ):
+                self.reset()
+
+        compacted = {
+            index: compact_message(messages[index], self.tool_result_keep_chars)
+            for index in range(prefix + self._dropped, prefix + self._watermark)
+        }
+        savings = {
+            index: sizes[index] - estimate_message_tokens(message, model)
+            for index, message in compacted.items()
+            if message is not messages[index]
+        }
+        total = raw_total - sum(sizes[prefix : prefix + self._dropped]) - sum(savings.values())
+
+        if self._scaled(total) > context_window * self.max_context_fraction:
+            target = context_window * self.compact_to_fraction
+            boundaries = [start - prefix for start in turn_starts if start - prefix <= limit]
+            for boundary in boundaries:
+                if boundary <= self._watermark:
+                    continue
+                for index in range(prefix + self._watermark, prefix + boundary):
+                    message = compact_message(messages[index], self.tool_result_keep_chars)
+                    compacted[index] = message
+                    if message is not messages[index]:
+                        saved = sizes[index] - estimate_message_tokens(message, model)
+                        savings[index] = saved
+                        total -= saved
+                self._watermark = boundary
+                if self._scaled(total) <= target:
+                    break
+
+            for boundary in boundaries:
+                if self._scaled(total) <= target or boundary > self._watermark:
+                    break
+                if boundary <= self._dropped:
+                    continue
+                for index in range(prefix + self._dropped, prefix + boundary):
+                    total -= sizes[index] - savings.pop(index, 0)
+                    compacted.pop(index, None)
+                self._dropped = boundary
+
+            self._advances += 1
+            if self._watermark:
+                self._anchor = _fingerprint(messages[prefix + self._watermark - 1])
+            logger.info(
+                "Compacted request history to fit the context window",
+                data={
+                    "context_window": context_window,
+                    "estimated_tokens": self._scaled(total),
+                    "compacted_messages": self._watermark - self._dropped,
+                    "dropped_messages": self._dropped,
+                },
+            )
+            if self._scaled(total) > context_window * self.max_context_fraction:
+                logger.warning(
+                    "Recent turns alone exceed the context budget",
+                    data={
+                        "context_window": context_window,
+                        "estimated_tokens": self._scaled(total),
+                        "preserve_recent_turns": self.preserve_recent_turns,
+                    },
+                )
+
+        self._record(raw_total, total, len(savings))
+        if not self._watermark:
+            return messages
+        return [
+            *messages[:prefix],
+            *(
+                compacted[index]
+                for index in range(prefix + self._dropped, prefix + self._watermark)
+            ),
+            *messages[prefix + self._watermark :],
+        ]
+
+    def _record(self, raw_total: int, total: int, compacted: int) -> None:
+        self._last_raw_estimate = total
+        self._last_estimate = self._scaled(total)
+        self._last_saved = self._scaled(raw_total - total)
+        self._last_compacted = compacted
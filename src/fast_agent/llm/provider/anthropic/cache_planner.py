@@ -1,19 +1,73 @@
+from collections import deque
+from dataclasses import dataclass
 
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.llm.usage_tracking import TurnUsage
 from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
 
+logger = get_logger(__name__)
+
+
+def _fingerprint(message: PromptMessageExtended) -> tuple[object, ...]:
+    """Content identity of a message that survives the per-request history copies."""
+    return (
+        message.role,
+        hash(message.all_text()),
+        len(message.content),
+        tuple(message.tool_calls or ()),
+        tuple(message.tool_results or ()),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CacheTurnStats:
+    """Prompt-cache outcome of one Anthropic request."""
+
+    breakpoints: tuple[int, ...]
+    hit_tokens: int
+    """Input tokens read from the cache (``cache_read_input_tokens``)."""
+    write_tokens: int
+    """Input tokens written to the cache (``cache_creation_input_tokens``)."""
+    miss_tokens: int
+    """Input tokens not served from the cache (uncached input plus cache writes)."""
+
+    @property
+    def hit_rate(self) -> float | None:
+        total = self.hit_tokens + self.miss_tokens
+        return self.hit_tokens / total if total else None
+
 
 class AnthropicCachePlanner:
-    """Calculate where to apply Anthropic cache_control blocks."""
+    """Calculate where to apply Anthropic cache_control blocks.
+
+    By default every call is planned from scratch. With ``stateful=True`` the
+    planner remembers the conversation breakpoints it placed: they stay on the
+    same messages while history grows. Once the budget is used up, the
+    earlier breakpoints stay fixed. The last slot moves forward to each new
+    walk-distance boundary, so the newest prefix is still written to the
+    cache. Placed breakpoints are matched by message content, because agents
+    send a copy of their history with every request. State is dropped if the
+    history no longer has the same messages at those positions (e.g. after
+    clear or compaction).
+    """
+
+    MAX_TURN_STATS = 256
 
     def __init__(
         self,
         walk_distance: int = 6,
         max_conversation_blocks: int = 2,
         max_total_blocks: int = 4,
+        *,
+        stateful: bool = False,
     ) -> None:
         self.walk_distance = walk_distance
         self.max_conversation_blocks = max_conversation_blocks
         self.max_total_blocks = max_total_blocks
+        self.stateful = stateful
+        self.turn_stats: deque[CacheTurnStats] = deque(maxlen=self.MAX_TURN_STATS)
+        self._placed: list[tuple[int, tuple[object, ...]]] = []
+        self._last_breakpoints: tuple[int, ...] = ()
 
     def _template_prefix_count(self, messages: list[PromptMessageExtended]) -> int:
         return sum(msg.is_template for msg in messages)
@@ -27,10 +81,12 @@ class AnthropicCachePlanner:
         """Return message indices that should receive cache_control."""
 
         if cache_mode == "off" or not messages:
+            self._last_breakpoints = ()
             return []
 
         budget = max(0, self.max_total_blocks - system_cache_blocks)
         if budget == 0:
+            self._last_breakpoints = ()
             return []
 
         template_prefix = self._template_prefix_count(messages)
@@ -43,7 +99,11 @@ class AnthropicCachePlanner:
         conversation_indices: list[int] = []
         if cache_mode == "auto" and budget > 0:
             conv_count = max(0, len(messages) - template_prefix)
-            if conv_count >= self.walk_distance:
+            if self.stateful:
+                conversation_indices = self._plan_stable(
+                    messages, template_prefix, conv_count, budget
+                )
+            elif conv_count >= self.walk_distance:
                 positions = [
                     template_prefix + i
                     for i in range(self.walk_distance - 1, conv_count, self.walk_distance)
@@ -53,4 +113,72 @@ class AnthropicCachePlanner:
                 positions = positions[-self.max_conversation_blocks :]
                 conversation_indices = positions[:budget]
 
-        return template_indices + conversation_indices
+        indices = template_indices + conversation_indices
+        self._last_breakpoints = tuple(indices)
+        return indices
+
+    def _plan_stable(
+        self,
+        messages: list[PromptMessageExtended],
+        template_prefix: int,
+        conv_count: int,
+        budget: int,
+    ) -> list[int]:
+        if any(
+            index >= len(messages) or _fingerprint(messages[index]) != anchor
+            for index, anchor in self._placed
+        ):
+            self._placed = []
+
+        limit = min(self.max_conversation_blocks, budget)
+        if not limit:
+            self._placed = []
+            return []
+
+        placed = [index for index, _ in self._placed][:limit]
+        boundaries = range(
+            template_prefix + self.walk_distance - 1,
+            template_prefix + conv_count,
+            self.walk_distance,
+        )
+        newest = boundaries[-1] if boundaries else None
+        if newest is not None and (not placed or newest > placed[-1]):
+            if len(placed) < limit:
+                # Fill free slots with the boundaries not yet covered.
+                start = placed[-1] + self.walk_distance if placed else boundaries[0]
+                missing = list(range(start, newest + 1, self.walk_distance))
+                placed.extend(missing[-(limit - len(placed)) :])
+            else:
+                # Earlier breakpoints stay put; only the last slot follows the
+                # conversation, so the newest prefix is written for the next hit.
+                placed[-1] = newest
+        self._placed = [(index, _fingerprint(messages[index])) for index in placed]
+        return placed
+
+    def reset(self) -> None:
+        """Forget placed breakpoints and recorded statistics."""
+        self._placed = []
+        self._last_breakpoints = ()
+        self.turn_stats.clear()
+
+    def record_usage(self, usage: TurnUsage) -> CacheTurnStats:
+        """Record cache hit/miss tokens reported for the request just planned."""
+        cache = usage.cache_usage
+        stats = CacheTurnStats(
+            breakpoints=self._last_breakpoints,
+            hit_tokens=cache.cache_read_tokens,
+            write_tokens=cache.cache_write_tokens,
+            miss_tokens=usage.input_tokens + cache.cache_write_tokens,
+        )
+        self.turn_stats.append(stats)
+        logger.debug(
+            "Anthropic prompt cache usage",
+            data={
+                "breakpoints": list(stats.breakpoints),
+                "cache_hit_tokens": stats.hit_tokens,
+                "cache_miss_tokens": stats.miss_tokens,
+                "cache_write_tokens": stats.write_tokens,
+                "cache_hit_rate": stats.hit_rate,
+            },
+        )
+        return stats
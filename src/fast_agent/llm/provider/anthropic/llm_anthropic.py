@@ -334,6 +334,7 @@ def _ensure_additional_properties_false(schema: dict[str, Any]) -> dict[str, Any
 
 class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
     CONVERSATION_CACHE_WALK_DISTANCE = 6
+    CACHE_PROVIDER_CONVERSION = True
     MAX_CONVERSATION_CACHE_BLOCKS = 2
     # Anthropic-specific parameter exclusions
     ANTHROPIC_EXCLUDE_FIELDS = {
@@ -366,6 +367,11 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
         self._web_fetch_override: bool | None = (
             bool(web_fetch_override) if isinstance(web_fetch_override, bool) else None
         )
+        self._cache_planner = AnthropicCachePlanner(
+            self.CONVERSATION_CACHE_WALK_DISTANCE,
+            self.MAX_CONVERSATION_CACHE_BLOCKS,
+            stateful=self._get_cache_placement() == "stable",
+        )
 
         raw_setting = kwargs.get("reasoning_effort", None)
         reasoning_source: str | None = None
@@ -502,6 +508,13 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
             cache_mode = self.context.config.anthropic.cache_mode
         return cache_mode
 
+    def _get_cache_placement(self) -> str:
+        """Get the conversation cache placement strategy ('stable' or 'sliding')."""
+        placement = "stable"
+        if self.context.config and self.context.config.anthropic:
+            placement = self.context.config.anthropic.cache_placement
+        return placement
+
     def _get_cache_ttl(self) -> str:
         """Get the cache TTL configuration ('5m' or '1h')."""
         cache_ttl = "5m"  # Default to 5 minutes
@@ -642,14 +655,17 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
         if structured_model:
             return []
         # Regular mode - use tools from aggregator
-        return [
-            ToolParam(
-                name=tool.name,
-                description=tool.description or "",
-                input_schema=tool.inputSchema,
+        return list(
+            self._tool_schema_cache.convert(
+                tools or [],
+                lambda tool: ToolParam(
+                    name=tool.name,
+                    description=tool.description or "",
+                    input_schema=tool.inputSchema,
+                ),
+                dialect="anthropic",
             )
-            for tool in tools or []
-        ]
+        )
 
     def _prepare_web_tools(self, model: str) -> tuple[list[ToolParam], tuple[str, ...]]:
         anthropic_settings = self.context.config.anthropic if self.context.config else None
@@ -1299,9 +1315,7 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
     ) -> None:
         system_cache_applied = self._apply_system_cache(arguments, cache_mode)
 
-        planner = AnthropicCachePlanner(
-            self.CONVERSATION_CACHE_WALK_DISTANCE, self.MAX_CONVERSATION_CACHE_BLOCKS
-        )
+        planner = self._cache_planner
         plan_messages: list[PromptMessageExtended] = []
         include_current = not params.use_history or not history
         if params.use_history and history:
@@ -1669,6 +1683,7 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
                     response.usage, model or DEFAULT_ANTHROPIC_MODEL
                 )
                 self._finalize_turn_usage(turn_usage)
+                self._cache_planner.record_usage(turn_usage)
             except Exception as e:
                 logger.warning(f"Failed to track usage: {e}")
 
@@ -1776,7 +1791,7 @@ class AnthropicLLM(FastAgentLLM[MessageParam, Message]):
     ) -> list[MessageParam]:
         """
         Convert PromptMessageExtended list to Anthropic MessageParam format.
-        This is called fresh on every API call from _convert_to_provider_format().
+        _convert_to_provider_format() calls this one message at a time and caches the results.
 
         Args:
             messages: List of PromptMessageExtended objects
@@ -156,6 +156,7 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
 
     # Class-level capabilities cache shared across all instances
     capabilities: dict[str, ModelCapabilities] = {}
+    CACHE_PROVIDER_CONVERSION = True
 
     @classmethod
     def debug_cache(cls) -> None:
@@ -345,7 +346,7 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
     ) -> list[BedrockMessageParam]:
         """
         Convert PromptMessageExtended list to Bedrock BedrockMessageParam format.
-        This is called fresh on every API call from _convert_to_provider_format().
+        _convert_to_provider_format() calls this one message at a time and caches the results.
 
         Args:
             messages: List of PromptMessageExtended objects
@@ -423,46 +424,10 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
 
         self.logger.debug(f"Converting {len(tools.tools)} MCP tools to Nova format")
 
-        for tool in tools.tools:
-            self.logger.debug(f"Converting MCP tool: {tool.name}")
-
-            # Extract and validate the input schema
-            input_schema = tool.inputSchema or {}
-
-            # Create Nova-compliant schema with ONLY the three allowed fields
-            # Always include type and properties (even if empty)
-            nova_schema: dict[str, Any] = {"type": "object", "properties": {}}
-
-            # Properties - clean them strictly
-            properties: dict[str, Any] = {}
-            if "properties" in input_schema and isinstance(input_schema["properties"], dict):
-                for prop_name, prop_def in input_schema["properties"].items():
-                    # Only include type and description for each property
-                    clean_prop: dict[str, Any] = {}
-
-                    if isinstance(prop_def, dict):
-                        # Only include type (required) and description (optional)
-                        clean_prop["type"] = prop_def.get("type", "string")
-                        # Nova allows description in properties
-                        if "description" in prop_def:
-                            clean_prop["description"] = prop_def["description"]
-                    else:
-                        # Handle simple property definitions
-                        clean_prop["type"] = "string"
-
-                    properties[prop_name] = clean_prop
-
-            # Always set properties (even if empty for parameterless tools)
-            nova_schema["properties"] = properties
-
-            # Required fields - only add if present and not empty
-            if (
-                "required" in input_schema
-                and isinstance(input_schema["required"], list)
-                and input_schema["required"]
-            ):
-                nova_schema["required"] = input_schema["required"]
-
+        nova_schemas = self._tool_schema_cache.convert(
+            tools.tools, self._nova_input_schema, dialect="bedrock_nova"
+        )
+        for tool, nova_schema in zip(tools.tools, nova_schemas):
             # Use the tool name mapping that was already built in _bedrock_completion
             # This ensures consistent transformation logic across the codebase
             clean_name = None
@@ -491,6 +456,49 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
         self.logger.debug(f"Converted {len(bedrock_tools)} tools for Nova format")
         return bedrock_tools
 
+    def _nova_input_schema(self, tool: Tool) -> dict[str, Any]:
+        """Reduce a tool's input schema to the fields Nova accepts."""
+        self.logger.debug(f"Converting MCP tool: {tool.name}")
+
+        # Extract and validate the input schema
+        input_schema = tool.inputSchema or {}
+
+        # Create Nova-compliant schema with ONLY the three allowed fields
+        # Always include type and properties (even if empty)
+        nova_schema: dict[str, Any] = {"type": "object", "properties": {}}
+
+        # Properties - clean them strictly
+        properties: dict[str, Any] = {}
+        if "properties" in input_schema and isinstance(input_schema["properties"], dict):
+            for prop_name, prop_def in input_schema["properties"].items():
+                # Only include type and description for each property
+                clean_prop: dict[str, Any] = {}
+
+                if isinstance(prop_def, dict):
+                    # Only include type (required) and description (optional)
+                    clean_prop["type"] = prop_def.get("type", "string")
+                    # Nova allows description in properties
+                    if "description" in prop_def:
+                        clean_prop["description"] = prop_def["description"]
+                else:
+                    # Handle simple property definitions
+                    clean_prop["type"] = "string"
+
+                properties[prop_name] = clean_prop
+
+        # Always set properties (even if empty for parameterless tools)
+        nova_schema["properties"] = properties
+
+        # Required fields - only add if present and not empty
+        if (
+            "required" in input_schema
+            and isinstance(input_schema["required"], list)
+            and input_schema["required"]
+        ):
+            nova_schema["required"] = input_schema["required"]
+
+        return nova_schema
+
     def _convert_tools_system_prompt_format(
         self, tools: "ListToolsResult", tool_name_mapping: dict[str, str]
     ) -> str:
@@ -506,23 +514,11 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
         ]
 
         # Add each tool definition in JSON format
-        for tool in tools.tools:
-            self.logger.debug(f"Converting MCP tool: {tool.name}")
-
-            # Use original tool name (no hyphen replacement)
-            tool_name = tool.name
-
-            # Create tool definition
-            tool_def = {
-                "type": "function",
-                "function": {
-                    "name": tool_name,
-                    "description": tool.description or f"Tool: {tool.name}",
-                    "parameters": tool.inputSchema or {"type": "object", "properties": {}},
-                },
-            }
-
-            prompt_parts.append(json.dumps(tool_def))
+        prompt_parts.extend(
+            self._tool_schema_cache.convert(
+                tools.tools, self._system_prompt_tool_definition, dialect="bedrock_system_prompt"
+            )
+        )
 
         # Add the response format instructions
         prompt_parts.extend(
@@ -543,6 +539,21 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
 
         return system_prompt
 
+    def _system_prompt_tool_definition(self, tool: Tool) -> str:
+        """Render one tool as a JSON function definition for the system prompt."""
+        self.logger.debug(f"Converting MCP tool: {tool.name}")
+
+        # Use original tool name (no hyphen replacement)
+        tool_def = {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description or f"Tool: {tool.name}",
+                "parameters": tool.inputSchema or {"type": "object", "properties": {}},
+            },
+        }
+        return json.dumps(tool_def)
+
     def _convert_tools_anthropic_format(
         self, tools: "ListToolsResult", tool_name_mapping: dict[str, str]
     ) -> list[dict[str, Any]]:
@@ -552,30 +563,35 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
             f"Converting {len(tools.tools)} MCP tools to Anthropic format with toolSpec wrapper"
         )
 
-        bedrock_tools = []
-        for tool in tools.tools:
-            self.logger.debug(f"Converting MCP tool: {tool.name}")
-
-            # Use raw MCP schema (like native Anthropic provider) - no cleaning
-            input_schema = tool.inputSchema or {"type": "object", "properties": {}}
-
-            # Wrap in Bedrock toolSpec format but preserve raw Anthropic schema
-            bedrock_tool = {
-                "toolSpec": {
-                    "name": tool.name,  # Original name, no cleaning
-                    "description": tool.description or f"Tool: {tool.name}",
-                    "inputSchema": {
-                        "json": input_schema  # Raw MCP schema, not cleaned
-                    },
-                }
-            }
-            bedrock_tools.append(bedrock_tool)
+        bedrock_tools = list(
+            self._tool_schema_cache.convert(
+                tools.tools, self._anthropic_tool_spec, dialect="bedrock_anthropic"
+            )
+        )
 
         self.logger.debug(
             f"Converted {len(bedrock_tools)} tools to Anthropic format with toolSpec wrapper"
         )
         return bedrock_tools
 
+    def _anthropic_tool_spec(self, tool: Tool) -> dict[str, Any]:
+        """Wrap a tool's raw MCP schema in a Bedrock toolSpec."""
+        self.logger.debug(f"Converting MCP tool: {tool.name}")
+
+        # Use raw MCP schema (like native Anthropic provider) - no cleaning
+        input_schema = tool.inputSchema or {"type": "object", "properties": {}}
+
+        # Wrap in Bedrock toolSpec format but preserve raw Anthropic schema
+        return {
+            "toolSpec": {
+                "name": tool.name,  # Original name, no cleaning
+                "description": tool.description or f"Tool: {tool.name}",
+                "inputSchema": {
+                    "json": input_schema  # Raw MCP schema, not cleaned
+                },
+            }
+        }
+
     def _parse_tool_arguments(self, func_name: str, args_str: str) -> dict[str, Any]:
         """Parse tool call arguments from key=value or single-value format.
 
@@ -251,16 +251,19 @@ class GoogleConverter:
         """
         Converts a list of fast-agent ToolDefinition to google.genai types.Tool.
         """
-        google_tools: list[types.Tool] = []
-        for tool in tools:
-            cleaned_input_schema = self._clean_schema_for_google(tool.inputSchema)
-            function_declaration = types.FunctionDeclaration(
-                name=tool.name,
-                description=tool.description if tool.description else "",
-                parameters=types.Schema(**cleaned_input_schema),
-            )
-            google_tools.append(types.Tool(function_declarations=[function_declaration]))
-        return google_tools
+        return [self.convert_to_google_tool(tool) for tool in tools]
+
+    def convert_to_google_tool(self, tool: Tool) -> types.Tool:
+        """
+        Converts a single fast-agent ToolDefinition to a google.genai types.Tool.
+        """
+        cleaned_input_schema = self._clean_schema_for_google(tool.inputSchema)
+        function_declaration = types.FunctionDeclaration(
+            name=tool.name,
+            description=tool.description if tool.description else "",
+            parameters=types.Schema(**cleaned_input_schema),
+        )
+        return types.Tool(function_declarations=[function_declaration])
 
     def convert_from_google_content(
         self, content: types.Content
@@ -74,6 +74,8 @@ class GoogleNativeLLM(FastAgentLLM[types.Content, types.Content]):
     Google LLM provider using the native google.genai library.
     """
 
+    CACHE_PROVIDER_CONVERSION = True
+
     def __init__(self, **kwargs) -> None:
         kwargs.pop("provider", None)
         super().__init__(provider=Provider.GOOGLE, **kwargs)
@@ -560,8 +562,10 @@ class GoogleNativeLLM(FastAgentLLM[types.Content, types.Content]):
         self.logger.debug(f"Google completion requested with messages: {conversation_history}")
         self._log_chat_progress(self.chat_turn(), model=request_params.model)
 
-        available_tools: list[types.Tool] = (
-            self._converter.convert_to_google_tools(tools or []) if tools else []
+        available_tools: list[types.Tool] = list(
+            self._tool_schema_cache.convert(
+                tools or [], self._converter.convert_to_google_tool, dialect="google"
+            )
         )
 
         # 2. Prepare generate_content arguments
@@ -768,7 +772,7 @@ class GoogleNativeLLM(FastAgentLLM[types.Content, types.Content]):
     ) -> list[types.Content]:
         """
         Convert PromptMessageExtended list to Google types.Content format.
-        This is called fresh on every API call from _convert_to_provider_format().
+        _convert_to_provider_format() calls this one message at a time and caches the results.
 
         Args:
             messages: List of PromptMessageExtended objects
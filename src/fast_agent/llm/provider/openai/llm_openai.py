@@ -67,6 +67,7 @@ class OpenAILLM(
 ):
     # Config section name override (falls back to provider value)
     config_section: str | None = None
+    CACHE_PROVIDER_CONVERSION = True
     # OpenAI-specific parameter exclusions
     OPENAI_EXCLUDE_FIELDS = {
         FastAgentLLM.PARAM_MESSAGES,
@@ -855,19 +856,16 @@ class OpenAILLM(
         if message:
             messages.extend(cast("list[ChatCompletionMessageParam]", message))
 
-        available_tools: list[ChatCompletionToolParam] | None = cast(
-            "list[ChatCompletionToolParam]",
-            [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description if tool.description else "",
-                        "parameters": self.adjust_schema(tool.inputSchema, model_name=model_name),
-                    },
-                }
-                for tool in tools or []
-            ],
+        available_tools: list[ChatCompletionToolParam] | None = list(
+            self._tool_schema_cache.convert(
+                tools or [],
+                lambda tool: self._tool_param(tool, model_name),
+                dialect=(
+                    "chat_completions",
+                    self.provider,
+                    should_strip_tool_schema_defaults(model_name),
+                ),
+            )
         )
 
         if not available_tools:
@@ -1170,7 +1168,7 @@ class OpenAILLM(
     ) -> list[ChatCompletionMessageParam]:
         """
         Convert PromptMessageExtended list to OpenAI ChatCompletionMessageParam format.
-        This is called fresh on every API call from _convert_to_provider_format().
+        _convert_to_provider_format() calls this one message at a time and caches the results.
 
         Args:
             messages: List of PromptMessageExtended objects
@@ -1218,6 +1216,16 @@ class OpenAILLM(
 
         return converted
 
+    def _tool_param(self, tool: Tool, model_name: str) -> ChatCompletionToolParam:
+        return {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description if tool.description else "",
+                "parameters": self.adjust_schema(tool.inputSchema, model_name=model_name),
+            },
+        }
+
     def adjust_schema(self, inputSchema: dict, model_name: str | None = None) -> dict:
         effective_model = model_name or self.default_request_params.model
         result = (
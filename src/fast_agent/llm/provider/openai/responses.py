@@ -618,6 +618,17 @@ class ResponsesLLM(
                 "Please check that your API key is valid and not expired.",
             ) from e
 
+    def _tool_payload(self, tool: Tool, model_name: str) -> dict[str, Any]:
+        custom_payload = get_openai_responses_custom_tool_payload(tool)
+        if custom_payload is not None:
+            return custom_payload
+        return {
+            "type": "function",
+            "name": tool.name,
+            "description": tool.description or "",
+            "parameters": self._adjust_schema(tool.inputSchema, model_name),
+        }
+
     def _adjust_schema(self, input_schema: dict[str, Any], model_name: str) -> dict[str, Any]:
         result = (
             sanitize_tool_input_schema(input_schema)
@@ -675,22 +686,13 @@ class ResponsesLLM(
             base_args["instructions"] = system_prompt
 
         if tools:
-            tools_payload: list[dict[str, Any]] = []
-            for tool in tools:
-                custom_payload = get_openai_responses_custom_tool_payload(tool)
-                if custom_payload is not None:
-                    tools_payload.append(custom_payload)
-                    continue
-
-                tools_payload.append(
-                    {
-                        "type": "function",
-                        "name": tool.name,
-                        "description": tool.description or "",
-                        "parameters": self._adjust_schema(tool.inputSchema, model),
-                    }
+            base_args["tools"] = list(
+                self._tool_schema_cache.convert(
+                    tools,
+                    lambda tool: self._tool_payload(tool, model),
+                    dialect=("responses", should_strip_tool_schema_defaults(model)),
                 )
-            base_args["tools"] = tools_payload
+            )
 
         resolved_web_search = resolve_web_search(
             self._openai_settings(),
@@ -0,0 +1,137 @@
+"""
+Reuse provider-format conversions of conversation history across API calls.
+
+Agents hand the LLM a fresh deep copy of the conversation on every call, so
+object identity cannot be used to spot messages that were already converted.
+Instead each message is reduced to a structural fingerprint built from its
+field values. Deep copies share the underlying (immutable) strings, so
+fingerprints are cheap to build and compare, and any in-place edit to a
+message produces a different fingerprint and therefore a fresh conversion.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from mcp.types import TextContent
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from fast_agent.types import PromptMessageExtended
+
+MessageParamT = TypeVar("MessageParamT")
+
+_ATOMIC_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _value_fingerprint(value: Any) -> Hashable:
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if type(value) is TextContent and value.annotations is None and value.meta is None:
+        # Fast path for the overwhelmingly common block type.
+        return value.text
+    if isinstance(value, BaseModel):
+        return (
+            type(value).__name__,
+            tuple([_value_fingerprint(item) for item in value.__dict__.values()]),
+        )
+    if isinstance(value, dict):
+        return tuple([(key, _value_fingerprint(item)) for key, item in value.items()])
+    if isinstance(value, (list, tuple)):
+        return tuple([_value_fingerprint(item) for item in value])
+    return repr(value)
+
+
+def message_fingerprint(message: PromptMessageExtended) -> Hashable:
+    """Return a hashable fingerprint covering every field of ``message``."""
+    return tuple([(name, _value_fingerprint(value)) for name, value in message.__dict__.items()])
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy nested dicts/lists so callers may mutate them; leaf values are shared."""
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ConversionCacheStats:
+    hits: int
+    misses: int
+    entries: int
+
+
+class ProviderConversionCache(Generic[MessageParamT]):
+    """
+    Per-LLM cache mapping message fingerprints to converted provider messages.
+
+    Only messages present in the most recent conversion are retained, so
+    history that is popped, trimmed or cleared drops out on the next call.
+    Returned provider messages are container copies: providers may attach
+    request-scoped fields (e.g. Anthropic ``cache_control``) without
+    corrupting the cached originals.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[MessageParamT, ...]] = {}
+        self._dialect: Hashable | None = None
+        self._hits = 0
+        self._misses = 0
+
+    def convert(
+        self,
+        messages: list[PromptMessageExtended],
+        convert: Callable[[list[PromptMessageExtended]], list[MessageParamT]],
+        *,
+        dialect: Hashable = None,
+    ) -> list[MessageParamT]:
+        """
+        Convert ``messages`` reusing cached results where the content is unchanged.
+
+        Args:
+            messages: Conversation history to convert
+            convert: Provider conversion function, called with single-message lists
+            dialect: Conversion settings (e.g. model) - a change drops all entries
+
+        Returns:
+            Flat list of provider-specific messages
+        """
+        if dialect != self._dialect:
+            self._entries = {}
+            self._dialect = dialect
+
+        previous = self._entries
+        current: dict[Hashable, tuple[MessageParamT, ...]] = {}
+        converted: list[MessageParamT] = []
+        for message in messages:
+            key = message_fingerprint(message)
+            entry = current.get(key)
+            if entry is None:
+                entry = previous.get(key)
+                if entry is None:
+                    entry = tuple(convert([message]))
+                    self._misses += 1
+                else:
+                    self._hits += 1
+                current[key] = entry
+            else:
+                self._hits += 1
+            converted.extend(_copy_containers(item) for item in entry)
+
+        self._entries = current
+        return converted
+
+    def clear(self) -> None:
+        """Drop all cached conversions."""
+        self._entries = {}
+
+    @property
+    def stats(self) -> ConversionCacheStats:
+        return ConversionCacheStats(
+            hits=self._hits, misses=self._misses, entries=len(self._entries)
+        )
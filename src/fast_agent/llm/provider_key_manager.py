@@ -3,6 +3,7 @@ Provider API key management for various LLM providers.
 Centralizes API key handling logic to make provider implementations more generic.
 """
 
+import hashlib
 import os
 from typing import Any
 
@@ -46,6 +47,13 @@ class ProviderKeyManager:
     def get_env_key_name(provider_name: str) -> str:
         return PROVIDER_ENVIRONMENT_MAP.get(provider_name, f"{provider_name.upper()}_API_KEY")
 
+    @staticmethod
+    def key_fingerprint(api_key: str | None) -> str:
+        """Stable, non-reversible identifier for an API key (e.g. for per-key accounting)."""
+        if not api_key:
+            return ""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
     @staticmethod
     def get_config_file_key(provider_name: str, config: Any) -> str | None:
         api_key = None
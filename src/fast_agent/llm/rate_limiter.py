@@ -0,0 +1,206 @@
+"""
+Process-wide request/token rate limiting for provider calls.
+
+Every LLM that shares a provider and API key draws from one ``ProviderRateLimiter``
+holding two token buckets: requests per minute and tokens per minute. Callers
+*reserve* capacity up front (the bucket may go into debt) and sleep until that debt
+is repaid, so admission is first-come-first-served across agents and the process
+stays under the provider's limits instead of discovering them through 429s.
+
+Token reservations are estimates; ``reconcile`` corrects the bucket once the
+provider reports actual usage.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+class TokenBucket:
+    """Continuous-refill token bucket that permits debt.
+
+    ``reserve`` always succeeds and returns how long the caller must wait for
+    its share; later callers queue behind the accumulated debt.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._level = min(self.capacity, self._level + elapsed * self.refill_per_second)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket and return the wait until it is covered."""
+        now = self._clock()
+        self._refill(now)
+        self._level -= amount
+        if self._level >= 0:
+            return 0.0
+        return -self._level / self.refill_per_second
+
+    def refund(self, amount: float) -> None:
+        now = self._clock()
+        self._refill(now)
+        self._level = min(self.capacity, self._level + amount)
+
+    def resize(self, capacity: float, refill_per_second: float) -> None:
+        now = self._clock()
+        self._refill(now)
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = min(self._level, capacity)
+
+    @property
+    def level(self) -> float:
+        self._refill(self._clock())
+        return self._level
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimiterStats:
+    """Counters for one limiter."""
+
+    admitted: int
+    delayed: int
+    wait_seconds: float
+    reserved_tokens: int
+
+
+class ProviderRateLimiter:
+    """Request-per-minute and token-per-minute budget for one provider/API key."""
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests: TokenBucket | None = None
+        self._tokens: TokenBucket | None = None
+        self._admitted = 0
+        self._delayed = 0
+        self._wait_seconds = 0.0
+        self._reserved_tokens = 0
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(self, requests_per_minute: int | None, tokens_per_minute: int | None) -> None:
+        """Apply (possibly changed) limits; None or non-positive disables a bucket."""
+        with self._lock:
+            self._requests = self._bucket(self._requests, requests_per_minute)
+            self._tokens = self._bucket(self._tokens, tokens_per_minute)
+
+    def _bucket(self, bucket: TokenBucket | None, per_minute: int | None) -> TokenBucket | None:
+        if not per_minute or per_minute <= 0:
+            return None
+        if bucket is None:
+            return TokenBucket(per_minute, per_minute / 60.0, clock=self._clock)
+        bucket.resize(per_minute, per_minute / 60.0)
+        return bucket
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and ``tokens`` tokens; returns seconds to wait."""
+        with self._lock:
+            delay = 0.0
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1))
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.reserve(tokens))
+            self._admitted += 1
+            self._reserved_tokens += tokens
+            if delay > 0:
+                self._delayed += 1
+                self._wait_seconds += delay
+            return delay
+
+    def refund(self, tokens: int) -> None:
+        """Return a reservation that was never used (e.g. the caller was cancelled)."""
+        with self._lock:
+            if self._requests is not None:
+                self._requests.refund(1)
+            if self._tokens is not None:
+                self._tokens.refund(tokens)
+            self._reserved_tokens -= tokens
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the provider has reported real usage."""
+        difference = actual_tokens - estimated_tokens
+        if difference == 0:
+            return
+        with self._lock:
+            if self._tokens is not None:
+                if difference > 0:
+                    self._tokens.reserve(difference)
+                else:
+                    self._tokens.refund(-difference)
+            self._reserved_tokens += difference
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait until the request fits the budget; returns the time spent waiting."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund(tokens)
+                raise
+        return delay
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(
+                admitted=self._admitted,
+                delayed=self._delayed,
+                wait_seconds=self._wait_seconds,
+                reserved_tokens=self._reserved_tokens,
+            )
+
+
+_limiters: dict[tuple[str, str], ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    key_fingerprint: str,
+    *,
+    requests_per_minute: int | None,
+    tokens_per_minute: int | None,
+) -> ProviderRateLimiter:
+    """Return the shared limiter for ``(provider, key_fingerprint)``, updating its limits."""
+    key = (provider, key_fingerprint)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[key] = limiter
+            return limiter
+    limiter.configure(requests_per_minute, tokens_per_minute)
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all limiter state (used by tests)."""
+    with _limiters_lock:
+        _limiters.clear()
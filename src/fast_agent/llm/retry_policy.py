@@ -0,0 +1,435 @@
+"""
+Retry policy for provider calls.
+
+``FastAgentLLM._execute_with_retry`` delegates every "should we try again, and when?"
+decision to a ``RetryPolicy``:
+
+- transient failures are classified from the HTTP status carried by the provider SDK
+  exception; without a status only known connection and timeout errors are
+  transient (plus ``ProviderKeyError`` messages with rate-limit keywords), so
+  local bugs are not retried and never count towards the circuit breaker,
+- server hints (``Retry-After``, ``retry-after-ms`` and the OpenAI/Anthropic rate-limit
+  reset headers) are honoured when present,
+- otherwise the delay is exponential backoff with full jitter, so agents that fail
+  together do not retry together,
+- a per-provider ``CircuitBreaker`` short-circuits calls after repeated outages
+  (connection errors and 5xx responses) until a cooldown has passed. Rate limits
+  (429, and any response carrying a retry hint) do not count: the provider is up
+  and has said when to come back, so every caller keeps retrying with its own
+  backoff instead of being turned away.
+"""
+
+import asyncio
+import functools
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Any
+
+from fast_agent.core.exceptions import AgentConfigError, ProviderKeyError, ServerConfigError
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+"""HTTP statuses treated as transient (529 is Anthropic's "overloaded")."""
+
+TRANSIENT_KEYWORDS = (
+    "429",
+    "503",
+    "quota",
+    "exhausted",
+    "overloaded",
+    "unavailable",
+    "timeout",
+)
+"""Message fragments that mark a ``ProviderKeyError`` as transient when no status is known."""
+
+
+@functools.cache
+def transient_error_types() -> tuple[type[BaseException], ...]:
+    """Connection and timeout errors that are retried when no HTTP status is available."""
+    # Imported lazily: the SDKs are heavy and only needed once a call has failed.
+    import aiohttp
+    import anthropic
+    import httpx
+    import openai
+
+    # APITimeoutError subclasses APIConnectionError in both SDKs.
+    return (
+        asyncio.TimeoutError,
+        OSError,
+        httpx.TransportError,
+        aiohttp.ClientConnectionError,
+        openai.APIConnectionError,
+        anthropic.APIConnectionError,
+    )
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|s|m|h))+")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class RetryAction(StrEnum):
+    """What ``_execute_with_retry`` should do with a failed attempt."""
+
+    RETRY = "retry"
+    """Back off and call again."""
+
+    GIVE_UP = "give_up"
+    """Stop retrying and hand the error to the final-error handler."""
+
+    FATAL = "fatal"
+    """Re-raise immediately, bypassing the final-error handler."""
+
+
+@dataclass(frozen=True, slots=True)
+class RetryDecision:
+    """Outcome of ``RetryPolicy.decide`` for one failed attempt."""
+
+    action: RetryAction
+    delay: float = 0.0
+    transient: bool = False
+    status_code: int | None = None
+    retry_after: float | None = None
+    reason: str = ""
+    trips_circuit: bool = False
+    """Whether the failure counts towards opening the provider's circuit breaker."""
+
+
+def _iter_error_chain(error: BaseException, limit: int = 5):
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen and len(seen) < limit:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__ or current.__context__
+
+
+def _response_metadata(error: BaseException) -> Mapping[str, Any] | None:
+    """botocore-style ``ClientError.response`` dictionaries."""
+    response = getattr(error, "response", None)
+    if isinstance(response, Mapping):
+        metadata = response.get("ResponseMetadata")
+        if isinstance(metadata, Mapping):
+            return metadata
+    return None
+
+
+def extract_status_code(error: BaseException) -> int | None:
+    """Find the HTTP status of a provider error, following ``__cause__`` chains."""
+    for candidate in _iter_error_chain(error):
+        for attr in ("status_code", "status", "code"):
+            value = getattr(candidate, attr, None)
+            if isinstance(value, int) and not isinstance(value, bool) and 100 <= value < 600:
+                return value
+        response = getattr(candidate, "response", None)
+        value = getattr(response, "status_code", None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+        metadata = _response_metadata(candidate)
+        if metadata is not None:
+            value = metadata.get("HTTPStatusCode")
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def extract_headers(error: BaseException) -> dict[str, str]:
+    """Collect response headers from a provider error as a lower-cased dict."""
+    for candidate in _iter_error_chain(error):
+        headers: Any = getattr(getattr(candidate, "response", None), "headers", None)
+        if headers is None:
+            metadata = _response_metadata(candidate)
+            headers = metadata.get("HTTPHeaders") if metadata is not None else None
+        if headers is None:
+            continue
+        try:
+            return {str(key).lower(): str(value) for key, value in headers.items()}
+        except (AttributeError, TypeError):
+            continue
+    return {}
+
+
+def _parse_reset(value: str, now: float) -> float | None:
+    """Parse a reset header into seconds from now.
+
+    Accepts Go-style durations (``"1s"``, ``"6m0s"``, ``"250ms"``), plain seconds,
+    epoch timestamps and RFC 3339 / HTTP dates.
+    """
+    text = value.strip()
+    if not text:
+        return None
+    if _DURATION.fullmatch(text):
+        return sum(
+            float(amount) * _DURATION_UNITS[unit] for amount, unit in _DURATION_PART.findall(text)
+        )
+    try:
+        number = float(text)
+    except ValueError:
+        pass
+    else:
+        # Values this large are absolute epoch timestamps rather than deltas.
+        return number - now if number > 1_000_000_000 else number
+
+    try:
+        moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp() - now
+
+
+def _remaining_key(reset_key: str) -> str | None:
+    if reset_key.startswith("x-ratelimit-reset-"):
+        return "x-ratelimit-remaining-" + reset_key.removeprefix("x-ratelimit-reset-")
+    if reset_key.startswith("anthropic-ratelimit-") and reset_key.endswith("-reset"):
+        return reset_key.removesuffix("-reset") + "-remaining"
+    return None
+
+
+def retry_after_from_headers(
+    headers: Mapping[str, str],
+    *,
+    include_rate_limit_resets: bool = True,
+    now: float | None = None,
+) -> float | None:
+    """Seconds the server asked us to wait, or None when it gave no hint.
+
+    ``retry-after-ms`` and ``retry-after`` win. Otherwise, when
+    ``include_rate_limit_resets`` is set, the latest reset among exhausted
+    rate-limit buckets (remaining == 0) is used.
+    """
+    now = time.time() if now is None else now
+    lowered = {key.lower(): value for key, value in headers.items()}
+
+    if "retry-after-ms" in lowered:
+        try:
+            return max(0.0, float(lowered["retry-after-ms"]) / 1000.0)
+        except ValueError:
+            pass
+    if "retry-after" in lowered:
+        parsed = _parse_reset(lowered["retry-after"], now)
+        if parsed is not None:
+            return max(0.0, parsed)
+
+    if not include_rate_limit_resets:
+        return None
+
+    exhausted: list[float] = []
+    for key, value in lowered.items():
+        remaining_key = _remaining_key(key)
+        if remaining_key is None:
+            continue
+        try:
+            remaining = float(lowered.get(remaining_key, "1"))
+        except ValueError:
+            continue
+        if remaining > 0:
+            continue
+        parsed = _parse_reset(value, now)
+        if parsed is not None:
+            exhausted.append(max(0.0, parsed))
+    return max(exhausted) if exhausted else None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by every LLM of one provider.
+
+    Closed: calls flow. After ``failure_threshold`` consecutive outage failures
+    (see ``RetryPolicy.counts_toward_circuit``) the breaker opens and calls are rejected for ``reset_seconds``. It then lets a
+    single probe through (half-open); success closes it, failure re-opens it.
+    A probe that never reports back is replaced after another ``reset_seconds``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half_open"
+
+    def check(self) -> float | None:
+        """Return None if a call may proceed, otherwise seconds until the next probe."""
+        if self.failure_threshold <= 0:
+            return None
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            now = self._clock()
+            remaining = self._opened_at + self.reset_seconds - now
+            if remaining > 0:
+                return remaining
+            if self._probe_started is not None:
+                probe_remaining = self._probe_started + self.reset_seconds - now
+                if probe_remaining > 0:
+                    return probe_remaining
+            self._probe_started = now
+            return None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> bool:
+        """Count an outage failure; returns True when this failure opened the breaker."""
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            self._failures += 1
+            probing = self._probe_started is not None
+            if probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = self._clock()
+                self._probe_started = None
+                return True
+            return False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    provider: str, *, failure_threshold: int = 5, reset_seconds: float = 30.0
+) -> CircuitBreaker:
+    """Return the process-wide breaker for ``provider``, creating it on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_seconds)
+            _breakers[provider] = breaker
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breaker state (used by tests and long-running servers)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+@dataclass
+class RetryPolicy:
+    """Decides whether and when a failed provider call is retried.
+
+    Subclass and override ``decide`` or ``backoff`` (or assign a different
+    instance to ``FastAgentLLM.retry_policy``) to customise retries.
+    """
+
+    max_delay: float = 60.0
+    """Upper bound for the jittered exponential delay."""
+
+    max_retry_after: float = 120.0
+    """Server hints longer than this stop retrying instead of sleeping."""
+
+    retry_after_jitter: float = 1.0
+    """Random spread added on top of a server hint so callers do not wake together."""
+
+    respect_retry_after: bool = True
+
+    circuit_failure_threshold: int = 5
+    """Consecutive outage failures that open a provider's breaker (0 disables)."""
+
+    circuit_reset_seconds: float = 30.0
+
+    def circuit_breaker(self, provider: str) -> CircuitBreaker:
+        return get_circuit_breaker(
+            provider,
+            failure_threshold=self.circuit_failure_threshold,
+            reset_seconds=self.circuit_reset_seconds,
+        )
+
+    def backoff(self, attempt: int, base_delay: float) -> float:
+        """Full-jitter exponential backoff: uniform(0, min(max_delay, base * 2**attempt))."""
+        ceiling = min(self.max_delay, base_delay * (2**attempt))
+        return random.uniform(0, max(0.0, ceiling))
+
+    def is_transient(self, error: Exception, status_code: int | None) -> bool:
+        if status_code is not None:
+            return status_code in RETRYABLE_STATUS_CODES
+        if isinstance(error, ProviderKeyError):
+            message = str(error).lower()
+            if any(keyword in message for keyword in TRANSIENT_KEYWORDS):
+                return True
+        # SDK connection errors and timeouts carry no status. Anything else is
+        # most likely a local bug: give up rather than retry it.
+        transient_types = transient_error_types()
+        return any(isinstance(candidate, transient_types) for candidate in _iter_error_chain(error))
+
+    def counts_toward_circuit(
+        self, error: Exception, status_code: int | None, retry_after: float | None
+    ) -> bool:
+        """Whether a transient failure looks like an outage rather than a rate limit."""
+        if status_code is not None:
+            return status_code >= 500 and retry_after is None
+        transient_types = transient_error_types()
+        return any(isinstance(candidate, transient_types) for candidate in _iter_error_chain(error))
+
+    def decide(self, error: Exception, attempt: int, *, base_delay: float) -> RetryDecision:
+        if isinstance(error, (AgentConfigError, ServerConfigError)):
+            return RetryDecision(RetryAction.FATAL, reason="configuration error")
+
+        status_code = extract_status_code(error)
+        if not self.is_transient(error, status_code):
+            action = (
+                RetryAction.FATAL if isinstance(error, ProviderKeyError) else RetryAction.GIVE_UP
+            )
+            return RetryDecision(action, status_code=status_code, reason="not transient")
+
+        retry_after = None
+        if self.respect_retry_after:
+            retry_after = retry_after_from_headers(
+                extract_headers(error), include_rate_limit_resets=status_code == 429
+            )
+        trips_circuit = self.counts_toward_circuit(error, status_code, retry_after)
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return RetryDecision(
+                    RetryAction.GIVE_UP,
+                    transient=True,
+                    status_code=status_code,
+                    retry_after=retry_after,
+                    reason="retry-after exceeds max_retry_after",
+                    trips_circuit=trips_circuit,
+                )
+            delay = retry_after + random.uniform(0, self.retry_after_jitter)
+            reason = "retry-after"
+        else:
+            delay = self.backoff(attempt, base_delay)
+            reason = "backoff"
+
+        return RetryDecision(
+            RetryAction.RETRY,
+            delay=delay,
+            transient=True,
+            status_code=status_code,
+            retry_after=retry_after,
+            reason=reason,
+            trips_circuit=trips_circuit,
+        )
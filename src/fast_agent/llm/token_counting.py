@@ -0,0 +1,335 @@
+"""
+Local token counting for messages and histories.
+
+Several features need token counts before a request is sent: context budgeting
+and compaction, the ``/status`` context line, streaming progress and rate
+limiting. Resolving a tiktoken encoding is expensive (and may download the BPE
+file), and re-encoding a whole history for every request is wasted work when
+only the newest messages changed.
+
+``TokenCounter`` keeps one encoder per model family, resolved once per model
+name, and memoizes per-message counts keyed by the message's content
+signature: the length and hash of each text part. Python strings cache their
+hash and survive ``model_copy(deep=True)`` unchanged, so the per-request
+history copies made by agents hit the memo at the cost of a tuple build.
+
+Resolving an encoder blocks, so agents warm it in a worker thread when an LLM
+is attached (``TokenCounter.warm``). Request paths that need exact counts
+(compaction, rate limiting) await that warm-up with ``wait_ready``; streaming
+progress counts with ``load=False`` and uses the heuristic until the encoder
+is ready rather than stalling the event loop on the first chunk.
+
+Models tiktoken does not know (or environments where tiktoken or its encoding
+files are unavailable) use a heuristic calibrated against BPE tokenizers from
+character and word counts. Binary content (images, audio, blobs) is not
+tokenized; it is estimated from its encoded length.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+from mcp.types import (
+    AudioContent,
+    BlobResourceContents,
+    ContentBlock,
+    EmbeddedResource,
+    ImageContent,
+    ResourceLink,
+    TextContent,
+    TextResourceContents,
+)
+
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.llm.usage_tracking import CHARS_PER_TOKEN_ESTIMATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+    from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
+logger = get_logger(__name__)
+
+HEURISTIC_FAMILY = "heuristic"
+"""Family name used when no tokenizer is available for a model."""
+
+_WORDS_PER_TOKEN = 0.75
+
+
+class _Encoding(Protocol):
+    def encode_ordinary(self, text: str) -> list[int]: ...
+
+    def encode_ordinary_batch(self, text: list[str]) -> list[list[int]]: ...
+
+
+def heuristic_token_count(text: str) -> int:
+    """Approximate the BPE token count of ``text`` from its character and word counts."""
+    if not text:
+        return 0
+    by_chars = (len(text) + CHARS_PER_TOKEN_ESTIMATE - 1) // CHARS_PER_TOKEN_ESTIMATE
+    by_words = int(len(text.split()) / _WORDS_PER_TOKEN + 0.5)
+    return max(by_chars, by_words)
+
+
+def _binary_tokens(chars: int) -> int:
+    return (chars + CHARS_PER_TOKEN_ESTIMATE - 1) // CHARS_PER_TOKEN_ESTIMATE
+
+
+def _add_block(block: ContentBlock, texts: list[str]) -> int:
+    """Append the text of ``block`` to ``texts``; return its binary length."""
+    if isinstance(block, TextContent):
+        texts.append(block.text)
+    elif isinstance(block, (ImageContent, AudioContent)):
+        return len(block.data)
+    elif isinstance(block, EmbeddedResource):
+        resource = block.resource
+        if isinstance(resource, TextResourceContents):
+            texts.append(resource.text)
+        elif isinstance(resource, BlobResourceContents):
+            return len(resource.blob)
+    elif isinstance(block, ResourceLink):
+        texts.append(str(block.uri))
+    return 0
+
+
+def message_parts(message: PromptMessageExtended) -> tuple[list[str], int]:
+    """Return the text parts of a message and the total length of its binary content."""
+    texts: list[str] = []
+    binary = 0
+    for block in message.content:
+        binary += _add_block(block, texts)
+    for request in (message.tool_calls or {}).values():
+        texts.append(request.params.name)
+        if request.params.arguments:
+            texts.append(json.dumps(request.params.arguments, default=str))
+    for result in (message.tool_results or {}).values():
+        for block in result.content:
+            binary += _add_block(block, texts)
+        if result.structuredContent:
+            texts.append(json.dumps(result.structuredContent, default=str))
+    return texts, binary
+
+
+def _load_tiktoken_encoding(encoding_name: str) -> _Encoding | None:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding(encoding_name)
+
+
+def _tiktoken_encoding_name(model: str) -> str | None:
+    try:
+        from tiktoken.model import encoding_name_for_model
+    except ImportError:
+        return None
+    try:
+        return encoding_name_for_model(model)
+    except KeyError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class TokenCounterStats:
+    hits: int
+    misses: int
+    entries: int
+
+
+class TokenCounter:
+    """Count tokens with a cached encoder per model family and memoized message counts."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 8192,
+        encoding_name_for_model: Callable[[str], str | None] = _tiktoken_encoding_name,
+        load_encoding: Callable[[str], _Encoding | None] = _load_tiktoken_encoding,
+    ) -> None:
+        self.max_entries = max_entries
+        self._encoding_name_for_model = encoding_name_for_model
+        self._load_encoding = load_encoding
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._families: dict[str, str] = {}
+        self._encodings: dict[str, _Encoding | None] = {}
+        self._memo: OrderedDict[tuple[Hashable, ...], int] = OrderedDict()
+        self._warming: dict[str, asyncio.Task[None]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def family(self, model: str | None) -> str:
+        """Return the tokenizer family (encoding name) used for ``model``."""
+        if not model:
+            return HEURISTIC_FAMILY
+        family = self._families.get(model)
+        if family is None:
+            family = self._encoding_name_for_model(model) or HEURISTIC_FAMILY
+            self._families[model] = family
+        return family
+
+    def _encoding(self, family: str) -> _Encoding | None:
+        if family == HEURISTIC_FAMILY:
+            return None
+        if family in self._encodings:
+            return self._encodings[family]
+        # Separate from the memo lock so loop callers counting with load=False
+        # never wait behind a load running in the warm-up thread.
+        with self._load_lock:
+            if family in self._encodings:
+                return self._encodings[family]
+            try:
+                encoding = self._load_encoding(family)
+            except Exception as exc:
+                logger.warning(
+                    "Token encoding unavailable; using heuristic token counts",
+                    data={"encoding": family, "error": str(exc)},
+                )
+                encoding = None
+            self._encodings[family] = encoding
+            return encoding
+
+    def _loaded_encoding(self, model: str | None) -> _Encoding | None:
+        """Return the encoder for ``model`` if it is already resolved, without loading it."""
+        family = self._families.get(model) if model else None
+        if family is None:
+            return None
+        return self._encodings.get(family)
+
+    def is_ready(self, model: str | None) -> bool:
+        """Whether counting for ``model`` can run without resolving an encoder."""
+        if not model:
+            return True
+        family = self._families.get(model)
+        return family is not None and (family == HEURISTIC_FAMILY or family in self._encodings)
+
+    def preload(self, model: str | None) -> None:
+        """Resolve the encoder for ``model`` now; this may read or download BPE files."""
+        self._encoding(self.family(model))
+
+    def warm(self, model: str | None) -> asyncio.Task[None] | None:
+        """Resolve the encoder for ``model`` in a worker thread, without waiting for it.
+
+        Must be called from a running event loop. Returns the warm-up task, or
+        None when there is nothing to load.
+        """
+        if not model or self.is_ready(model):
+            return None
+        task = self._warming.get(model)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(asyncio.to_thread(self.preload, model))
+            self._warming[model] = task
+            task.add_done_callback(lambda _: self._warming.pop(model, None))
+        return task
+
+    async def wait_ready(self, model: str | None) -> None:
+        """Wait until the encoder for ``model`` is resolved, loading it in a worker thread."""
+        task = self.warm(model)
+        if task is not None:
+            # Shielded: the warm-up is shared, so a cancelled caller must not cancel it
+            await asyncio.shield(task)
+
+    def count_text(self, text: str, model: str | None = None, *, load: bool = True) -> int:
+        """Count the tokens of ``text`` for ``model``.
+
+        With ``load=False`` the heuristic is used until the encoder has been
+        resolved (see ``warm``), so the call never blocks on loading it.
+        """
+        if not text:
+            return 0
+        encoding = self._encoding(self.family(model)) if load else self._loaded_encoding(model)
+        if encoding is None:
+            return heuristic_token_count(text)
+        return len(encoding.encode_ordinary(text))
+
+    def count_message(self, message: PromptMessageExtended, model: str | None = None) -> int:
+        """Count the tokens of one message, memoized by content."""
+        return self.count_messages([message], model)
+
+    def count_messages(
+        self, messages: Sequence[PromptMessageExtended], model: str | None = None
+    ) -> int:
+        """Count the tokens of a history, encoding only messages not seen before."""
+        return sum(self.count_each(messages, model))
+
+    def count_each(
+        self, messages: Sequence[PromptMessageExtended], model: str | None = None
+    ) -> list[int]:
+        """Return the token count of each message, batch-encoding the uncached ones."""
+        family = self.family(model)
+        counts: list[int] = [0] * len(messages)
+        pending: list[tuple[int, tuple[Hashable, ...], list[str], int]] = []
+
+        with self._lock:
+            for index, message in enumerate(messages):
+                texts, binary = message_parts(message)
+                key = (family, binary, *((len(text), hash(text)) for text in texts))
+                cached = self._memo.get(key)
+                if cached is None:
+                    pending.append((index, key, texts, binary))
+                    continue
+                self._memo.move_to_end(key)
+                self._hits += 1
+                counts[index] = cached
+
+        if not pending:
+            return counts
+
+        encoding = self._encoding(family)
+        batch = [text for _, _, texts, _ in pending for text in texts]
+        if encoding is not None and batch:
+            text_counts = [len(tokens) for tokens in encoding.encode_ordinary_batch(batch)]
+        else:
+            text_counts = [heuristic_token_count(text) for text in batch]
+
+        position = 0
+        with self._lock:
+            for index, key, texts, binary in pending:
+                count = sum(text_counts[position : position + len(texts)])
+                count += _binary_tokens(binary)
+                position += len(texts)
+                counts[index] = count
+                self._misses += 1
+                self._memo[key] = count
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+    @property
+    def stats(self) -> TokenCounterStats:
+        with self._lock:
+            return TokenCounterStats(hits=self._hits, misses=self._misses, entries=len(self._memo))
+
+
+_token_counter: TokenCounter | None = None
+_token_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the process-wide token counter."""
+    global _token_counter
+    with _token_counter_lock:
+        if _token_counter is None:
+            _token_counter = TokenCounter()
+        return _token_counter
+
+
+def reset_token_counter(counter: TokenCounter | None = None) -> None:
+    """Replace the process-wide token counter (used by tests)."""
+    global _token_counter
+    with _token_counter_lock:
+        _token_counter = counter
+
+
+def count_tokens(text: str, model: str | None = None, *, load: bool = True) -> int:
+    """Count the tokens of ``text`` with the process-wide counter."""
+    return get_token_counter().count_text(text, model, load=load)
@@ -0,0 +1,110 @@
+"""
+Reuse provider-format tool definitions across API calls.
+
+Every turn hands the LLM the agent's tool list, and every provider converts it
+into its own tool definition format - often walking and sanitizing each JSON
+schema. The aggregator hands out the same ``Tool`` objects until its tool index
+changes (attach, detach, refresh), so object identity marks a tool whose
+definition has already been built. An unchanged list therefore costs one
+identity comparison per tool instead of a schema walk.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+    from mcp import Tool
+
+ToolParamT = TypeVar("ToolParamT")
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSchemaCacheStats:
+    hits: int
+    misses: int
+    entries: int
+
+
+class ToolSchemaCache(Generic[ToolParamT]):
+    """
+    Per-LLM cache mapping ``Tool`` objects to converted provider tool definitions.
+
+    Entries are keyed by tool identity and hold a reference to the tool, so an
+    id cannot be reused while its entry is alive. Only tools present in the most
+    recent conversion are retained, and a change of dialect (provider format or
+    settings that affect conversion) drops every entry.
+
+    Converted definitions are shared between calls and must be treated as
+    read-only; callers that need to add request-scoped fields should copy them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[Tool, ToolParamT]] = {}
+        self._dialect: Hashable | None = None
+        self._last_tools: tuple[Tool, ...] = ()
+        self._last_converted: tuple[ToolParamT, ...] = ()
+        self._hits = 0
+        self._misses = 0
+
+    def convert(
+        self,
+        tools: Sequence[Tool],
+        convert: Callable[[Tool], ToolParamT],
+        *,
+        dialect: Hashable = None,
+    ) -> tuple[ToolParamT, ...]:
+        """
+        Convert ``tools`` reusing cached definitions for tools seen on the previous call.
+
+        Args:
+            tools: Tools advertised to the model for this request
+            convert: Provider conversion function for a single tool
+            dialect: Conversion format and settings - a change drops all entries
+
+        Returns:
+            Converted tool definitions, in the order of ``tools``
+        """
+        if dialect != self._dialect:
+            self.clear()
+            self._dialect = dialect
+
+        tools = tuple(tools)
+        if len(tools) == len(self._last_tools) and all(
+            tool is last for tool, last in zip(tools, self._last_tools)
+        ):
+            self._hits += len(tools)
+            return self._last_converted
+
+        previous = self._entries
+        current: dict[int, tuple[Tool, ToolParamT]] = {}
+        converted: list[ToolParamT] = []
+        for tool in tools:
+            entry = previous.get(id(tool))
+            if entry is None or entry[0] is not tool:
+                entry = (tool, convert(tool))
+                self._misses += 1
+            else:
+                self._hits += 1
+            current[id(tool)] = entry
+            converted.append(entry[1])
+
+        self._entries = current
+        self._last_tools = tools
+        self._last_converted = tuple(converted)
+        return self._last_converted
+
+    def clear(self) -> None:
+        """Drop all cached tool definitions."""
+        self._entries = {}
+        self._last_tools = ()
+        self._last_converted = ()
+
+    @property
+    def stats(self) -> ToolSchemaCacheStats:
+        return ToolSchemaCacheStats(
+            hits=self._hits, misses=self._misses, entries=len(self._entries)
+        )
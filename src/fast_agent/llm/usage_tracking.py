@@ -6,7 +6,7 @@ including detailed cache metrics and context window management.
 """
 
 import time
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 # Proper type imports for each provider
 try:
@@ -29,6 +29,11 @@ from fast_agent.core.logging.json_serializer import JsonValue, snapshot_json_val
 from fast_agent.llm.model_database import ModelDatabase
 from fast_agent.llm.provider_types import Provider
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
 
 # Fast-agent specific usage type for synthetic providers
 class FastAgentUsage(BaseModel):
@@ -399,6 +404,29 @@ class UsageAccumulator(BaseModel):
         }
 
 
+CHARS_PER_TOKEN_ESTIMATE = 4
+"""Rough characters-per-token ratio used when no provider count is available."""
+
+
+def estimate_request_tokens(
+    messages: "Sequence[PromptMessageExtended]",
+    usage_accumulator: UsageAccumulator | None = None,
+    *,
+    model: str | None = None,
+) -> int:
+    """Estimate input tokens for a request before it is sent.
+
+    Counts the outgoing messages locally, raised to the last measured context
+    size when the accumulator has one (history is usually resent).
+    """
+    from fast_agent.llm.token_counting import get_token_counter
+
+    estimate = get_token_counter().count_messages(messages, model)
+    if usage_accumulator is not None:
+        estimate = max(estimate, usage_accumulator.current_context_tokens)
+    return estimate
+
+
 # Utility functions for fast-agent integration
 def create_fast_agent_usage(
     input_content: str,
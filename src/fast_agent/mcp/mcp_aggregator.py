@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 from asyncio import Lock
@@ -36,7 +37,7 @@ from pydantic import AnyUrl, BaseModel, ConfigDict, Field
 
 from fast_agent.config import MCPServerSettings
 from fast_agent.context_dependent import ContextDependent
-from fast_agent.core.exceptions import ServerSessionTerminatedError
+from fast_agent.core.exceptions import ServerInitializationError, ServerSessionTerminatedError
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.core.logging.progress_payloads import build_progress_payload
 from fast_agent.core.model_resolution import (
@@ -345,6 +346,10 @@ class MCPAggregator(ContextDependent):
         # Track discovered Skybridge configurations per server
         self._skybridge_configs: dict[str, SkybridgeServerConfig] = {}
 
+        # Precomputed list_tools() result, rebuilt when the tool index version changes
+        self._tool_index_version = 0
+        self._tools_snapshot: tuple[tuple[int, int, int], list[Tool]] | None = None
+
         # Cache for server capabilities in non-persistent mode
         self._capabilities_cache: dict[str, ServerCapabilities] = {}
         self._capabilities_cache_lock = Lock()
@@ -540,11 +545,11 @@ class MCPAggregator(ContextDependent):
         skipped_servers: list[str] = []
         attached_results: list[MCPAttachResult] = []
 
-        servers_to_load = list(self._configured_server_names)
+        servers_to_load: list[str] = []
+        server_registry = self.context.server_registry if self.context else None
 
-        for server_name in servers_to_load:
+        for server_name in self._configured_server_names:
             # Check if server should be loaded on start
-            server_registry = self.context.server_registry if self.context else None
             if server_registry is not None:
                 server_config = server_registry.get_server_config(server_name)
                 if (
@@ -555,13 +560,48 @@ class MCPAggregator(ContextDependent):
                     logger.debug(f"Skipping server '{server_name}' - load_on_start=False")
                     skipped_servers.append(server_name)
                     continue
+            servers_to_load.append(server_name)
+            # Register up front so concurrent attaches cannot reorder server_names.
+            if server_name not in self.server_names:
+                self.server_names.append(server_name)
 
-            attached_results.append(
-                await self.attach_server(
-                    server_name=server_name,
-                    options=MCPAttachOptions(),
+        concurrency, deadline = self._startup_limits()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def attach_with_limits(server_name: str) -> MCPAttachResult:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.attach_server(server_name=server_name, options=MCPAttachOptions()),
+                        timeout=deadline,
+                    )
+                except TimeoutError as exc:
+                    raise ServerInitializationError(
+                        f"MCP server '{server_name}' did not start within {deadline}s",
+                        "Increase mcp.startup_deadline_seconds or check the server.",
+                    ) from exc
+
+        results = await gather_with_cancel(attach_with_limits(name) for name in servers_to_load)
+        await self._reorder_runtime_indexes(self._configured_server_names)
+
+        failures: list[tuple[str, BaseException]] = []
+        for server_name, result in zip(servers_to_load, results, strict=True):
+            if isinstance(result, BaseException):
+                failures.append((server_name, result))
+            else:
+                attached_results.append(result)
+
+        if failures:
+            if len(failures) > 1:
+                logger.error(
+                    "Multiple MCP servers failed to start",
+                    data={
+                        "agent_name": self.agent_name,
+                        "servers": [name for name, _ in failures],
+                    },
                 )
-            )
+            # Servers that did start stay attached; report the first failure in config order.
+            raise failures[0][1]
 
         if skipped_servers:
             logger.debug(
@@ -583,6 +623,42 @@ class MCPAggregator(ContextDependent):
 
         self.initialized = True
 
+    def _startup_limits(self) -> tuple[int, float | None]:
+        """Concurrency and per-server deadline for startup attaches from ``mcp`` settings."""
+        config = getattr(self.context, "config", None) if self.context else None
+        mcp_settings = getattr(config, "mcp", None)
+        concurrency = getattr(mcp_settings, "startup_concurrency", None) or 8
+        deadline = getattr(mcp_settings, "startup_deadline_seconds", None)
+        return max(1, int(concurrency)), deadline
+
+    async def _reorder_runtime_indexes(self, order: list[str]) -> None:
+        """Put per-server indexes back into configured order after concurrent attaches."""
+        rank = {server_name: index for index, server_name in enumerate(order)}
+
+        def ordered(names) -> list[str]:
+            return sorted(names, key=lambda name: rank.get(name, len(rank)))
+
+        async with self._tool_map_lock:
+            self._server_to_tool_map = {
+                name: self._server_to_tool_map[name] for name in ordered(self._server_to_tool_map)
+            }
+            self._namespaced_tool_map = {
+                tool.namespaced_tool_name: tool
+                for tools in self._server_to_tool_map.values()
+                for tool in tools
+            }
+
+        async with self._prompt_cache_lock:
+            self._prompt_cache = {
+                name: self._prompt_cache[name] for name in ordered(self._prompt_cache)
+            }
+
+        self._skybridge_configs = {
+            name: self._skybridge_configs[name] for name in ordered(self._skybridge_configs)
+        }
+        self._attached_server_names = ordered(self._attached_server_names)
+        self._invalidate_tools_snapshot()
+
     async def _reset_runtime_indexes(self) -> None:
         async with self._tool_map_lock:
             self._namespaced_tool_map.clear()
@@ -596,6 +672,7 @@ class MCPAggregator(ContextDependent):
 
         self._skybridge_configs.clear()
         self._attached_server_names = []
+        self._invalidate_tools_snapshot()
 
     async def _fetch_server_tools(self, server_name: str) -> list[Tool]:
         supports_tools = await self.server_supports_feature(server_name, "tools")
@@ -723,8 +800,15 @@ class MCPAggregator(ContextDependent):
         if server_name not in self.server_names:
             self.server_names.append(server_name)
 
-        tools = await self._fetch_server_tools(server_name)
-        prompts = await self._fetch_server_prompts(server_name)
+        tools_result, prompts_result = await gather_with_cancel(
+            [self._fetch_server_tools(server_name), self._fetch_server_prompts(server_name)]
+        )
+        if isinstance(tools_result, BaseException):
+            raise tools_result
+        tools = cast("list[Tool]", tools_result)
+        prompts: list[Prompt] = (
+            [] if isinstance(prompts_result, BaseException) else cast("list[Prompt]", prompts_result)
+        )
 
         async with self._tool_map_lock:
             for namespaced in self._server_to_tool_map.get(server_name, []):
@@ -747,6 +831,7 @@ class MCPAggregator(ContextDependent):
         skybridge_result = await self._evaluate_skybridge_for_server(server_name)
         _, skybridge_config = skybridge_result
         self._skybridge_configs[server_name] = skybridge_config
+        self._invalidate_tools_snapshot()
 
         if server_name not in self._attached_server_names:
             self._attached_server_names.append(server_name)
@@ -804,6 +889,7 @@ class MCPAggregator(ContextDependent):
             self._capabilities_cache.pop(server_name, None)
 
         self._skybridge_configs.pop(server_name, None)
+        self._invalidate_tools_snapshot()
         self._attached_server_names = [
             name for name in self._attached_server_names if name != server_name
         ]
@@ -843,6 +929,7 @@ class MCPAggregator(ContextDependent):
 
             server_name, config = result
             self._skybridge_configs[server_name] = config
+            self._invalidate_tools_snapshot()
 
     async def _evaluate_skybridge_for_server(
         self, server_name: str
@@ -1100,30 +1187,42 @@ class MCPAggregator(ContextDependent):
         if not self.initialized:
             await self.load_servers()
 
-        tools: list[Tool] = []
+        # Tools in the snapshot are shared between calls and must be treated as read-only.
+        return ListToolsResult.model_construct(tools=list(self._current_tools_snapshot()))
 
-        for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items():
-            tool_copy = namespaced_tool.tool.model_copy(
-                deep=True, update={"name": namespaced_tool_name}
-            )
-            skybridge_config = self._skybridge_configs.get(namespaced_tool.server_name)
-            if skybridge_config:
-                matching_tool = next(
-                    (
-                        tool
-                        for tool in skybridge_config.tools
-                        if tool.namespaced_tool_name == namespaced_tool_name and tool.is_valid
-                    ),
-                    None,
-                )
-                if matching_tool:
-                    meta = dict(tool_copy.meta or {})
-                    meta["openai/skybridgeEnabled"] = True
-                    meta["openai/skybridgeTemplate"] = str(matching_tool.template_uri)
-                    tool_copy.meta = meta
-            tools.append(tool_copy)
+    def _invalidate_tools_snapshot(self) -> None:
+        """Mark the aggregated tool list stale after the tool index or Skybridge configs change."""
+        self._tool_index_version += 1
 
-        return ListToolsResult(tools=tools)
+    def _current_tools_snapshot(self) -> list[Tool]:
+        key = (
+            self._tool_index_version,
+            id(self._namespaced_tool_map),
+            id(self._skybridge_configs),
+        )
+        if self._tools_snapshot is not None and self._tools_snapshot[0] == key:
+            return self._tools_snapshot[1]
+
+        skybridge_templates: dict[str, str] = {
+            tool.namespaced_tool_name: str(tool.template_uri)
+            for config in self._skybridge_configs.values()
+            for tool in config.tools
+            if tool.is_valid
+        }
+
+        tools: list[Tool] = []
+        for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items():
+            update: dict[str, Any] = {"name": namespaced_tool_name}
+            template = skybridge_templates.get(namespaced_tool_name)
+            if template is not None:
+                meta = dict(namespaced_tool.tool.meta or {})
+                meta["openai/skybridgeEnabled"] = True
+                meta["openai/skybridgeTemplate"] = template
+                update["meta"] = meta
+            tools.append(namespaced_tool.tool.model_copy(update=update))
+
+        self._tools_snapshot = (key, tools)
+        return tools
 
     async def refresh_all_tools(self) -> None:
         """
@@ -2567,6 +2666,7 @@ class MCPAggregator(ContextDependent):
 
                         self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
                         self._server_to_tool_map[server_name].append(namespaced_tool)
+                    self._invalidate_tools_snapshot()
 
                 logger.info(
                     f"Successfully refreshed tools for server '{server_name}'",
@@ -137,8 +137,19 @@ def from_json(json_str: str) -> list[PromptMessageExtended]:
         List of PromptMessageExtended objects
     """
     # Parse JSON to dictionary
-    result_dict = json.loads(json_str)
+    return from_dict(json.loads(json_str))
 
+
+def from_dict(result_dict: dict) -> list[PromptMessageExtended]:
+    """
+    Parse a decoded JSON prompt document into PromptMessageExtended objects.
+
+    Args:
+        result_dict: Dictionary with a "messages" array (enhanced or legacy format)
+
+    Returns:
+        List of PromptMessageExtended objects
+    """
     # Extract messages array
     messages_data = result_dict.get("messages", [])
 
@@ -197,7 +208,8 @@ def load_json(file_path: str) -> list[PromptMessageExtended]:
     """
     Load PromptMessageExtended objects from a JSON file.
 
-    Handles both enhanced format and legacy GetPromptResult format.
+    Handles both enhanced format and legacy GetPromptResult format. Session
+    history snapshots are extended with the messages recorded in their journal.
 
     Args:
         file_path: Path to the JSON file
@@ -209,13 +221,23 @@ def load_json(file_path: str) -> list[PromptMessageExtended]:
         json_str = f.read()
 
     try:
-        return from_json(json_str)
+        result_dict = json.loads(json_str)
     except json.JSONDecodeError as exc:
         raise AgentConfigError(
             f"Failed to parse JSON prompt file: {file_path}",
             str(exc),
         ) from exc
 
+    generation = result_dict.get("journal_generation")
+    if isinstance(generation, str):
+        from fast_agent.session.history_journal import read_journal
+
+        result_dict["messages"] = [
+            *result_dict.get("messages", []),
+            *read_journal(file_path, generation, len(result_dict.get("messages", []))),
+        ]
+    return from_dict(result_dict)
+
 
 def save_messages(messages: list[PromptMessageExtended], file_path: str) -> None:
     """
@@ -0,0 +1,136 @@
+"""
+Per-agent admission control for shared-scope MCP serving.
+
+In ``shared`` scope every client talks to the same agent instances. An agent
+holds a single conversation history, so two requests running at once against
+the same agent interleave their messages, and nothing else limits how many
+requests pile up in memory under a burst.
+
+``AgentAdmission`` gives each agent a gate: at most ``max_concurrent`` requests
+run at once (1 serializes them), at most ``max_queue`` more wait in arrival
+order, and a request that cannot start within ``max_wait`` seconds is turned
+away. Rejections raise ``AdmissionRejected`` with a retry hint so clients can
+back off and try again. Queue depth and wait times are kept per agent for the
+server's status output.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+
+class AdmissionRejected(Exception):
+    """Raised when an agent is saturated and a request cannot be admitted."""
+
+    def __init__(self, agent_name: str, reason: str, retry_after: float) -> None:
+        self.agent_name = agent_name
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(
+            f"Agent '{agent_name}' is busy ({reason}); retry in about {retry_after:.0f}s."
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AgentAdmissionStats:
+    active: int
+    queued: int
+    admitted: int
+    rejected: int
+    mean_wait: float
+    """Mean time admitted requests waited, in seconds."""
+    max_wait: float
+    """Longest time an admitted request waited, in seconds."""
+
+
+class _Gate:
+    __slots__ = ("admitted", "active", "queued", "rejected", "semaphore", "total_wait", "max_wait")
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class AgentAdmission:
+    """Bound concurrent and queued requests per agent."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 1,
+        max_queue: int = 32,
+        max_wait: float | None = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.max_wait = max_wait
+        self._clock = clock
+        self._gates: dict[str, _Gate] = {}
+
+    def _gate(self, agent_name: str) -> _Gate:
+        gate = self._gates.get(agent_name)
+        if gate is None:
+            gate = _Gate(self.max_concurrent)
+            self._gates[agent_name] = gate
+        return gate
+
+    def _retry_after(self, gate: _Gate) -> float:
+        mean_wait = gate.total_wait / gate.admitted if gate.admitted else 0.0
+        return max(1.0, mean_wait)
+
+    @asynccontextmanager
+    async def admit(self, agent_name: str) -> AsyncIterator[None]:
+        """Wait for a slot on ``agent_name``; raise ``AdmissionRejected`` when saturated."""
+        gate = self._gate(agent_name)
+        if gate.semaphore.locked() and gate.queued >= self.max_queue:
+            gate.rejected += 1
+            raise AdmissionRejected(agent_name, "queue full", self._retry_after(gate))
+
+        start = self._clock()
+        gate.queued += 1
+        try:
+            await asyncio.wait_for(gate.semaphore.acquire(), self.max_wait)
+        except TimeoutError:
+            gate.rejected += 1
+            raise AdmissionRejected(
+                agent_name, "timed out waiting in queue", self._retry_after(gate)
+            ) from None
+        finally:
+            gate.queued -= 1
+
+        waited = self._clock() - start
+        gate.admitted += 1
+        gate.total_wait += waited
+        gate.max_wait = max(gate.max_wait, waited)
+        gate.active += 1
+        try:
+            yield
+        finally:
+            gate.active -= 1
+            gate.semaphore.release()
+
+    def stats(self) -> dict[str, AgentAdmissionStats]:
+        return {
+            agent_name: AgentAdmissionStats(
+                active=gate.active,
+                queued=gate.queued,
+                admitted=gate.admitted,
+                rejected=gate.rejected,
+                mean_wait=gate.total_wait / gate.admitted if gate.admitted else 0.0,
+                max_wait=gate.max_wait,
+            )
+            for agent_name, gate in sorted(self._gates.items())
+        }
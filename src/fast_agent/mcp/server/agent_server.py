@@ -1,14 +1,16 @@
 """Agent MCP server."""
 
 import asyncio
+import contextlib
 import logging
 import os
 import time
 from importlib.metadata import version as get_version
-from typing import Any, Awaitable, Callable, Literal, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, cast
 
 from fastmcp import Context as MCPContext
 from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
 from fastmcp.prompts import Message
 from fastmcp.server.auth import RemoteAuthProvider
 from fastmcp.server.dependencies import get_access_token
@@ -26,10 +28,15 @@ from fast_agent.llm.request_params import (
 )
 from fast_agent.mcp.auth.middleware import HFAuthHeaderMiddleware
 from fast_agent.mcp.prompts.prompt_server import convert_to_fastmcp_messages
+from fast_agent.mcp.server.admission import AdmissionRejected, AgentAdmission
+from fast_agent.mcp.server.instance_pool import AgentInstancePool
 from fast_agent.mcp.tool_progress import MCPToolProgressManager
 from fast_agent.types import PromptMessageExtended, RequestParams
 from fast_agent.utils.async_utils import run_sync
 
+if TYPE_CHECKING:
+    from fast_agent.config import AdmissionSettings, InstancePoolSettings
+
 logger = get_logger(__name__)
 
 
@@ -99,6 +106,8 @@ class AgentMCPServer:
         get_registry_version: Callable[[], int] | None = None,
         reload_callback: Callable[[], Awaitable[bool]] | None = None,
         tool_name_template: str | None = None,
+        instance_pool: "InstancePoolSettings | None" = None,
+        admission: "AdmissionSettings | None" = None,
     ) -> None:
         self.primary_instance = primary_instance
         self._create_instance_task = create_instance
@@ -116,6 +125,24 @@ class AgentMCPServer:
         self._tool_name_template = tool_name_template or "{agent}"
         if "{agent}" not in self._tool_name_template:
             raise ValueError("tool_name_template must include '{agent}'.")
+        self._instance_pool: AgentInstancePool | None = None
+        if instance_scope == "request" and instance_pool is not None and instance_pool.enabled:
+            self._instance_pool = AgentInstancePool(
+                create_instance,
+                dispose_instance,
+                min_size=instance_pool.min_size,
+                max_size=instance_pool.max_size,
+                max_reuse=instance_pool.max_reuse,
+                idle_ttl=instance_pool.idle_ttl_seconds,
+                get_registry_version=get_registry_version,
+            )
+        self._admission: AgentAdmission | None = None
+        if instance_scope == "shared" and admission is not None and admission.enabled:
+            self._admission = AgentAdmission(
+                max_concurrent=admission.max_concurrent_per_agent,
+                max_queue=admission.max_queue_per_agent,
+                max_wait=admission.max_wait_seconds,
+            )
 
         oauth_provider, oauth_scopes, resource_url = _get_oauth_config()
         auth_provider = None
@@ -155,9 +182,11 @@ class AgentMCPServer:
             from starlette.responses import PlainTextResponse
 
             version = _get_fast_agent_version() or "unknown"
-            return PlainTextResponse(
-                f"fast-agent mcp server (v{version}) - see https://fast-agent.ai for more information."
-            )
+            lines = [
+                f"fast-agent mcp server (v{version}) - see https://fast-agent.ai for more information.",
+                *self._status_lines(),
+            ]
+            return PlainTextResponse("\n".join(lines))
 
         self._registered_agents: set[str] = set(primary_instance.agents.keys())
         self.std_logger = logging.getLogger("fast_agent.server")
@@ -234,48 +263,63 @@ class AgentMCPServer:
 
             request_params = RequestParams(**request_param_overrides)
             try:
-                instance = await self._acquire_instance(ctx)
-                agent_instance = instance.app[agent_name]
-                agent_context = getattr(agent_instance, "context", None)
-
-                async def execute_send() -> str:
-                    start = time.perf_counter()
-                    logger.info(
-                        f"MCP request received for agent '{agent_name}'",
-                        name="mcp_request_start",
-                        agent=agent_name,
-                        session=self._session_identifier(ctx),
-                    )
-                    self.std_logger.info(
-                        "MCP request received for agent '%s' (scope=%s)",
-                        agent_name,
-                        self._instance_scope,
-                    )
-
-                    response = await agent_instance.send(message, request_params=request_params)
-                    duration = time.perf_counter() - start
-
-                    logger.info(
-                        f"Agent '{agent_name}' completed MCP request",
-                        name="mcp_request_complete",
-                        agent=agent_name,
-                        duration=duration,
-                        session=self._session_identifier(ctx),
-                    )
-                    self.std_logger.info(
-                        "Agent '%s' completed MCP request in %.2fs (scope=%s)",
-                        agent_name,
-                        duration,
-                        self._instance_scope,
-                    )
-                    return response
-
-                try:
-                    if agent_context is not None:
-                        return await self.with_bridged_context(agent_context, ctx, execute_send)
-                    return await execute_send()
-                finally:
-                    await self._release_instance(ctx, instance)
+                async with self._admit(agent_name):
+                    instance = await self._acquire_instance(ctx)
+                    succeeded = False
+                    agent_instance = instance.app[agent_name]
+                    agent_context = getattr(agent_instance, "context", None)
+
+                    async def execute_send() -> str:
+                        start = time.perf_counter()
+                        logger.info(
+                            f"MCP request received for agent '{agent_name}'",
+                            name="mcp_request_start",
+                            agent=agent_name,
+                            session=self._session_identifier(ctx),
+                        )
+                        self.std_logger.info(
+                            "MCP request received for agent '%s' (scope=%s)",
+                            agent_name,
+                            self._instance_scope,
+                        )
+
+                        response = await agent_instance.send(message, request_params=request_params)
+                        duration = time.perf_counter() - start
+
+                        logger.info(
+                            f"Agent '{agent_name}' completed MCP request",
+                            name="mcp_request_complete",
+                            agent=agent_name,
+                            duration=duration,
+                            session=self._session_identifier(ctx),
+                        )
+                        self.std_logger.info(
+                            "Agent '%s' completed MCP request in %.2fs (scope=%s)",
+                            agent_name,
+                            duration,
+                            self._instance_scope,
+                        )
+                        return response
+
+                    try:
+                        if agent_context is not None:
+                            response = await self.with_bridged_context(
+                                agent_context, ctx, execute_send
+                            )
+                        else:
+                            response = await execute_send()
+                        succeeded = True
+                        return response
+                    finally:
+                        await self._release_instance(ctx, instance, reusable=succeeded)
+            except AdmissionRejected as exc:
+                logger.warning(
+                    f"Rejected MCP request for agent '{agent_name}': {exc.reason}",
+                    name="mcp_request_rejected",
+                    agent=agent_name,
+                    reason=exc.reason,
+                )
+                raise ToolError(str(exc)) from exc
             finally:
                 request_bearer_token.reset(saved_token)
 
@@ -322,6 +366,30 @@ class AgentMCPServer:
             finally:
                 await self._release_instance(ctx, instance, reuse_connection=True)
 
+    def _admit(self, agent_name: str) -> contextlib.AbstractAsyncContextManager[None]:
+        if self._admission is None:
+            return contextlib.nullcontext()
+        return self._admission.admit(agent_name)
+
+    def _status_lines(self) -> list[str]:
+        """Admission queue and instance pool metrics for the root info page."""
+        lines: list[str] = []
+        if self._admission is not None:
+            for agent_name, stats in self._admission.stats().items():
+                lines.append(
+                    f"agent {agent_name}: active={stats.active} queued={stats.queued} "
+                    f"admitted={stats.admitted} rejected={stats.rejected} "
+                    f"mean_wait={stats.mean_wait:.3f}s max_wait={stats.max_wait:.3f}s"
+                )
+        if self._instance_pool is not None:
+            stats = self._instance_pool.stats
+            lines.append(
+                f"instance pool: idle={stats.idle} in_use={stats.in_use} "
+                f"created={stats.created} reused={stats.reused} retired={stats.retired} "
+                f"overflow={stats.overflow} failed_creates={stats.failed_creates}"
+            )
+        return lines
+
     def _register_missing_agents(self, instance: AgentInstance) -> None:
         new_agents = set(instance.agents.keys())
         for agent_name in sorted(new_agents - self._registered_agents):
@@ -401,6 +469,8 @@ class AgentMCPServer:
             return self.primary_instance
 
         if self._instance_scope == "request":
+            if self._instance_pool is not None:
+                return await self._instance_pool.acquire()
             return await self._create_instance_task()
 
         assert ctx is not None, "Context is required for connection-scoped instances"
@@ -419,6 +489,7 @@ class AgentMCPServer:
         instance: AgentInstance,
         *,
         reuse_connection: bool = False,
+        reusable: bool = True,
     ) -> None:
         del ctx, reuse_connection
         if self._instance_scope == "shared":
@@ -427,6 +498,9 @@ class AgentMCPServer:
             await self._dispose_stale_instances_if_idle()
             return
         if self._instance_scope == "request":
+            if self._instance_pool is not None:
+                await self._instance_pool.release(instance, reusable=reusable)
+                return
             await self._dispose_instance_task(instance)
 
     def _connection_key(self, ctx: MCPContext) -> int:
@@ -571,6 +645,8 @@ class AgentMCPServer:
         port: int = 8000,
     ) -> None:
         """Run the MCP server asynchronously."""
+        if self._instance_pool is not None:
+            self._instance_pool.warm()
         try:
             if transport == "http":
                 await self.mcp_server.run_http_async(
@@ -626,6 +702,8 @@ class AgentMCPServer:
 
     async def shutdown(self) -> None:
         """Dispose all managed agent instances."""
+        if self._instance_pool is not None:
+            await self._instance_pool.close()
         await self._dispose_all_connection_instances()
         await self._dispose_primary_instance()
         await self._dispose_all_stale_instances()
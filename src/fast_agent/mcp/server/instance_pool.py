@@ -0,0 +1,249 @@
+"""
+Pool of agent instances for request-scoped MCP serving.
+
+In ``request`` scope every tool call needs an agent instance with an empty
+history. Building one (agents, LLMs and their MCP server connections) and
+tearing it down again dominates the cost of a call, so instead of disposing
+an instance after each request the pool clears its conversation history and
+hands it to the next request.
+
+- ``min_size`` instances are built in the background ahead of demand, and the
+  pool is topped back up after instances are retired.
+- At most ``max_size`` instances are kept. Requests beyond that still get an
+  instance of their own; it is disposed when the request finishes.
+- An instance is retired after ``max_reuse`` requests, when a request using it
+  fails, or when the agent registry version has moved past the version it was
+  built from (AgentCard reloads).
+- Idle instances above ``min_size`` are retired after ``idle_ttl`` seconds.
+  Expiry is checked whenever an instance is acquired or released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from fast_agent.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fast_agent.core.fastagent import AgentInstance
+
+logger = get_logger(__name__)
+
+
+async def reset_instance_history(instance: AgentInstance) -> None:
+    """Clear the conversation history of every agent, keeping prompt templates."""
+    for agent in instance.agents.values():
+        clear = getattr(agent, "clear", None)
+        if clear is None:
+            continue
+        result = clear(clear_prompts=False)
+        if inspect.isawaitable(result):
+            await result
+
+
+@dataclass(slots=True)
+class _PooledInstance:
+    instance: AgentInstance
+    uses: int = 0
+    idle_since: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class InstancePoolStats:
+    idle: int
+    in_use: int
+    created: int
+    reused: int
+    retired: int
+    overflow: int
+    """Requests served by a one-off instance because the pool was at ``max_size``."""
+    failed_creates: int
+
+
+class AgentInstancePool:
+    """Reuse agent instances across requests, resetting history in between."""
+
+    def __init__(
+        self,
+        create_instance: Callable[[], Awaitable[AgentInstance]],
+        dispose_instance: Callable[[AgentInstance], Awaitable[None]],
+        *,
+        min_size: int = 1,
+        max_size: int = 8,
+        max_reuse: int = 100,
+        idle_ttl: float | None = 300.0,
+        get_registry_version: Callable[[], int] | None = None,
+        reset_instance: Callable[[AgentInstance], Awaitable[None]] = reset_instance_history,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max(1, max_size)
+        self.min_size = min(max(0, min_size), self.max_size)
+        self.max_reuse = max(1, max_reuse)
+        self.idle_ttl = idle_ttl
+        self._create_instance = create_instance
+        self._dispose_instance = dispose_instance
+        self._get_registry_version = get_registry_version
+        self._reset_instance = reset_instance
+        self._clock = clock
+        self._idle: list[_PooledInstance] = []
+        self._in_use: dict[int, _PooledInstance] = {}
+        self._pending = 0
+        self._warm_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+        self._retired = 0
+        self._overflow = 0
+        self._failed_creates = 0
+
+    @property
+    def stats(self) -> InstancePoolStats:
+        return InstancePoolStats(
+            idle=len(self._idle),
+            in_use=len(self._in_use),
+            created=self._created,
+            reused=self._reused,
+            retired=self._retired,
+            overflow=self._overflow,
+            failed_creates=self._failed_creates,
+        )
+
+    @property
+    def size(self) -> int:
+        """Instances owned by the pool, including ones still being built."""
+        return len(self._idle) + len(self._in_use) + self._pending
+
+    def warm(self) -> None:
+        """Build instances in the background until ``min_size`` are available."""
+        if self._closed or (self._warm_task is not None and not self._warm_task.done()):
+            return
+        if self.size >= self.min_size:
+            return
+        self._warm_task = asyncio.create_task(self._fill_to_min())
+
+    async def acquire(self) -> AgentInstance:
+        """Return an idle instance, or build a new one."""
+        await self._retire_expired()
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_current(pooled):
+                self._in_use[id(pooled.instance)] = pooled
+                self._reused += 1
+                self.warm()
+                return pooled.instance
+            await self._retire(pooled, reason="registry changed")
+
+        if self.size >= self.max_size:
+            self._overflow += 1
+            return await self._create_instance()
+
+        self._pending += 1
+        try:
+            instance = await self._create_instance()
+        except BaseException:
+            self._failed_creates += 1
+            raise
+        finally:
+            self._pending -= 1
+        self._created += 1
+        self._in_use[id(instance)] = _PooledInstance(instance)
+        self.warm()
+        return instance
+
+    async def release(self, instance: AgentInstance, *, reusable: bool = True) -> None:
+        """Return an instance after a request; it is reset for reuse or retired."""
+        pooled = self._in_use.pop(id(instance), None)
+        if pooled is None:
+            # One-off instance created while the pool was full.
+            await self._dispose(instance)
+            return
+
+        pooled.uses += 1
+        reason = None
+        if self._closed:
+            reason = "pool closed"
+        elif not reusable:
+            reason = "request failed"
+        elif pooled.uses >= self.max_reuse:
+            reason = "max reuse reached"
+        elif not self._is_current(pooled):
+            reason = "registry changed"
+        if reason is None:
+            try:
+                await self._reset_instance(instance)
+            except Exception as exc:
+                logger.warning("Failed to reset pooled agent instance", data={"error": str(exc)})
+                reason = "reset failed"
+
+        if reason is not None:
+            await self._retire(pooled, reason=reason)
+            self.warm()
+        else:
+            pooled.idle_since = self._clock()
+            self._idle.append(pooled)
+        await self._retire_expired()
+
+    async def close(self) -> None:
+        """Stop warming and dispose idle instances; in-use instances are retired on release."""
+        self._closed = True
+        if self._warm_task is not None and not self._warm_task.done():
+            self._warm_task.cancel()
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                pass
+        idle = list(self._idle)
+        self._idle.clear()
+        for pooled in idle:
+            await self._retire(pooled, reason="pool closed")
+
+    def _is_current(self, pooled: _PooledInstance) -> bool:
+        if self._get_registry_version is None:
+            return True
+        return pooled.instance.registry_version >= self._get_registry_version()
+
+    async def _fill_to_min(self) -> None:
+        while not self._closed and self.size < self.min_size:
+            self._pending += 1
+            try:
+                instance = await self._create_instance()
+            except Exception as exc:
+                self._failed_creates += 1
+                logger.warning("Failed to pre-warm agent instance", data={"error": str(exc)})
+                return
+            finally:
+                self._pending -= 1
+            self._created += 1
+            if self._closed:
+                await self._dispose(instance)
+                return
+            self._idle.append(_PooledInstance(instance, idle_since=self._clock()))
+
+    async def _retire_expired(self) -> None:
+        if self.idle_ttl is None or len(self._idle) <= self.min_size:
+            return
+        cutoff = self._clock() - self.idle_ttl
+        # Oldest first; keep at least min_size idle instances.
+        self._idle.sort(key=lambda pooled: pooled.idle_since)
+        while len(self._idle) > self.min_size and self._idle[0].idle_since <= cutoff:
+            await self._retire(self._idle.pop(0), reason="idle timeout")
+
+    async def _retire(self, pooled: _PooledInstance, *, reason: str) -> None:
+        self._retired += 1
+        logger.debug(
+            "Retiring pooled agent instance",
+            data={"reason": reason, "uses": pooled.uses},
+        )
+        await self._dispose(pooled.instance)
+
+    async def _dispose(self, instance: AgentInstance) -> None:
+        try:
+            await self._dispose_instance(instance)
+        except Exception as exc:
+            logger.warning("Failed to dispose agent instance", data={"error": str(exc)})
@@ -0,0 +1,237 @@
+"""
+Indexed catalog of the sessions in a sessions directory.
+
+Listing sessions used to open and parse every ``session.json``. The catalog
+keeps the parsed metadata of each session together with the size and mtime of
+its ``session.json``, and persists that index to ``.session-index.json`` in
+the sessions directory. A listing only stats each metadata file and re-reads
+the ones that changed, so sessions created, edited or deleted outside this
+process (another fast-agent instance, a manual ``rm``) are repaired
+incrementally.
+
+Session metadata writes and deletions update the in-memory catalog directly;
+the index file is rewritten lazily, the next time a listing finds it stale.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from fast_agent.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+SESSION_INDEX_FILENAME = ".session-index.json"
+SESSION_INDEX_VERSION = 1
+SESSION_METADATA_FILENAME = "session.json"
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class _CatalogEntry:
+    mtime_ns: int
+    size: int
+    info: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class SessionCatalogStats:
+    listings: int
+    reloaded: int
+    index_writes: int
+
+
+class SessionCatalog:
+    """Cached, self-repairing index of session metadata for one sessions directory."""
+
+    def __init__(self, base_dir: pathlib.Path) -> None:
+        self.base_dir = base_dir
+        self.index_path = base_dir / SESSION_INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CatalogEntry] | None = None
+        self._dirty = False
+        self._listings = 0
+        self._reloaded = 0
+        self._index_writes = 0
+
+    def list_infos(self) -> list[dict[str, Any]]:
+        """Return the metadata dictionary of every session, repairing stale entries."""
+        with self._lock:
+            entries = self._load_index()
+            seen: set[str] = set()
+            try:
+                directories = list(os.scandir(self.base_dir))
+            except FileNotFoundError:
+                directories = []
+
+            for directory in directories:
+                if not directory.is_dir():
+                    continue
+                name = directory.name
+                metadata_path = os.path.join(directory.path, SESSION_METADATA_FILENAME)
+                try:
+                    stat = os.stat(metadata_path)
+                except OSError:
+                    continue
+                seen.add(name)
+                entry = entries.get(name)
+                if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    continue
+                info = self._read_metadata(metadata_path)
+                if info is None:
+                    seen.discard(name)
+                    continue
+                entries[name] = _CatalogEntry(stat.st_mtime_ns, stat.st_size, info)
+                self._reloaded += 1
+                self._dirty = True
+
+            for name in entries.keys() - seen:
+                del entries[name]
+                self._dirty = True
+
+            if self._dirty:
+                self._write_index(entries)
+            self._listings += 1
+            # Callers get copies; SessionInfo shares the dicts it is built from.
+            return [_copy_json(entry.info) for entry in entries.values()]
+
+    def record(self, name: str, info: dict[str, Any], metadata_path: pathlib.Path) -> None:
+        """Update the entry for a session whose metadata was just written."""
+        try:
+            stat = metadata_path.stat()
+        except OSError:
+            return
+        with self._lock:
+            entries = self._load_index()
+            entries[name] = _CatalogEntry(stat.st_mtime_ns, stat.st_size, info)
+            self._dirty = True
+
+    def forget(self, name: str) -> None:
+        """Drop the entry for a deleted session."""
+        with self._lock:
+            entries = self._load_index()
+            if entries.pop(name, None) is not None:
+                self._dirty = True
+
+    @property
+    def stats(self) -> SessionCatalogStats:
+        with self._lock:
+            return SessionCatalogStats(
+                listings=self._listings,
+                reloaded=self._reloaded,
+                index_writes=self._index_writes,
+            )
+
+    def _load_index(self) -> dict[str, _CatalogEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, _CatalogEntry] = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            data = None
+        except Exception as exc:
+            logger.warning(
+                "Ignoring unreadable session index",
+                data={"path": str(self.index_path), "error": str(exc)},
+            )
+            data = None
+
+        if isinstance(data, dict) and data.get("version") == SESSION_INDEX_VERSION:
+            sessions = data.get("sessions")
+            if isinstance(sessions, dict):
+                for name, raw in sessions.items():
+                    if not isinstance(raw, dict) or not isinstance(raw.get("info"), dict):
+                        continue
+                    try:
+                        entries[name] = _CatalogEntry(
+                            int(raw["mtime_ns"]), int(raw["size"]), raw["info"]
+                        )
+                    except (KeyError, TypeError, ValueError):
+                        continue
+
+        self._entries = entries
+        return entries
+
+    def _read_metadata(self, metadata_path: str) -> dict[str, Any] | None:
+        try:
+            with open(metadata_path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except Exception as exc:
+            logger.warning(f"Failed to load session metadata from {metadata_path}: {exc}")
+            return None
+        if not isinstance(data, dict) or "name" not in data:
+            return None
+        return data
+
+    def _write_index(self, entries: dict[str, _CatalogEntry]) -> None:
+        payload = {
+            "version": SESSION_INDEX_VERSION,
+            "sessions": {
+                name: {"mtime_ns": entry.mtime_ns, "size": entry.size, "info": entry.info}
+                for name, entry in entries.items()
+            },
+        }
+        temp_path: pathlib.Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                delete=False,
+                dir=self.base_dir,
+                prefix=f"{SESSION_INDEX_FILENAME}.",
+                suffix=".tmp",
+            ) as handle:
+                temp_path = pathlib.Path(handle.name)
+                json.dump(payload, handle)
+            os.replace(temp_path, self.index_path)
+            self._dirty = False
+            self._index_writes += 1
+        except Exception as exc:
+            # The index is only a cache; the next listing will try again.
+            logger.warning(
+                "Failed to write session index",
+                data={"path": str(self.index_path), "error": str(exc)},
+            )
+        finally:
+            if temp_path and temp_path.exists():
+                try:
+                    temp_path.unlink()
+                except Exception:
+                    pass
+
+
+_catalogs: dict[pathlib.Path, SessionCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_session_catalog(base_dir: pathlib.Path) -> SessionCatalog:
+    """Return the shared catalog for a sessions directory."""
+    key = base_dir.resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = SessionCatalog(key)
+            _catalogs[key] = catalog
+        return catalog
+
+
+def reset_session_catalogs() -> None:
+    """Forget all in-memory catalogs (used by tests)."""
+    with _catalogs_lock:
+        _catalogs.clear()
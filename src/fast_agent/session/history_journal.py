@@ -0,0 +1,277 @@
+"""
+Append-only journal for session history files.
+
+Rewriting ``history_<agent>.json`` after every tool-loop iteration makes a long
+turn quadratic in bytes written. A journaled history keeps the JSON file as a
+*snapshot* and appends messages added since that snapshot to a sibling JSONL
+journal, one record per message. The journal is folded back into a fresh
+snapshot (compaction) once it grows past a threshold, or whenever the history
+stops being an extension of what was persisted (rollback, clear, compaction of
+the conversation itself).
+
+Every snapshot carries a random *generation* and every journal record repeats
+it, so a crash between writing a new snapshot and removing the old journal
+cannot replay stale records. A torn final line is ignored.
+
+When a previous file is kept, compaction moves the old journal along with the
+old snapshot, so the previous file replays to the full history that was
+persisted rather than to the last compaction. Appends touch the snapshot so
+its mtime tracks the latest write.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import secrets
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.mcp.prompt_serialization import serialize_to_dict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from fast_agent.types import PromptMessageExtended
+
+logger = get_logger(__name__)
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+JOURNAL_GENERATION_KEY = "journal_generation"
+
+
+def journal_path_for(snapshot_path: str | pathlib.Path) -> pathlib.Path:
+    """Return the journal file that accompanies a history snapshot."""
+    path = pathlib.Path(snapshot_path)
+    return path.with_name(f"{path.stem}{JOURNAL_SUFFIX}")
+
+
+def read_journal(
+    snapshot_path: str | pathlib.Path,
+    generation: str,
+    start_index: int,
+) -> list[dict[str, Any]]:
+    """
+    Return serialized messages journaled after a snapshot.
+
+    Args:
+        snapshot_path: Path of the history snapshot
+        generation: Generation recorded in the snapshot
+        start_index: Number of messages already in the snapshot
+
+    Returns:
+        Message dictionaries to append, in order
+    """
+    path = journal_path_for(snapshot_path)
+    try:
+        with open(path, encoding="utf-8") as handle:
+            lines = handle.readlines()
+    except FileNotFoundError:
+        return []
+
+    messages: list[dict[str, Any]] = []
+    next_index = start_index
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(
+                "Skipping unreadable history journal record",
+                data={"path": str(path), "line": line_number},
+            )
+            continue
+        if not isinstance(record, dict) or record.get("generation") != generation:
+            continue
+        index = record.get("index")
+        if not isinstance(index, int) or index < next_index:
+            continue
+        if index > next_index:
+            logger.warning(
+                "History journal has a gap; ignoring later records",
+                data={"path": str(path), "expected": next_index, "found": index},
+            )
+            break
+        message = record.get("message")
+        if isinstance(message, dict):
+            messages.append(message)
+            next_index += 1
+    return messages
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryJournalStats:
+    appended: int
+    compactions: int
+    fsyncs: int
+    bytes_written: int
+
+
+class HistoryJournal:
+    """
+    Persist one agent's history as a snapshot plus an append-only journal.
+
+    The journal remembers how much of the history it has persisted. ``save``
+    appends only the new messages when the history still starts with them and
+    compacts otherwise. Journal appends are flushed on every save, but only
+    fsync'd every ``fsync_every`` records or ``fsync_interval`` seconds;
+    snapshots are always fsync'd before they replace the previous file.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: pathlib.Path,
+        *,
+        previous_path: pathlib.Path | None = None,
+        compact_after: int = 256,
+        fsync_every: int = 32,
+        fsync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path_for(snapshot_path)
+        self.previous_path = previous_path
+        self.compact_after = compact_after
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._clock = clock
+        self._generation: str | None = None
+        self._count = 0
+        self._journaled = 0
+        self._last_message: PromptMessageExtended | None = None
+        self._last_serialized: dict[str, Any] | None = None
+        self._unsynced = 0
+        self._last_sync = clock()
+        self._appended = 0
+        self._compactions = 0
+        self._fsyncs = 0
+        self._bytes_written = 0
+
+    def save(self, messages: Sequence[PromptMessageExtended]) -> None:
+        """Persist ``messages``, appending to the journal whenever possible."""
+        if not self._extends_persisted(messages):
+            self.compact(messages)
+            return
+
+        new_messages = messages[self._count :]
+        if not new_messages:
+            return
+        if self._journaled + len(new_messages) > self.compact_after:
+            self.compact(messages)
+            return
+        self._append(new_messages)
+
+    def compact(self, messages: Sequence[PromptMessageExtended]) -> None:
+        """Write ``messages`` as a new snapshot and discard the journal."""
+        generation = secrets.token_hex(8)
+        serialized = [serialize_to_dict(message) for message in messages]
+        payload = json.dumps({"messages": serialized, JOURNAL_GENERATION_KEY: generation}, indent=2)
+
+        temp_path: pathlib.Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                delete=False,
+                dir=self.snapshot_path.parent,
+                prefix=f".{self.snapshot_path.name}.tmp.",
+                suffix=self.snapshot_path.suffix or ".json",
+            ) as handle:
+                temp_path = pathlib.Path(handle.name)
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+            if self.previous_path is not None and self.snapshot_path.exists():
+                os.replace(self.snapshot_path, self.previous_path)
+                previous_journal = journal_path_for(self.previous_path)
+                if self.journal_path.exists():
+                    os.replace(self.journal_path, previous_journal)
+                else:
+                    previous_journal.unlink(missing_ok=True)
+            os.replace(temp_path, self.snapshot_path)
+        finally:
+            if temp_path and temp_path.exists():
+                try:
+                    temp_path.unlink()
+                except Exception:
+                    logger.warning(
+                        "Failed to clean up history temp file",
+                        data={"path": str(temp_path)},
+                    )
+
+        # Records left behind by a crash here carry the old generation and are ignored.
+        self.journal_path.unlink(missing_ok=True)
+
+        self._generation = generation
+        self._count = len(messages)
+        self._journaled = 0
+        self._remember_last(messages, serialized[-1] if serialized else None)
+        self._unsynced = 0
+        self._last_sync = self._clock()
+        self._compactions += 1
+        self._bytes_written += len(payload)
+
+    def _extends_persisted(self, messages: Sequence[PromptMessageExtended]) -> bool:
+        if self._generation is None or self._count == 0 or len(messages) < self._count:
+            return False
+        if not self.snapshot_path.exists():
+            return False
+        boundary = messages[self._count - 1]
+        if boundary is self._last_message:
+            return True
+        return serialize_to_dict(boundary) == self._last_serialized
+
+    def _append(self, new_messages: Sequence[PromptMessageExtended]) -> None:
+        serialized = [serialize_to_dict(message) for message in new_messages]
+        lines = "".join(
+            json.dumps(
+                {
+                    "generation": self._generation,
+                    "index": self._count + offset,
+                    "message": message,
+                }
+            )
+            + "\n"
+            for offset, message in enumerate(serialized)
+        )
+        with open(self.journal_path, "a", encoding="utf-8") as handle:
+            handle.write(lines)
+            handle.flush()
+            self._unsynced += len(new_messages)
+            if (
+                self._unsynced >= self.fsync_every
+                or self._clock() - self._last_sync >= self.fsync_interval
+            ):
+                os.fsync(handle.fileno())
+                self._unsynced = 0
+                self._last_sync = self._clock()
+                self._fsyncs += 1
+        # Readers pick the most recent history by snapshot mtime.
+        os.utime(self.snapshot_path)
+
+        self._count += len(new_messages)
+        self._journaled += len(new_messages)
+        self._remember_last(new_messages, serialized[-1])
+        self._appended += len(new_messages)
+        self._bytes_written += len(lines)
+
+    def _remember_last(
+        self,
+        messages: Sequence[PromptMessageExtended],
+        serialized: dict[str, Any] | None,
+    ) -> None:
+        self._last_message = messages[-1] if messages else None
+        self._last_serialized = serialized
+
+    @property
+    def stats(self) -> HistoryJournalStats:
+        return HistoryJournalStats(
+            appended=self._appended,
+            compactions=self._compactions,
+            fsyncs=self._fsyncs,
+            bytes_written=self._bytes_written,
+        )
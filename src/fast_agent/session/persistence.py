@@ -0,0 +1,159 @@
+"""
+Background writer for session files.
+
+Session metadata and history are written from coroutines (after every turn and
+tool-loop iteration). Doing that filesystem work on the event loop stalls
+streaming output and MCP keepalives when the environment directory is slow, so
+writes are handed to a single worker thread instead.
+
+Writes are keyed by target file. A write that is still queued when another
+write for the same file arrives is replaced by it (the newest state wins) and
+both callers are resolved when the surviving write finishes. A single worker
+keeps writes to one file in submission order, and each write keeps its own
+durability guarantees (fsync + atomic rename). Pending writes are flushed on
+application cleanup and at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from fast_agent.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _QueuedWrite:
+    write: Callable[[], Any]
+    future: Future[Any]
+
+
+@dataclass(frozen=True, slots=True)
+class SessionWriterStats:
+    submitted: int
+    coalesced: int
+    completed: int
+    failed: int
+
+
+class SessionWriter:
+    """Run session file writes on a worker thread, coalescing queued writes per file."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._queued: dict[Hashable, _QueuedWrite] = {}
+        self._outstanding: set[Future[Any]] = set()
+        self._submitted = 0
+        self._coalesced = 0
+        self._completed = 0
+        self._failed = 0
+
+    def submit(self, key: Hashable, write: Callable[[], Any]) -> Future[Any]:
+        """Queue ``write`` for ``key``, replacing a queued write for the same key."""
+        with self._lock:
+            self._submitted += 1
+            queued = self._queued.get(key)
+            if queued is not None:
+                queued.write = write
+                self._coalesced += 1
+                return queued.future
+
+            future: Future[Any] = Future()
+            self._queued[key] = _QueuedWrite(write=write, future=future)
+            self._outstanding.add(future)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="fast-agent-session-writer"
+                )
+            self._executor.submit(self._run, key)
+            return future
+
+    async def write(self, key: Hashable, write: Callable[[], Any]) -> Any:
+        """Queue ``write`` and wait for it (or the write that replaced it) to finish."""
+        return await asyncio.wrap_future(self.submit(key, write))
+
+    def _run(self, key: Hashable) -> None:
+        with self._lock:
+            queued = self._queued.pop(key)
+        try:
+            result = queued.write()
+        except BaseException as exc:
+            with self._lock:
+                self._failed += 1
+                self._outstanding.discard(queued.future)
+            queued.future.set_exception(exc)
+            return
+        with self._lock:
+            self._completed += 1
+            self._outstanding.discard(queued.future)
+        queued.future.set_result(result)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued write has finished; returns False on timeout."""
+        with self._lock:
+            pending = list(self._outstanding)
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except TimeoutError:
+                return False
+            except Exception:
+                # The submitter already received this error.
+                pass
+        return True
+
+    async def aflush(self) -> None:
+        """Wait for every queued write without blocking the event loop."""
+        with self._lock:
+            pending = list(self._outstanding)
+        if pending:
+            await asyncio.gather(
+                *(asyncio.wrap_future(future) for future in pending), return_exceptions=True
+            )
+
+    @property
+    def stats(self) -> SessionWriterStats:
+        with self._lock:
+            return SessionWriterStats(
+                submitted=self._submitted,
+                coalesced=self._coalesced,
+                completed=self._completed,
+                failed=self._failed,
+            )
+
+
+_session_writer: SessionWriter | None = None
+_session_writer_lock = threading.Lock()
+
+
+def get_session_writer() -> SessionWriter:
+    """Return the process-wide session writer."""
+    global _session_writer
+    with _session_writer_lock:
+        if _session_writer is None:
+            _session_writer = SessionWriter()
+            atexit.register(_flush_at_exit)
+        return _session_writer
+
+
+async def flush_session_writes() -> None:
+    """Wait for pending session writes (called during application cleanup)."""
+    writer = _session_writer
+    if writer is not None:
+        await writer.aflush()
+
+
+def _flush_at_exit() -> None:
+    writer = _session_writer
+    if writer is not None and not writer.flush(timeout=30):
+        logger.warning("Timed out flushing session writes at exit")
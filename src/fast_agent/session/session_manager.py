@@ -7,6 +7,7 @@ Provides automatic saving and loading of conversation sessions in the fast-agent
 from __future__ import annotations
 
 import contextlib
+import copy
 import json
 import os
 import pathlib
@@ -16,6 +17,7 @@ import shutil
 import socket
 import string
 import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -23,10 +25,15 @@ from typing import TYPE_CHECKING, Any, Mapping
 
 from fast_agent.core.default_agent import resolve_default_agent_name
 from fast_agent.core.logging.logger import get_logger
+from fast_agent.mcp.prompt_serialization import save_messages
 from fast_agent.paths import resolve_environment_paths
+from fast_agent.session.catalog import get_session_catalog
+from fast_agent.session.history_journal import HistoryJournal, journal_path_for
+from fast_agent.session.persistence import get_session_writer
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
 
     from fast_agent.interfaces import AgentProtocol
     from fast_agent.types import PromptMessageExtended
@@ -45,6 +52,24 @@ HISTORY_PREFIX = "history_"
 HISTORY_SUFFIX = ".json"
 HISTORY_PREVIOUS_SUFFIX = "_previous.json"
 
+# Metadata queued on the session writer but not yet on disk, by metadata file.
+# Readers in this process use it so they never see (and re-save) stale metadata.
+_pending_metadata: dict[pathlib.Path, dict[str, Any]] = {}
+_pending_metadata_lock = threading.Lock()
+# Held while a metadata write runs and while a session directory is deleted, so
+# a deferred write neither races the deletion nor recreates a deleted session.
+_session_files_lock = threading.Lock()
+
+
+def _read_session_metadata(metadata_file: pathlib.Path) -> dict[str, Any]:
+    """Read a session.json, preferring metadata still queued for writing."""
+    with _pending_metadata_lock:
+        pending = _pending_metadata.get(metadata_file)
+    if pending is not None:
+        return copy.deepcopy(pending)
+    with open(metadata_file) as f:
+        return json.load(f)
+
 
 def _normalized_environment_override(cwd: pathlib.Path) -> str | None:
     """Return ENVIRONMENT_DIR as an absolute path string when set."""
@@ -125,6 +150,16 @@ def get_session_history_window() -> int:
         return 20
 
 
+def session_history_journal_enabled() -> bool:
+    """Return whether session history is persisted through an append-only journal."""
+    try:
+        from fast_agent.config import get_settings
+
+        return bool(getattr(get_settings(), "session_history_journal", True))
+    except Exception:
+        return True
+
+
 def apply_session_window(
     sessions: "Sequence[SessionInfo]",
     limit: int | None = None,
@@ -232,12 +267,15 @@ class Session:
         self.info = info
         self.directory = directory
         self._dirty = False
+        self._journals: dict[str, HistoryJournal] = {}
 
 
     async def save_history(self, agent: AgentProtocol, filename: str | None = None) -> str:
-        """Save agent history to this session."""
-        from fast_agent.history.history_exporter import HistoryExporter
+        """Save agent history to this session.
 
+        Serialization and file writes run on the session writer thread; the
+        history is snapshotted here so the agent can keep appending meanwhile.
+        """
         self.info.last_activity = datetime.now()
         self._dirty = True
 
@@ -259,7 +297,11 @@ class Session:
             filename = current_filename
         else:
             filepath = self.directory / filename
-            result = await HistoryExporter.save(agent, str(filepath))
+            messages = list(agent.message_history)
+            await get_session_writer().write(
+                ("history", filepath), lambda: save_messages(messages, str(filepath))
+            )
+            result = str(filepath)
 
         # Update session info
         if rotating and current_filename:
@@ -291,7 +333,7 @@ class Session:
             if preview:
                 self.info.metadata["first_user_preview"] = preview
 
-        self._save_metadata()
+        await self._save_metadata_async()
         return result
 
     async def _save_rotating_history(
@@ -301,13 +343,36 @@ class Session:
         current_filename: str,
         previous_filename: str,
     ) -> str:
-        """Save history using a current/previous rotation scheme."""
-        from fast_agent.history.history_exporter import HistoryExporter
+        """Save history using a current/previous rotation scheme.
 
+        With the history journal enabled, only messages added since the last save are
+        appended and the previous file is rotated when the journal is compacted.
+        """
         current_path = self.directory / current_filename
         previous_path = self.directory / previous_filename
-        temp_path: pathlib.Path | None = None
+        messages = list(agent.message_history)
+
+        if session_history_journal_enabled():
+            journal = self._journals.get(current_filename)
+            if journal is None:
+                journal = HistoryJournal(current_path, previous_path=previous_path)
+                self._journals[current_filename] = journal
+            await get_session_writer().write(("history", current_path), lambda: journal.save(messages))
+            return str(current_path)
+
+        await get_session_writer().write(
+            ("history", current_path),
+            lambda: self._write_rotating_history(messages, current_path, previous_path),
+        )
+        return str(current_path)
 
+    def _write_rotating_history(
+        self,
+        messages: list[PromptMessageExtended],
+        current_path: pathlib.Path,
+        previous_path: pathlib.Path,
+    ) -> None:
+        temp_path: pathlib.Path | None = None
         try:
             suffix = current_path.suffix or ".json"
             with tempfile.NamedTemporaryFile(
@@ -315,12 +380,12 @@ class Session:
                 encoding="utf-8",
                 delete=False,
                 dir=self.directory,
-                prefix=f".{current_filename}.tmp.",
+                prefix=f".{current_path.name}.tmp.",
                 suffix=suffix,
             ) as handle:
                 temp_path = pathlib.Path(handle.name)
 
-            await HistoryExporter.save(agent, str(temp_path))
+            save_messages(messages, str(temp_path))
 
             if current_path.exists():
                 os.replace(current_path, previous_path)
@@ -335,15 +400,65 @@ class Session:
                         data={"path": str(temp_path)},
                     )
 
-        return str(current_path)
-
     def _save_metadata(self) -> None:
-        """Save session metadata."""
-        metadata_file = self.directory / "session.json"
-        with self._metadata_lock():
-            self._atomic_write_json(metadata_file, self.info.to_dict())
+        """Save session metadata without waiting for queued session writes.
+
+        A new session's metadata is written right away, so the session can be
+        listed and loaded immediately; there is nothing queued for it yet.
+        Otherwise the write is queued behind (and coalesced with) the pending
+        writes for this session, and errors are logged when it runs.
+        """
+        metadata_file, write = self._metadata_write()
+        self._dirty = False
+        if not metadata_file.exists():
+            write()
+            return
+        future = get_session_writer().submit(("metadata", metadata_file), write)
+        future.add_done_callback(self._log_metadata_failure)
+
+    def _log_metadata_failure(self, future: Future[Any]) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        self._dirty = True
+        logger.warning(
+            "Failed to save session metadata",
+            data={"session": self.info.name, "error": str(future.exception())},
+        )
+
+    async def _save_metadata_async(self) -> None:
+        """Save session metadata without blocking the event loop."""
+        metadata_file, write = self._metadata_write()
+        await get_session_writer().write(("metadata", metadata_file), write)
         self._dirty = False
 
+    def _metadata_write(self) -> tuple[pathlib.Path, Callable[[], None]]:
+        metadata_file = self.directory / "session.json"
+        # Snapshot now: the metadata dict keeps changing on the event loop.
+        payload = copy.deepcopy(self.info.to_dict())
+
+        catalog = get_session_catalog(self.directory.parent)
+        with _pending_metadata_lock:
+            _pending_metadata[metadata_file] = payload
+        # Listings see the new metadata right away; the entry is refreshed
+        # with the new file's size and mtime once it is written.
+        catalog.record(self.info.name, payload, metadata_file)
+
+        def write() -> None:
+            try:
+                with _session_files_lock:
+                    if not self.directory.is_dir():
+                        # Deleted while the write was queued.
+                        return
+                    with self._metadata_lock():
+                        self._atomic_write_json(metadata_file, payload)
+            finally:
+                with _pending_metadata_lock:
+                    if _pending_metadata.get(metadata_file) is payload:
+                        del _pending_metadata[metadata_file]
+            catalog.record(self.info.name, payload, metadata_file)
+
+        return metadata_file, write
+
     def set_pinned(self, pinned: bool) -> None:
         """Pin or unpin the session to prevent auto-pruning."""
         if pinned:
@@ -468,8 +583,10 @@ class Session:
 
     def delete(self) -> None:
         """Delete this session."""
-        if self.directory.exists():
-            shutil.rmtree(self.directory)
+        with _session_files_lock:
+            if self.directory.exists():
+                shutil.rmtree(self.directory)
+        get_session_catalog(self.directory.parent).forget(self.info.name)
 
     def set_title(self, title: str) -> None:
         """Set a user-friendly title for this session."""
@@ -599,19 +716,11 @@ class SessionManager:
         if not self.base_dir.exists():
             return sessions
 
-        for session_dir in self.base_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            metadata_file = session_dir / "session.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file) as f:
-                        data = json.load(f)
-                        info = SessionInfo.from_dict(data)
-                        sessions.append(info)
-                except Exception as e:
-                    logger.warning(f"Failed to load session metadata from {metadata_file}: {e}")
+        for data in get_session_catalog(self.base_dir).list_infos():
+            try:
+                sessions.append(SessionInfo.from_dict(data))
+            except Exception as e:
+                logger.warning(f"Failed to load session metadata for {data.get('name')}: {e}")
 
         sessions.sort(key=lambda info: info.last_activity, reverse=True)
         return sessions
@@ -625,9 +734,7 @@ class SessionManager:
             return None
 
         try:
-            with open(metadata_file) as f:
-                data = json.load(f)
-                info = SessionInfo.from_dict(data)
+            info = SessionInfo.from_dict(_read_session_metadata(metadata_file))
 
             session = Session(info, session_dir)
             session.info.last_activity = datetime.now()
@@ -647,7 +754,9 @@ class SessionManager:
             return False
 
         try:
-            shutil.rmtree(session_dir)
+            with _session_files_lock:
+                shutil.rmtree(session_dir)
+            get_session_catalog(self.base_dir).forget(name)
             logger.info(f"Deleted session: {name}")
             if self._current_session and self._current_session.info.name == name:
                 self._current_session = None
@@ -859,9 +968,7 @@ class SessionManager:
             return None
 
         try:
-            with open(metadata_file) as f:
-                data = json.load(f)
-                info = SessionInfo.from_dict(data)
+            info = SessionInfo.from_dict(_read_session_metadata(metadata_file))
             return Session(info, session_dir)
         except Exception as e:
             logger.error(f"Failed to get session {name}: {e}")
@@ -947,6 +1054,9 @@ class SessionManager:
                 dest_path = dest_dir / dest_name
                 counter += 1
         shutil.copy2(src_path, dest_path)
+        journal_path = journal_path_for(src_path)
+        if journal_path.exists():
+            shutil.copy2(journal_path, journal_path_for(dest_path))
         return dest_name
 
     def set_current_session(self, session: Session) -> None:
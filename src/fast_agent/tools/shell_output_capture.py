@@ -0,0 +1,242 @@
+"""
+Bounded capture of shell command output for tool results.
+
+Commands can print far more than fits in a tool result, and for builds and
+test runs the useful part (the failure) is usually at the end. A capture keeps
+the first ``head`` bytes of the stream and the most recent ``tail`` bytes in a
+fixed-size ring buffer, so memory stays bounded no matter how chatty the
+process is, and the retained text is the head, an omission marker and the
+tail.
+
+Output arrives from the process as bytes; byte accounting uses those lengths
+directly rather than re-encoding decoded text. Cut points are moved to UTF-8
+character boundaries when the retained text is decoded.
+
+When spilling is enabled, a stream that overflows the limit is also written in
+full to a temporary file (starting with the bytes still held in memory at the
+moment of overflow), so the agent can page through the complete output later
+instead of re-running the command.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import BinaryIO
+
+SPILL_FILE_PREFIX = "fast-agent-shell-"
+
+
+def _is_continuation_byte(byte: int) -> bool:
+    return byte & 0xC0 == 0x80
+
+
+def _complete_prefix_length(data: bytes | bytearray) -> int:
+    """Length of ``data`` without a trailing, incomplete UTF-8 sequence."""
+    end = len(data)
+    index = end - 1
+    while index >= 0 and end - index <= 4 and _is_continuation_byte(data[index]):
+        index -= 1
+    if index < 0:
+        return end
+    lead = data[index]
+    if lead >= 0xF0:
+        needed = 4
+    elif lead >= 0xE0:
+        needed = 3
+    elif lead >= 0xC0:
+        needed = 2
+    else:
+        return end
+    return index if end - index < needed else end
+
+
+def _leading_continuation_length(data: bytes | bytearray) -> int:
+    """Number of UTF-8 continuation bytes at the start of ``data`` (at most 3)."""
+    count = 0
+    while count < min(3, len(data)) and _is_continuation_byte(data[count]):
+        count += 1
+    return count
+
+
+class ByteRing:
+    """Fixed-capacity byte buffer that keeps the most recently written bytes."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(0, capacity)
+        self._buffer = bytearray(self.capacity)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> int:
+        """Append ``data``; return how many older bytes were discarded."""
+        capacity = self.capacity
+        if not data:
+            return 0
+        if capacity == 0:
+            return len(data)
+        if len(data) >= capacity:
+            discarded = self._size + len(data) - capacity
+            self._buffer[:] = data[-capacity:]
+            self._start = 0
+            self._size = capacity
+            return discarded
+
+        end = (self._start + self._size) % capacity
+        first = min(len(data), capacity - end)
+        self._buffer[end : end + first] = data[:first]
+        if first < len(data):
+            self._buffer[: len(data) - first] = data[first:]
+
+        discarded = max(0, self._size + len(data) - capacity)
+        self._size += len(data) - discarded
+        self._start = (self._start + discarded) % capacity
+        return discarded
+
+    def getvalue(self) -> bytes:
+        end = self._start + self._size
+        if end <= self.capacity:
+            return bytes(self._buffer[self._start : end])
+        return bytes(self._buffer[self._start :] + self._buffer[: end - self.capacity])
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedOutput:
+    """Text retained from a command's output."""
+
+    text: str
+    retained_bytes: int
+    total_bytes: int
+    truncated: bool
+    spill_path: str | None = None
+
+    @property
+    def omitted_bytes(self) -> int:
+        return max(self.total_bytes - self.retained_bytes, 0)
+
+
+class ShellOutputCapture:
+    """Keep the head and tail of a byte stream within a byte limit.
+
+    ``tail_fraction`` of ``byte_limit`` is reserved for the end of the stream;
+    a fraction of 0 keeps only the head.
+    """
+
+    def __init__(
+        self,
+        byte_limit: int,
+        *,
+        tail_fraction: float = 0.5,
+        spill: bool = False,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.byte_limit = max(0, byte_limit)
+        tail_limit = int(self.byte_limit * min(max(tail_fraction, 0.0), 1.0))
+        self.head_limit = self.byte_limit - tail_limit
+        self._head = bytearray()
+        self._tail = ByteRing(tail_limit)
+        self._total_bytes = 0
+        self._spill_enabled = spill
+        self._spill_dir = spill_dir
+        self._spill_file: BinaryIO | None = None
+        self._spill_path: str | None = None
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def retained_bytes(self) -> int:
+        return len(self._head) + len(self._tail)
+
+    @property
+    def truncated(self) -> bool:
+        return self._total_bytes > self.byte_limit
+
+    @property
+    def spill_path(self) -> str | None:
+        return self._spill_path
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        overflowing = self._total_bytes + len(data) > self.byte_limit
+        if overflowing and self._spill_enabled and self._spill_file is None:
+            self._open_spill()
+        if self._spill_file is not None:
+            self._write_spill(data)
+        self._total_bytes += len(data)
+
+        room = self.head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        self._tail.write(data)
+
+    def close(self) -> None:
+        """Close the spill file; later writes are only kept in memory."""
+        self._spill_enabled = False
+        if self._spill_file is not None:
+            try:
+                self._spill_file.close()
+            except OSError:
+                pass
+            self._spill_file = None
+
+    def result(self) -> CapturedOutput:
+        """Close the spill file and return the retained text."""
+        self.close()
+        head = bytes(self._head)
+        tail = self._tail.getvalue()
+        if not self.truncated:
+            text = (head + tail).decode("utf-8", errors="replace")
+            return CapturedOutput(text, len(head) + len(tail), self._total_bytes, False)
+
+        head = head[: _complete_prefix_length(head)]
+        tail = tail[_leading_continuation_length(tail) :]
+        retained = len(head) + len(tail)
+        parts = [head.decode("utf-8", errors="replace")]
+        if tail:
+            if parts[0] and not parts[0].endswith("\n"):
+                parts.append("\n")
+            parts.append(f"[... {self._total_bytes - retained} bytes omitted ...]\n")
+            parts.append(tail.decode("utf-8", errors="replace"))
+        return CapturedOutput(
+            "".join(parts),
+            retained,
+            self._total_bytes,
+            True,
+            spill_path=self._spill_path,
+        )
+
+    def _open_spill(self) -> None:
+        try:
+            fd, path = tempfile.mkstemp(
+                prefix=SPILL_FILE_PREFIX, suffix=".log", dir=self._spill_dir
+            )
+            self._spill_file = os.fdopen(fd, "wb")
+            self._spill_path = path
+        except OSError:
+            self._spill_enabled = False
+            return
+        # Everything written so far is still in memory: head + tail.
+        self._write_spill(bytes(self._head) + self._tail.getvalue())
+
+    def _write_spill(self, data: bytes) -> None:
+        if self._spill_file is None:
+            return
+        try:
+            self._spill_file.write(data)
+        except OSError:
+            # A failed spill leaves an incomplete file; do not point the agent at it.
+            try:
+                self._spill_file.close()
+            except OSError:
+                pass
+            self._spill_file = None
+            self._spill_path = None
+            self._spill_enabled = False
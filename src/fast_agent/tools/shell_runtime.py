@@ -27,6 +27,7 @@ from fast_agent.constants import (
 )
 from fast_agent.core.logging.progress_payloads import build_progress_payload
 from fast_agent.event_progress import ProgressAction
+from fast_agent.tools.shell_output_capture import CapturedOutput, ShellOutputCapture
 from fast_agent.ui import console
 from fast_agent.ui.console_display import ConsoleDisplay
 from fast_agent.ui.display_suppression import display_tools_enabled
@@ -39,6 +40,8 @@ from fast_agent.utils.async_utils import gather_with_cancel
 
 _STREAM_READ_CHUNK_SIZE = 4096
 _MAX_PENDING_STREAM_BYTES = 65536
+_MAX_SPILL_FILES = 8
+_STDERR_PREFIX = b"[stderr] "
 
 
 @dataclass(frozen=True, slots=True)
@@ -52,10 +55,7 @@ class _ShellProcessPlan:
 
 @dataclass(slots=True)
 class _ShellOutputState:
-    output_segments: list[str] = field(default_factory=list)
-    output_bytes: int = 0
-    total_output_bytes: int = 0
-    output_truncated: bool = False
+    capture: ShellOutputCapture
     truncation_notice_printed: bool = False
     had_stream_output: bool = False
     output_line_count: int = 0
@@ -107,11 +107,18 @@ class ShellRuntime:
         self._agent_name = agent_name
         self._output_display_lines: int | None = None
         self._show_bash_output = True
+        self._output_tail_fraction = 0.5
+        self._output_spill = False
+        self._spill_paths: deque[str] = deque()
         if config is not None:
             shell_config = getattr(config, "shell_execution", None)
             if shell_config is not None:
                 self._output_display_lines = getattr(shell_config, "output_display_lines", None)
                 self._show_bash_output = bool(getattr(shell_config, "show_bash", True))
+                self._output_tail_fraction = float(
+                    getattr(shell_config, "output_tail_fraction", 0.5)
+                )
+                self._output_spill = bool(getattr(shell_config, "output_spill", False))
 
         if self.enabled:
             # Detect the shell early so we can include it in the tool description
@@ -340,26 +347,28 @@ class ShellRuntime:
             state.display_tail_buffer = deque(maxlen=max(display_tail_limit, 1))
         return state
 
-    def _append_output_text(self, output_text: str, state: _ShellOutputState) -> None:
-        output_blob = output_text.encode("utf-8", errors="replace")
-        state.total_output_bytes += len(output_blob)
-        if state.output_truncated:
-            return
+    def _new_output_capture(self) -> ShellOutputCapture:
+        return ShellOutputCapture(
+            self._output_byte_limit,
+            tail_fraction=self._output_tail_fraction,
+            spill=self._output_spill,
+        )
 
-        remaining = self._output_byte_limit - state.output_bytes
-        if remaining <= 0:
-            state.output_truncated = True
-            return
-        if len(output_blob) <= remaining:
-            state.output_segments.append(output_text)
-            state.output_bytes += len(output_blob)
-            return
+    def _release_output_capture(self, capture: ShellOutputCapture) -> None:
+        """Close the capture's spill file and keep it under the retention limit."""
+        capture.close()
+        self._track_spill_file(capture.spill_path)
 
-        truncated_text = output_blob[:remaining].decode("utf-8", errors="replace")
-        if truncated_text:
-            state.output_segments.append(truncated_text)
-        state.output_bytes += remaining
-        state.output_truncated = True
+    def _track_spill_file(self, path: str | None) -> None:
+        """Remember a spill file, deleting the oldest ones beyond the retention limit."""
+        if path is None:
+            return
+        self._spill_paths.append(path)
+        while len(self._spill_paths) > _MAX_SPILL_FILES:
+            try:
+                os.unlink(self._spill_paths.popleft())
+            except OSError:
+                pass
 
     def _maybe_print_truncation_notice(
         self,
@@ -367,19 +376,23 @@ class ShellRuntime:
         output_state: _ShellOutputState,
         display_state: _ShellDisplayState,
     ) -> None:
-        if output_state.truncation_notice_printed or not output_state.output_truncated:
+        if output_state.truncation_notice_printed or not output_state.capture.truncated:
             return
         if display_state.use_live_shell_display and (
             display_state.display_line_limit is None or display_state.display_line_limit > 0
         ):
             estimated_tokens = int(self._output_byte_limit / TERMINAL_BYTES_PER_TOKEN)
+            if output_state.capture.head_limit < self._output_byte_limit:
+                omitted = "output beyond the start and end omitted from tool result."
+            else:
+                omitted = "additional output omitted from tool result."
             console.console.print(
                 " ".join(
                     [
                         "▶ Shell to agent output reached",
                         f"{self._output_byte_limit} bytes",
                         f"(~{estimated_tokens} tokens);",
-                        "additional output omitted from tool result.",
+                        omitted,
                     ]
                 ),
                 style="black on red",
@@ -428,7 +441,7 @@ class ShellRuntime:
 
     def _record_stream_output(
         self,
-        text: str,
+        data: bytes,
         *,
         style: str | None,
         output_state: _ShellOutputState,
@@ -437,8 +450,8 @@ class ShellRuntime:
     ) -> None:
         output_state.had_stream_output = True
         output_state.output_line_count += 1
-        output_text = text if not is_stderr else f"[stderr] {text}"
-        self._append_output_text(output_text, output_state)
+        output_state.capture.write(_STDERR_PREFIX + data if is_stderr else data)
+        text = data.decode(errors="replace")
         self._maybe_print_truncation_notice(
             output_state=output_state,
             display_state=display_state,
@@ -469,7 +482,7 @@ class ShellRuntime:
             if not chunk:
                 if pending:
                     self._record_stream_output(
-                        pending.decode(errors="replace"),
+                        bytes(pending),
                         style=style,
                         output_state=output_state,
                         display_state=display_state,
@@ -484,7 +497,7 @@ class ShellRuntime:
                     line = bytes(pending[: newline_index + 1])
                     del pending[: newline_index + 1]
                     self._record_stream_output(
-                        line.decode(errors="replace"),
+                        line,
                         style=style,
                         output_state=output_state,
                         display_state=display_state,
@@ -498,7 +511,7 @@ class ShellRuntime:
                 line = bytes(pending[:_MAX_PENDING_STREAM_BYTES])
                 del pending[:_MAX_PENDING_STREAM_BYTES]
                 self._record_stream_output(
-                    line.decode(errors="replace"),
+                    line,
                     style=style,
                     output_state=output_state,
                     display_state=display_state,
@@ -638,19 +651,23 @@ class ShellRuntime:
             except Exception:
                 return -1
 
-    def _truncation_summary(self, output_state: _ShellOutputState) -> str | None:
-        if not output_state.output_truncated:
+    def _truncation_summary(self, captured: CapturedOutput) -> str | None:
+        if not captured.truncated:
             return None
-        retained_tokens = max(int(output_state.output_bytes / TERMINAL_BYTES_PER_TOKEN), 1)
-        total_tokens = max(int(output_state.total_output_bytes / TERMINAL_BYTES_PER_TOKEN), 1)
-        omitted_bytes = max(output_state.total_output_bytes - output_state.output_bytes, 0)
-        return (
+        retained_tokens = max(int(captured.retained_bytes / TERMINAL_BYTES_PER_TOKEN), 1)
+        total_tokens = max(int(captured.total_bytes / TERMINAL_BYTES_PER_TOKEN), 1)
+        summary = (
             "[Output truncated: retained "
-            f"{output_state.output_bytes} of {output_state.total_output_bytes} bytes "
+            f"{captured.retained_bytes} of {captured.total_bytes} bytes "
             f"(~{retained_tokens} of ~{total_tokens} tokens); "
-            f"omitted {omitted_bytes} bytes. "
-            "Increase shell_execution.output_byte_limit to retain more.]"
+            f"omitted {captured.omitted_bytes} bytes. "
         )
+        if captured.spill_path:
+            summary += (
+                f"Full output saved to {captured.spill_path}; "
+                "read it in pages (e.g. read_text_file with line/limit) instead of re-running. "
+            )
+        return summary + "Increase shell_execution.output_byte_limit to retain more.]"
 
     def _build_shell_result(
         self,
@@ -658,11 +675,12 @@ class ShellRuntime:
         return_code: int,
         output_state: _ShellOutputState,
     ) -> tuple[CallToolResult, str]:
-        combined_output = "".join(output_state.output_segments)
+        captured = output_state.capture.result()
+        combined_output = captured.text
         if combined_output and not combined_output.endswith("\n"):
             combined_output += "\n"
 
-        truncation_summary = self._truncation_summary(output_state)
+        truncation_summary = self._truncation_summary(captured)
         if truncation_summary:
             combined_output += f"{truncation_summary}\n"
 
@@ -760,6 +778,7 @@ class ShellRuntime:
             return self._invalid_execute_result(working_dir_error)
 
         progress_context = progress_display.paused() if display_tools_enabled() else nullcontext()
+        output_state: _ShellOutputState | None = None
         with progress_context:
             try:
                 self._emit_progress_event(
@@ -770,7 +789,7 @@ class ShellRuntime:
 
                 plan = self._build_process_plan(configured_working_dir)
                 process = await self._start_shell_process(command, plan)
-                output_state = _ShellOutputState()
+                output_state = _ShellOutputState(capture=self._new_output_capture())
                 display_state = self._build_display_state(
                     defer_display_to_tool_result=defer_display_to_tool_result
                 )
@@ -844,6 +863,10 @@ class ShellRuntime:
                     isError=True,
                     content=[TextContent(type="text", text=f"Command failed to start: {exc}")],
                 )
+            finally:
+                # Also on errors and cancellation, so the spill file is not leaked.
+                if output_state is not None:
+                    self._release_output_capture(output_state.capture)
 
     def _emit_progress_event(
         self,
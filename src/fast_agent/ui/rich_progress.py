@@ -308,6 +308,7 @@ class RichProgressDisplay:
             ProgressAction.FINISHED: "black on green",
             ProgressAction.SHUTDOWN: "black on red",
             ProgressAction.AGGREGATOR_INITIALIZED: "bold green",
+            ProgressAction.RETRYING: "bold yellow",
             ProgressAction.FATAL_ERROR: "black on red",
         }.get(action, "white")
 
@@ -11,14 +11,26 @@ This module provides a simple, robust streaming buffer that:
 Design philosophy:
 - Keep the logic linear and easy to reason about.
 - Avoid expensive render passes; use width-based line estimation.
+- Analyze incrementally: a render re-reads only the lines that arrived since
+  the previous one, plus the lines that end up in the viewport.
+
+Streamed text is indexed line by line (``_LineIndex``). Each completed line is
+classified once by a small block scanner that follows markdown-it's rules for
+fenced and indented code blocks, GFM tables and the HTML blocks that hide
+them, and its estimated display
+height is cached per terminal width. Only the trailing, still-growing line is
+re-examined on each render.
 """
 
-from dataclasses import dataclass
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from math import ceil
-from typing import Generator
+from typing import Sequence
 
-from markdown_it import MarkdownIt
-from markdown_it.token import Token
+from markdown_it.common.html_blocks import block_names
+from markdown_it.common.html_re import HTML_OPEN_CLOSE_TAG_STR
 
 
 @dataclass
@@ -39,6 +51,525 @@ class Table:
     header_lines: list[str]  # Header row + separator (e.g., ["| A | B |", "|---|---|"])
 
 
+_FENCE_RE = re.compile(r"^([ \t]*)(`{3,}|~{3,})(.*)$")
+_TABLE_DELIMITER_CELL_RE = re.compile(r"^:?-+:?$")
+_LIST_ITEM_RE = re.compile(r"^[ \t]*([-*+]|\d{1,9}[.)])([ \t]+|$)")
+_HEADING_RE = re.compile(r"^ {0,3}#{1,6}(?:[ \t]|$)")
+_THEMATIC_BREAK_RE = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_BLOCKQUOTE_RE = re.compile(r"^ {0,3}>")
+_SETEXT_UNDERLINE_RE = re.compile(r"^[ \t]*(?:=+|-+)[ \t]*$")
+# CommonMark HTML block start and end conditions, and whether each kind can
+# interrupt a paragraph (the same table markdown-it uses).
+_HTML_BLOCKS: list[tuple[re.Pattern[str], re.Pattern[str], bool]] = [
+    (
+        re.compile(r"^<(script|pre|style|textarea)(?=(\s|>|$))", re.IGNORECASE),
+        re.compile(r"</(script|pre|style|textarea)>", re.IGNORECASE),
+        True,
+    ),
+    (re.compile(r"^<!--"), re.compile(r"-->"), True),
+    (re.compile(r"^<\?"), re.compile(r"\?>"), True),
+    (re.compile(r"^<![A-Z]"), re.compile(r">"), True),
+    (re.compile(r"^<!\[CDATA\["), re.compile(r"\]\]>"), True),
+    (
+        re.compile(r"^</?(" + "|".join(block_names) + r")(?=(\s|/?>|$))", re.IGNORECASE),
+        re.compile(r"^$"),
+        True,
+    ),
+    (re.compile(HTML_OPEN_CLOSE_TAG_STR + r"\s*$"), re.compile(r"^$"), False),
+]
+
+_MAX_CACHED_WIDTHS = 4
+
+
+def _indent_width(line: str) -> int:
+    """Columns of leading whitespace, with tabs advancing to the next multiple of 4."""
+    width = 0
+    for ch in line:
+        if ch == " ":
+            width += 1
+        elif ch == "\t":
+            width += 4 - width % 4
+        else:
+            break
+    return width
+
+
+def _line_display_height(line: str, width: int) -> int:
+    if not line:
+        return 1
+    length = len(line.expandtabs()) if "\t" in line else len(line)
+    return max(1, ceil(length / width))
+
+
+def _split_table_row(line: str) -> list[str]:
+    """Split a table row on unescaped pipes, dropping enclosing empty cells."""
+    cells: list[str] = []
+    current: list[str] = []
+    escaped = False
+    for ch in line:
+        if ch == "|" and not escaped:
+            cells.append("".join(current))
+            current = []
+        elif ch == "|":
+            current[-1:] = ["|"]
+        else:
+            current.append(ch)
+        escaped = ch == "\\"
+    cells.append("".join(current))
+    if cells and cells[0] == "":
+        cells.pop(0)
+    if cells and cells[-1] == "":
+        cells.pop()
+    return cells
+
+
+def _table_delimiter_columns(line: str) -> int | None:
+    """Return the column count of a GFM delimiter row, or None if ``line`` is not one."""
+    text = line.strip()
+    if len(text) < 2 or text[0] not in "|-:":
+        return None
+    if text[1] not in "|-: \t" or (text[0] == "-" and text[1] in " \t"):
+        return None
+    if any(ch not in "|-: \t" for ch in text):
+        return None
+    columns = text.split("|")
+    count = 0
+    for index, column in enumerate(columns):
+        cell = column.strip()
+        if not cell:
+            if index in (0, len(columns) - 1):
+                continue
+            return None
+        if not _TABLE_DELIMITER_CELL_RE.match(cell):
+            return None
+        count += 1
+    return count
+
+
+@dataclass(slots=True)
+class _CodeSpan:
+    start_line: int
+    end_line: int
+    language: str
+
+
+@dataclass(slots=True)
+class _TableSpan:
+    start_line: int
+    end_line: int
+    header_lines: list[str]
+
+
+def _html_block_kind(line: str) -> tuple[re.Pattern[str], bool] | None:
+    """Return the end pattern of the HTML block ``line`` opens and whether it interrupts."""
+    text = line.lstrip(" \t")
+    if not text.startswith("<"):
+        return None
+    for start, end, interrupts in _HTML_BLOCKS:
+        if start.search(text):
+            return end, interrupts
+    return None
+
+
+def _list_content_indent(line: str, indent: int) -> int | None:
+    """Return the content column of a list item line, or None if it is not one."""
+    match = _LIST_ITEM_RE.match(line)
+    if match is None:
+        return None
+    marker = match.group(1).strip()
+    spacing = _indent_width(match.group(2).replace("\t", "    ")) if match.group(2) else 1
+    if not line[match.end() :].strip() or spacing > 4:
+        spacing = 1
+    return indent + len(marker) + spacing
+
+
+@dataclass(slots=True)
+class _BlockScanner:
+    """Line-by-line recognizer for fenced/indented code blocks and GFM tables.
+
+    Mirrors the markdown-it block rules that matter for truncation context, at
+    the top level and inside list items. HTML blocks are followed so that
+    fences and pipes inside them are not mistaken for structure; block quotes
+    are only tracked far enough to skip their lazy continuation lines.
+    """
+
+    fence_start: int | None = None
+    fence_marker: str = ""
+    fence_base: int = 0
+    fence_info: str = ""
+    indented_start: int | None = None
+    indented_last: int = 0
+    indented_base: int = 0
+    html_end: re.Pattern[str] | None = None
+    html_base: int = 0
+    table_start: int | None = None
+    table_base: int = 0
+    table_header: list[str] = field(default_factory=list)
+    table_has_body: bool = False
+    table_last: int = 0
+    list_indents: list[int] = field(default_factory=list)
+    in_paragraph: bool = False
+    in_quote: bool = False
+    empty_item: bool = False
+    candidate: tuple[int, str, int] | None = None
+
+    def copy(self) -> "_BlockScanner":
+        return replace(
+            self, table_header=list(self.table_header), list_indents=list(self.list_indents)
+        )
+
+    def feed(self, index: int, line: str, code: list[_CodeSpan], tables: list[_TableSpan]) -> None:
+        blank = not line.strip()
+        indent = _indent_width(line)
+
+        if self.fence_start is not None:
+            if blank or indent >= self.fence_base:
+                if self._closes_fence(line, indent):
+                    code.append(_CodeSpan(self.fence_start, index + 1, self.fence_info))
+                    self.fence_start = None
+                    self._end_paragraph()
+                return
+            # The list item holding the fence ended.
+            code.append(_CodeSpan(self.fence_start, index, self.fence_info))
+            self.fence_start = None
+
+        if self.html_end is not None:
+            if indent >= self.html_base:
+                text = line.lstrip(" \t")
+                if not self.html_end.search(text):
+                    return
+                self.html_end = None
+                if text:
+                    return
+            else:
+                # The list item holding the HTML block ended.
+                self.html_end = None
+
+        if self.indented_start is not None:
+            if blank:
+                return
+            if indent - self.indented_base >= 4:
+                self.indented_last = index
+                return
+            code.append(_CodeSpan(self.indented_start, self.indented_last + 1, ""))
+            self.indented_start = None
+
+        if self.table_start is not None:
+            relative = indent - self.table_base
+            if (
+                blank
+                or relative < 0
+                or relative >= 4
+                or self._interrupts(line, indent, paragraph=False)
+            ):
+                self._finish_table(tables)
+            else:
+                self.table_last = index
+                self.table_has_body = True
+                return
+
+        empty_item, self.empty_item = self.empty_item, False
+        if blank:
+            if empty_item:
+                # A list item cannot start with two blank lines.
+                self.list_indents.pop()
+            self.in_quote = False
+            self._end_paragraph()
+            return
+
+        if self.in_quote:
+            if self.in_paragraph and not self._interrupts(line, indent, paragraph=False):
+                return
+            self.in_quote = False
+            self._end_paragraph()
+        lazy = self.in_paragraph and not self._interrupts(line, indent)
+
+        top = self.list_indents[-1] if self.list_indents else 0
+        if self.in_paragraph and 0 <= indent - top < 4 and _SETEXT_UNDERLINE_RE.match(line):
+            self._end_paragraph()
+            return
+
+        content_indent = _list_content_indent(line, indent)
+        if content_indent is not None and not lazy and not _THEMATIC_BREAK_RE.match(line):
+            while self.list_indents and self.list_indents[-1] > indent:
+                self.list_indents.pop()
+            if indent - (self.list_indents[-1] if self.list_indents else 0) < 4:
+                self.list_indents.append(content_indent)
+                self.in_paragraph = bool(line[content_indent:].strip())
+                self.empty_item = not self.in_paragraph
+                self.candidate = None
+                return
+        if self.list_indents and indent < self.list_indents[-1]:
+            if lazy:
+                # Lazy continuation of a list item paragraph; it may still
+                # be the header row of a table.
+                self.candidate = (index, line, self.list_indents[-1])
+                return
+            while self.list_indents and indent < self.list_indents[-1]:
+                self.list_indents.pop()
+
+        if _BLOCKQUOTE_RE.match(line):
+            self.in_quote = True
+            self.in_paragraph = True
+            self.candidate = None
+            return
+
+        base = self.list_indents[-1] if self.list_indents else 0
+        relative = indent - base
+
+        if relative < 4 and self._opens_fence(line):
+            self.fence_start = index
+            self.fence_base = base
+            self._end_paragraph()
+            return
+
+        if relative >= 4 and not self.in_paragraph:
+            self.indented_start = index
+            self.indented_last = index
+            self.indented_base = base
+            return
+
+        html = _html_block_kind(line) if relative < 4 else None
+        if html is not None and (html[1] or not self.in_paragraph):
+            end = html[0]
+            self._end_paragraph()
+            if not end.search(line.lstrip(" \t")):
+                self.html_end = end
+                self.html_base = base
+            return
+
+        candidate = self.candidate
+        if candidate is not None and candidate[0] == index - 1 and candidate[2] == base:
+            columns = _table_delimiter_columns(line) if relative < 4 else None
+            header = candidate[1].strip()
+            if columns and "|" in header and len(_split_table_row(header)) == columns:
+                # A lazy header line closes the list items it is not indented into.
+                header_indent = _indent_width(candidate[1])
+                while self.list_indents and self.list_indents[-1] > header_indent:
+                    self.list_indents.pop()
+                self.table_start = candidate[0]
+                self.table_base = self.list_indents[-1] if self.list_indents else 0
+                self.table_header = [candidate[1], line]
+                self.table_last = index
+                self.table_has_body = False
+                self._end_paragraph()
+                return
+
+        if _HEADING_RE.match(line[base:]) or _THEMATIC_BREAK_RE.match(line[base:]):
+            self._end_paragraph()
+            return
+        self.in_paragraph = True
+        self.candidate = (index, line, base) if relative < 4 else None
+
+    def finish(self, line_count: int, code: list[_CodeSpan], tables: list[_TableSpan]) -> None:
+        """Close blocks still open at the end of the text."""
+        if self.fence_start is not None:
+            code.append(_CodeSpan(self.fence_start, line_count, self.fence_info))
+            self.fence_start = None
+        if self.indented_start is not None:
+            code.append(_CodeSpan(self.indented_start, self.indented_last + 1, ""))
+            self.indented_start = None
+        self.html_end = None
+        if self.table_start is not None:
+            self._finish_table(tables)
+
+    def _end_paragraph(self) -> None:
+        self.in_paragraph = False
+        self.candidate = None
+
+    def _finish_table(self, tables: list[_TableSpan]) -> None:
+        if self.table_start is not None and self.table_has_body:
+            tables.append(_TableSpan(self.table_start, self.table_last + 1, self.table_header))
+        self.table_start = None
+        self.table_header = []
+
+    def _opens_fence(self, line: str) -> bool:
+        match = _FENCE_RE.match(line)
+        if match is None:
+            return False
+        marker, info = match.group(2), match.group(3)
+        if marker[0] == "`" and "`" in info:
+            return False
+        self.fence_marker = marker
+        self.fence_info = info
+        return True
+
+    def _closes_fence(self, line: str, indent: int) -> bool:
+        match = _FENCE_RE.match(line)
+        if match is None or match.group(3).strip():
+            return False
+        marker = match.group(2)
+        return (
+            marker[0] == self.fence_marker[0]
+            and len(marker) >= len(self.fence_marker)
+            and indent - self.fence_base < 4
+        )
+
+    def _interrupts(self, line: str, indent: int, *, paragraph: bool = True) -> bool:
+        """Whether ``line`` starts a block that ends a paragraph (or a table body)."""
+        base = self.list_indents[-1] if self.list_indents else 0
+        if indent - base >= 4 and indent >= 4:
+            return False
+        if _FENCE_RE.match(line) or _BLOCKQUOTE_RE.match(line):
+            return True
+        if _HEADING_RE.match(line) or _THEMATIC_BREAK_RE.match(line):
+            return True
+        html = _html_block_kind(line)
+        if html is not None:
+            return html[1]
+        match = _LIST_ITEM_RE.match(line)
+        if match is None:
+            return False
+        if indent < base or not paragraph:
+            # Any item ends a table; a new item of an enclosing list ends a paragraph.
+            return True
+        # Only non-empty bullets and lists starting at 1 interrupt a paragraph.
+        marker = match.group(1)
+        return bool(line[match.end() :].strip()) and (marker in "-*+" or int(marker[:-1]) == 1)
+
+
+class _LineIndex:
+    """Incrementally maintained line structure of a streamed markdown text.
+
+    Completed lines are stored with their start offsets and scanned for block
+    structure exactly once; display heights are cached per terminal width. The
+    trailing partial line is analyzed on demand, on a copy of the scanner
+    state, because markdown-it treats it as a complete line.
+    """
+
+    def __init__(self) -> None:
+        self.source: str | None = None
+        self.lines: list[str] = []
+        self.starts: list[int] = []
+        self.partial = ""
+        self.partial_start = 0
+        self._scanner = _BlockScanner()
+        self._code: list[_CodeSpan] = []
+        self._tables: list[_TableSpan] = []
+        self._heights: OrderedDict[int, tuple[list[int], list[int]]] = OrderedDict()
+
+    @property
+    def length(self) -> int:
+        return self.partial_start + len(self.partial)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counting the trailing partial line (as ``str.split``)."""
+        return len(self.lines) + 1
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        if "\n" not in chunk:
+            self.partial += chunk
+            return
+        pieces = (self.partial + chunk).split("\n")
+        for line in pieces[:-1]:
+            index = len(self.lines)
+            self.lines.append(line)
+            self.starts.append(self.partial_start)
+            self.partial_start += len(line) + 1
+            self._scanner.feed(index, line, self._code, self._tables)
+        self.partial = pieces[-1]
+
+    def line(self, index: int) -> str:
+        return self.lines[index] if index < len(self.lines) else self.partial
+
+    def offset(self, index: int) -> int:
+        """Character offset of line ``index`` (``length + 1`` past the last line)."""
+        if index < len(self.starts):
+            return self.starts[index]
+        if index == len(self.starts):
+            return self.partial_start
+        return self.length + 1
+
+    def text_from(self, index: int) -> str:
+        """Return the text from the start of line ``index`` to the end."""
+        if index >= len(self.lines):
+            return self.partial
+        return "\n".join(self.lines[index:]) + "\n" + self.partial
+
+    def _completed_heights(self, width: int) -> tuple[list[int], list[int]]:
+        """Per-line heights of completed lines and their running totals."""
+        cached = self._heights.get(width)
+        if cached is None:
+            cached = ([], [0])
+            self._heights[width] = cached
+            while len(self._heights) > _MAX_CACHED_WIDTHS:
+                self._heights.popitem(last=False)
+        else:
+            self._heights.move_to_end(width)
+        heights, totals = cached
+        for line in self.lines[len(heights) :]:
+            height = _line_display_height(line, width)
+            heights.append(height)
+            totals.append(totals[-1] + height)
+        return cached
+
+    def display_height(self, index: int, width: int) -> int:
+        if index < len(self.lines):
+            return self._completed_heights(width)[0][index]
+        return _line_display_height(self.partial, width)
+
+    def total_display_height(self, width: int) -> int:
+        totals = self._completed_heights(width)[1]
+        return totals[-1] + _line_display_height(self.partial, width)
+
+    def structures(self) -> tuple[list[_CodeSpan], list[_TableSpan]]:
+        """Code blocks and tables of the whole text, including the partial line."""
+        code: list[_CodeSpan] = []
+        tables: list[_TableSpan] = []
+        scanner = self._scanner.copy()
+        line_count = len(self.lines)
+        # Like markdown-it, ignore a trailing line that holds only whitespace.
+        if self.partial.strip():
+            scanner.feed(line_count, self.partial, code, tables)
+            line_count += 1
+        scanner.finish(line_count, code, tables)
+        return self._code + code, self._tables + tables
+
+    def code_block_at(self, pos: int) -> CodeBlock | None:
+        code, _ = self.structures()
+        span = self._span_at(code, pos)
+        if span is None:
+            return None
+        return CodeBlock(self.offset(span.start_line), self.offset(span.end_line), span.language)
+
+    def table_at(self, pos: int) -> Table | None:
+        _, tables = self.structures()
+        span = self._span_at(tables, pos)
+        if span is None:
+            return None
+        return Table(
+            self.offset(span.start_line), self.offset(span.end_line), list(span.header_lines)
+        )
+
+    def _span_at[S: (_CodeSpan, _TableSpan)](self, spans: list[S], pos: int) -> S | None:
+        # Spans are ordered and disjoint: only the last one starting before
+        # ``pos`` can contain it.
+        index = bisect_left(_SpanStarts(self, spans), pos) - 1
+        if index < 0:
+            return None
+        span = spans[index]
+        if self.offset(span.start_line) < pos < self.offset(span.end_line):
+            return span
+        return None
+
+
+class _SpanStarts:
+    """Sequence view of span start offsets, for bisecting without building a list."""
+
+    def __init__(self, index: _LineIndex, spans: Sequence[_CodeSpan | _TableSpan]) -> None:
+        self._index = index
+        self._spans = spans
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, item: int) -> int:
+        return self._index.offset(self._spans[item].start_line)
+
+
 class StreamBuffer:
     """Buffer for streaming markdown content with smart truncation.
 
@@ -55,8 +586,12 @@ class StreamBuffer:
         if not 0 < target_height_ratio <= 1:
             raise ValueError("target_height_ratio must be between 0 and 1")
         self._chunks: list[str] = []
+        self._index = _LineIndex()
+        # Indexes of texts passed to truncate_text/estimate_display_lines, so a
+        # caller re-submitting a growing text only pays for the new suffix.
+        self._text_indexes: list[_LineIndex] = []
+        self._text_index_limit = 8
         self._target_height_ratio = target_height_ratio
-        self._parser = MarkdownIt().enable("table")
 
     def append(self, chunk: str) -> None:
         """Add a chunk to the buffer.
@@ -66,6 +601,7 @@ class StreamBuffer:
         """
         if chunk:
             self._chunks.append(chunk)
+            self._index.feed(chunk)
 
     def get_full_text(self) -> str:
         """Get the complete buffered text.
@@ -73,7 +609,9 @@ class StreamBuffer:
         Returns:
             Full concatenated text from all chunks
         """
-        return "".join(self._chunks)
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
 
     def get_display_text(
         self,
@@ -94,12 +632,11 @@ class StreamBuffer:
         Returns:
             Text ready for display (truncated if needed)
         """
-        full_text = self.get_full_text()
-        if not full_text:
-            return full_text
+        if not self._chunks:
+            return ""
         ratio = target_ratio if target_ratio is not None else self._target_height_ratio
         return self._truncate_for_display(
-            full_text,
+            self._index,
             terminal_height,
             ratio,
             terminal_width,
@@ -120,7 +657,7 @@ class StreamBuffer:
             return text
         ratio = target_ratio if target_ratio is not None else self._target_height_ratio
         return self._truncate_for_display(
-            text,
+            self._index_for(text),
             terminal_height,
             ratio,
             terminal_width,
@@ -130,10 +667,39 @@ class StreamBuffer:
     def clear(self) -> None:
         """Clear the buffer."""
         self._chunks.clear()
+        self._index = _LineIndex()
+        self._text_indexes.clear()
+
+    def _index_for(self, text: str) -> _LineIndex:
+        """Return a line index of ``text``, extending one built for a prefix of it."""
+        best: _LineIndex | None = None
+        for candidate in self._text_indexes:
+            source = candidate.source
+            if source is None or len(source) > len(text):
+                continue
+            if best is not None and best.length >= len(source):
+                continue
+            if source is text or text.startswith(source):
+                best = candidate
+                if len(source) == len(text):
+                    break
+
+        if best is None:
+            best = _LineIndex()
+            self._text_indexes.append(best)
+            if len(self._text_indexes) > self._text_index_limit:
+                self._text_indexes.pop(0)
+        else:
+            self._text_indexes.remove(best)
+            self._text_indexes.append(best)
+        if best.length < len(text):
+            best.feed(text[best.length :])
+        best.source = text
+        return best
 
     def _truncate_for_display(
         self,
-        text: str,
+        index: _LineIndex,
         terminal_height: int,
         target_ratio: float,
         terminal_width: int | None,
@@ -145,13 +711,16 @@ class StreamBuffer:
         Algorithm:
         1. If text fits, return as-is
         2. Otherwise, keep last N lines (where N = terminal_height * target_ratio)
-        3. Parse markdown to find code blocks and tables
+        3. Look up the code block or table containing the cut
         4. If we truncated mid-code-block, prepend opening fence
         5. If we truncated mid-table-data, prepend table header
         6. If code block is unclosed, append closing fence
 
+        Heights and block structure come from the line index, so only the
+        retained lines are visited here.
+
         Args:
-            text: Full markdown text
+            index: Line index of the full markdown text
             terminal_height: Terminal height in lines
             target_ratio: Multiplier for target line count
 
@@ -159,66 +728,57 @@ class StreamBuffer:
             Truncated text with preserved context
         """
         if terminal_height <= 0:
-            return text
+            return index.text_from(0)
 
-        lines = text.split("\n")
+        line_count = index.line_count
         target_lines = max(1, int(terminal_height * target_ratio))
+        width = terminal_width if terminal_width and terminal_width > 0 else None
 
         # Estimate how many rendered lines the text will occupy
-        if terminal_width and terminal_width > 0:
-            # Treat each logical line as taking at least one row, expanding based on width
-            display_counts = self._estimate_display_counts(lines, terminal_width)
-            total_display_lines = sum(display_counts)
+        if width:
+            total_display_lines = index.total_display_height(width)
         else:
-            display_counts = None
-            total_display_lines = len(lines)
+            total_display_lines = line_count
 
         # Fast path: no truncation needed if content still fits the viewport
         if total_display_lines <= terminal_height:
+            text = index.text_from(0)
             return self._add_closing_fence_if_needed(text) if add_closing_fence else text
 
         # Determine how many display lines we want to keep after truncation
         desired_display_lines = min(total_display_lines, target_lines)
 
         # Determine how many logical lines we can keep based on estimated display rows
-        if display_counts:
+        if width:
             running_total = 0
-            start_index = len(lines) - 1
-            for idx in range(len(lines) - 1, -1, -1):
-                running_total += display_counts[idx]
+            start_index = line_count - 1
+            for idx in range(line_count - 1, -1, -1):
+                running_total += index.display_height(idx, width)
                 start_index = idx
                 if running_total >= desired_display_lines:
                     break
         else:
-            start_index = max(len(lines) - desired_display_lines, 0)
+            start_index = max(line_count - desired_display_lines, 0)
 
         # Compute character position where truncation occurs
-        truncation_pos = sum(len(line) + 1 for line in lines[:start_index])
-        truncated_text = text[truncation_pos:]
-
-        if terminal_width and terminal_width > 0:
-            truncated_text, truncation_pos = self._trim_within_line_if_needed(
-                text=text,
-                truncated_text=truncated_text,
-                truncation_pos=truncation_pos,
-                terminal_width=terminal_width,
-                max_display_lines=desired_display_lines,
-            )
+        truncation_pos = index.offset(start_index)
+        truncated_text = index.text_from(start_index)
 
-        # Parse markdown structures only when we see markers that can affect
-        # context preservation, and only once per truncation pass.
-        if self._contains_context_markers(text):
-            code_blocks, tables = self._find_structures(text)
-
-            # Preserve code block context if needed
-            truncated_text = self._preserve_code_block_context(
-                text, truncated_text, truncation_pos, code_blocks
+        if width:
+            truncated_text, trimmed = self._trim_within_line_if_needed(
+                truncated_text, width, desired_display_lines
             )
+            truncation_pos += trimmed
 
-            # Preserve table context if needed
-            truncated_text = self._preserve_table_context(
-                text, truncated_text, truncation_pos, tables
+        # Preserve the code block or table the cut falls into, if any
+        code_block = index.code_block_at(truncation_pos)
+        if code_block is not None:
+            truncated_text = self._preserve_code_block_context(
+                truncated_text, truncation_pos, [code_block]
             )
+        table = index.table_at(truncation_pos)
+        if table is not None:
+            truncated_text = self._preserve_table_context(truncated_text, truncation_pos, [table])
 
         # Add closing fence if code block is unclosed (display-only)
         if add_closing_fence:
@@ -226,126 +786,8 @@ class StreamBuffer:
 
         return truncated_text
 
-    def _contains_context_markers(self, text: str) -> bool:
-        """Quick check for markdown structures that need context preservation."""
-        if "```" in text or "~~~" in text:
-            return True
-
-        # Tables are line-oriented and include pipe-delimited rows.
-        if "|" in text and "\n" in text:
-            if text.startswith("|") or "\n|" in text:
-                return True
-            if "|---" in text or "---|" in text:
-                return True
-            if self._contains_pipe_table_separator(text):
-                return True
-
-        # Indented code blocks can be expressed without fences.
-        if text.startswith("    ") or "\n    " in text:
-            return True
-        if text.startswith("\t") or "\n\t" in text:
-            return True
-
-        return False
-
-    def _contains_pipe_table_separator(self, text: str) -> bool:
-        """Detect GFM separator rows, including tables without leading pipes."""
-        for line in text.splitlines():
-            stripped = line.strip()
-            if "|" not in stripped:
-                continue
-            cells = [cell.strip() for cell in stripped.strip("|").split("|")]
-            if len(cells) < 2:
-                continue
-            if all(self._is_table_separator_cell(cell) for cell in cells):
-                return True
-        return False
-
-    def _is_table_separator_cell(self, cell: str) -> bool:
-        """Return True when cell is a GFM separator token like ':---:'."""
-        if not cell:
-            return False
-        if cell.startswith(":"):
-            cell = cell[1:]
-        if cell.endswith(":"):
-            cell = cell[:-1]
-        return len(cell) >= 3 and all(ch == "-" for ch in cell)
-
-    def _line_start_offsets(self, lines: list[str]) -> list[int]:
-        """Return character offsets for each line start (plus EOF)."""
-        offsets = [0]
-        running = 0
-        for line in lines:
-            running += len(line) + 1
-            offsets.append(running)
-        return offsets
-
-    def _find_structures(self, text: str) -> tuple[list[CodeBlock], list[Table]]:
-        """Parse markdown once and return code blocks and tables."""
-        tokens = self._parser.parse(text)
-        lines = text.split("\n")
-        line_offsets = self._line_start_offsets(lines)
-        code_blocks = self._find_code_blocks(
-            text,
-            tokens=tokens,
-            lines=lines,
-            line_offsets=line_offsets,
-        )
-        tables = self._find_tables(
-            text,
-            tokens=tokens,
-            lines=lines,
-            line_offsets=line_offsets,
-        )
-        return code_blocks, tables
-
-    def _find_code_blocks(
-        self,
-        text: str,
-        *,
-        tokens: list[Token] | None = None,
-        lines: list[str] | None = None,
-        line_offsets: list[int] | None = None,
-    ) -> list[CodeBlock]:
-        """Find all code blocks in text using markdown-it parser.
-
-        Args:
-            text: Markdown text to analyze
-
-        Returns:
-            List of CodeBlock objects with position information
-        """
-        if tokens is None:
-            tokens = self._parser.parse(text)
-        if lines is None:
-            lines = text.split("\n")
-        if line_offsets is None:
-            line_offsets = self._line_start_offsets(lines)
-        blocks = []
-
-        for token in self._flatten_tokens(tokens):
-            if token.type in ("fence", "code_block") and token.map:
-                start_line = token.map[0]
-                end_line = token.map[1]
-                start_pos = line_offsets[start_line]
-                end_pos = line_offsets[end_line]
-                language = getattr(token, "info", "") or ""
-
-                blocks.append(
-                    CodeBlock(start_pos=start_pos, end_pos=end_pos, language=language)
-                )
-
-        return blocks
-
-    def _find_tables(
-        self,
-        text: str,
-        *,
-        tokens: list[Token] | None = None,
-        lines: list[str] | None = None,
-        line_offsets: list[int] | None = None,
-    ) -> list[Table]:
-        """Find all tables in text using markdown-it parser.
+    def _find_tables(self, text: str) -> list[Table]:
+        """Find all tables in text.
 
         Args:
             text: Markdown text to analyze
@@ -353,48 +795,17 @@ class StreamBuffer:
         Returns:
             List of Table objects with position and header information
         """
-        if tokens is None:
-            tokens = self._parser.parse(text)
-        if lines is None:
-            lines = text.split("\n")
-        if line_offsets is None:
-            line_offsets = self._line_start_offsets(lines)
-        tables = []
-
-        for i, token in enumerate(tokens):
-            token_map = token.map
-            if token.type == "table_open" and token_map is not None:
-                # Find tbody within this table to extract header
-                tbody_start_line = None
-
-                # Look ahead for tbody
-                for j in range(i + 1, len(tokens)):
-                    tbody_map = tokens[j].map
-                    if tokens[j].type == "tbody_open" and tbody_map is not None:
-                        tbody_start_line = tbody_map[0]
-                        break
-                    elif tokens[j].type == "table_close":
-                        break
-
-                if tbody_start_line is not None:
-                    table_start_line = token_map[0]
-                    table_end_line = token_map[1]
-
-                    # Calculate positions
-                    start_pos = line_offsets[table_start_line]
-                    end_pos = line_offsets[table_end_line]
-
-                    # Header lines = everything before tbody (header row + separator)
-                    header_lines = lines[table_start_line:tbody_start_line]
-
-                    tables.append(
-                        Table(start_pos=start_pos, end_pos=end_pos, header_lines=header_lines)
-                    )
-
-        return tables
+        index = self._index_for(text)
+        _, spans = index.structures()
+        return [
+            Table(
+                index.offset(span.start_line), index.offset(span.end_line), list(span.header_lines)
+            )
+            for span in spans
+        ]
 
     def _preserve_code_block_context(
-        self, original_text: str, truncated_text: str, truncation_pos: int, code_blocks: list[CodeBlock]
+        self, truncated_text: str, truncation_pos: int, code_blocks: list[CodeBlock]
     ) -> str:
         """Prepend code block opening fence if truncation removed it.
 
@@ -402,7 +813,6 @@ class StreamBuffer:
         so the remaining code still renders with syntax highlighting.
 
         Args:
-            original_text: Full original text
             truncated_text: Text after truncation
             truncation_pos: Character position where truncation happened
             code_blocks: List of code blocks in original text
@@ -425,7 +835,7 @@ class StreamBuffer:
         return truncated_text
 
     def _preserve_table_context(
-        self, original_text: str, truncated_text: str, truncation_pos: int, tables: list[Table]
+        self, truncated_text: str, truncation_pos: int, tables: list[Table]
     ) -> str:
         """Prepend table header if truncation removed it.
 
@@ -438,7 +848,6 @@ class StreamBuffer:
         - Separator (e.g., "|------|------|")
 
         Args:
-            original_text: Full original text
             truncated_text: Text after truncation
             truncation_pos: Character position where truncation happened
             tables: List of tables in original text
@@ -451,15 +860,8 @@ class StreamBuffer:
             if table.start_pos < truncation_pos < table.end_pos:
                 # Check if we removed the header (header is at start of table)
                 # If truncation happened after the header, we need to restore it
-                lines = original_text.split("\n")
-                table_start_line = sum(
-                    1 for line in original_text[:table.start_pos].split("\n")
-                ) - 1
-
-                # Find where the data rows start (after separator)
-                # Header lines include header row + separator
-                data_start_line = table_start_line + len(table.header_lines)
-                data_start_pos = sum(len(line) + 1 for line in lines[:data_start_line])
+                # Data rows start after the header lines (header row + separator)
+                data_start_pos = table.start_pos + sum(len(line) + 1 for line in table.header_lines)
 
                 header_text = "\n".join(table.header_lines) + "\n"
                 if truncated_text.startswith(header_text):
@@ -518,68 +920,58 @@ class StreamBuffer:
 
         return text
 
-    def _flatten_tokens(self, tokens: list[Token]) -> Generator[Token, None, None]:
-        """Flatten nested token tree.
-
-        Args:
-            tokens: List of tokens from markdown-it
-
-        Yields:
-            Flattened tokens
-        """
-        for token in tokens:
-            is_fence = token.type == "fence"
-            is_image = token.tag == "img"
-            if token.children and not (is_image or is_fence):
-                yield from self._flatten_tokens(token.children)
-            else:
-                yield token
-
     def _estimate_display_counts(self, lines: list[str], terminal_width: int) -> list[int]:
         """Estimate how many terminal rows each logical line will occupy."""
-        return [
-            max(1, ceil(len(line.expandtabs()) / terminal_width)) if line else 1
-            for line in lines
-        ]
+        return [_line_display_height(line, terminal_width) for line in lines]
 
     def estimate_display_lines(self, text: str, terminal_width: int) -> int:
         """Estimate how many terminal rows the given text will occupy."""
         if not text:
             return 0
-        lines = text.split("\n")
-        return sum(self._estimate_display_counts(lines, terminal_width))
+        return self._index_for(text).total_display_height(terminal_width)
 
     def _trim_within_line_if_needed(
         self,
-        text: str,
         truncated_text: str,
-        truncation_pos: int,
         terminal_width: int,
         max_display_lines: int,
     ) -> tuple[str, int]:
-        """Trim additional characters when a single line exceeds the viewport."""
-        current_pos = truncation_pos
-        current_text = truncated_text
-        estimated_lines = self.estimate_display_lines(current_text, terminal_width)
+        """Trim additional characters when a single line exceeds the viewport.
 
-        while estimated_lines > max_display_lines and current_pos < len(text):
+        Returns the trimmed text and the number of characters removed from its start.
+        """
+        current_pos = 0
+        estimated_lines = sum(
+            self._estimate_display_counts(truncated_text.split("\n"), terminal_width)
+        )
+
+        while estimated_lines > max_display_lines and current_pos < len(truncated_text):
             excess_display = estimated_lines - max_display_lines
             chars_to_trim = excess_display * terminal_width
             if chars_to_trim <= 0:
                 break
 
-            candidate_pos = min(len(text), current_pos + chars_to_trim)
+            candidate_pos = min(len(truncated_text), current_pos + chars_to_trim)
 
             # Prefer trimming at the next newline to keep markdown structures intact
-            newline_pos = text.find("\n", current_pos, candidate_pos)
+            newline_pos = truncated_text.find("\n", current_pos, candidate_pos)
             if newline_pos != -1:
                 candidate_pos = newline_pos + 1
 
             if candidate_pos <= current_pos:
                 break
 
+            # Only the first remaining line changes height as characters are removed.
+            first_end = truncated_text.find("\n", current_pos)
+            if first_end == -1:
+                first_end = len(truncated_text)
+            estimated_lines -= _line_display_height(
+                truncated_text[current_pos:first_end], terminal_width
+            )
+            if candidate_pos <= first_end:
+                estimated_lines += _line_display_height(
+                    truncated_text[candidate_pos:first_end], terminal_width
+                )
             current_pos = candidate_pos
-            current_text = text[current_pos:]
-            estimated_lines = self.estimate_display_lines(current_text, terminal_width)
 
-        return current_text, current_pos
+        return truncated_text[current_pos:], current_pos
@@ -0,0 +1,177 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import pytest
+from acp.agent.connection import AgentSideConnection
+from mcp.types import CallToolResult, ImageContent, TextContent
+
+from fast_agent.acp.history_replay import iter_history_update_pages, replay_start
+from fast_agent.acp.server.agent_acp_server import ACPSessionState, AgentACPServer
+from fast_agent.core.agent_app import AgentApp
+from fast_agent.core.fastagent import AgentInstance
+from fast_agent.types import PromptMessageExtended
+
+if TYPE_CHECKING:
+    from fast_agent.interfaces import AgentProtocol
+
+
+def _text(role: Literal["user", "assistant"], text: str) -> PromptMessageExtended:
+    return PromptMessageExtended(role=role, content=[TextContent(type="text", text=text)])
+
+
+def _tool_result() -> PromptMessageExtended:
+    return PromptMessageExtended(
+        role="user",
+        content=[],
+        tool_results={"call": CallToolResult(content=[TextContent(type="text", text="ok")])},
+    )
+
+
+def _summary(pages) -> list[list[tuple[str, str]]]:
+    return [
+        [
+            (update.session_update, getattr(update.content, "text", update.content.type))
+            for update in page
+        ]
+        for page in pages
+    ]
+
+
+def test_replay_window_starts_at_a_turn_boundary() -> None:
+    history = [
+        _text("user", "first"),
+        _text("assistant", "calling a tool"),
+        _tool_result(),
+        _text("assistant", "done"),
+        _text("user", "second"),
+        _text("assistant", "answer"),
+    ]
+
+    assert replay_start(history, 0) == 0
+    assert replay_start(history, 10) == 0
+    # The window would start on a tool result; move it to the next prompt.
+    assert replay_start(history, 4) == 4
+    # The last turn alone is longer than the window.
+    assert replay_start(history[:4], 2) == 2
+
+
+def test_history_updates_merge_adjacent_text_and_page() -> None:
+    history = [
+        _text("user", "look at this"),
+        PromptMessageExtended(
+            role="user",
+            content=[ImageContent(type="image", data="aGk=", mimeType="image/png")],
+        ),
+        _text("assistant", "Checking. "),
+        _tool_result(),
+        _text("assistant", "It is a cat."),
+        _text("user", "thanks"),
+    ]
+
+    pages = list(iter_history_update_pages(history, page_size=2))
+
+    assert _summary(pages) == [
+        [("user_message_chunk", "look at this"), ("user_message_chunk", "image")],
+        [("agent_message_chunk", "Checking. It is a cat."), ("user_message_chunk", "thanks")],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_page_is_written_in_order_on_the_connection() -> None:
+    lines: list[dict[str, Any]] = []
+    received = asyncio.Event()
+    history = [_text("user" if index % 2 == 0 else "assistant", f"m{index}") for index in range(40)]
+    (page,) = iter_history_update_pages(history, page_size=100)
+
+    async def collect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            lines.append(json.loads(line))
+            if len(lines) == len(page):
+                received.set()
+        writer.close()
+
+    client = await asyncio.start_server(collect, "127.0.0.1", 0)
+    port = client.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    agents = {"agent": cast("AgentProtocol", SimpleNamespace(name="agent"))}
+    instance = AgentInstance(app=AgentApp(agents), agents=agents)
+
+    async def create_instance() -> AgentInstance:
+        return instance
+
+    async def dispose_instance(_instance: AgentInstance) -> None:
+        return None
+
+    server = AgentACPServer(
+        primary_instance=instance,
+        create_instance=create_instance,
+        dispose_instance=dispose_instance,
+        instance_scope="shared",
+        server_name="test",
+        permissions_enabled=False,
+    )
+    server._connection = AgentSideConnection(cast("Any", server), writer, reader, listening=False)
+    try:
+        await server._send_update_page("session-1", page)
+        await asyncio.wait_for(received.wait(), timeout=2)
+    finally:
+        writer.close()
+        client.close()
+
+    assert [line["params"]["update"]["content"]["text"] for line in lines] == [
+        f"m{index}" for index in range(40)
+    ]
+
+
+class _RecordingConnection:
+    def __init__(self) -> None:
+        self.updates: list[Any] = []
+
+    async def session_update(self, session_id: str, update: Any, **kwargs: Any) -> None:
+        self.updates.append(update)
+
+
+@pytest.mark.asyncio
+async def test_replay_announces_omitted_messages() -> None:
+    history = [_text("user" if index % 2 == 0 else "assistant", f"m{index}") for index in range(10)]
+    agents = {
+        "agent": cast("AgentProtocol", SimpleNamespace(name="agent", message_history=history))
+    }
+    instance = AgentInstance(app=AgentApp(agents), agents=agents)
+
+    async def create_instance() -> AgentInstance:
+        return instance
+
+    async def dispose_instance(_instance: AgentInstance) -> None:
+        return None
+
+    server = AgentACPServer(
+        primary_instance=instance,
+        create_instance=create_instance,
+        dispose_instance=dispose_instance,
+        instance_scope="shared",
+        server_name="test",
+        permissions_enabled=False,
+        history_replay_messages=4,
+    )
+    connection = _RecordingConnection()
+    server._connection = cast("Any", connection)
+    session = SimpleNamespace(info=SimpleNamespace(metadata={}, last_activity=datetime.now()))
+
+    await server._send_session_history_updates(
+        ACPSessionState(session_id="session-1", instance=instance),
+        cast("Any", session),
+        "agent",
+    )
+
+    replayed = [(update.session_update, update.content.text) for update in connection.updates[1:]]
+    assert replayed == [
+        ("agent_message_chunk", "6 earlier messages not shown — use /history to view them."),
+        ("user_message_chunk", "m6"),
+        ("agent_message_chunk", "m7"),
+        ("user_message_chunk", "m8"),
+        ("agent_message_chunk", "m9"),
+    ]
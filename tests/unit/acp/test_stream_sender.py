@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from fast_agent.acp.stream_sender import ACPStreamSender
+from fast_agent.acp.tool_progress import ACPToolProgressManager
+from fast_agent.llm.stream_types import StreamChunk
+
+
+class _RecordingConnection:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.updates: list[tuple[str, str]] = []
+
+    async def session_update(self, session_id: str, update: Any, **kwargs: Any) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        content = getattr(update, "content", None)
+        text = getattr(content, "text", None) or getattr(update, "title", "")
+        self.updates.append((update.session_update, text))
+
+
+def _sender(connection: _RecordingConnection, **kwargs: Any) -> ACPStreamSender:
+    sender = ACPStreamSender(connection, "session-1", **kwargs)
+    sender.start()
+    return sender
+
+
+@pytest.mark.asyncio
+async def test_consecutive_deltas_are_coalesced_in_order() -> None:
+    connection = _RecordingConnection()
+    sender = _sender(connection, flush_interval=10)
+
+    for token in ["Let", " me", " think"]:
+        sender.push(StreamChunk(token, is_reasoning=True))
+    for token in ["Hello", ",", " world"]:
+        sender.push(StreamChunk(token))
+    sender.push(StreamChunk(""))
+    sender.push(StreamChunk("!"))
+    await sender.aclose()
+
+    assert connection.updates == [
+        ("agent_thought_chunk", "Let me think"),
+        ("agent_message_chunk", "Hello, world!"),
+    ]
+    assert sender.stats.chunks == 7
+    assert sender.stats.frames == 2
+
+
+@pytest.mark.asyncio
+async def test_full_frames_are_sent_without_waiting_for_the_interval() -> None:
+    connection = _RecordingConnection()
+    sender = _sender(connection, flush_interval=10, max_frame_bytes=4)
+
+    for token in ["ab", "cd", "ef"]:
+        sender.push(StreamChunk(token))
+    await asyncio.wait_for(sender.flush(), timeout=1)
+
+    assert connection.updates == [
+        ("agent_message_chunk", "abcd"),
+        ("agent_message_chunk", "ef"),
+    ]
+    await sender.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_receives_fewer_larger_frames() -> None:
+    connection = _RecordingConnection(delay=0.02)
+    sender = _sender(connection, flush_interval=0)
+
+    for index in range(50):
+        sender.push(StreamChunk(f"{index} "))
+        await asyncio.sleep(0.001)
+    await sender.aclose()
+
+    assert "".join(text for _, text in connection.updates) == "".join(
+        f"{index} " for index in range(50)
+    )
+    assert len(connection.updates) < 50
+
+
+@pytest.mark.asyncio
+async def test_tool_stream_start_is_sent_after_preceding_text() -> None:
+    connection = _RecordingConnection()
+    sender = _sender(connection, flush_interval=10)
+    manager = ACPToolProgressManager(cast("Any", connection), "session-1")
+    manager.set_stream_sender(sender)
+
+    sender.push(StreamChunk("Let me check."))
+    manager.handle_tool_stream_event("start", {"tool_name": "search", "tool_use_id": "t1"})
+    assert await manager.get_tool_call_id_for_tool_use("t1") is not None
+
+    assert connection.updates == [
+        ("agent_message_chunk", "Let me check."),
+        ("tool_call", "search"),
+    ]
+    await sender.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pending_frames_are_bounded_for_slow_clients() -> None:
+    connection = _RecordingConnection(delay=0.01)
+    sender = _sender(connection, flush_interval=0, max_frame_bytes=1, max_pending_frames=3)
+
+    for index in range(100):
+        sender.push(StreamChunk(f"{index} "))
+        assert sender.pending_frames <= 3
+    await sender.aclose()
+
+    assert "".join(text for _, text in connection.updates) == "".join(
+        f"{index} " for index in range(100)
+    )
+    assert len(connection.updates) <= 4
@@ -13,6 +13,7 @@ from fast_agent.agents.agent_types import AgentConfig
 from fast_agent.agents.llm_agent import LlmAgent
 from fast_agent.agents.tool_runner import ToolRunner, ToolRunnerHooks
 from fast_agent.agents.workflow.agents_as_tools_agent import (
+    DEFAULT_WARM_INSTANCES,
     AgentsAsToolsAgent,
     AgentsAsToolsOptions,
     HistoryMergeTarget,
@@ -348,50 +349,128 @@ async def test_list_tools_adds_response_mode_when_child_tool_result_mode_is_sele
     }
 
 
-@pytest.mark.asyncio
-async def test_run_tools_respects_max_parallel_and_timeout():
-    fast_child = FakeChildAgent("fast", response_text="fast")
-    slow_child = FakeChildAgent("slow", response_text="slow", delay=0.05)
+class CountingChild(FakeChildAgent):
+    """Child that spawns distinct clones and tracks concurrency across them."""
 
-    options = AgentsAsToolsOptions(max_parallel=1, child_timeout_sec=0.01)
-    agent = AgentsAsToolsAgent(AgentConfig("parent"), [fast_child, slow_child], options=options)
-    await agent.initialize()
+    def __init__(self, name: str, response_text: str = "ok", delay: float = 0) -> None:
+        super().__init__(name, response_text=response_text, delay=delay)
+        self.spawned: list[CountingChild] = []
+        self.shutdowns = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._template: CountingChild = self
+
+    async def generate(self, messages, request_params=None, tools=None):
+        template = self._template
+        template.in_flight += 1
+        template.max_in_flight = max(template.max_in_flight, template.in_flight)
+        try:
+            return await super().generate(messages, request_params=request_params, tools=tools)
+        finally:
+            template.in_flight -= 1
+
+    async def spawn_detached_instance(self, name: str | None = None):
+        clone = CountingChild(name or self.name, self._response_text, self._delay)
+        clone._template = self
+        self.spawned.append(clone)
+        return clone
 
+    async def shutdown(self) -> None:
+        self._template.shutdowns += 1
+
+
+def _child_calls(tool_name: str, count: int) -> PromptMessageExtended:
     tool_calls = {
-        "1": CallToolRequest(params=CallToolRequestParams(name="agent__fast", arguments={"text": "hi"})),
-        "2": CallToolRequest(params=CallToolRequestParams(name="agent__slow", arguments={"text": "hi"})),
+        str(i): CallToolRequest(
+            params=CallToolRequestParams(name=tool_name, arguments={"text": f"hi {i}"})
+        )
+        for i in range(1, count + 1)
     }
-    request = PromptMessageExtended(role="assistant", content=[], tool_calls=tool_calls)
+    return PromptMessageExtended(role="assistant", content=[], tool_calls=tool_calls)
+
 
-    result_message = await agent.run_tools(request)
+@pytest.mark.asyncio
+async def test_run_tools_queues_calls_beyond_max_parallel():
+    child = CountingChild("worker", response_text="done", delay=0.01)
+    options = AgentsAsToolsOptions(max_parallel=2)
+    agent = AgentsAsToolsAgent(AgentConfig("parent"), [child], options=options)
+    await agent.initialize()
+
+    result_message = await agent.run_tools(_child_calls("agent__worker", 5))
     assert result_message.tool_results is not None
 
-    fast_result = result_message.tool_results["1"]
-    slow_result = result_message.tool_results["2"]
-
-    assert not fast_result.isError
-    # Skipped due to max_parallel cap.
-    assert slow_result.isError
-    assert slow_result.content is not None
-    assert slow_result.content[0].type == "text"
-    assert isinstance(slow_result.content[0], TextContent)
-    assert "Skipped" in slow_result.content[0].text
-
-    # Now ensure timeout path yields an error result when a single slow call runs.
-    request_single = PromptMessageExtended(
-        role="assistant",
-        content=[],
-        tool_calls={"3": CallToolRequest(params=CallToolRequestParams(name="agent__slow", arguments={"text": "hi"}))},
-    )
-    single_result = await agent.run_tools(request_single)
+    assert len(result_message.tool_results) == 5
+    assert all(not result.isError for result in result_message.tool_results.values())
+    assert child.max_in_flight == 2
+    # Queued calls reuse the warm instances for their slot.
+    assert [clone.name for clone in child.spawned] == ["worker[1]", "worker[2]"]
+
+
+@pytest.mark.asyncio
+async def test_run_tools_reuses_instances_across_turns_and_shuts_down_pool():
+    child = CountingChild("worker")
+    agent = AgentsAsToolsAgent(AgentConfig("parent"), [child])
+    await agent.initialize()
+
+    await agent.run_tools(_child_calls("agent__worker", 2))
+    await agent.run_tools(_child_calls("agent__worker", 3))
+    assert len(child.spawned) == 3
+    assert child.shutdowns == 0
+
+    await agent.shutdown()
+    # Pooled clones plus the template child itself.
+    assert child.shutdowns == 4
+
+
+@pytest.mark.asyncio
+async def test_run_tools_bounds_warm_pool_for_uncapped_fan_out():
+    child = CountingChild("worker")
+    agent = AgentsAsToolsAgent(AgentConfig("parent"), [child])
+    await agent.initialize()
+
+    await agent.run_tools(_child_calls("agent__worker", DEFAULT_WARM_INSTANCES + 6))
+
+    assert len(child.spawned) == DEFAULT_WARM_INSTANCES + 6
+    assert child.shutdowns == 6
+    assert sorted(agent._instance_pool) == [
+        ("agent__worker", slot) for slot in range(1, DEFAULT_WARM_INSTANCES + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_tools_discards_instances_when_reuse_disabled():
+    child = CountingChild("worker")
+    options = AgentsAsToolsOptions(reuse_instances=False)
+    agent = AgentsAsToolsAgent(AgentConfig("parent"), [child], options=options)
+    await agent.initialize()
+
+    await agent.run_tools(_child_calls("agent__worker", 2))
+    await agent.run_tools(_child_calls("agent__worker", 2))
+
+    assert len(child.spawned) == 4
+    assert child.shutdowns == 4
+
+
+@pytest.mark.asyncio
+async def test_run_tools_times_out_slow_child_and_discards_instance():
+    slow_child = CountingChild("slow", response_text="slow", delay=0.05)
+
+    options = AgentsAsToolsOptions(child_timeout_sec=0.01)
+    agent = AgentsAsToolsAgent(AgentConfig("parent"), [slow_child], options=options)
+    await agent.initialize()
+
+    single_result = await agent.run_tools(_child_calls("agent__slow", 1))
     assert single_result.tool_results is not None
-    err_res = single_result.tool_results["3"]
+    err_res = single_result.tool_results["1"]
     assert err_res.isError
     assert err_res.content is not None
     assert any(
         isinstance(block, TextContent) and "Tool execution failed" in (block.text or "")
         for block in err_res.content
     )
+    # Timed-out instances are not returned to the warm pool.
+    assert slow_child.shutdowns == 1
+    assert agent._instance_pool == {}
 
 
 @pytest.mark.asyncio
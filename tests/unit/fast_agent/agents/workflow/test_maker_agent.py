@@ -0,0 +1,141 @@
+"""
+Unit tests for the MAKER agent's concurrent sampling mode.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from fast_agent.agents.agent_types import AgentConfig
+from fast_agent.agents.llm_agent import LlmAgent
+from fast_agent.agents.workflow.maker_agent import MakerAgent
+from fast_agent.core.exceptions import AgentConfigError
+from fast_agent.core.prompt import Prompt
+from fast_agent.llm.internal.passthrough import PassthroughLLM
+from fast_agent.llm.request_params import RequestParams
+
+if TYPE_CHECKING:
+    from mcp import Tool
+
+    from fast_agent.interfaces import AgentProtocol
+    from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
+
+class _ScriptedWorker:
+    """Worker returning scripted (delay, text) samples in call order."""
+
+    def __init__(self, script: list[tuple[float, str]]) -> None:
+        self.name = "worker"
+        self.config = AgentConfig(name="worker")
+        self.message_history = []
+        self.initialized = True
+        self._script = list(script)
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    async def generate(self, messages, request_params=None):
+        delay, text = self._script[self.started % len(self._script)]
+        self.started += 1
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self._in_flight -= 1
+        self.completed += 1
+        return Prompt.assistant(text)
+
+
+class _SlowVotingLlm(PassthroughLLM):
+    """Answers "A" quickly and "B" slowly, recording the context of each call."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+        self.contexts: list[list[str]] = []
+
+    async def _apply_prompt_provider_specific(
+        self,
+        multipart_messages: "list[PromptMessageExtended]",
+        request_params: RequestParams | None = None,
+        tools: "list[Tool] | None" = None,
+        is_template: bool = False,
+    ) -> "PromptMessageExtended":
+        self.calls += 1
+        self.contexts.append([message.first_text() for message in multipart_messages])
+        slow = self.calls % 2 == 0
+        await asyncio.sleep(5.0 if slow else 0.01)
+        return Prompt.assistant("B" if slow else "A")
+
+
+def _maker(worker: _ScriptedWorker | LlmAgent, **kwargs) -> MakerAgent:
+    return MakerAgent(
+        config=AgentConfig(name="maker"), worker_agent=cast("AgentProtocol", worker), **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sampling_cancels_in_flight_samples_after_winner():
+    worker = _ScriptedWorker([(0.01, "A"), (0.01, "A"), (5.0, "B"), (5.0, "B")])
+    maker = _maker(worker, k=2, max_samples=10, parallel_samples=4)
+
+    response = await maker.generate_impl([Prompt.user("choose")])
+
+    assert response.last_text() == "A"
+    result = maker.last_result
+    assert result is not None
+    assert result.converged is True
+    assert result.total_samples == 2
+    assert result.cancelled_samples == 2
+    assert worker.max_in_flight == 4
+    assert worker.cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sampling_tracks_red_flags_and_respects_max_samples():
+    worker = _ScriptedWorker([(0.0, "this answer is far too long"), (0.0, "ok")])
+    maker = _maker(worker, k=3, max_samples=4, parallel_samples=3, red_flag_max_length=5)
+
+    response = await maker.generate_impl([Prompt.user("choose")])
+
+    assert response.last_text() == "ok"
+    result = maker.last_result
+    assert result is not None
+    assert result.converged is False
+    assert result.total_samples == 4
+    assert result.discarded_samples == 2
+    assert result.votes == {"ok": 2}
+    assert worker.started == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sampling_does_not_interleave_worker_history():
+    llm = _SlowVotingLlm()
+    worker = LlmAgent(AgentConfig(name="worker"))
+    worker._llm = llm
+    worker.append_history([Prompt.user("earlier"), Prompt.assistant("reply")])
+    maker = _maker(worker, k=2, max_samples=6, parallel_samples=4)
+
+    response = await maker.generate_impl([Prompt.user("choose")])
+
+    assert response.last_text() == "A"
+    assert [message.first_text() for message in worker.message_history] == [
+        "earlier",
+        "reply",
+        "choose",
+        "A",
+    ]
+    assert llm.contexts
+    assert all(context == ["earlier", "reply", "choose"] for context in llm.contexts)
+
+
+def test_parallel_samples_must_be_positive():
+    with pytest.raises(AgentConfigError):
+        _maker(_ScriptedWorker([(0.0, "A")]), parallel_samples=0)
@@ -0,0 +1,149 @@
+"""
+Unit tests for the parallel agent's fan-in modes.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from fast_agent.agents.agent_types import AgentConfig
+from fast_agent.agents.workflow.parallel_agent import FanInMode, ParallelAgent
+from fast_agent.core.exceptions import AgentConfigError
+from fast_agent.core.prompt import Prompt
+
+if TYPE_CHECKING:
+    from fast_agent.interfaces import AgentProtocol
+
+
+class _DelayedAgent:
+    """Fan-out stub replying with its name after a fixed delay."""
+
+    def __init__(self, name: str, delay: float) -> None:
+        self.name = name
+        self.initialized = True
+        self._delay = delay
+        self.cancelled = False
+
+    async def generate(self, messages, request_params=None):
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return Prompt.assistant(f"{self.name} says hi")
+
+
+class _EchoFanIn:
+    """Fan-in stub that returns the aggregated prompt unchanged."""
+
+    name = "fan_in"
+    initialized = True
+
+    async def generate(self, messages, request_params=None):
+        return Prompt.assistant(messages[-1].all_text())
+
+
+class _RecordingStep:
+    def __init__(self, log: list[tuple], arguments) -> None:
+        self._log = log
+        self._arguments = arguments
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def update(self, *, message=None, progress=None, total=None):
+        self._log.append(("update", message, progress, total))
+
+    async def finish(self, success, *, text=None, content=None, error=None):
+        self._log.append(("finish", self._arguments, success, text or error))
+
+
+class _RecordingTelemetry:
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def start_step(self, tool_name, *, server_name="workflow", arguments=None):
+        return _RecordingStep(self.events, arguments)
+
+
+def _parallel(fan_out, **kwargs) -> ParallelAgent:
+    return ParallelAgent(
+        config=AgentConfig(name="parallel"),
+        fan_in_agent=cast("AgentProtocol", _EchoFanIn()),
+        fan_out_agents=fan_out,
+        include_request=False,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_first_n_aggregates_early_and_cancels_stragglers():
+    slow = _DelayedAgent("slow", 5.0)
+    fan_out = [slow, _DelayedAgent("fast", 0.0), _DelayedAgent("medium", 0.01)]
+    parallel = _parallel(fan_out, fan_in_mode=FanInMode.FIRST_N, fan_in_count=2)
+    telemetry = _RecordingTelemetry()
+    parallel.workflow_telemetry = telemetry
+
+    response = await parallel.generate_impl([Prompt.user("hello")])
+
+    assert response.last_text() == (
+        '<fastagent:response agent="slow" status="cancelled"/>\n\n'
+        '<fastagent:response agent="fast">\nfast says hi\n</fastagent:response>\n\n'
+        '<fastagent:response agent="medium">\nmedium says hi\n</fastagent:response>'
+    )
+    assert slow.cancelled is True
+    assert [branch.status for branch in parallel.last_fan_out] == [
+        "cancelled",
+        "completed",
+        "completed",
+    ]
+    finished = {
+        event[1]["agent"]: event
+        for event in telemetry.events
+        if event[0] == "finish" and event[1] and "agent" in event[1]
+    }
+    assert finished["fast"][2] is True
+    assert "completed fan-out work in" in finished["fast"][3]
+    assert finished["slow"][2] is False
+    assert "cancelled after" in finished["slow"][3]
+
+
+@pytest.mark.asyncio
+async def test_deadline_marks_stragglers_timed_out():
+    fan_out = [_DelayedAgent("slow", 5.0), _DelayedAgent("fast", 0.0)]
+    parallel = _parallel(fan_out, fan_in_mode="deadline", fan_out_timeout=0.05)
+
+    response = await parallel.generate_impl([Prompt.user("hello")])
+
+    text = response.last_text() or ""
+    assert '<fastagent:response agent="slow" status="timed_out"/>' in text
+    assert "fast says hi" in text
+    assert parallel.last_fan_out[0].latency_ms >= 50
+
+
+@pytest.mark.asyncio
+async def test_arrival_order_lists_responses_as_they_land_and_reports_progress():
+    fan_out = [_DelayedAgent("second", 0.02), _DelayedAgent("first", 0.0)]
+    parallel = _parallel(fan_out, fan_in_mode=FanInMode.ARRIVAL_ORDER)
+    telemetry = _RecordingTelemetry()
+    parallel.workflow_telemetry = telemetry
+
+    await parallel.generate_impl([Prompt.user("hello")])
+
+    assert [branch.agent_name for branch in parallel.last_fan_out] == ["first", "second"]
+    progress = [event for event in telemetry.events if event[0] == "update"]
+    assert [(event[2], event[3]) for event in progress] == [(1, 2), (2, 2)]
+
+
+def test_fan_in_mode_validation():
+    fan_out = [_DelayedAgent("a", 0.0), _DelayedAgent("b", 0.0)]
+    with pytest.raises(AgentConfigError):
+        _parallel(fan_out, fan_in_mode=FanInMode.FIRST_N, fan_in_count=3)
+    with pytest.raises(AgentConfigError):
+        _parallel(fan_out, fan_in_mode=FanInMode.DEADLINE)
+    with pytest.raises(AgentConfigError):
+        _parallel(fan_out, fan_out_timeout=1.0)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from fast_agent.agents.agent_types import AgentType
+from fast_agent.core import direct_factory
+from fast_agent.core.direct_factory import active_agents_in_dependency_group
+
+
+class _FakeAgent:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.shutdown_called = False
+
+    async def shutdown(self) -> None:
+        self.shutdown_called = True
+
+
+class _Builders:
+    """Builders that record how many builds overlap; later agents finish first."""
+
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.running = 0
+        self.max_running = 0
+        self.built: list[_FakeAgent] = []
+
+    async def __call__(self, name: str, agent_data, build_ctx, result_agents) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01 * (10 - int(name[-1])))
+            if name in self.failing:
+                raise ValueError(f"{name} failed")
+            agent = _FakeAgent(name)
+            self.built.append(agent)
+            result_agents[name] = agent
+        finally:
+            self.running -= 1
+
+
+def _app(concurrency: int) -> Any:
+    config = SimpleNamespace(agent_startup_concurrency=concurrency, session_history=False)
+    return SimpleNamespace(context=SimpleNamespace(config=config))
+
+
+def _agents_dict() -> dict[str, dict[str, Any]]:
+    return {
+        "router_1": {"type": AgentType.ROUTER.value},
+        "basic_2": {"type": AgentType.BASIC.value},
+        "chain_3": {"type": AgentType.CHAIN.value},
+        "basic_4": {"type": AgentType.BASIC.value},
+        "basic_5": {"type": AgentType.BASIC.value},
+    }
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, builders: _Builders) -> None:
+    for agent_type in (AgentType.BASIC, AgentType.ROUTER, AgentType.CHAIN):
+        monkeypatch.setitem(direct_factory._AGENT_TYPE_BUILDERS, agent_type, builders)
+
+
+@pytest.mark.asyncio
+async def test_group_is_built_concurrently_in_deterministic_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builders = _Builders()
+    _install(monkeypatch, builders)
+    agents_dict = _agents_dict()
+    active_agents: dict[str, Any] = {"existing": _FakeAgent("existing")}
+
+    await active_agents_in_dependency_group(
+        _app(2),
+        agents_dict,
+        cast("Any", None),
+        ["basic_5", "chain_3", "router_1", "basic_4", "basic_2"],
+        active_agents,
+    )
+
+    assert builders.max_running == 2
+    # Agent type order first, then declaration order.
+    assert list(active_agents) == [
+        "existing",
+        "basic_2",
+        "basic_4",
+        "basic_5",
+        "router_1",
+        "chain_3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_group_failure_raises_first_error_and_shuts_down_built_agents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builders = _Builders(failing={"basic_4", "router_1"})
+    _install(monkeypatch, builders)
+    active_agents: dict[str, Any] = {}
+
+    with pytest.raises(ValueError, match="basic_4 failed"):
+        await active_agents_in_dependency_group(
+            _app(8), _agents_dict(), cast("Any", None), list(_agents_dict()), active_agents
+        )
+
+    assert active_agents == {}
+    assert sorted(agent.name for agent in builders.built) == ["basic_2", "basic_5", "chain_3"]
+    assert all(agent.shutdown_called for agent in builders.built)
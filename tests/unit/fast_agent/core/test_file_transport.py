@@ -0,0 +1,103 @@
+"""Tests for FileTransport write-behind batching and rotation."""
+
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+
+from fast_agent.core.logging.events import Event
+from fast_agent.core.logging.transport import FileTransport
+
+
+def _event(message: str) -> Event:
+    return Event(type="info", namespace="tests.file", message=message)
+
+
+def _messages(text: str) -> list[str]:
+    return [json.loads(line)["message"] for line in text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_buffers_until_interval_flush(tmp_path):
+    path = tmp_path / "log.jsonl"
+    transport = FileTransport(path, write_behind=True, flush_interval=0.05)
+
+    await transport.send_event(_event("one"))
+    await transport.send_event(_event("two"))
+    assert not path.exists() or path.read_text() == ""
+
+    for _ in range(200):
+        if path.exists() and path.read_text():
+            break
+        await asyncio.sleep(0.01)
+    assert _messages(path.read_text()) == ["one", "two"]
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flushes_on_size_threshold_and_close(tmp_path):
+    path = tmp_path / "log.jsonl"
+    transport = FileTransport(path, write_behind=True, flush_bytes=1, flush_interval=60)
+
+    await transport.send_event(_event("urgent"))
+    for _ in range(20):
+        if path.exists() and path.read_text():
+            break
+        await asyncio.sleep(0.01)
+    assert _messages(path.read_text()) == ["urgent"]
+
+    transport.flush_bytes = 1 << 20
+    await transport.send_event(_event("tail"))
+    await transport.close()
+    assert _messages(path.read_text()) == ["urgent", "tail"]
+    assert transport.is_closed
+
+
+@pytest.mark.asyncio
+async def test_rotation_keeps_backups_and_compresses(tmp_path):
+    path = tmp_path / "log.jsonl"
+    line_size = len(FileTransport(path)._format_line(_event("message-0")))
+    transport = FileTransport(
+        path, max_bytes=line_size * 2 + 8, backup_count=2, compress_rotated=True
+    )
+
+    for i in range(7):
+        await transport.send_event(_event(f"message-{i}"))
+    await transport.close()
+
+    assert _messages(path.read_text()) == ["message-6"]
+    with gzip.open(tmp_path / "log.jsonl.1.gz", "rt") as rotated:
+        assert _messages(rotated.read()) == ["message-4", "message-5"]
+    with gzip.open(tmp_path / "log.jsonl.2.gz", "rt") as rotated:
+        assert _messages(rotated.read()) == ["message-2", "message-3"]
+    assert not (tmp_path / "log.jsonl.3.gz").exists()
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_an_in_flight_write(tmp_path, monkeypatch):
+    path = tmp_path / "log.jsonl"
+    transport = FileTransport(path, write_behind=True, flush_bytes=1, flush_interval=60)
+    write_lines = transport._write_lines
+    active = []
+    overlaps = []
+
+    def slow_write_lines(lines: list[str]) -> None:
+        active.append(1)
+        overlaps.append(len(active))
+        time.sleep(0.05)
+        write_lines(lines)
+        active.pop()
+
+    monkeypatch.setattr(transport, "_write_lines", slow_write_lines)
+
+    await transport.send_event(_event("first"))
+    await asyncio.sleep(0.01)  # writer is now inside the worker thread
+    transport.flush_bytes = 1 << 20
+    await transport.send_event(_event("second"))
+    await transport.close()
+
+    assert _messages(path.read_text()) == ["first", "second"]
+    assert max(overlaps) == 1
+    assert transport._file is None
@@ -0,0 +1,166 @@
+"""Tests for HTTPTransport against a local stand-in collector."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from fast_agent.core.logging.events import Event
+from fast_agent.core.logging.transport import AsyncEventBus, HTTPTransport
+
+
+class _Collector:
+    """Local HTTP server that records batches and can fail a set number of times."""
+
+    def __init__(self, failures: list[int] | None = None, delay: float = 0.0) -> None:
+        self.failures = list(failures or [])
+        self.delay = delay
+        self.batches: list[list[dict]] = []
+        self.encodings: list[str | None] = []
+        self.peers: set[object] = set()
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            return web.Response(status=self.failures.pop(0), text="collector unavailable")
+        self.encodings.append(request.headers.get("Content-Encoding"))
+        self.peers.add(request.transport.get_extra_info("peername") if request.transport else None)
+        # aiohttp transparently inflates gzip request bodies
+        self.batches.append(await request.json())
+        return web.Response(status=204)
+
+    async def __aenter__(self) -> "_Collector":
+        app = web.Application()
+        app.router.add_post("/events", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.url = f"http://127.0.0.1:{port}/events"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        assert self._runner is not None
+        await self._runner.cleanup()
+
+
+def _event(message: str) -> Event:
+    return Event(type="info", namespace="tests.http", message=message)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_gzipped_over_a_reused_connection():
+    async with _Collector() as collector:
+        transport = HTTPTransport(collector.url, batch_size=2, flush_interval=60)
+
+        for i in range(4):
+            await transport.send_event(_event(f"event-{i}"))
+        for _ in range(50):
+            if len(collector.batches) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await transport.stop()
+
+    assert [[item["message"] for item in batch] for batch in collector.batches] == [
+        ["event-0", "event-1"],
+        ["event-2", "event-3"],
+    ]
+    assert collector.encodings == ["gzip", "gzip"]
+    assert len(collector.peers) == 1
+    assert transport.stats.sent == 4
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_and_client_errors_dropped():
+    async with _Collector(failures=[503, 502]) as collector:
+        transport = HTTPTransport(
+            collector.url, batch_size=10, flush_interval=60, retry_backoff=0.001
+        )
+
+        await transport.send_event(_event("retried"))
+        await transport.stop()
+        collector.failures = [400]
+        await transport.send_event(_event("rejected"))
+        await transport.stop()
+
+    assert [[item["message"] for item in batch] for batch in collector.batches] == [["retried"]]
+    stats = transport.stats
+    assert (stats.sent, stats.retried, stats.dropped) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_events():
+    async with _Collector() as collector:
+        transport = HTTPTransport(
+            collector.url, batch_size=100, flush_interval=60, max_queue_size=3
+        )
+        for i in range(5):
+            await transport.send_event(_event(f"event-{i}"))
+        await transport.stop()
+
+    assert [item["message"] for item in collector.batches[0]] == ["event-2", "event-3", "event-4"]
+    assert transport.stats.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_event_bus_exposes_transport_counters_and_flushes_on_stop():
+    AsyncEventBus.reset()
+    async with _Collector() as collector:
+        transport = HTTPTransport(collector.url, batch_size=100, flush_interval=60)
+        bus = AsyncEventBus.get(transport=transport)
+        await bus.start()
+        try:
+            bus.emit_nowait(_event("via bus"))
+            assert bus._queue is not None
+            await asyncio.wait_for(bus._queue.join(), timeout=2.0)
+            assert bus.stats.transport is not None
+            assert bus.stats.transport.pending == 1
+            await bus.stop()
+        finally:
+            AsyncEventBus.reset()
+
+    assert [item["message"] for item in collector.batches[0]] == ["via bus"]
+    assert transport.stats.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_during_a_request_still_delivers_the_batch():
+    async with _Collector(delay=0.1) as collector:
+        transport = HTTPTransport(collector.url, batch_size=2, flush_interval=60)
+        for i in range(3):
+            await transport.send_event(_event(f"event-{i}"))
+        await asyncio.sleep(0.02)  # first batch is in flight
+        await transport.stop()
+
+    assert [[item["message"] for item in batch] for batch in collector.batches] == [
+        ["event-0", "event-1"],
+        ["event-2"],
+    ]
+    assert (transport.stats.sent, transport.stats.dropped) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_requeues_its_batch():
+    async with _Collector(delay=1.0) as collector:
+        transport = HTTPTransport(collector.url, batch_size=2, flush_interval=60)
+        for i in range(3):
+            await transport.send_event(_event(f"event-{i}"))
+        await asyncio.sleep(0.02)
+        assert transport._sender_task is not None
+        transport._sender_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await transport._sender_task
+
+        assert [item["message"] for item in transport._queue] == [
+            "event-0",
+            "event-1",
+            "event-2",
+        ]
+        collector.delay = 0
+        await transport.stop()
+
+    assert transport.stats.sent == 3
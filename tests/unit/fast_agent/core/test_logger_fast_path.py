@@ -0,0 +1,161 @@
+"""Tests for the synchronous, pre-filtered logger emit path."""
+
+import asyncio
+
+import pytest
+
+from fast_agent.core.logging.events import Event, EventFilter
+from fast_agent.core.logging.listeners import EventListener, FilteredListener
+from fast_agent.core.logging.logger import Logger
+from fast_agent.core.logging.transport import AsyncEventBus, NoOpTransport
+
+
+class RecordingListener(FilteredListener):
+    def __init__(self, event_filter: EventFilter | None = None) -> None:
+        super().__init__(event_filter=event_filter)
+        self.messages: list[str] = []
+
+    async def handle_matched_event(self, event: Event) -> None:
+        self.messages.append(event.message)
+
+
+class RecordingTransport:
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def send_event(self, event: Event) -> None:
+        self.messages.append(event.message)
+
+
+class BlockingListener(EventListener):
+    """Listener that holds the worker so events pile up in the queue."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.messages: list[str] = []
+
+    async def handle_event(self, event: Event) -> None:
+        await self.release.wait()
+        self.messages.append(event.message)
+
+
+@pytest.fixture
+def fresh_bus():
+    AsyncEventBus.reset()
+    bus = AsyncEventBus.get(transport=NoOpTransport())
+    yield bus
+    AsyncEventBus.reset()
+
+
+async def _drain(bus: AsyncEventBus) -> None:
+    assert bus._queue is not None
+    await asyncio.wait_for(bus._queue.join(), timeout=2.0)
+
+
+@pytest.mark.asyncio
+async def test_filtered_events_are_rejected_before_allocation(fresh_bus, monkeypatch):
+    listener = RecordingListener(EventFilter(min_level="warning"))
+    fresh_bus.add_listener("recording", listener)
+    await fresh_bus.start()
+
+    built: list[str] = []
+    original_init = Event.__init__
+
+    def counting_init(self, **kwargs):
+        built.append(kwargs["message"])
+        original_init(self, **kwargs)
+
+    monkeypatch.setattr(Event, "__init__", counting_init)
+    tasks_before = len(asyncio.all_tasks())
+
+    logger = Logger("tests.fast_path")
+    for i in range(100):
+        logger.debug(f"noise {i}")
+    logger.warning("kept")
+
+    assert len(asyncio.all_tasks()) == tasks_before
+    assert built == ["kept"]
+    await _drain(fresh_bus)
+    assert listener.messages == ["kept"]
+    assert fresh_bus.stats.filtered == 100
+    await fresh_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_progress_events_reach_listeners_regardless_of_level(fresh_bus):
+    from fast_agent.core.logging.listeners import ProgressListener
+
+    class _Display:
+        def __init__(self) -> None:
+            self.updates = []
+
+        def start(self) -> None:
+            pass
+
+        def stop(self) -> None:
+            pass
+
+        def update(self, event) -> None:
+            self.updates.append(event)
+
+    display = _Display()
+    fresh_bus.add_listener("progress", ProgressListener(display=display))
+    await fresh_bus.start()
+
+    logger = Logger("fast_agent.agents.test")
+    logger.debug("plain debug")
+    logger.debug("progress", data={"progress_action": "Running", "agent_name": "agent"})
+
+    await _drain(fresh_bus)
+    assert len(display.updates) == 1
+    assert fresh_bus.stats.enqueued == 1
+    await fresh_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_events_and_counts_them(fresh_bus):
+    transport = RecordingTransport()
+    fresh_bus.transport = transport
+    blocker = BlockingListener()
+    fresh_bus.add_listener("blocking", blocker)
+    fresh_bus.max_queue_size = 3
+    await fresh_bus.start()
+
+    logger = Logger("tests.fast_path")
+    logger.info("first")
+    # Let the worker take "first" and block on it.
+    await asyncio.sleep(0.15)
+    for i in range(6):
+        logger.info(f"burst {i}")
+
+    assert fresh_bus.stats.dropped == 3
+    assert fresh_bus.stats.pending == 3
+
+    blocker.release.set()
+    await _drain(fresh_bus)
+    assert blocker.messages == ["first", "burst 3", "burst 4", "burst 5"]
+    assert transport.messages == blocker.messages
+    await fresh_bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_events_from_other_threads_are_handed_to_bus_loop(fresh_bus):
+    listener = RecordingListener()
+    fresh_bus.add_listener("recording", listener)
+    await fresh_bus.start()
+
+    logger = Logger("tests.fast_path")
+    await asyncio.to_thread(logger.info, "from thread")
+
+    for _ in range(50):
+        if listener.messages:
+            break
+        await asyncio.sleep(0.01)
+    assert listener.messages == ["from thread"]
+    await fresh_bus.stop()
+
+
+def test_stopped_bus_accepts_nothing(fresh_bus):
+    logger = Logger("tests.fast_path")
+    logger.error("ignored")
+    assert fresh_bus.stats.enqueued == 0
@@ -82,3 +82,82 @@ def test_conversation_cache_waits_for_walk_distance():
         AnthropicLLM._apply_cache_control_to_message(provider_msgs[idx])
 
     assert count_cache_controls(provider_msgs) == 1
+
+
+def test_stateful_planner_keeps_breakpoints_as_history_grows():
+    planner = AnthropicCachePlanner(walk_distance=3, max_conversation_blocks=2, stateful=True)
+    history = [make_message("template", is_template=True)]
+    history.extend(make_message(f"turn {i}") for i in range(3))
+
+    assert planner.plan_indices(history, cache_mode="auto") == [0, 3]
+
+    history.extend(make_message(f"turn {i}") for i in range(3, 5))
+    assert planner.plan_indices(history, cache_mode="auto") == [0, 3]
+
+    history.append(make_message("turn 5"))
+    assert planner.plan_indices(history, cache_mode="auto") == [0, 3, 6]
+
+    history.extend(make_message(f"turn {i}") for i in range(6, 9))
+    # Earlier breakpoints stay put; only the last one moves forward.
+    assert planner.plan_indices(history, cache_mode="auto") == [0, 3, 9]
+
+
+def test_stateful_planner_survives_history_copies():
+    stateful = AnthropicCachePlanner(stateful=True)
+    sliding = AnthropicCachePlanner()
+    history = []
+    stable_plans = []
+    sliding_plans = []
+    for turn in range(29):
+        history.append(make_message(f"turn {turn}"))
+        # Agents send a deep copy of their history with every request.
+        request = [message.model_copy(deep=True) for message in history]
+        stable_plans.append(stateful.plan_indices(request, cache_mode="auto"))
+        sliding_plans.append(sliding.plan_indices(request, cache_mode="auto"))
+
+    assert stable_plans[5::6] == [[5], [5, 11], [5, 17], [5, 23]]
+    assert sliding_plans[5::6] == [[5], [5, 11], [11, 17], [17, 23]]
+
+
+def test_stateful_planner_keeps_newest_breakpoint_when_budget_shrinks():
+    history = [make_message(f"turn {i}") for i in range(12)]
+    stateless = AnthropicCachePlanner(max_total_blocks=4)
+    stateful = AnthropicCachePlanner(max_total_blocks=4, stateful=True)
+
+    # With one slot left the sliding planner lags a boundary behind.
+    assert stateless.plan_indices(history, cache_mode="auto", system_cache_blocks=3) == [5]
+    assert stateful.plan_indices(history, cache_mode="auto", system_cache_blocks=3) == [11]
+
+
+def test_stateful_planner_resets_when_history_is_replaced():
+    planner = AnthropicCachePlanner(walk_distance=2, stateful=True)
+    history = [make_message(f"turn {i}") for i in range(4)]
+    assert planner.plan_indices(history, cache_mode="auto") == [1, 3]
+
+    replaced = [make_message(f"compacted {i}") for i in range(3)]
+    assert planner.plan_indices(replaced, cache_mode="auto") == [1]
+
+
+def test_planner_records_cache_hit_and_miss_tokens():
+    from anthropic.types.beta import BetaUsage
+
+    from fast_agent.llm.usage_tracking import TurnUsage
+
+    planner = AnthropicCachePlanner(stateful=True)
+    history = [make_message(f"turn {i}") for i in range(6)]
+    planner.plan_indices(history, cache_mode="auto")
+
+    usage = BetaUsage(
+        input_tokens=200,
+        output_tokens=50,
+        cache_creation_input_tokens=300,
+        cache_read_input_tokens=1500,
+    )
+    stats = planner.record_usage(TurnUsage.from_anthropic(usage, "claude-sonnet-4-5"))
+
+    assert stats.breakpoints == (5,)
+    assert stats.hit_tokens == 1500
+    assert stats.write_tokens == 300
+    assert stats.miss_tokens == 500
+    assert stats.hit_rate == 0.75
+    assert list(planner.turn_stats) == [stats]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    ImageContent,
+    TextContent,
+)
+
+from fast_agent.llm.history_compaction import HistoryCompactor, estimate_message_tokens
+from fast_agent.llm.provider_types import Provider
+from fast_agent.llm.usage_tracking import TurnUsage, UsageAccumulator
+from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+from fast_agent.types.llm_stop_reason import LlmStopReason
+
+
+def _text(role: Literal["user", "assistant"], text: str, **kwargs) -> PromptMessageExtended:
+    return PromptMessageExtended(role=role, content=[TextContent(type="text", text=text)], **kwargs)
+
+
+def _result_texts(message: PromptMessageExtended, call_id: str) -> list[str]:
+    assert message.tool_results is not None
+    content = message.tool_results[call_id].content
+    return [block.text for block in content if isinstance(block, TextContent)]
+
+
+def _tool_turn(index: int, output_chars: int = 8000) -> list[PromptMessageExtended]:
+    call_id = f"call-{index}"
+    return [
+        _text("user", f"question {index}"),
+        PromptMessageExtended(
+            role="assistant",
+            tool_calls={
+                call_id: CallToolRequest(
+                    method="tools/call", params=CallToolRequestParams(name="search")
+                )
+            },
+            stop_reason=LlmStopReason.TOOL_USE,
+        ),
+        PromptMessageExtended(
+            role="user",
+            tool_results={
+                call_id: CallToolResult(
+                    content=[
+                        TextContent(type="text", text="r" * output_chars),
+                        ImageContent(type="image", data="i" * 4000, mimeType="image/png"),
+                    ]
+                )
+            },
+        ),
+        _text("assistant", f"answer {index}"),
+    ]
+
+
+def _history(turns: int) -> list[PromptMessageExtended]:
+    messages = [_text("user", "system primer", is_template=True)]
+    for index in range(turns):
+        messages.extend(_tool_turn(index))
+    return messages
+
+
+def _tokens(messages: list[PromptMessageExtended]) -> int:
+    return sum(estimate_message_tokens(message) for message in messages)
+
+
+def test_history_under_budget_is_sent_unchanged() -> None:
+    compactor = HistoryCompactor()
+    history = _history(3)
+
+    assert compactor.compact(history, context_window=1_000_000) is history
+    assert compactor.compact(history, context_window=None) is history
+
+
+def test_old_tool_output_is_elided_and_recent_turns_kept() -> None:
+    compactor = HistoryCompactor(preserve_recent_turns=2, tool_result_keep_chars=100)
+    history = _history(6)
+    window = int(_tokens(history) / 0.9)
+
+    compacted = compactor.compact(history, context_window=window)
+
+    assert _tokens(compacted) <= window * 0.6
+    assert compacted[0] is history[0]
+    # The two most recent turns are passed through untouched.
+    assert compacted[-8:] == history[-8:]
+    assert all(a is b for a, b in zip(compacted[-8:], history[-8:]))
+    old_result = _result_texts(compacted[3], "call-0")
+    assert old_result[0].endswith("characters of earlier tool output elided]")
+    assert old_result[1].startswith("[image omitted from earlier context")
+    # Stored history is never modified.
+    assert _result_texts(history[3], "call-0")[0] == "r" * 8000
+
+
+def test_compacted_prefix_is_stable_across_requests() -> None:
+    compactor = HistoryCompactor(preserve_recent_turns=1, tool_result_keep_chars=100)
+    history = _history(6)
+    window = int(_tokens(history) / 0.9)
+    first = compactor.compact(history, context_window=window)
+    advances = compactor.stats.advances
+
+    # A fresh copy of the grown history (as the agent sends each request).
+    grown = [message.model_copy(deep=True) for message in history] + _tool_turn(6, 100)
+    second = compactor.compact(grown, context_window=window)
+
+    assert compactor.stats.advances == advances
+    assert [m.model_dump() for m in second[: len(first) - 4]] == [
+        m.model_dump() for m in first[: len(first) - 4]
+    ]
+
+
+def test_oldest_turns_are_dropped_when_elision_is_not_enough() -> None:
+    compactor = HistoryCompactor(preserve_recent_turns=1, tool_result_keep_chars=0)
+    history = [_text("user", "primer", is_template=True)]
+    for index in range(6):
+        history.extend([_text("user", "q" * 4000), _text("assistant", f"answer {index}")])
+    window = int(_tokens(history) / 0.9)
+
+    compacted = compactor.compact(history, context_window=window)
+
+    assert compactor.stats.dropped_messages > 0
+    assert compacted[0] is history[0]
+    assert compacted[1].role == "user"
+    assert compacted[-2:] == history[-2:]
+    assert _tokens(compacted) <= window * 0.6
+
+
+def test_estimate_is_calibrated_with_reported_input_tokens() -> None:
+    compactor = HistoryCompactor(preserve_recent_turns=1)
+    usage = UsageAccumulator()
+    history = _history(2)
+    window = _tokens(history) * 2
+
+    assert compactor.compact(history, context_window=window, usage=usage) is history
+    usage.add_turn(
+        TurnUsage(
+            provider=Provider.OPENAI,
+            model="test",
+            input_tokens=_tokens(history) * 3,
+            output_tokens=10,
+            total_tokens=_tokens(history) * 3 + 10,
+        )
+    )
+
+    # The provider counted three times the estimate, so the same history no longer fits.
+    compacted = compactor.compact(history, context_window=window, usage=usage)
+    assert compacted is not history
+    assert compactor.stats.advances == 1
@@ -0,0 +1,92 @@
+from typing import Literal
+
+from mcp.types import TextContent
+
+from fast_agent.context import Context
+from fast_agent.llm.provider.anthropic.llm_anthropic import AnthropicLLM
+from fast_agent.llm.provider_conversion_cache import ProviderConversionCache
+from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
+
+def _message(role: Literal["user", "assistant"], text: str) -> PromptMessageExtended:
+    return PromptMessageExtended(role=role, content=[TextContent(type="text", text=text)])
+
+
+def _recording_converter(calls: list[str]):
+    def convert(messages: list[PromptMessageExtended]) -> list[dict]:
+        converted = []
+        for msg in messages:
+            calls.append(msg.first_text())
+            converted.append({"role": msg.role, "content": [{"text": msg.first_text()}]})
+        return converted
+
+    return convert
+
+
+def test_only_new_messages_are_converted():
+    cache: ProviderConversionCache[dict] = ProviderConversionCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    history = [_message("user", "one"), _message("assistant", "two")]
+
+    cache.convert(history, convert)
+    history.append(_message("user", "three"))
+    # Agents pass deep copies of history on each call; content still matches.
+    result = cache.convert([msg.model_copy(deep=True) for msg in history], convert)
+
+    assert calls == ["one", "two", "three"]
+    assert [item["content"][0]["text"] for item in result] == ["one", "two", "three"]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 3
+
+
+def test_edited_message_is_reconverted():
+    cache: ProviderConversionCache[dict] = ProviderConversionCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    message = _message("user", "draft")
+
+    cache.convert([message], convert)
+    message.add_text("appended")
+    cache.convert([message], convert)
+
+    assert calls == ["draft", "draft"]
+    assert cache.stats.misses == 2
+
+
+def test_returned_messages_do_not_alias_cache():
+    cache: ProviderConversionCache[dict] = ProviderConversionCache()
+    convert = _recording_converter([])
+    history = [_message("user", "hello")]
+
+    first = cache.convert(history, convert)
+    first[0]["content"][0]["cache_control"] = {"type": "ephemeral"}
+    second = cache.convert(history, convert)
+
+    assert "cache_control" not in second[0]["content"][0]
+
+
+def test_dropped_messages_and_dialect_changes_evict_entries():
+    cache: ProviderConversionCache[dict] = ProviderConversionCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    history = [_message("user", "one"), _message("assistant", "two")]
+
+    cache.convert(history, convert, dialect="model-a")
+    cache.convert(history[:1], convert, dialect="model-a")
+    assert cache.stats.entries == 1
+
+    cache.convert(history[:1], convert, dialect="model-b")
+    assert calls == ["one", "two", "one"]
+
+
+def test_llm_clear_invalidates_conversion_cache():
+    llm = AnthropicLLM(context=Context())
+    history = [_message("user", "hello"), _message("assistant", "hi")]
+
+    first = llm._convert_to_provider_format(history)
+    assert llm._conversion_cache.stats.entries == 2
+    assert llm._convert_to_provider_format(history) == first
+
+    llm.clear()
+    assert llm._conversion_cache.stats.entries == 0
@@ -0,0 +1,122 @@
+"""Tests for the shared provider token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from fast_agent.config import RateLimitSettings, Settings
+from fast_agent.context import Context
+from fast_agent.core.prompt import Prompt
+from fast_agent.llm.internal.passthrough import PassthroughLLM
+from fast_agent.llm.provider_key_manager import ProviderKeyManager
+from fast_agent.llm.provider_types import Provider
+from fast_agent.llm.rate_limiter import (
+    ProviderRateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def test_token_bucket_goes_into_debt_and_refills():
+    now = [0.0]
+    bucket = TokenBucket(60, 1.0, clock=lambda: now[0])
+
+    assert bucket.reserve(50) == 0.0
+    assert bucket.reserve(20) == pytest.approx(10.0)
+    # The next caller queues behind the existing debt.
+    assert bucket.reserve(5) == pytest.approx(15.0)
+
+    now[0] = 15.0
+    assert bucket.level == pytest.approx(0.0)
+    now[0] = 500.0
+    assert bucket.level == 60
+
+
+def test_limiter_waits_for_the_tighter_budget_and_reconciles():
+    now = [0.0]
+    limiter = ProviderRateLimiter(
+        requests_per_minute=120, tokens_per_minute=600, clock=lambda: now[0]
+    )
+
+    assert limiter.reserve(600) == 0.0
+    # Requests bucket has room; the token bucket needs 100 tokens at 10/s.
+    assert limiter.reserve(100) == pytest.approx(10.0)
+
+    # The first request actually used far fewer tokens than estimated.
+    limiter.reconcile(estimated_tokens=600, actual_tokens=100)
+    assert limiter.reserve(0) == 0.0
+
+    stats = limiter.stats
+    assert stats.admitted == 3
+    assert stats.delayed == 1
+    assert stats.reserved_tokens == 200
+
+
+def test_limiters_are_shared_per_provider_and_key():
+    first = get_rate_limiter("openai", "a", requests_per_minute=10, tokens_per_minute=None)
+    again = get_rate_limiter("openai", "a", requests_per_minute=20, tokens_per_minute=None)
+    other_key = get_rate_limiter("openai", "b", requests_per_minute=10, tokens_per_minute=None)
+
+    assert first is again
+    assert first is not other_key
+    assert ProviderKeyManager.key_fingerprint("sk-secret") != "sk-secret"
+    assert ProviderKeyManager.key_fingerprint("sk-secret") == ProviderKeyManager.key_fingerprint(
+        "sk-secret"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_reservation():
+    limiter = ProviderRateLimiter(requests_per_minute=60)
+    for _ in range(60):
+        limiter.reserve(0)
+
+    waiter = asyncio.create_task(limiter.acquire(0))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # Only the cancelled request's slot was returned, so the bucket is still empty.
+    assert limiter.reserve(0) == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_agents_sharing_a_provider_are_admitted_in_order(monkeypatch):
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("fast_agent.llm.rate_limiter.asyncio.sleep", fake_sleep)
+    settings = Settings(
+        rate_limits={"fast-agent": RateLimitSettings(requests_per_minute=2)},
+    )
+    llms = [
+        PassthroughLLM(provider=Provider.FAST_AGENT, context=Context(config=settings))
+        for _ in range(4)
+    ]
+
+    await asyncio.gather(*(llm.generate([Prompt.user("hello")]) for llm in llms))
+
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(30.0, abs=0.5)
+    assert sleeps[1] == pytest.approx(60.0, abs=0.5)
+    limiter = llms[0]._rate_limiter()
+    assert limiter is not None
+    assert limiter is llms[3]._rate_limiter()
+    assert limiter.stats.admitted == 4
+
+
+@pytest.mark.asyncio
+async def test_no_limiter_without_configuration():
+    llm = PassthroughLLM(provider=Provider.FAST_AGENT, context=Context(config=Settings()))
+    assert llm._rate_limiter() is None
@@ -0,0 +1,291 @@
+"""Tests for the provider retry policy and its use in _execute_with_retry."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from openai import APIConnectionError, BadRequestError, RateLimitError
+
+from fast_agent.context import Context
+from fast_agent.core.exceptions import ProviderKeyError, ProviderUnavailableError
+from fast_agent.llm.internal.passthrough import PassthroughLLM
+from fast_agent.llm.provider_types import Provider
+from fast_agent.llm.retry_policy import (
+    CircuitBreaker,
+    RetryAction,
+    RetryPolicy,
+    reset_circuit_breakers,
+    retry_after_from_headers,
+)
+
+NOW = 1_700_000_000.0
+
+
+def _status_error(cls, status: int, headers: dict[str, str] | None = None):
+    request = httpx.Request("POST", "https://api.example.com/v1/chat")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return cls("provider said no", response=response, body=None)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_breakers():
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+def test_retry_after_headers_take_precedence():
+    assert retry_after_from_headers({"retry-after-ms": "1500", "retry-after": "9"}) == 1.5
+    assert retry_after_from_headers({"Retry-After": "7"}) == 7.0
+
+    http_date = format_datetime(datetime.fromtimestamp(NOW + 30, tz=timezone.utc), usegmt=True)
+    assert retry_after_from_headers({"retry-after": http_date}, now=NOW) == pytest.approx(30)
+
+
+def test_rate_limit_resets_use_exhausted_buckets_only():
+    openai_headers = {
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "6m0s",
+        "x-ratelimit-remaining-tokens": "1200",
+        "x-ratelimit-reset-tokens": "250ms",
+    }
+    assert retry_after_from_headers(openai_headers) == 360.0
+    assert retry_after_from_headers(openai_headers, include_rate_limit_resets=False) is None
+
+    reset_at = datetime.fromtimestamp(NOW + 12, tz=timezone.utc).isoformat()
+    anthropic_headers = {
+        "anthropic-ratelimit-tokens-remaining": "0",
+        "anthropic-ratelimit-tokens-reset": reset_at.replace("+00:00", "Z"),
+        "anthropic-ratelimit-requests-remaining": "40",
+        "anthropic-ratelimit-requests-reset": reset_at,
+    }
+    assert retry_after_from_headers(anthropic_headers, now=NOW) == pytest.approx(12)
+
+
+def test_backoff_is_full_jitter_and_capped(monkeypatch):
+    policy = RetryPolicy(max_delay=20.0)
+    ceilings: list[tuple[float, float]] = []
+    monkeypatch.setattr(
+        "fast_agent.llm.retry_policy.random.uniform",
+        lambda low, high: ceilings.append((low, high)) or high,
+    )
+
+    assert [policy.backoff(attempt, 4.0) for attempt in range(4)] == [4.0, 8.0, 16.0, 20.0]
+    assert all(low == 0 for low, _ in ceilings)
+
+
+def test_decide_classifies_by_status_and_honours_retry_after():
+    policy = RetryPolicy(retry_after_jitter=0.0)
+
+    limited = _status_error(RateLimitError, 429, {"retry-after": "3"})
+    decision = policy.decide(limited, 0, base_delay=10.0)
+    assert decision.action == RetryAction.RETRY
+    assert decision.delay == 3.0
+    assert decision.status_code == 429
+
+    bad_request = _status_error(BadRequestError, 400)
+    decision = policy.decide(bad_request, 0, base_delay=10.0)
+    assert decision.action == RetryAction.GIVE_UP
+    assert not decision.transient
+
+    too_long = _status_error(RateLimitError, 429, {"retry-after": "3600"})
+    assert policy.decide(too_long, 0, base_delay=10.0).action == RetryAction.GIVE_UP
+
+    connection = APIConnectionError(request=httpx.Request("POST", "https://api.example.com"))
+    assert policy.decide(connection, 0, base_delay=1.0).action == RetryAction.RETRY
+
+
+def test_decide_follows_cause_and_keeps_key_errors_fatal():
+    policy = RetryPolicy()
+    try:
+        raise ProviderKeyError("Provider rejected request", "details") from _status_error(
+            RateLimitError, 429
+        )
+    except ProviderKeyError as wrapped:
+        assert policy.decide(wrapped, 0, base_delay=1.0).action == RetryAction.RETRY
+
+    assert (
+        policy.decide(ProviderKeyError("Invalid API key"), 0, base_delay=1.0).action
+        == RetryAction.FATAL
+    )
+    assert (
+        policy.decide(ProviderKeyError("Model overloaded"), 0, base_delay=1.0).action
+        == RetryAction.RETRY
+    )
+
+
+def test_circuit_breaker_opens_then_probes_once():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10.0, clock=lambda: now[0])
+
+    assert breaker.check() is None
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+    assert breaker.check() == pytest.approx(10.0)
+
+    now[0] = 11.0
+    assert breaker.check() is None  # the probe
+    assert breaker.check() is not None  # everyone else waits for it
+    assert breaker.record_failure() is True  # failed probe re-opens
+    assert breaker.check() == pytest.approx(10.0)
+
+    now[0] = 22.0
+    assert breaker.check() is None
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.check() is None
+
+
+def _llm(retries: int) -> PassthroughLLM:
+    llm = PassthroughLLM(provider=Provider.FAST_AGENT, context=Context())
+    llm.retry_count = retries
+    llm.retry_backoff_seconds = 0.0
+    llm.retry_policy = RetryPolicy(retry_after_jitter=0.0, circuit_failure_threshold=3)
+    return llm
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_sleeps_for_retry_after(monkeypatch):
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("fast_agent.llm.fastagent_llm.asyncio.sleep", fake_sleep)
+    llm = _llm(retries=2)
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _status_error(RateLimitError, 429, {"retry-after-ms": "2500"})
+        return "ok"
+
+    assert await llm._execute_with_retry(flaky) == "ok"
+    assert calls == 2
+    assert sleeps == [2.5]
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_stops_on_non_transient_status():
+    llm = _llm(retries=3)
+    calls = 0
+    handled: list[Exception] = []
+
+    async def rejected() -> str:
+        nonlocal calls
+        calls += 1
+        raise _status_error(BadRequestError, 400)
+
+    result = await llm._execute_with_retry(
+        rejected, on_final_error=lambda error: handled.append(error) or "handled"
+    )
+    assert result == "handled"
+    assert calls == 1
+    assert isinstance(handled[0], BadRequestError)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_short_circuits_other_llms_of_same_provider():
+    first = _llm(retries=2)
+    calls = 0
+
+    async def overloaded() -> str:
+        nonlocal calls
+        calls += 1
+        raise _status_error(RateLimitError, 503)
+
+    with pytest.raises(RateLimitError):
+        await first._execute_with_retry(overloaded)
+    assert calls == 3
+
+    second = _llm(retries=2)
+    with pytest.raises(ProviderUnavailableError) as exc_info:
+        await second._execute_with_retry(overloaded)
+    assert calls == 3
+    assert exc_info.value.provider == Provider.FAST_AGENT.config_name
+
+
+def test_only_connection_and_timeout_errors_are_transient_without_status():
+    policy = RetryPolicy()
+
+    for error in (
+        httpx.ConnectTimeout("connect timed out"),
+        TimeoutError(),
+        ConnectionResetError(),
+    ):
+        decision = policy.decide(error, 0, base_delay=1.0)
+        assert (decision.action, decision.transient) == (RetryAction.RETRY, True)
+
+    try:
+        raise RuntimeError("stream failed") from httpx.ReadError("connection lost")
+    except RuntimeError as wrapped:
+        assert policy.decide(wrapped, 0, base_delay=1.0).action == RetryAction.RETRY
+
+    decision = policy.decide(KeyError("choices"), 0, base_delay=1.0)
+    assert (decision.action, decision.transient) == (RetryAction.GIVE_UP, False)
+
+
+@pytest.mark.asyncio
+async def test_local_errors_are_not_retried_or_counted_by_the_breaker():
+    llm = _llm(retries=3)
+    calls = 0
+
+    async def buggy() -> str:
+        nonlocal calls
+        calls += 1
+        raise AttributeError("'NoneType' object has no attribute 'content'")
+
+    for _ in range(5):
+        with pytest.raises(AttributeError):
+            await llm._execute_with_retry(buggy)
+    assert calls == 5
+    assert llm.retry_policy.circuit_breaker(Provider.FAST_AGENT.config_name).state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rate_limits_do_not_open_the_circuit(monkeypatch):
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay: float) -> None:
+        # Yield, so every agent hits the limit before any of them retries.
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("fast_agent.llm.fastagent_llm.asyncio.sleep", fake_sleep)
+    llms = [_llm(retries=2) for _ in range(6)]
+    limited: set[int] = set()
+
+    def call(index: int):
+        async def rate_limited() -> str:
+            if index not in limited:
+                limited.add(index)
+                headers = {"retry-after": "1"} if index % 2 else {}
+                raise _status_error(RateLimitError, 429, headers)
+            return f"ok-{index}"
+
+        return rate_limited
+
+    results = await asyncio.gather(
+        *(llm._execute_with_retry(call(index)) for index, llm in enumerate(llms))
+    )
+
+    assert results == [f"ok-{index}" for index in range(6)]
+    assert len(sleeps) == 6
+    assert llms[0].retry_policy.circuit_breaker(Provider.FAST_AGENT.config_name).state == "closed"
+
+
+def test_only_outages_count_toward_the_circuit():
+    policy = RetryPolicy()
+
+    assert not policy.decide(_status_error(RateLimitError, 429), 0, base_delay=1.0).trips_circuit
+    overloaded = _status_error(RateLimitError, 529, {"retry-after": "2"})
+    assert not policy.decide(overloaded, 0, base_delay=1.0).trips_circuit
+    assert policy.decide(_status_error(RateLimitError, 503), 0, base_delay=1.0).trips_circuit
+    connection = APIConnectionError(request=httpx.Request("POST", "https://api.example.com"))
+    assert policy.decide(connection, 0, base_delay=1.0).trips_circuit
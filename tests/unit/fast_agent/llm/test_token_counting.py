@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Literal
+
+import pytest
+from mcp.types import CallToolResult, ImageContent, TextContent
+
+from fast_agent.llm.token_counting import (
+    HEURISTIC_FAMILY,
+    TokenCounter,
+    heuristic_token_count,
+)
+from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+
+
+class _WordEncoding:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode_ordinary(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return list(range(len(text.split())))
+
+    def encode_ordinary_batch(self, text: list[str]) -> list[list[int]]:
+        return [self.encode_ordinary(item) for item in text]
+
+
+def _counter(encoding: _WordEncoding, loads: list[str]) -> TokenCounter:
+    def load(name: str) -> _WordEncoding:
+        loads.append(name)
+        return encoding
+
+    return TokenCounter(
+        encoding_name_for_model=lambda model: "words" if model.startswith("gpt") else None,
+        load_encoding=load,
+    )
+
+
+def _message(role: Literal["user", "assistant"], text: str) -> PromptMessageExtended:
+    return PromptMessageExtended(role=role, content=[TextContent(type="text", text=text)])
+
+
+def test_encoder_is_resolved_once_per_family() -> None:
+    encoding = _WordEncoding()
+    loads: list[str] = []
+    counter = _counter(encoding, loads)
+
+    assert counter.count_text("one two three", "gpt-4o") == 3
+    assert counter.count_text("four five", "gpt-4.1") == 2
+    assert loads == ["words"]
+    assert counter.family("claude-sonnet-4") == HEURISTIC_FAMILY
+    assert counter.count_text("x" * 40, "claude-sonnet-4") == heuristic_token_count("x" * 40)
+
+
+def test_message_counts_are_memoized_across_history_copies() -> None:
+    encoding = _WordEncoding()
+    counter = _counter(encoding, [])
+    history = [
+        _message("user", "list the files"),
+        PromptMessageExtended(
+            role="user",
+            tool_results={
+                "call": CallToolResult(
+                    content=[
+                        TextContent(type="text", text="a.py b.py c.py"),
+                        ImageContent(type="image", data="x" * 40, mimeType="image/png"),
+                    ]
+                )
+            },
+        ),
+    ]
+
+    assert counter.count_each(history, "gpt-4o") == [3, 3 + 10]
+    encoded = len(encoding.encoded)
+
+    copies = [message.model_copy(deep=True) for message in history]
+    copies.append(_message("assistant", "three files"))
+    assert counter.count_messages(copies, "gpt-4o") == 18
+    # Only the new message was encoded.
+    assert encoding.encoded[encoded:] == ["three files"]
+    assert counter.stats.hits == 2
+    assert counter.stats.misses == 3
+
+    # Edited content is counted again.
+    copies[0].content[0] = TextContent(type="text", text="list all the files")
+    assert counter.count_message(copies[0], "gpt-4o") == 4
+
+
+def test_failed_encoder_load_falls_back_to_heuristic_once() -> None:
+    loads: list[str] = []
+
+    def load(name: str) -> None:
+        loads.append(name)
+        raise OSError("offline")
+
+    counter = TokenCounter(encoding_name_for_model=lambda model: "o200k_base", load_encoding=load)
+    text = "word " * 20
+
+    assert counter.count_text(text, "gpt-4o") == heuristic_token_count(text)
+    assert counter.count_message(_message("user", text), "gpt-4o") == heuristic_token_count(text)
+    assert loads == ["o200k_base"]
+
+
+@pytest.mark.asyncio
+async def test_warm_loads_the_encoder_off_the_event_loop() -> None:
+    encoding = _WordEncoding()
+    load_threads: list[threading.Thread] = []
+
+    def load(name: str) -> _WordEncoding:
+        load_threads.append(threading.current_thread())
+        return encoding
+
+    counter = TokenCounter(encoding_name_for_model=lambda model: "words", load_encoding=load)
+    text = "one two three"
+
+    # Until the encoder is resolved, non-loading counts use the heuristic.
+    assert counter.count_text(text, "gpt-4o", load=False) == heuristic_token_count(text)
+    assert load_threads == []
+
+    task = counter.warm("gpt-4o")
+    assert task is not None
+    assert counter.warm("gpt-4o") is task
+    await task
+
+    assert load_threads and load_threads[0] is not threading.main_thread()
+    assert counter.is_ready("gpt-4o")
+    assert counter.warm("gpt-4o") is None
+    assert counter.count_text(text, "gpt-4o", load=False) == 3
+
+
+def test_concurrent_loads_resolve_the_encoder_once() -> None:
+    encoding = _WordEncoding()
+    loads: list[str] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def load(name: str) -> _WordEncoding:
+        loads.append(name)
+        started.set()
+        release.wait(timeout=5)
+        return encoding
+
+    counter = TokenCounter(encoding_name_for_model=lambda model: "words", load_encoding=load)
+    warm_thread = threading.Thread(target=counter.preload, args=("gpt-4o",))
+    warm_thread.start()
+    assert started.wait(timeout=5)
+
+    loop_thread = threading.Thread(target=counter.preload, args=("gpt-4o",))
+    loop_thread.start()
+    loop_thread.join(timeout=0.05)
+    release.set()
+    warm_thread.join(timeout=5)
+    loop_thread.join(timeout=5)
+
+    assert loads == ["words"]
+    assert counter.count_text("one two", "gpt-4o", load=False) == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_ready_survives_a_cancelled_waiter() -> None:
+    encoding = _WordEncoding()
+    load_threads: list[threading.Thread] = []
+    release = threading.Event()
+
+    def load(name: str) -> _WordEncoding:
+        load_threads.append(threading.current_thread())
+        release.wait(timeout=5)
+        return encoding
+
+    counter = TokenCounter(encoding_name_for_model=lambda model: "words", load_encoding=load)
+
+    cancelled = asyncio.create_task(counter.wait_ready("gpt-4o"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    release.set()
+    await counter.wait_ready("gpt-4o")
+
+    assert len(load_threads) == 1 and load_threads[0] is not threading.main_thread()
+    assert counter.is_ready("gpt-4o")
+    assert counter.count_text("one two three", "gpt-4o", load=False) == 3
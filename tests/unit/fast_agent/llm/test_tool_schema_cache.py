@@ -0,0 +1,79 @@
+import pytest
+from mcp import Tool
+
+from fast_agent.context import Context
+from fast_agent.llm.provider.anthropic.llm_anthropic import AnthropicLLM
+from fast_agent.llm.tool_schema_cache import ToolSchemaCache
+
+
+def _tool(name: str) -> Tool:
+    return Tool(name=name, inputSchema={"type": "object", "properties": {"x": {"type": "string"}}})
+
+
+def _recording_converter(calls: list[str]):
+    def convert(tool: Tool) -> dict:
+        calls.append(tool.name)
+        return {"name": tool.name, "parameters": tool.inputSchema}
+
+    return convert
+
+
+def test_unchanged_tool_list_is_not_reconverted():
+    cache: ToolSchemaCache[dict] = ToolSchemaCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    tools = [_tool("alpha"), _tool("beta")]
+
+    first = cache.convert(tools, convert)
+    second = cache.convert(list(tools), convert)
+
+    assert calls == ["alpha", "beta"]
+    assert second is first
+    assert isinstance(first, tuple)
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+
+
+def test_only_new_tools_are_converted_and_removed_tools_dropped():
+    cache: ToolSchemaCache[dict] = ToolSchemaCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    alpha, beta = _tool("alpha"), _tool("beta")
+
+    cache.convert([alpha, beta], convert)
+    # A refreshed server hands out a new object for the same tool name.
+    refreshed = _tool("beta")
+    result = cache.convert([alpha, refreshed, _tool("gamma")], convert)
+
+    assert calls == ["alpha", "beta", "beta", "gamma"]
+    assert [item["name"] for item in result] == ["alpha", "beta", "gamma"]
+    assert cache.stats.entries == 3
+
+    cache.convert([alpha], convert)
+    assert cache.stats.entries == 1
+
+
+def test_dialect_change_drops_entries():
+    cache: ToolSchemaCache[dict] = ToolSchemaCache()
+    calls: list[str] = []
+    convert = _recording_converter(calls)
+    tools = [_tool("alpha")]
+
+    cache.convert(tools, convert, dialect=("chat", False))
+    cache.convert(tools, convert, dialect=("chat", True))
+
+    assert calls == ["alpha", "alpha"]
+
+
+@pytest.mark.asyncio
+async def test_anthropic_tool_params_are_reused_across_turns():
+    llm = AnthropicLLM(context=Context())
+    tools = [_tool("alpha"), _tool("beta")]
+
+    first = await llm._prepare_tools(tools=tools)
+    second = await llm._prepare_tools(tools=tools)
+
+    assert [param["name"] for param in first] == ["alpha", "beta"]
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert llm._tool_schema_cache.stats.misses == 2
+    assert llm._tool_schema_cache.stats.hits == 2
@@ -0,0 +1,122 @@
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from fast_agent.agents.agent_types import AgentConfig
+from fast_agent.config import AdmissionSettings
+from fast_agent.core.agent_app import AgentApp
+from fast_agent.core.fastagent import AgentInstance
+from fast_agent.mcp.server.admission import AdmissionRejected, AgentAdmission
+from fast_agent.mcp.server.agent_server import AgentMCPServer
+
+if TYPE_CHECKING:
+    from fastmcp.tools import FunctionTool
+
+    from fast_agent.interfaces import AgentProtocol
+
+
+class SlowAgent:
+    def __init__(self) -> None:
+        self.config = AgentConfig("worker")
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def send(self, message: str, request_params=None) -> str:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return f"echo:{message}"
+
+    async def shutdown(self) -> None:
+        return None
+
+
+class _NoopNotificationSession:
+    async def send_notification(self, *_args, **_kwargs) -> None:
+        return None
+
+
+def _build_test_context() -> object:
+    request_context = SimpleNamespace(
+        meta=None,
+        request=SimpleNamespace(headers={}),
+        request_id="req-1",
+        session=_NoopNotificationSession(),
+    )
+    return SimpleNamespace(session=object(), request_context=request_context)
+
+
+async def _build_server(agent: SlowAgent, admission: AdmissionSettings) -> AgentMCPServer:
+    async def create_instance() -> AgentInstance:
+        wrapped = cast("AgentProtocol", agent)
+        return AgentInstance(app=AgentApp({"worker": wrapped}), agents={"worker": wrapped})
+
+    async def dispose_instance(instance: AgentInstance) -> None:
+        await instance.shutdown()
+
+    return AgentMCPServer(
+        primary_instance=await create_instance(),
+        create_instance=create_instance,
+        dispose_instance=dispose_instance,
+        instance_scope="shared",
+        admission=admission,
+    )
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_when_queue_is_full_or_wait_expires() -> None:
+    admission = AgentAdmission(max_concurrent=1, max_queue=1, max_wait=0.05)
+    release = asyncio.Event()
+
+    async def hold(agent_name: str) -> None:
+        async with admission.admit(agent_name):
+            await release.wait()
+
+    running = asyncio.create_task(hold("worker"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(hold("worker"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="queue full"):
+        async with admission.admit("worker"):
+            pass
+    # Other agents have their own gate.
+    async with admission.admit("other"):
+        pass
+
+    with pytest.raises(AdmissionRejected, match="timed out"):
+        await queued
+
+    release.set()
+    await running
+    stats = admission.stats()["worker"]
+    assert (stats.active, stats.queued, stats.admitted, stats.rejected) == (0, 0, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_shared_scope_requests_to_one_agent_are_serialized() -> None:
+    agent = SlowAgent()
+    server = await _build_server(agent, AdmissionSettings(max_queue_per_agent=1))
+    tool = cast("FunctionTool", await server.mcp_server.get_tool("worker"))
+    ctx = _build_test_context()
+
+    first = asyncio.create_task(tool.fn(message="one", ctx=ctx))
+    second = asyncio.create_task(tool.fn(message="two", ctx=ctx))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(ToolError, match="busy"):
+        await tool.fn(message="three", ctx=ctx)
+    assert any(
+        line.startswith("agent worker: active=1 queued=1") for line in server._status_lines()
+    )
+
+    agent.release.set()
+    assert await asyncio.gather(first, second) == ["echo:one", "echo:two"]
+    assert agent.max_running == 1
@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from fast_agent.core.fastagent import AgentInstance
+from fast_agent.mcp.server.instance_pool import AgentInstancePool
+
+
+class _Agent:
+    def __init__(self) -> None:
+        self.clears: list[bool] = []
+
+    def clear(self, *, clear_prompts: bool = False) -> None:
+        self.clears.append(clear_prompts)
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.registry_version = 0
+        self.created: list[AgentInstance] = []
+        self.disposed: list[AgentInstance] = []
+
+    async def create(self) -> AgentInstance:
+        agent = _Agent()
+        instance = AgentInstance(
+            app=cast("Any", None),
+            agents=cast("Any", {"worker": agent}),
+            registry_version=self.registry_version,
+        )
+        self.created.append(instance)
+        return instance
+
+    async def dispose(self, instance: AgentInstance) -> None:
+        self.disposed.append(instance)
+
+
+def _pool(factory: _Factory, **kwargs: Any) -> AgentInstancePool:
+    kwargs.setdefault("min_size", 0)
+    return AgentInstancePool(
+        factory.create,
+        factory.dispose,
+        get_registry_version=lambda: factory.registry_version,
+        **kwargs,
+    )
+
+
+def _clears(instance: AgentInstance) -> list[bool]:
+    return cast("_Agent", instance.agents["worker"]).clears
+
+
+@pytest.mark.asyncio
+async def test_released_instances_are_reset_and_reused() -> None:
+    factory = _Factory()
+    pool = _pool(factory)
+
+    first = await pool.acquire()
+    await pool.release(first)
+    second = await pool.acquire()
+
+    assert second is first
+    assert _clears(first) == [False]
+    assert pool.stats.created == 1
+    assert pool.stats.reused == 1
+    assert pool.stats.in_use == 1
+
+
+@pytest.mark.asyncio
+async def test_instances_are_retired_on_failure_reuse_limit_and_reload() -> None:
+    factory = _Factory()
+    pool = _pool(factory, max_reuse=2)
+
+    failed = await pool.acquire()
+    await pool.release(failed, reusable=False)
+    assert factory.disposed == [failed]
+
+    worn = await pool.acquire()
+    await pool.release(worn)
+    assert await pool.acquire() is worn
+    await pool.release(worn)
+    assert factory.disposed == [failed, worn]
+
+    stale = await pool.acquire()
+    await pool.release(stale)
+    factory.registry_version = 1
+    fresh = await pool.acquire()
+    assert fresh is not stale
+    assert fresh.registry_version == 1
+    assert factory.disposed == [failed, worn, stale]
+    assert pool.stats.retired == 3
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_max_size_use_one_off_instances() -> None:
+    factory = _Factory()
+    pool = _pool(factory, max_size=1)
+
+    pooled = await pool.acquire()
+    extra = await pool.acquire()
+    await pool.release(extra)
+    await pool.release(pooled)
+
+    assert factory.disposed == [extra]
+    assert pool.stats.overflow == 1
+    assert pool.stats.idle == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_prewarms_and_expires_idle_instances_above_min_size() -> None:
+    factory = _Factory()
+    now = [0.0]
+    pool = _pool(factory, min_size=1, max_size=4, idle_ttl=60, clock=lambda: now[0])
+
+    pool.warm()
+    await asyncio.sleep(0)
+    assert pool.stats.idle == 1
+
+    instances = [await pool.acquire() for _ in range(3)]
+    for instance in instances:
+        await pool.release(instance)
+    assert pool.stats.idle == 3
+
+    now[0] = 120.0
+    await pool.release(await pool.acquire())
+    assert pool.stats.idle == 1
+    assert len(factory.disposed) == 2
+
+    await pool.close()
+    assert len(factory.disposed) == 3
@@ -1,17 +1,22 @@
+import asyncio
+import time
 from types import SimpleNamespace
 
 import pytest
 from mcp.types import ListToolsResult, Tool
+from pydantic import AnyUrl
 
-from fast_agent.config import MCPServerSettings
+from fast_agent.config import MCPServerSettings, MCPSettings, Settings
 from fast_agent.context import Context
+from fast_agent.core.exceptions import ServerInitializationError
+from fast_agent.mcp.common import create_namespaced_name
 from fast_agent.mcp.mcp_aggregator import (
     MCPAggregator,
     MCPAttachOptions,
     MCPAttachResult,
     NamespacedTool,
 )
-from fast_agent.mcp.skybridge import SkybridgeServerConfig
+from fast_agent.mcp.skybridge import SkybridgeServerConfig, SkybridgeToolConfig
 from fast_agent.mcp_server_registry import ServerRegistry
 
 
@@ -222,3 +227,139 @@ async def test_attach_server_registers_runtime_server_before_prompt_discovery()
     assert result.tools_total == 1
     assert result.prompts_total == 1
     assert aggregator.server_names == ["runtime"]
+
+
+class _SlowDiscoveryAggregator(MCPAggregator):
+    """Aggregator whose list_tools latency is set per server."""
+
+    def __init__(self, delays: dict[str, float], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.delays = delays
+        self.active = 0
+        self.max_active = 0
+
+    async def get_capabilities(self, server_name: str):
+        del server_name
+        return SimpleNamespace(tools=True, prompts=False, resources=False)
+
+    async def _execute_on_server(
+        self,
+        server_name: str,
+        operation_type: str,
+        operation_name: str,
+        method_name: str,
+        method_args=None,
+        error_factory=None,
+        progress_callback=None,
+    ):
+        del operation_type, operation_name, method_args, error_factory, progress_callback
+        assert method_name == "list_tools"
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays[server_name])
+        finally:
+            self.active -= 1
+        return ListToolsResult(tools=[Tool(name="echo", inputSchema={"type": "object"})])
+
+    async def _evaluate_skybridge_for_server(
+        self, server_name: str
+    ) -> tuple[str, SkybridgeServerConfig]:
+        return server_name, SkybridgeServerConfig(server_name=server_name)
+
+
+def _slow_context(names: list[str], **mcp_settings) -> Context:
+    registry = ServerRegistry()
+    registry.registry = {
+        name: MCPServerSettings(name=name, transport="stdio", command="echo") for name in names
+    }
+    return Context(
+        server_registry=registry,
+        config=Settings(mcp=MCPSettings(**mcp_settings)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_servers_attaches_concurrently_in_configured_order() -> None:
+    names = ["alpha", "beta", "gamma", "delta"]
+    aggregator = _SlowDiscoveryAggregator(
+        delays={"alpha": 0.2, "beta": 0.05, "gamma": 0.1, "delta": 0.0},
+        server_names=names,
+        connection_persistence=False,
+        context=_slow_context(names, startup_concurrency=3),
+    )
+
+    started = time.perf_counter()
+    await aggregator.load_servers()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.3  # sequential attach would take at least 0.35s
+    assert aggregator.max_active == 3
+    assert aggregator.list_attached_servers() == names
+    assert list(aggregator._server_to_tool_map) == names
+    assert list(aggregator._namespaced_tool_map) == [
+        create_namespaced_name(name, "echo") for name in names
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_servers_deadline_does_not_block_other_servers() -> None:
+    names = ["alpha", "stuck", "gamma"]
+    aggregator = _SlowDiscoveryAggregator(
+        delays={"alpha": 0.0, "stuck": 5.0, "gamma": 0.0},
+        server_names=names,
+        connection_persistence=False,
+        context=_slow_context(names, startup_deadline_seconds=0.1),
+    )
+
+    with pytest.raises(ServerInitializationError, match="stuck"):
+        await aggregator.load_servers()
+
+    assert aggregator.list_attached_servers() == ["alpha", "gamma"]
+    assert aggregator.initialized is False
+
+
+@pytest.mark.asyncio
+async def test_list_tools_reuses_snapshot_until_tool_index_changes() -> None:
+    aggregator = MCPAggregator(
+        server_names=["alpha"],
+        connection_persistence=False,
+        context=_build_context({}),
+    )
+    aggregator.initialized = True
+
+    original = Tool(name="demo", inputSchema={"type": "object"})
+    namespaced = NamespacedTool(
+        tool=original, server_name="alpha", namespaced_tool_name="alpha.demo"
+    )
+    aggregator._attached_server_names = ["alpha"]
+    aggregator._namespaced_tool_map["alpha.demo"] = namespaced
+    aggregator._server_to_tool_map["alpha"] = [namespaced]
+    aggregator._skybridge_configs["alpha"] = SkybridgeServerConfig(
+        server_name="alpha",
+        tools=[
+            SkybridgeToolConfig(
+                tool_name="demo",
+                namespaced_tool_name="alpha.demo",
+                template_uri=AnyUrl("ui://widget/demo"),
+                is_valid=True,
+            )
+        ],
+    )
+    aggregator._invalidate_tools_snapshot()
+
+    first = await aggregator.list_tools()
+    second = await aggregator.list_tools()
+
+    assert [tool.name for tool in first.tools] == ["alpha.demo"]
+    assert first.tools[0] is second.tools[0]
+    assert first.tools is not second.tools
+    assert first.tools[0].meta == {
+        "openai/skybridgeEnabled": True,
+        "openai/skybridgeTemplate": "ui://widget/demo",
+    }
+    assert original.name == "demo"
+    assert original.meta is None
+
+    await aggregator.detach_server("alpha")
+    assert (await aggregator.list_tools()).tools == []
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Literal, cast
+
+import pytest
+from mcp.types import TextContent
+
+from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+from fast_agent.mcp.prompt_serialization import load_messages
+from fast_agent.session.history_journal import HistoryJournal, journal_path_for
+from fast_agent.session.session_manager import Session, SessionInfo
+
+if TYPE_CHECKING:
+    from fast_agent.interfaces import AgentProtocol
+
+
+def _message(role: Literal["user", "assistant"], text: str) -> PromptMessageExtended:
+    return PromptMessageExtended(role=role, content=[TextContent(type="text", text=text)])
+
+
+def _texts(messages: list[PromptMessageExtended]) -> list[str]:
+    return [message.first_text() for message in messages]
+
+
+def test_only_new_messages_are_appended_and_replayed(tmp_path) -> None:
+    snapshot = tmp_path / "history_agent.json"
+    journal = HistoryJournal(snapshot)
+    history = [_message("user", "one"), _message("assistant", "two")]
+
+    journal.save(history)
+    history.append(_message("user", "three"))
+    journal.save(history)
+    history.append(_message("assistant", "four"))
+    journal.save(history)
+
+    assert journal.stats.compactions == 1
+    assert journal.stats.appended == 2
+    assert len(json.loads(snapshot.read_text())["messages"]) == 2
+    assert len(journal_path_for(snapshot).read_text().splitlines()) == 2
+    assert _texts(load_messages(str(snapshot))) == ["one", "two", "three", "four"]
+
+
+def test_rewritten_history_compacts_and_ignores_stale_records(tmp_path) -> None:
+    snapshot = tmp_path / "history_agent.json"
+    previous = tmp_path / "history_agent_previous.json"
+    journal = HistoryJournal(snapshot, previous_path=previous)
+    history = [_message("user", "one"), _message("assistant", "two")]
+    journal.save(history)
+    journal.save([*history, _message("user", "three")])
+    stale_records = journal_path_for(snapshot).read_text()
+
+    # Rolled back to a shorter history: rewrite instead of appending.
+    journal.save([_message("user", "one")])
+    assert journal.stats.compactions == 2
+    assert not journal_path_for(snapshot).exists()
+    # The previous file keeps its journal and replays to everything persisted.
+    assert _texts(load_messages(str(previous))) == ["one", "two", "three"]
+
+    # A crash between snapshot and journal removal leaves old-generation records.
+    journal_path_for(snapshot).write_text(stale_records + '{"torn": ')
+    assert _texts(load_messages(str(snapshot))) == ["one"]
+
+
+def test_append_touches_snapshot_mtime(tmp_path) -> None:
+    snapshot = tmp_path / "history_agent.json"
+    journal = HistoryJournal(snapshot)
+    history = [_message("user", "one")]
+    journal.save(history)
+    os.utime(snapshot, (0, 0))
+
+    history.append(_message("assistant", "two"))
+    journal.save(history)
+
+    assert snapshot.stat().st_mtime > 0
+
+
+def test_journal_compacts_after_threshold(tmp_path) -> None:
+    snapshot = tmp_path / "history_agent.json"
+    journal = HistoryJournal(snapshot, compact_after=2, fsync_every=1)
+    history = [_message("user", "0")]
+    journal.save(history)
+
+    for index in range(1, 5):
+        history.append(_message("user", str(index)))
+        journal.save(history)
+
+    assert journal.stats.compactions == 2
+    assert journal.stats.appended == 3
+    assert journal.stats.fsyncs == 3
+    assert len(json.loads(snapshot.read_text())["messages"]) == 4
+    assert _texts(load_messages(str(snapshot))) == ["0", "1", "2", "3", "4"]
+
+
+@dataclass
+class _Agent:
+    name: str
+    message_history: list[PromptMessageExtended] = field(default_factory=list)
+
+
+@pytest.mark.asyncio
+async def test_session_save_history_uses_journal(tmp_path) -> None:
+    now = datetime.now()
+    session = Session(SessionInfo(name="s", created_at=now, last_activity=now), tmp_path)
+    agent = _Agent(name="agent", message_history=[_message("user", "hello")])
+
+    path = await session.save_history(cast("AgentProtocol", agent))
+    agent.message_history.append(_message("assistant", "hi"))
+    assert await session.save_history(cast("AgentProtocol", agent)) == path
+
+    assert journal_path_for(path).exists()
+    assert session.info.history_files == ["history_agent.json"]
+    assert _texts(load_messages(path)) == ["hello", "hi"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import shutil
+
+from fast_agent.session.catalog import SESSION_INDEX_FILENAME, SessionCatalog
+from fast_agent.session.session_manager import SessionManager
+
+
+def _manager(tmp_path, monkeypatch) -> SessionManager:
+    monkeypatch.setenv("ENVIRONMENT_DIR", str(tmp_path / "env"))
+    return SessionManager(cwd=tmp_path)
+
+
+def test_listing_uses_index_and_repairs_external_changes(tmp_path, monkeypatch) -> None:
+    manager = _manager(tmp_path, monkeypatch)
+    first = manager.create_session(metadata={"title": "first"})
+    second = manager.create_session(metadata={"title": "second"})
+
+    assert {info.name for info in manager.list_sessions()} == {first.info.name, second.info.name}
+    index = json.loads((manager.base_dir / SESSION_INDEX_FILENAME).read_text())
+    assert set(index["sessions"]) == {first.info.name, second.info.name}
+
+    # A fresh process trusts the index for unchanged sessions...
+    catalog = SessionCatalog(manager.base_dir)
+    assert len(catalog.list_infos()) == 2
+    assert catalog.stats.reloaded == 0
+
+    # ...and re-reads only what changed on disk behind its back.
+    metadata_path = second.directory / "session.json"
+    data = json.loads(metadata_path.read_text())
+    data["metadata"]["title"] = "edited elsewhere"
+    metadata_path.write_text(json.dumps(data))
+    shutil.rmtree(first.directory)
+
+    infos = catalog.list_infos()
+    assert [info["metadata"]["title"] for info in infos] == ["edited elsewhere"]
+    assert catalog.stats.reloaded == 1
+
+
+def test_pin_and_delete_update_the_catalog(tmp_path, monkeypatch) -> None:
+    manager = _manager(tmp_path, monkeypatch)
+    session = manager.create_session()
+    session.set_pinned(True)
+
+    (listed,) = manager.list_sessions()
+    assert listed.metadata.get("pinned") is True
+    listed.metadata["pinned"] = False
+    assert manager.list_sessions()[0].metadata.get("pinned") is True
+
+    assert manager.delete_session(session.info.name)
+    assert manager.list_sessions() == []
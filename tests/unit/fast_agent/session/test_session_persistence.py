@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from fast_agent.session.persistence import SessionWriter, get_session_writer
+from fast_agent.session.session_manager import Session, SessionInfo, SessionManager
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_for_same_key_are_coalesced() -> None:
+    writer = SessionWriter()
+    release = threading.Event()
+    written: list[str] = []
+
+    def blocker() -> None:
+        release.wait(timeout=5)
+        written.append("blocker")
+
+    first = writer.submit("other", blocker)
+    # Both writes queue behind the blocker; only the newest one runs.
+    stale = writer.submit("history", lambda: written.append("stale") or "stale")
+    latest = writer.submit("history", lambda: written.append("latest") or "latest")
+    release.set()
+
+    assert await asyncio.wrap_future(latest) == "latest"
+    assert stale is latest
+    first.result(timeout=5)
+    assert written == ["blocker", "latest"]
+    assert writer.stats.coalesced == 1
+    assert writer.stats.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_write_runs_off_the_event_loop_and_propagates_errors() -> None:
+    writer = SessionWriter()
+    loop_thread = threading.get_ident()
+
+    assert await writer.write("a", threading.get_ident) != loop_thread
+
+    def fail() -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        await writer.write("a", fail)
+    assert writer.stats.failed == 1
+
+
+def test_flush_waits_for_pending_writes() -> None:
+    writer = SessionWriter()
+    release = threading.Event()
+    done: list[int] = []
+    writer.submit("slow", lambda: release.wait(timeout=5) and done.append(1))
+
+    assert writer.flush(timeout=0.05) is False
+    release.set()
+    assert writer.flush(timeout=5) is True
+    assert done == [1]
+
+
+@pytest.mark.asyncio
+async def test_metadata_snapshot_is_taken_before_the_write(tmp_path) -> None:
+    now = datetime.now()
+    session = Session(SessionInfo(name="s", created_at=now, last_activity=now), tmp_path)
+    session.info.metadata["title"] = "first"
+
+    pending = asyncio.ensure_future(session._save_metadata_async())
+    await asyncio.sleep(0)
+    session.info.metadata["title"] = "changed later"
+    await pending
+
+    saved = json.loads((tmp_path / "session.json").read_text())
+    assert saved["metadata"]["title"] == "first"
+
+
+def test_sync_metadata_saves_do_not_wait_for_queued_writes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("ENVIRONMENT_DIR", str(tmp_path / "env"))
+    manager = SessionManager(cwd=tmp_path)
+    session = manager.create_session(metadata={"title": "draft"})
+    writer = get_session_writer()
+    release = threading.Event()
+    blocker = writer.submit("slow history", lambda: release.wait(timeout=5))
+
+    try:
+        session.set_title("final")
+        session.set_pinned(True)
+        assert not blocker.done()
+
+        # Readers in this process already see the queued metadata.
+        reloaded = manager.get_session(session.info.name)
+        assert reloaded is not None
+        assert reloaded.info.metadata["title"] == "final"
+        (listed,) = manager.list_sessions()
+        assert listed.metadata["pinned"] is True
+    finally:
+        release.set()
+
+    assert writer.flush(timeout=5)
+    saved = json.loads((session.directory / "session.json").read_text())
+    assert saved["metadata"] == {"title": "final", "pinned": True}
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from fast_agent.tools.shell_output_capture import ByteRing, ShellOutputCapture
+
+
+def test_byte_ring_keeps_most_recent_bytes() -> None:
+    ring = ByteRing(8)
+
+    assert ring.write(b"abcde") == 0
+    assert ring.write(b"fghij") == 2
+    assert ring.getvalue() == b"cdefghij"
+    assert ring.write(b"0123456789") == 10
+    assert ring.getvalue() == b"23456789"
+    assert len(ring) == 8
+
+
+def test_capture_under_limit_returns_everything() -> None:
+    capture = ShellOutputCapture(64)
+    capture.write(b"line one\n")
+    capture.write(b"line two\n")
+
+    captured = capture.result()
+
+    assert captured.text == "line one\nline two\n"
+    assert captured.truncated is False
+    assert captured.retained_bytes == captured.total_bytes == 18
+
+
+def test_capture_keeps_head_and_tail_within_limit() -> None:
+    capture = ShellOutputCapture(40, tail_fraction=0.5)
+    for index in range(100):
+        capture.write(f"line {index:03d}\n".encode())
+
+    captured = capture.result()
+
+    assert captured.truncated is True
+    assert captured.total_bytes == 900
+    assert captured.retained_bytes == 40
+    assert captured.text.startswith("line 000\nline 001\n")
+    assert captured.text.endswith("line 098\nline 099\n")
+    assert "[... 860 bytes omitted ...]" in captured.text
+
+
+def test_capture_with_zero_tail_keeps_only_the_head() -> None:
+    capture = ShellOutputCapture(10, tail_fraction=0)
+    capture.write(b"0123456789abcdef")
+
+    captured = capture.result()
+
+    assert captured.text == "0123456789"
+    assert captured.omitted_bytes == 6
+
+
+def test_capture_cuts_on_utf8_character_boundaries() -> None:
+    capture = ShellOutputCapture(8, tail_fraction=0.5)
+    capture.write("ééééé".encode())  # 10 bytes, 2 per character
+
+    captured = capture.result()
+
+    assert "�" not in captured.text
+    assert captured.text.startswith("éé\n")
+    assert captured.text.endswith("éé")
+    assert captured.retained_bytes == 8
+
+
+def test_capture_spills_full_stream_on_overflow(tmp_path: Path) -> None:
+    capture = ShellOutputCapture(16, spill=True, spill_dir=str(tmp_path))
+    capture.write(b"short\n")
+    assert capture.spill_path is None
+
+    payload = b"".join(f"row {index}\n".encode() for index in range(50))
+    capture.write(payload)
+    captured = capture.result()
+
+    assert captured.spill_path is not None
+    assert Path(captured.spill_path).read_bytes() == b"short\n" + payload
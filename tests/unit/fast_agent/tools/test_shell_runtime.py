@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import platform
+import re
 import signal
 import subprocess
 import sys
@@ -13,6 +14,7 @@ from mcp.types import TextContent
 
 from fast_agent.config import Settings, ShellSettings
 from fast_agent.event_progress import ProgressAction
+from fast_agent.tools.shell_output_capture import ShellOutputCapture
 from fast_agent.tools.shell_runtime import ShellRuntime
 from fast_agent.ui import console
 from fast_agent.ui.display_suppression import suppress_interactive_display
@@ -229,6 +231,90 @@ async def test_execute_handles_overlong_output_lines_without_timeout() -> None:
     assert "[Output truncated: retained" in text
 
 
+@pytest.mark.asyncio
+async def test_execute_keeps_start_and_end_of_overflowing_output() -> None:
+    logger = logging.getLogger("shell-runtime-test")
+    runtime = ShellRuntime(
+        activation_reason="test",
+        logger=logger,
+        timeout_seconds=10,
+        output_byte_limit=400,
+        config=Settings(shell_execution=ShellSettings(show_bash=False, output_spill=True)),
+    )
+
+    command = f'"{sys.executable}" -c "[print(f\'line {{i}}\') for i in range(2000)]"'
+    result = await runtime.execute({"command": command})
+
+    assert result.content is not None
+    assert isinstance(result.content[0], TextContent)
+    text = result.content[0].text
+    assert text.startswith("line 0\n")
+    assert "line 1999\n" in text
+    assert "bytes omitted ...]" in text
+    match = re.search(r"Full output saved to (\S+);", text)
+    assert match is not None
+    spill_path = Path(match.group(1))
+    try:
+        assert spill_path.read_text().splitlines()[-1] == "line 1999"
+    finally:
+        spill_path.unlink()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_execute_closes_and_tracks_the_spill_file(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    logger = logging.getLogger("shell-runtime-test")
+    runtime = ShellRuntime(
+        activation_reason="test",
+        logger=logger,
+        timeout_seconds=10,
+        output_byte_limit=400,
+        config=Settings(shell_execution=ShellSettings(show_bash=False, output_spill=True)),
+    )
+    captures: list[ShellOutputCapture] = []
+    new_output_capture = runtime._new_output_capture
+
+    def record_capture() -> ShellOutputCapture:
+        captures.append(new_output_capture())
+        return captures[-1]
+
+    processes: list[asyncio.subprocess.Process] = []
+    start_shell_process = runtime._start_shell_process
+
+    async def record_process(*args: Any) -> asyncio.subprocess.Process:
+        processes.append(await start_shell_process(*args))
+        return processes[-1]
+
+    monkeypatch.setattr(runtime, "_new_output_capture", record_capture)
+    monkeypatch.setattr(runtime, "_start_shell_process", record_process)
+    script = (
+        "import time; [print(f'line {i}') for i in range(2000)]; print(flush=True); time.sleep(0.5)"
+    )
+    task = asyncio.create_task(runtime.execute({"command": f'"{sys.executable}" -c "{script}"'}))
+
+    for _ in range(200):
+        if captures and captures[0].spill_path is not None:
+            break
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    (capture,) = captures
+    spill_path = capture.spill_path
+    assert spill_path is not None
+    try:
+        assert capture._spill_file is None
+        assert list(runtime._spill_paths) == [spill_path]
+    finally:
+        Path(spill_path).unlink()
+        for process in processes:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+
 @pytest.mark.asyncio
 async def test_execute_with_missing_working_directory_returns_actionable_error(
     tmp_path: Path,
@@ -0,0 +1,97 @@
+import pytest
+from markdown_it import MarkdownIt
+
+from fast_agent.ui.streaming_buffer import CodeBlock, StreamBuffer, Table, _LineIndex
+
+_PARSER = MarkdownIt().enable("table")
+
+DOCUMENTS = [
+    "Intro\n\n```python\nprint('hi')\n```\n\nAfter\n",
+    "Text\n\n| A | B |\n|---|---|\n| 1 | 2 |\n| 3 | 4 |\n\nMore text\n",
+    "Name | Size\n:--- | ---:\nfoo | 1\nbar | 2",
+    "Para\n\n    indented code\n\n    more code\n\nback to text\n",
+    "- item\n  ```bash\n  echo hi\n  ```\n- next\n  | a | b |\n  |---|---|\n  | 1 | 2 |\n",
+    "* star\n| 1 | 2 |\n  |---|---|\n| a | b |\n",
+    "> quote\n| a | b |\n|---|---|\n| 1 | 2 |\n",
+    "Heading\n-\n    code after setext heading\n",
+    "~~~~ js\nconst a = 1;\n~~~\nstill code\n~~~~\n",
+    "1. first\n\n   ```\n   nested\n```\nafter\n",
+    "```\nunclosed\n  ",
+    "<div>\n```\nnot code\n| a | b |\n|---|---|\n\n```\ncode\n```\n",
+    "Para\n<div>\n    not indented code\n</div>\n\n    code\n",
+    "Para\n<span>\n| a | b |\n|---|---|\n| 1 | 2 |\n",
+    "| a | b |\n|---|---|\n| 1 | 2 |\n<!-- note\n| 3 | 4 |\n-->\n| 5 | 6 |\n",
+    "<pre>\n\n```\n</pre>\n```\nafter\n",
+    "- item\n  <div>\n  ```\n- next\n  ```\n  code\n  ```\n",
+]
+
+
+def _markdown_it_structures(text: str) -> tuple[list[CodeBlock], list[Table]]:
+    """Reference code blocks and tables, as found by markdown-it."""
+    tokens = _PARSER.parse(text)
+    lines = text.split("\n")
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+
+    code_blocks: list[CodeBlock] = []
+    tables: list[Table] = []
+    body_start: int | None = None
+    for token in reversed(tokens):
+        token_map = token.map
+        if token_map is None:
+            continue
+        if token.type in ("fence", "code_block"):
+            code_blocks.append(CodeBlock(offsets[token_map[0]], offsets[token_map[1]], token.info))
+        elif token.type == "tbody_open":
+            body_start = token_map[0]
+        elif token.type == "table_open":
+            if body_start is not None:
+                header_lines = lines[token_map[0] : body_start]
+                tables.append(Table(offsets[token_map[0]], offsets[token_map[1]], header_lines))
+            body_start = None
+    return code_blocks[::-1], tables[::-1]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_incremental_structures_match_markdown_it(document: str, chunk_size: int) -> None:
+    index = _LineIndex()
+    for start in range(0, len(document), chunk_size):
+        index.feed(document[start : start + chunk_size])
+        text = document[: start + chunk_size]
+        code_spans, table_spans = index.structures()
+
+        code_blocks = [
+            CodeBlock(index.offset(span.start_line), index.offset(span.end_line), span.language)
+            for span in code_spans
+        ]
+        tables = [
+            Table(index.offset(span.start_line), index.offset(span.end_line), span.header_lines)
+            for span in table_spans
+        ]
+        assert (code_blocks, tables) == _markdown_it_structures(text)
+
+
+def test_appended_chunks_truncate_like_the_full_text() -> None:
+    text = "\n\n".join(
+        f"Paragraph {idx}\n\n```python\n"
+        + "\n".join(f"value_{idx}_{n} = {n}" for n in range(6))
+        + "\n```\n\n| A | B |\n|---|---|\n"
+        + "\n".join(f"| {n} | {n * 2} |" for n in range(4))
+        for idx in range(12)
+    )
+    streamed = StreamBuffer()
+    resubmitted = StreamBuffer()
+
+    for start in range(0, len(text), 23):
+        streamed.append(text[start : start + 23])
+        partial = text[: start + 23]
+        expected = StreamBuffer().truncate_text(partial, 12, 40)
+
+        assert streamed.get_display_text(12, terminal_width=40) == expected
+        assert resubmitted.truncate_text(partial, 12, 40) == expected
+        estimate = StreamBuffer().estimate_display_lines(partial, 40)
+        assert resubmitted.estimate_display_lines(partial, 40) == estimate
+
+    assert streamed.get_full_text() == text